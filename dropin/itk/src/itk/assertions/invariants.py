@@ -3,12 +3,20 @@
 Invariants are assertions about trace structure and content that should
 hold true for valid executions. Failed invariants indicate bugs or
 unexpected behavior.
+
+All invariants are evaluated from a shared `TraceIndex`, built in a single
+pass over the spans (ids, duplicates, parents, roots, components, retries,
+errors; timestamps are parsed once on first use). Checks are looked up by
+name in a registry, so case-defined invariants (`expected.invariants` in
+case YAML) and plugins registered with `register_invariant` are evaluated
+in the same pass as the built-in ones.
 """
 from __future__ import annotations
 
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional, Sequence
+from functools import cached_property, lru_cache
+from typing import Any, Callable, Iterable, Mapping, Optional, Sequence
 
 from itk.trace.trace_model import Trace
 from itk.trace.span_model import Span
@@ -40,77 +48,134 @@ class InvariantConfig:
     check_timestamps: bool = True
 
 
-def _check_has_spans(trace: Trace) -> InvariantResult:
-    """Check that trace has at least one span."""
+class TraceIndex:
+    """Facts about a trace gathered in one pass over its spans."""
+
+    def __init__(self, trace: Trace) -> None:
+        self.trace = trace
+        self.span_count = 0
+        self.span_ids: set[str] = set()
+        self.duplicate_ids: list[str] = []
+        self.components: set[str] = set()
+        self.root_count = 0
+        self.retried_spans: list[Span] = []
+        self.error_spans: list[Span] = []
+        self._children: list[Span] = []
+        self._timed_spans: list[Span] = []
+
+        # Locals keep the per-span loop cheap; this runs once per soak iteration
+        span_ids = self.span_ids
+        duplicate_ids = self.duplicate_ids
+        components = self.components
+        children = self._children
+        timed_spans = self._timed_spans
+        retried_spans = self.retried_spans
+        error_spans = self.error_spans
+        for span in trace.spans:
+            span_id = span.span_id
+            if span_id in span_ids:
+                duplicate_ids.append(span_id)
+            else:
+                span_ids.add(span_id)
+            components.add(span.component)
+            if span.parent_span_id is None:
+                self.root_count += 1
+            else:
+                children.append(span)
+            if span.ts_start and span.ts_end:
+                timed_spans.append(span)
+            if span.attempt is not None:
+                retried_spans.append(span)
+            if span.error:
+                error_spans.append(span)
+        self.span_count = len(trace.spans)
+
+    @cached_property
+    def orphan_ids(self) -> list[str]:
+        """IDs of spans whose parent_span_id is not in the trace."""
+        return [s.span_id for s in self._children if s.parent_span_id not in self.span_ids]
+
+    @cached_property
+    def timestamps(self) -> list[tuple[Span, Optional[datetime], Optional[datetime]]]:
+        """(span, start, end) for spans with both timestamps, parsed once."""
+        return [
+            (s, _parse_timestamp(s.ts_start), _parse_timestamp(s.ts_end))  # type: ignore[arg-type]
+            for s in self._timed_spans
+        ]
+
+
+InvariantCheck = Callable[[TraceIndex, Mapping[str, Any]], InvariantResult]
+
+_REGISTRY: dict[str, InvariantCheck] = {}
+
+
+def register_invariant(
+    name: str, *, replace: bool = False
+) -> Callable[[InvariantCheck], InvariantCheck]:
+    """Register an invariant check under a name usable in case YAML.
+
+    The check receives the shared `TraceIndex` and the spec's params.
+
+    Example:
+        @register_invariant("max_span_count")
+        def _max_span_count(index, params):
+            limit = params.get("max", 100)
+            return InvariantResult("max_span_count", index.span_count <= limit)
+
+    Raises:
+        ValueError: If the name is taken and `replace` is False.
+    """
+
+    def decorator(check: InvariantCheck) -> InvariantCheck:
+        if name in _REGISTRY and not replace:
+            raise ValueError(f"Invariant already registered: {name}")
+        _REGISTRY[name] = check
+        return check
+
+    return decorator
+
+
+def registered_invariants() -> list[str]:
+    """Names of all registered invariants."""
+    return sorted(_REGISTRY)
+
+
+@register_invariant("has_spans")
+def _eval_has_spans(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
     return InvariantResult(
         name="has_spans",
-        passed=len(trace.spans) > 0,
-        details={"count": len(trace.spans)},
+        passed=index.span_count > 0,
+        details={"count": index.span_count},
     )
 
 
-def _check_no_duplicate_span_ids(trace: Trace) -> InvariantResult:
-    """Check that all span IDs are unique."""
-    seen: set[str] = set()
-    duplicates: list[str] = []
-
-    for span in trace.spans:
-        if span.span_id in seen:
-            duplicates.append(span.span_id)
-        seen.add(span.span_id)
-
+@register_invariant("no_duplicate_span_ids")
+def _eval_no_duplicate_span_ids(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
+    duplicates = index.duplicate_ids
     return InvariantResult(
         name="no_duplicate_span_ids",
         passed=len(duplicates) == 0,
-        details={"duplicates": duplicates} if duplicates else {},
+        details={"duplicates": list(duplicates)} if duplicates else {},
     )
 
 
-def _check_no_orphan_spans(trace: Trace) -> InvariantResult:
-    """Check that all spans with parent_span_id reference valid spans.
-
-    A span is orphaned if it has a parent_span_id that doesn't exist in the trace.
-    Root spans (parent_span_id=None) are not orphans.
-    """
-    span_ids = {s.span_id for s in trace.spans}
-    orphans: list[str] = []
-
-    for span in trace.spans:
-        if span.parent_span_id is not None and span.parent_span_id not in span_ids:
-            orphans.append(span.span_id)
-
+@register_invariant("no_orphan_spans")
+def _eval_no_orphan_spans(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
+    orphans = index.orphan_ids
     return InvariantResult(
         name="no_orphan_spans",
         passed=len(orphans) == 0,
-        details={"orphan_span_ids": orphans} if orphans else {},
+        details={"orphan_span_ids": list(orphans)} if orphans else {},
     )
 
 
-def _parse_timestamp(ts: str) -> Optional[datetime]:
-    """Parse an ISO timestamp string."""
-    try:
-        ts = ts.replace("Z", "+00:00")
-        return datetime.fromisoformat(ts)
-    except (ValueError, TypeError):
-        return None
-
-
-def _check_valid_timestamps(trace: Trace) -> InvariantResult:
-    """Check that ts_end >= ts_start for all spans with both timestamps."""
-    invalid: list[dict[str, Any]] = []
-
-    for span in trace.spans:
-        if span.ts_start and span.ts_end:
-            start = _parse_timestamp(span.ts_start)
-            end = _parse_timestamp(span.ts_end)
-
-            if start and end and end < start:
-                invalid.append({
-                    "span_id": span.span_id,
-                    "ts_start": span.ts_start,
-                    "ts_end": span.ts_end,
-                })
-
+@register_invariant("valid_timestamps")
+def _eval_valid_timestamps(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
+    invalid = [
+        {"span_id": span.span_id, "ts_start": span.ts_start, "ts_end": span.ts_end}
+        for span, start, end in index.timestamps
+        if start and end and end < start
+    ]
     return InvariantResult(
         name="valid_timestamps",
         passed=len(invalid) == 0,
@@ -118,21 +183,20 @@ def _check_valid_timestamps(trace: Trace) -> InvariantResult:
     )
 
 
-def _check_max_retry_count(trace: Trace, max_retries: int) -> InvariantResult:
-    """Check that no span exceeds the maximum retry count."""
+@register_invariant("max_retry_count")
+def _eval_max_retry_count(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
+    max_retries = params.get("max_retries", params.get("max_allowed", InvariantConfig.max_retry_count))
     excessive: list[dict[str, Any]] = []
-
-    for span in trace.spans:
-        if span.attempt is not None:
-            # attempt is 1-indexed, so retries = attempt - 1
-            retries = span.attempt - 1
-            if retries > max_retries:
-                excessive.append({
-                    "span_id": span.span_id,
-                    "component": span.component,
-                    "attempt": span.attempt,
-                    "retries": retries,
-                })
+    for span in index.retried_spans:
+        # attempt is 1-indexed, so retries = attempt - 1
+        retries = span.attempt - 1  # type: ignore[operator]
+        if retries > max_retries:
+            excessive.append({
+                "span_id": span.span_id,
+                "component": span.component,
+                "attempt": span.attempt,
+                "retries": retries,
+            })
 
     return InvariantResult(
         name="max_retry_count",
@@ -144,10 +208,9 @@ def _check_max_retry_count(trace: Trace, max_retries: int) -> InvariantResult:
     )
 
 
-def _check_required_components(
-    trace: Trace, required: Sequence[str]
-) -> InvariantResult:
-    """Check that all required components appear in the trace."""
+@register_invariant("required_components")
+def _eval_required_components(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
+    required = list(params.get("components", ()))
     if not required:
         return InvariantResult(
             name="required_components",
@@ -155,42 +218,37 @@ def _check_required_components(
             details={"required": [], "found": []},
         )
 
-    present = {s.component for s in trace.spans}
-    missing = [c for c in required if c not in present]
-
+    missing = [c for c in required if c not in index.components]
     return InvariantResult(
         name="required_components",
         passed=len(missing) == 0,
         details={
-            "required": list(required),
+            "required": required,
             "missing": missing,
-            "found": list(present),
+            "found": list(index.components),
         },
     )
 
 
-def _check_has_entrypoint(trace: Trace) -> InvariantResult:
-    """Check that trace has at least one root span (entrypoint)."""
-    roots = [s for s in trace.spans if s.parent_span_id is None]
+@register_invariant("has_entrypoint")
+def _eval_has_entrypoint(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
     return InvariantResult(
         name="has_entrypoint",
-        passed=len(roots) > 0,
-        details={"root_count": len(roots)},
+        passed=index.root_count > 0,
+        details={"root_count": index.root_count},
     )
 
 
-def _check_no_error_spans(trace: Trace) -> InvariantResult:
-    """Check that no spans have errors (useful for success-path tests)."""
-    errors: list[dict[str, Any]] = []
-
-    for span in trace.spans:
-        if span.error:
-            errors.append({
-                "span_id": span.span_id,
-                "component": span.component,
-                "error": span.error.get("message", str(span.error)),
-            })
-
+@register_invariant("no_error_spans")
+def _eval_no_error_spans(index: TraceIndex, params: Mapping[str, Any]) -> InvariantResult:
+    errors = [
+        {
+            "span_id": span.span_id,
+            "component": span.component,
+            "error": span.error.get("message", str(span.error)),  # type: ignore[union-attr]
+        }
+        for span in index.error_spans
+    ]
     return InvariantResult(
         name="no_error_spans",
         passed=len(errors) == 0,
@@ -198,49 +256,172 @@ def _check_no_error_spans(trace: Trace) -> InvariantResult:
     )
 
 
-def run_invariants(
-    trace: Trace,
-    config: Optional[InvariantConfig] = None,
+@lru_cache(maxsize=8192)
+def _parse_timestamp(ts: str) -> Optional[datetime]:
+    """Parse an ISO timestamp string.
+
+    Cached: fixture-driven soak iterations replay the same timestamps.
+    """
+    try:
+        return datetime.fromisoformat(ts)
+    except (ValueError, TypeError):
+        pass
+    try:
+        return datetime.fromisoformat(ts.replace("Z", "+00:00"))
+    except (ValueError, TypeError, AttributeError):
+        return None
+
+
+# Single-invariant helpers (each builds its own index; prefer evaluate_invariants)
+
+def _check_has_spans(trace: Trace) -> InvariantResult:
+    """Check that trace has at least one span."""
+    return _eval_has_spans(TraceIndex(trace), {})
+
+
+def _check_no_duplicate_span_ids(trace: Trace) -> InvariantResult:
+    """Check that all span IDs are unique."""
+    return _eval_no_duplicate_span_ids(TraceIndex(trace), {})
+
+
+def _check_no_orphan_spans(trace: Trace) -> InvariantResult:
+    """Check that all spans with parent_span_id reference valid spans.
+
+    A span is orphaned if it has a parent_span_id that doesn't exist in the trace.
+    Root spans (parent_span_id=None) are not orphans.
+    """
+    return _eval_no_orphan_spans(TraceIndex(trace), {})
+
+
+def _check_valid_timestamps(trace: Trace) -> InvariantResult:
+    """Check that ts_end >= ts_start for all spans with both timestamps."""
+    return _eval_valid_timestamps(TraceIndex(trace), {})
+
+
+def _check_max_retry_count(trace: Trace, max_retries: int) -> InvariantResult:
+    """Check that no span exceeds the maximum retry count."""
+    return _eval_max_retry_count(TraceIndex(trace), {"max_retries": max_retries})
+
+
+def _check_required_components(
+    trace: Trace, required: Sequence[str]
+) -> InvariantResult:
+    """Check that all required components appear in the trace."""
+    return _eval_required_components(TraceIndex(trace), {"components": required})
+
+
+def _check_has_entrypoint(trace: Trace) -> InvariantResult:
+    """Check that trace has at least one root span (entrypoint)."""
+    return _eval_has_entrypoint(TraceIndex(trace), {})
+
+
+def _check_no_error_spans(trace: Trace) -> InvariantResult:
+    """Check that no spans have errors (useful for success-path tests)."""
+    return _eval_no_error_spans(TraceIndex(trace), {})
+
+
+def evaluate_invariants(
+    trace: Trace | TraceIndex,
+    specs: Iterable[Any],
 ) -> list[InvariantResult]:
-    """Run all configured invariants on a trace.
+    """Evaluate invariants by name against one shared index.
 
     Args:
-        trace: The trace to validate
-        config: Optional configuration (uses defaults if None)
+        trace: The trace (or an already-built `TraceIndex`).
+        specs: Objects with `name` and `params` (e.g. `InvariantSpec` from
+            case YAML), or `(name, params)` tuples.
 
     Returns:
-        List of InvariantResult objects
+        One InvariantResult per spec, in order. Unknown names and checks
+        that raise produce a failed result rather than an exception.
     """
-    if config is None:
-        config = InvariantConfig()
-
+    index = trace if isinstance(trace, TraceIndex) else TraceIndex(trace)
     results: list[InvariantResult] = []
+    for spec in specs:
+        name, params = spec if isinstance(spec, tuple) else (spec.name, spec.params)
+        check = _REGISTRY.get(name)
+        if check is None:
+            results.append(
+                InvariantResult(name=name, passed=False, details={"error": f"Unknown invariant: {name}"})
+            )
+            continue
+        try:
+            results.append(check(index, params or {}))
+        except Exception as e:
+            results.append(
+                InvariantResult(name=name, passed=False, details={"error": f"{type(e).__name__}: {e}"})
+            )
+    return results
+
 
+def _merge_specs(
+    defaults: list[tuple[str, dict[str, Any]]], extra: Optional[Iterable[Any]]
+) -> list[tuple[str, dict[str, Any]]]:
+    """Apply case-defined specs: same name replaces a default, others append."""
+    specs = list(defaults)
+    positions = {name: i for i, (name, _) in enumerate(specs)}
+    for spec in extra or ():
+        name, params = spec if isinstance(spec, tuple) else (spec.name, spec.params)
+        if name in positions:
+            default_params = specs[positions[name]][1]
+            specs[positions[name]] = (name, {**default_params, **(params or {})})
+        else:
+            positions[name] = len(specs)
+            specs.append((name, dict(params or {})))
+    return specs
+
+
+def _default_specs(config: InvariantConfig) -> list[tuple[str, dict[str, Any]]]:
     # Always run these
-    results.append(_check_has_spans(trace))
-    results.append(_check_no_duplicate_span_ids(trace))
-    results.append(_check_has_entrypoint(trace))
+    specs: list[tuple[str, dict[str, Any]]] = [
+        ("has_spans", {}),
+        ("no_duplicate_span_ids", {}),
+        ("has_entrypoint", {}),
+    ]
 
     # Configurable checks
     if config.check_orphans:
-        results.append(_check_no_orphan_spans(trace))
+        specs.append(("no_orphan_spans", {}))
 
     if config.check_timestamps:
-        results.append(_check_valid_timestamps(trace))
+        specs.append(("valid_timestamps", {}))
 
-    results.append(_check_max_retry_count(trace, config.max_retry_count))
+    specs.append(("max_retry_count", {"max_retries": config.max_retry_count}))
 
     if config.required_components:
-        results.append(_check_required_components(trace, config.required_components))
+        specs.append(("required_components", {"components": config.required_components}))
 
-    return results
+    return specs
+
+
+def run_invariants(
+    trace: Trace,
+    config: Optional[InvariantConfig] = None,
+    extra: Optional[Iterable[Any]] = None,
+) -> list[InvariantResult]:
+    """Run all configured invariants on a trace.
 
+    Args:
+        trace: The trace to validate
+        config: Optional configuration (uses defaults if None)
+        extra: Case-defined invariant specs; a spec with the name of a
+            default invariant overrides its params
 
-def run_all_invariants(trace: Trace) -> list[InvariantResult]:
+    Returns:
+        List of InvariantResult objects
+    """
+    if config is None:
+        config = InvariantConfig()
+    return evaluate_invariants(trace, _merge_specs(_default_specs(config), extra))
+
+
+def run_all_invariants(
+    trace: Trace,
+    extra: Optional[Iterable[Any]] = None,
+) -> list[InvariantResult]:
     """Run ALL invariants including optional ones.
 
     Useful for comprehensive validation and testing.
     """
-    results = run_invariants(trace)
-    results.append(_check_no_error_spans(trace))
-    return results
+    specs = _default_specs(InvariantConfig()) + [("no_error_spans", {})]
+    return evaluate_invariants(trace, _merge_specs(specs, extra))
@@ -0,0 +1,34 @@
+"""Shared AWS client infrastructure: client pool and retry engine."""
+from itk.aws.client_pool import (
+    ClientPool,
+    ClientStats,
+    get_client,
+    get_client_pool,
+)
+from itk.aws.retry import (
+    ErrorClass,
+    ErrorClassification,
+    RetryBudget,
+    RetryEngine,
+    RetryPolicy,
+    RetryTelemetry,
+    classify_error,
+    get_retry_engine,
+    mark_not_retryable,
+)
+
+__all__ = [
+    "ClientPool",
+    "ClientStats",
+    "ErrorClass",
+    "ErrorClassification",
+    "RetryBudget",
+    "RetryEngine",
+    "RetryPolicy",
+    "RetryTelemetry",
+    "classify_error",
+    "get_client",
+    "get_client_pool",
+    "get_retry_engine",
+    "mark_not_retryable",
+]
@@ -0,0 +1,172 @@
+"""Shared, thread-safe pool of boto3 clients.
+
+Creating a boto3 client resolves credentials, loads the service model and
+endpoint data and sets up a fresh connection pool. Live cases used to do
+that in every adapter, the version resolver and the CloudWatch fetchers, on
+every soak iteration. `ClientPool` creates each client once per
+(service, region, profile, timeouts) and hands the same instance back:
+
+- one boto3 Session per profile (sessions are not thread-safe, so client
+  creation is serialized; the clients themselves are thread-safe)
+- `max_pool_connections` sized for concurrent soak workers, TCP keep-alive on
+- creation time and reuse counts recorded per client (see `stats`)
+
+Example:
+    client = get_client("lambda", region="us-east-1")
+"""
+from __future__ import annotations
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Optional
+
+# Connections kept per client; botocore's default of 10 throttles concurrent soak workers
+DEFAULT_MAX_POOL_CONNECTIONS = 50
+
+# (service, region, profile, connect_timeout, read_timeout, max_attempts)
+ClientKey = tuple[str, Optional[str], Optional[str], Optional[float], Optional[float], Optional[int]]
+
+
+@dataclass
+class ClientStats:
+    """Creation cost and reuse of one pooled client."""
+
+    service: str
+    region: Optional[str]
+    profile: Optional[str]
+    creation_ms: float
+    requests: int = 1  # Times the client was handed out
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "service": self.service,
+            "region": self.region,
+            "profile": self.profile,
+            "creation_ms": round(self.creation_ms, 2),
+            "requests": self.requests,
+        }
+
+
+class ClientPool:
+    """Reuse boto3 clients keyed by service, region, profile and timeouts."""
+
+    def __init__(
+        self,
+        max_pool_connections: int = DEFAULT_MAX_POOL_CONNECTIONS,
+        tcp_keepalive: bool = True,
+    ) -> None:
+        self.max_pool_connections = max_pool_connections
+        self.tcp_keepalive = tcp_keepalive
+        self._lock = threading.Lock()
+        self._sessions: dict[Optional[str], Any] = {}
+        self._clients: dict[ClientKey, Any] = {}
+        self._stats: dict[ClientKey, ClientStats] = {}
+
+    def client(
+        self,
+        service: str,
+        region: Optional[str] = None,
+        profile: Optional[str] = None,
+        *,
+        connect_timeout: Optional[float] = None,
+        read_timeout: Optional[float] = None,
+        max_attempts: Optional[int] = None,
+    ) -> Any:
+        """Return a shared client, creating it on first use.
+
+        Args:
+            service: boto3 service name (e.g. "lambda", "logs").
+            region: AWS region (default: boto3's resolution from env/config).
+            profile: AWS profile (default: AWS_PROFILE, else the default chain).
+            connect_timeout: Connect timeout in seconds (botocore default if None).
+            read_timeout: Read timeout in seconds (botocore default if None).
+            max_attempts: botocore `retries.max_attempts`, i.e. retries after the
+                first call (botocore default if None).
+        """
+        if profile is None:
+            profile = os.environ.get("AWS_PROFILE") or None
+        key: ClientKey = (service, region, profile, connect_timeout, read_timeout, max_attempts)
+
+        client = self._clients.get(key)
+        if client is not None:
+            with self._lock:
+                self._stats[key].requests += 1
+            return client
+
+        with self._lock:
+            client = self._clients.get(key)
+            if client is not None:
+                self._stats[key].requests += 1
+                return client
+
+            start = time.perf_counter()
+            session = self._session(profile)
+            client = session.client(service, region_name=region, config=self._config(key))
+            self._stats[key] = ClientStats(
+                service=service,
+                region=region,
+                profile=profile,
+                creation_ms=(time.perf_counter() - start) * 1000,
+            )
+            self._clients[key] = client
+            return client
+
+    def _session(self, profile: Optional[str]) -> Any:
+        """Return the session for a profile (caller holds the lock)."""
+        session = self._sessions.get(profile)
+        if session is None:
+            import boto3
+
+            session = boto3.Session(profile_name=profile)
+            self._sessions[profile] = session
+        return session
+
+    def _config(self, key: ClientKey) -> Any:
+        from botocore.config import Config
+
+        _, _, _, connect_timeout, read_timeout, max_attempts = key
+        options: dict[str, Any] = {
+            "max_pool_connections": self.max_pool_connections,
+            "tcp_keepalive": self.tcp_keepalive,
+        }
+        if connect_timeout is not None:
+            options["connect_timeout"] = connect_timeout
+        if read_timeout is not None:
+            options["read_timeout"] = read_timeout
+        if max_attempts is not None:
+            options["retries"] = {"max_attempts": max_attempts}
+        return Config(**options)
+
+    def stats(self) -> list[ClientStats]:
+        """Creation time and reuse count per client, in creation order."""
+        with self._lock:
+            return [ClientStats(**vars(s)) for s in self._stats.values()]
+
+    def clear(self) -> None:
+        """Drop all clients and sessions (e.g. after credentials change)."""
+        with self._lock:
+            self._clients.clear()
+            self._sessions.clear()
+            self._stats.clear()
+
+
+_default_pool: Optional[ClientPool] = None
+_default_pool_lock = threading.Lock()
+
+
+def get_client_pool() -> ClientPool:
+    """Return the process-wide client pool."""
+    global _default_pool
+    if _default_pool is None:
+        with _default_pool_lock:
+            if _default_pool is None:
+                _default_pool = ClientPool()
+    return _default_pool
+
+
+def get_client(service: str, region: Optional[str] = None, **kwargs: Any) -> Any:
+    """Return a client from the process-wide pool (see `ClientPool.client`)."""
+    return get_client_pool().client(service, region, **kwargs)
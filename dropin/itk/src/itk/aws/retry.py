@@ -0,0 +1,424 @@
+"""Backoff-aware retries for live AWS calls.
+
+Adapters wrap their AWS calls in a `RetryEngine`, which:
+
+- classifies each failure as throttling, transient or fatal, reusing the
+  soak `ThrottleType` taxonomy for throttles and timeouts
+- retries throttling and transient failures with decorrelated-jitter
+  exponential backoff, and never retries fatal ones (bad credentials,
+  missing resources, validation errors)
+- draws every retry from a `RetryBudget` shared by the process, so a
+  throttled account cannot turn one run into a retry storm. Successful
+  calls refill the budget, so a long soak that spends it during a burst of
+  throttling gets retries back once calls succeed again
+- never retries a failure the adapter marked with `mark_not_retryable`
+  (e.g. a non-idempotent call that had already started)
+- returns `RetryTelemetry` (attempts, per-retry class and delay, botocore's
+  own retries) with the result. If the call fails for good, the telemetry
+  is attached to the exception as `retry_telemetry`.
+
+Example:
+    response, telemetry = get_retry_engine().call(client.invoke, **params)
+"""
+from __future__ import annotations
+
+import os
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Callable, Optional, TypeVar
+
+from itk.soak import THROTTLE_MESSAGE_PATTERNS, ThrottleType
+
+T = TypeVar("T")
+
+# Retries allowed across all adapters before successes refill the budget
+# (override with ITK_RETRY_BUDGET)
+DEFAULT_RETRY_BUDGET = 50
+
+# Retries earned back per successful call: one per five successes
+DEFAULT_RETRY_REFILL = 0.2
+
+# Exception attribute set by `mark_not_retryable`
+_NOT_RETRYABLE_ATTR = "itk_not_retryable"
+
+# AWS error codes (lowercased) that mean the caller is being throttled
+_THROTTLE_CODES: dict[str, ThrottleType] = {
+    "throttlingexception": ThrottleType.AWS_THROTTLE,
+    "throttling": ThrottleType.AWS_THROTTLE,
+    "throttledexception": ThrottleType.AWS_THROTTLE,
+    "requestthrottled": ThrottleType.AWS_THROTTLE,
+    "provisionedthroughputexceededexception": ThrottleType.AWS_THROTTLE,
+    "ec2throttledexception": ThrottleType.AWS_THROTTLE,
+    "toomanyrequestsexception": ThrottleType.RATE_LIMIT,
+    "requestlimitexceeded": ThrottleType.RATE_LIMIT,
+    "slowdown": ThrottleType.RATE_LIMIT,
+}
+
+# AWS error codes (lowercased) for failures that usually succeed when retried
+_TRANSIENT_CODES = frozenset({
+    "internalserverexception",
+    "internalfailure",
+    "internalerror",
+    "serviceexception",
+    "serviceunavailable",
+    "serviceunavailableexception",
+    "badgatewayexception",
+    "dependencyfailedexception",
+    "modelnotreadyexception",
+    "requesttimeout",
+    "requesttimeoutexception",
+})
+
+# Exception class names (anywhere in the MRO) for timeouts and dropped connections
+_TIMEOUT_EXCEPTIONS = frozenset({
+    "ReadTimeoutError",
+    "ConnectTimeoutError",
+    "AgentTimeoutError",
+    "TimeoutError",
+})
+_CONNECTION_EXCEPTIONS = frozenset({
+    "EndpointConnectionError",
+    "ConnectionClosedError",
+    "ConnectionError",
+})
+
+
+class ErrorClass(Enum):
+    """How a failed call should be treated."""
+
+    THROTTLE = "throttle"
+    TRANSIENT = "transient"
+    FATAL = "fatal"
+
+
+@dataclass(frozen=True)
+class ErrorClassification:
+    """Classification of one failure."""
+
+    error_class: ErrorClass
+    throttle_type: Optional[ThrottleType] = None
+    code: str = ""
+
+    @property
+    def retryable(self) -> bool:
+        return self.error_class is not ErrorClass.FATAL
+
+
+def _error_code(exc: BaseException) -> tuple[str, Optional[int]]:
+    """Return (error code, HTTP status) from a botocore-style error."""
+    response = getattr(exc, "response", None)
+    if not isinstance(response, dict):
+        return "", None
+    code = response.get("Error", {}).get("Code", "") or ""
+    status = response.get("ResponseMetadata", {}).get("HTTPStatusCode")
+    return str(code), status
+
+
+def _classify_one(exc: BaseException) -> ErrorClassification:
+    code, status = _error_code(exc)
+    code_lower = code.lower()
+    if code_lower in _THROTTLE_CODES:
+        return ErrorClassification(ErrorClass.THROTTLE, _THROTTLE_CODES[code_lower], code)
+    if status == 429:
+        return ErrorClassification(ErrorClass.THROTTLE, ThrottleType.HTTP_429, code)
+    if code_lower in _TRANSIENT_CODES or (status is not None and status >= 500):
+        return ErrorClassification(ErrorClass.TRANSIENT, None, code)
+    if code:
+        return ErrorClassification(ErrorClass.FATAL, None, code)
+
+    names = {cls.__name__ for cls in type(exc).__mro__}
+    if names & _TIMEOUT_EXCEPTIONS:
+        return ErrorClassification(ErrorClass.TRANSIENT, ThrottleType.TIMEOUT, type(exc).__name__)
+    if names & _CONNECTION_EXCEPTIONS:
+        return ErrorClassification(ErrorClass.TRANSIENT, None, type(exc).__name__)
+
+    message = str(exc).lower()
+    for pattern, throttle_type in THROTTLE_MESSAGE_PATTERNS:
+        if pattern in message:
+            return ErrorClassification(ErrorClass.THROTTLE, throttle_type, type(exc).__name__)
+    return ErrorClassification(ErrorClass.FATAL, None, type(exc).__name__)
+
+
+def mark_not_retryable(exc: BaseException) -> BaseException:
+    """Flag `exc` so `RetryEngine` never retries it, whatever its class.
+
+    For failures after a non-idempotent call may already have taken
+    effect. Returns `exc` so it can be used in a `raise` statement.
+    """
+    try:
+        setattr(exc, _NOT_RETRYABLE_ATTR, True)
+    except AttributeError:
+        pass
+    return exc
+
+
+def classify_error(exc: BaseException) -> ErrorClassification:
+    """Classify a failure as throttling, transient or fatal.
+
+    Adapters often re-raise AWS errors as their own exceptions, so the
+    `__cause__` chain is inspected too. An explicit AWS error code anywhere
+    in the chain decides; otherwise the first retryable link does.
+    """
+    first: Optional[ErrorClassification] = None
+    seen: set[int] = set()
+    current: Optional[BaseException] = exc
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        result = _classify_one(current)
+        if result.retryable or _error_code(current)[0]:
+            return result
+        if first is None:
+            first = result
+        current = current.__cause__
+    return first or ErrorClassification(ErrorClass.FATAL, None, type(exc).__name__)
+
+
+@dataclass
+class RetryPolicy:
+    """When and how long to back off.
+
+    Attributes:
+        max_attempts: Total attempts including the first call.
+        base_delay_seconds: Minimum backoff delay.
+        max_delay_seconds: Cap for a single backoff delay.
+        retry_transient: Retry transient failures as well as throttles.
+        retry_timeouts: Retry timeouts (a kind of transient failure). Turn
+            off for non-idempotent calls, where the timed-out request may
+            still have run.
+    """
+
+    max_attempts: int = 3
+    base_delay_seconds: float = 0.2
+    max_delay_seconds: float = 20.0
+    retry_transient: bool = True
+    retry_timeouts: bool = True
+
+    def should_retry(self, classification: ErrorClassification) -> bool:
+        if classification.error_class is ErrorClass.THROTTLE:
+            return True
+        if not self.retry_transient or classification.error_class is not ErrorClass.TRANSIENT:
+            return False
+        return self.retry_timeouts or classification.throttle_type is not ThrottleType.TIMEOUT
+
+    def next_delay(self, previous: float, rng: random.Random) -> float:
+        """Decorrelated jitter: uniform between the base and 3x the previous delay."""
+        upper = max(self.base_delay_seconds, previous * 3)
+        return min(self.max_delay_seconds, rng.uniform(self.base_delay_seconds, upper))
+
+
+class RetryBudget:
+    """Thread-safe cap on retries, refilled by successful calls.
+
+    Each retry takes one token and each successful call returns
+    `refill_per_success` tokens, up to `max_retries`. Calls that keep
+    failing drain the budget; once calls succeed again it refills, so an
+    early burst of throttling does not leave the rest of the process
+    without retries.
+    """
+
+    def __init__(
+        self,
+        max_retries: Optional[int] = DEFAULT_RETRY_BUDGET,
+        refill_per_success: float = DEFAULT_RETRY_REFILL,
+    ) -> None:
+        self.max_retries = max_retries  # None = unlimited
+        self.refill_per_success = refill_per_success
+        self.spent = 0  # Retries taken in total
+        self._tokens = float(max_retries or 0)
+        self._lock = threading.Lock()
+
+    @property
+    def remaining(self) -> Optional[int]:
+        if self.max_retries is None:
+            return None
+        return int(self._tokens)
+
+    def try_spend(self) -> bool:
+        """Take one retry from the budget; False if it is exhausted."""
+        with self._lock:
+            if self.max_retries is not None:
+                if self._tokens < 1:
+                    return False
+                self._tokens -= 1
+            self.spent += 1
+            return True
+
+    def record_success(self) -> None:
+        """Return `refill_per_success` tokens after a call succeeded."""
+        if self.max_retries is None:
+            return
+        with self._lock:
+            self._tokens = min(float(self.max_retries), self._tokens + self.refill_per_success)
+
+
+@dataclass
+class RetryAttempt:
+    """One failed attempt that was retried."""
+
+    attempt: int
+    error_class: ErrorClass
+    code: str
+    delay_ms: float
+    throttle_type: Optional[ThrottleType] = None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "attempt": self.attempt,
+            "error_class": self.error_class.value,
+            "code": self.code,
+            "delay_ms": round(self.delay_ms, 1),
+            "throttle_type": self.throttle_type.value if self.throttle_type else None,
+        }
+
+
+@dataclass
+class RetryTelemetry:
+    """Retries made for one call.
+
+    `retries` are client-side retries made by the engine; `sdk_retries` are
+    the retries botocore made internally before returning or raising.
+    """
+
+    attempts: int = 0
+    retries: list[RetryAttempt] = field(default_factory=list)
+    total_delay_ms: float = 0.0
+    sdk_retries: int = 0
+    budget_exhausted: bool = False
+    final_error: Optional[ErrorClassification] = None
+
+    @property
+    def client_retries(self) -> int:
+        return len(self.retries)
+
+    def merge(self, other: "RetryTelemetry") -> None:
+        """Add another call's telemetry into this one (e.g. batches of one replay)."""
+        self.attempts += other.attempts
+        self.retries.extend(other.retries)
+        self.total_delay_ms += other.total_delay_ms
+        self.sdk_retries += other.sdk_retries
+        self.budget_exhausted = self.budget_exhausted or other.budget_exhausted
+        self.final_error = self.final_error or other.final_error
+
+    @property
+    def throttled(self) -> bool:
+        return any(r.error_class is ErrorClass.THROTTLE for r in self.retries)
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "attempts": self.attempts,
+            "client_retries": self.client_retries,
+            "sdk_retries": self.sdk_retries,
+            "total_delay_ms": round(self.total_delay_ms, 1),
+            "budget_exhausted": self.budget_exhausted,
+            "final_error": (
+                {
+                    "error_class": self.final_error.error_class.value,
+                    "code": self.final_error.code,
+                }
+                if self.final_error
+                else None
+            ),
+            "retries": [r.to_dict() for r in self.retries],
+        }
+
+
+def _sdk_retries(obj: Any) -> int:
+    """botocore's own retry count from a response dict or ClientError."""
+    response = obj if isinstance(obj, dict) else getattr(obj, "response", None)
+    if not isinstance(response, dict):
+        return 0
+    attempts = response.get("ResponseMetadata", {}).get("RetryAttempts", 0)
+    return attempts if isinstance(attempts, int) else 0
+
+
+class RetryEngine:
+    """Run calls with classification-aware backoff and a shared budget."""
+
+    def __init__(
+        self,
+        policy: Optional[RetryPolicy] = None,
+        budget: Optional[RetryBudget] = None,
+        sleep: Callable[[float], None] = time.sleep,
+        rng: Optional[random.Random] = None,
+    ) -> None:
+        self.policy = policy or RetryPolicy()
+        self.budget = budget or RetryBudget()
+        self._sleep = sleep
+        self._rng = rng or random.Random()
+
+    def with_policy(self, policy: RetryPolicy) -> "RetryEngine":
+        """Return an engine with a different policy drawing on the same budget."""
+        return RetryEngine(policy, self.budget, self._sleep, self._rng)
+
+    def call(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> tuple[T, RetryTelemetry]:
+        """Call `fn`, retrying throttled and transient failures.
+
+        Returns:
+            Tuple of (result, telemetry)
+
+        Raises:
+            The last exception, with `retry_telemetry` attached, once the
+            failure is fatal, attempts run out or the budget is exhausted.
+        """
+        telemetry = RetryTelemetry()
+        delay = self.policy.base_delay_seconds
+        for attempt in range(1, self.policy.max_attempts + 1):
+            telemetry.attempts = attempt
+            try:
+                result = fn(*args, **kwargs)
+            except Exception as exc:
+                classification = classify_error(exc)
+                telemetry.sdk_retries += _sdk_retries(exc)
+                give_up = (
+                    attempt >= self.policy.max_attempts
+                    or not self.policy.should_retry(classification)
+                    or getattr(exc, _NOT_RETRYABLE_ATTR, False)
+                )
+                if not give_up and not self.budget.try_spend():
+                    telemetry.budget_exhausted = True
+                    give_up = True
+                if give_up:
+                    telemetry.final_error = classification
+                    try:
+                        exc.retry_telemetry = telemetry  # type: ignore[attr-defined]
+                    except AttributeError:
+                        pass
+                    raise
+
+                delay = self.policy.next_delay(delay, self._rng)
+                telemetry.retries.append(
+                    RetryAttempt(
+                        attempt=attempt,
+                        error_class=classification.error_class,
+                        code=classification.code,
+                        delay_ms=delay * 1000,
+                        throttle_type=classification.throttle_type,
+                    )
+                )
+                telemetry.total_delay_ms += delay * 1000
+                self._sleep(delay)
+                continue
+            telemetry.sdk_retries += _sdk_retries(result)
+            self.budget.record_success()
+            return result, telemetry
+        raise RuntimeError("RetryPolicy.max_attempts must be at least 1")
+
+
+_default_engine: Optional[RetryEngine] = None
+_default_engine_lock = threading.Lock()
+
+
+def get_retry_engine() -> RetryEngine:
+    """Return the process-wide retry engine (one refilling budget for the process)."""
+    global _default_engine
+    if _default_engine is None:
+        with _default_engine_lock:
+            if _default_engine is None:
+                budget = int(os.environ.get("ITK_RETRY_BUDGET", DEFAULT_RETRY_BUDGET))
+                _default_engine = RetryEngine(budget=RetryBudget(budget))
+    return _default_engine
@@ -0,0 +1,30 @@
+"""Built-in benchmarks over a seeded synthetic support-bot log corpus.
+
+`itk bench` runs them; results (throughput, p50/p99, peak RSS) go to JSON
+and can be gated against a stored baseline.
+"""
+from itk.bench.corpus import SIZE_PRESETS, generate_log_lines, write_corpus
+from itk.bench.runner import (
+    BENCHMARKS,
+    BenchmarkResult,
+    BenchReport,
+    Regression,
+    baseline_mismatch,
+    check_regressions,
+    run_benchmark,
+    run_benchmarks,
+)
+
+__all__ = [
+    "BENCHMARKS",
+    "BenchmarkResult",
+    "BenchReport",
+    "Regression",
+    "SIZE_PRESETS",
+    "baseline_mismatch",
+    "check_regressions",
+    "generate_log_lines",
+    "run_benchmark",
+    "run_benchmarks",
+    "write_corpus",
+]
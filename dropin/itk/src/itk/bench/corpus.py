@@ -0,0 +1,238 @@
+"""Seeded synthetic log corpus shaped like the support bot's CloudWatch logs.
+
+Every line is a CloudWatch event (`{"timestamp": ms, "message": ...}`),
+as returned by FilterLogEvents. Each simulated conversation emits a
+correlated burst of them across components, using the shapes the parsers
+and correlation engine have to cope with in production:
+
+- application JSON stringified into `message`, some of it holding a
+  further stringified `payload`
+- orchestrator lines whose inner `message` embeds a Python dict repr
+  (`Event_body is {'ts': '1712345678.123456', ...}`)
+- Slack `ts` chains: the thread `ts` is the Bedrock session ID, and every
+  reply carries `thread_ts` pointing back at it
+- Bedrock agent trace events (`orchestrationTrace` with model input,
+  rationale, action group invocation and observation)
+- action group Lambda logs and Lambda runtime START/END/REPORT lines
+- occasional PII (emails, phone numbers) for the redaction benchmark
+
+Conversations overlap in time (`concurrency` are open at once) and their
+lines are merged in timestamp order, as FilterLogEvents returns them. The same seed always
+produces the same corpus, which makes benchmark runs comparable.
+"""
+from __future__ import annotations
+
+import heapq
+import itertools
+import json
+import random
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+from typing import Any, Iterator
+
+# Corpus sizes selectable by name (`itk bench --size`)
+SIZE_PRESETS: dict[str, int] = {
+    "10k": 10_000,
+    "1m": 1_000_000,
+    "10m": 10_000_000,
+}
+
+DEFAULT_SEED = 42
+DEFAULT_CONCURRENCY = 16  # Conversations in flight at once
+
+_EPOCH = datetime(2025, 6, 20, 17, 0, tzinfo=timezone.utc)
+_QUESTIONS = (
+    "What is CaaS 2.0?",
+    "How do I rotate my API key?",
+    "Why was my invoice charged twice?",
+    "Can you reset the staging cluster?",
+    "Where are the runbooks for the payments service?",
+)
+_ACTION_GROUPS = ("search-kb", "billing-lookup", "ticket-create")
+_PII = ("jane.doe@example.com", "555-123-4567", "ops-oncall@example.org")
+_WORDS = (
+    "the agent should search the knowledge base and summarise the retrieved "
+    "passages before answering the customer question about their account"
+).split()
+
+
+def _uuid(rng: random.Random) -> str:
+    return str(uuid.UUID(int=rng.getrandbits(128), version=4))
+
+
+def _prose(rng: random.Random, words: int) -> str:
+    parts = [rng.choice(_WORDS) for _ in range(words)]
+    if rng.random() < 0.05:
+        parts.insert(rng.randrange(len(parts)), rng.choice(_PII))
+    return " ".join(parts)
+
+
+def _conversation(rng: random.Random, start: datetime) -> Iterator[tuple[datetime, Any]]:
+    """Yield (time, log line) for one Slack question answered by the agent.
+
+    Log lines are dicts (structured application logs) or plain strings.
+    """
+    clock = start
+    ts = f"{start.timestamp():.6f}"
+    channel = f"C{rng.randrange(10**9):09d}"
+    user = f"U{rng.randrange(10**9):09d}"
+    request_id = _uuid(rng)
+    question = rng.choice(_QUESTIONS)
+
+    def tick(low_ms: int, high_ms: int) -> datetime:
+        nonlocal clock
+        clock += timedelta(milliseconds=rng.randint(low_ms, high_ms))
+        return clock
+
+    def app(message: str, logger: str = "main") -> dict[str, Any]:
+        return {
+            "appname": "support-bot-orchestrator",
+            "level": "INFO",
+            "logger_name": logger,
+            "message": message,
+            "timestamp": clock.isoformat(),
+        }
+
+    yield tick(0, 0), (f"START RequestId: {request_id} Version: $LATEST")
+    yield tick(1, 5), app(
+        f"Event_body is {{'message': {question!r}, 'ts': '{ts}', 'user': '{user}', 'channel': '{channel}'}}"
+    )
+    yield tick(5, 40), app(
+        f"SlackMessage class finished creation with: "
+        f"{{'thread_id': '{ts}', 'channel': '{channel}', 'user': '{user}', 'text': {question!r}}}",
+        logger="data_classes.slack_data",
+    )
+    payload = {"thread_id": ts, "channel": channel, "event": {"type": "app_mention", "text": question}}
+    yield tick(1, 10), {
+        "component": "lambda",
+        "operation": "handler.start",
+        "requestId": request_id,
+        "thread_id": ts,
+        "payload": json.dumps(payload),
+    }
+    yield tick(5, 30), app(f"Invoking Bedrock agent with session_id: {ts}", logger="bedrock.client")
+
+    for step in range(rng.randint(1, 3)):
+        trace_id = f"{ts}-{step}"
+        base = {"component": "bedrock", "session_id": ts, "sessionId": ts}
+        yield tick(50, 400), {
+            **base,
+            "timestamp": clock.isoformat(),
+            "trace": {"orchestrationTrace": {"modelInvocationInput": {
+                "traceId": trace_id, "type": "ORCHESTRATION", "text": _prose(rng, rng.randint(20, 120)),
+            }}},
+        }
+        yield tick(300, 2500), {
+            **base,
+            "timestamp": clock.isoformat(),
+            "trace": {"orchestrationTrace": {"rationale": {"traceId": trace_id, "text": _prose(rng, 15)}}},
+        }
+        group = rng.choice(_ACTION_GROUPS)
+        yield tick(5, 20), {
+            **base,
+            "timestamp": clock.isoformat(),
+            "trace": {"orchestrationTrace": {"invocationInput": {
+                "traceId": trace_id,
+                "invocationType": "ACTION_GROUP",
+                "actionGroupInvocationInput": {"actionGroupName": group, "apiPath": f"/{group}", "verb": "post"},
+            }}},
+        }
+        action_request_id = _uuid(rng)
+        yield tick(10, 60), {
+            "component": f"lambda:{group}",
+            "level": "INFO",
+            "message": f"Handling {group} for session {ts}",
+            "requestId": action_request_id,
+            "session_id": ts,
+            "timestamp": clock.isoformat(),
+        }
+        yield tick(20, 800), {
+            **base,
+            "timestamp": clock.isoformat(),
+            "trace": {"orchestrationTrace": {"observation": {
+                "traceId": trace_id,
+                "type": "ACTION_GROUP",
+                "actionGroupInvocationOutput": {"text": json.dumps({"results": _prose(rng, 30)})},
+            }}},
+        }
+
+    answer = _prose(rng, rng.randint(10, 60))
+    yield tick(200, 3000), {
+        "component": "bedrock",
+        "level": "INFO",
+        "message": f"Agent response received: {answer[:80]!r}",
+        "session_id": ts,
+        "timestamp": clock.isoformat(),
+    }
+    reply_ts = f"{clock.timestamp():.6f}"
+    yield tick(50, 300), app(
+        f"Posted response: {{'ts': '{reply_ts}', 'thread_ts': '{ts}', 'channel': '{channel}'}}",
+        logger="slack.response",
+    )
+    yield tick(1, 5), f"END RequestId: {request_id}"
+    duration = (clock - start).total_seconds() * 1000
+    yield tick(0, 1), (
+        f"REPORT RequestId: {request_id}\tDuration: {duration:.2f} ms\tBilled Duration: {int(duration) + 1} ms"
+    )
+
+
+def generate_log_lines(
+    lines: int,
+    seed: int = DEFAULT_SEED,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> Iterator[dict[str, Any]]:
+    """Yield exactly `lines` synthetic log events.
+
+    Args:
+        lines: Number of events to produce
+        seed: Random seed; equal seeds give identical corpora
+        concurrency: Conversations open at once (their lines interleave)
+
+    Yields:
+        CloudWatch events: `timestamp` (epoch ms) and `message`
+    """
+    rng = random.Random(seed)
+    start = last = _EPOCH
+    # (time of next line, tiebreak, line, rest of conversation), merged by time
+    pending: list[tuple[datetime, int, Any, Iterator[tuple[datetime, Any]]]] = []
+
+    def advance(conversation: Iterator[tuple[datetime, Any]]) -> None:
+        item = next(conversation, None)
+        if item is not None:
+            heapq.heappush(pending, (item[0], next(tiebreak), item[1], conversation))
+
+    tiebreak = itertools.count()
+    for _ in range(lines):
+        while len(pending) < concurrency:
+            # Never open a conversation before the last line emitted
+            start = max(start, last) + timedelta(milliseconds=rng.randint(10, 500))
+            advance(_conversation(rng, start))
+        at, _, line, conversation = heapq.heappop(pending)
+        last = at
+        advance(conversation)
+        yield {
+            "timestamp": int(at.timestamp() * 1000),
+            "message": line if isinstance(line, str) else json.dumps(line),
+        }
+
+
+def write_corpus(
+    path: Path,
+    lines: int,
+    seed: int = DEFAULT_SEED,
+    concurrency: int = DEFAULT_CONCURRENCY,
+) -> int:
+    """Write a synthetic corpus as JSONL (loadable by `itk trace --logs`).
+
+    Returns:
+        Bytes written
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    written = 0
+    with open(path, "w", encoding="utf-8") as f:
+        for event in generate_log_lines(lines, seed, concurrency):
+            line = json.dumps(event) + "\n"
+            f.write(line)
+            written += len(line.encode("utf-8"))
+    return written
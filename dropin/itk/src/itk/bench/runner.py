@@ -0,0 +1,411 @@
+"""Benchmark runner for `itk bench`.
+
+Each benchmark streams the synthetic corpus in windows of `window_lines`
+lines (so a 10M-line corpus never has to fit in memory), prepares its
+input from the window untimed, then times its operation on that input:
+
+- `parse`: parse_cloudwatch_logs on raw CloudWatch events
+- `correlate`: discover_correlations on raw events
+- `stitch`: stitch_spans_multi_key on the window's parsed spans
+- `redact`: Redactor.redact_dict on every event
+- `render`: trace viewer, timeline and Mermaid output for every trace
+- `compare`: compare_trace_sets between the two halves of the traces
+- `soak`: run_soak scheduling plus SoakAggregates, one iteration per trace
+
+A result reports throughput over the whole corpus (median of the runs),
+p50/p99 of the per-window latency across all runs, and peak RSS. Peak RSS
+is process-wide, so by default each benchmark runs in its own spawned
+process; `isolate=False` keeps everything in-process (faster, but RSS then
+includes everything run before).
+"""
+from __future__ import annotations
+
+import json
+import platform
+import statistics
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from itk.bench.corpus import DEFAULT_SEED, generate_log_lines
+
+DEFAULT_REPEAT = 3
+DEFAULT_WINDOW_LINES = 10_000
+DEFAULT_TOLERANCE = 0.2  # 20% worse than baseline counts as a regression
+
+
+@dataclass
+class BenchmarkResult:
+    """Timings for one benchmark.
+
+    Attributes:
+        name: Benchmark name
+        unit: What one item is (lines, spans, traces, iterations)
+        items: Items processed per run
+        run_seconds: Timed seconds of each full run over the corpus
+        window_ms: Per-window latencies across all runs
+        peak_rss_mb: Peak resident set size, if the platform reports it
+    """
+
+    name: str
+    unit: str
+    items: int
+    run_seconds: list[float] = field(default_factory=list)
+    window_ms: list[float] = field(default_factory=list)
+    peak_rss_mb: Optional[float] = None
+
+    @property
+    def seconds(self) -> float:
+        return statistics.median(self.run_seconds) if self.run_seconds else 0.0
+
+    @property
+    def throughput(self) -> float:
+        """Items per second for the median run."""
+        return self.items / self.seconds if self.seconds > 0 else 0.0
+
+    @property
+    def p50_ms(self) -> float:
+        from itk.compare.stats import percentile
+
+        return percentile(sorted(self.window_ms), 50)
+
+    @property
+    def p99_ms(self) -> float:
+        from itk.compare.stats import percentile
+
+        return percentile(sorted(self.window_ms), 99)
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "unit": self.unit,
+            "items": self.items,
+            "seconds": round(self.seconds, 6),
+            "throughput": round(self.throughput, 2),
+            "p50_ms": round(self.p50_ms, 3),
+            "p99_ms": round(self.p99_ms, 3),
+            "peak_rss_mb": round(self.peak_rss_mb, 1) if self.peak_rss_mb is not None else None,
+            "run_seconds": [round(s, 6) for s in self.run_seconds],
+            "windows": len(self.window_ms),
+        }
+
+
+@dataclass
+class BenchReport:
+    """All benchmark results for one corpus."""
+
+    lines: int
+    seed: int
+    repeat: int
+    window_lines: int
+    results: list[BenchmarkResult] = field(default_factory=list)
+    environment: dict[str, str] = field(default_factory=dict)
+    created_at: str = field(default_factory=lambda: datetime.now(timezone.utc).isoformat())
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "lines": self.lines,
+            "seed": self.seed,
+            "repeat": self.repeat,
+            "window_lines": self.window_lines,
+            "created_at": self.created_at,
+            "environment": self.environment,
+            "results": [r.to_dict() for r in self.results],
+        }
+
+    def write(self, path: Path) -> None:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(json.dumps(self.to_dict(), indent=2) + "\n", encoding="utf-8")
+
+
+@dataclass
+class Regression:
+    """A metric that got worse than the baseline by more than the tolerance."""
+
+    benchmark: str
+    metric: str
+    baseline: float
+    current: float
+
+    @property
+    def change_pct(self) -> float:
+        return (self.current - self.baseline) / self.baseline * 100 if self.baseline else 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "benchmark": self.benchmark,
+            "metric": self.metric,
+            "baseline": self.baseline,
+            "current": self.current,
+            "change_pct": round(self.change_pct, 1),
+        }
+
+
+# --- Benchmarks --------------------------------------------------------------
+#
+# Each benchmark is (unit, prepare, operation): `prepare` turns a window of
+# raw events into the operation's input outside the timed region, and
+# `operation` returns the number of items it processed.
+
+
+def _traces(events: list[dict[str, Any]]) -> list[Any]:
+    from itk.correlation.dynamic_discovery import chain_to_spans, discover_correlations
+    from itk.trace.build_trace import build_trace_from_spans
+
+    return [
+        build_trace_from_spans(chain_to_spans(chain, f"chain-{i}"))
+        for i, chain in enumerate(discover_correlations(events))
+    ]
+
+
+def _parse(events: list[dict[str, Any]]) -> int:
+    from itk.logs.parse import parse_cloudwatch_logs
+
+    parse_cloudwatch_logs(events)
+    return len(events)
+
+
+def _correlate(events: list[dict[str, Any]]) -> int:
+    from itk.correlation.dynamic_discovery import discover_correlations
+
+    discover_correlations(events)
+    return len(events)
+
+
+def _prepare_spans(events: list[dict[str, Any]]) -> list[Any]:
+    from itk.logs.parse import parse_cloudwatch_logs
+
+    return parse_cloudwatch_logs(events)
+
+
+def _stitch(spans: list[Any]) -> int:
+    from itk.correlation.stitch_graph import stitch_spans_multi_key
+
+    stitch_spans_multi_key(spans)
+    return len(spans)
+
+
+def _prepare_redact(events: list[dict[str, Any]]) -> tuple[Any, list[dict[str, Any]]]:
+    from itk.redaction import Redactor
+
+    return Redactor(), events
+
+
+def _redact(prepared: tuple[Any, list[dict[str, Any]]]) -> int:
+    redactor, events = prepared
+    for event in events:
+        redactor.redact_dict(event)
+    return len(events)
+
+
+def _render(traces: list[Any]) -> int:
+    from itk.diagrams.mermaid_seq import render_mermaid_sequence
+    from itk.diagrams.timeline_view import render_timeline_viewer
+    from itk.diagrams.trace_viewer import render_trace_viewer
+
+    for trace in traces:
+        render_trace_viewer(trace)
+        render_timeline_viewer(trace)
+        render_mermaid_sequence(trace)
+    return len(traces)
+
+
+def _compare(traces: list[Any]) -> int:
+    from itk.compare.compare import compare_trace_sets
+
+    half = len(traces) // 2
+    compare_trace_sets(traces[:half], traces[half:])
+    return len(traces)
+
+
+def _prepare_soak(events: list[dict[str, Any]]) -> list[list[dict[str, Any]]]:
+    from dataclasses import asdict
+
+    return [[asdict(span) for span in trace.spans] for trace in _traces(events)]
+
+
+def _soak(span_sets: list[list[dict[str, Any]]]) -> int:
+    from itk.soak import SoakConfig, SoakMode
+    from itk.soak.aggregates import SoakAggregates
+    from itk.soak.soak_runner import IterationResult, run_soak
+
+    if not span_sets:
+        return 0
+    aggregates = SoakAggregates(case_name="bench", mode=SoakMode.ITERATIONS.value)
+    # Rates high enough that the controller's pacing never sleeps meaningfully
+    config = SoakConfig(
+        mode=SoakMode.ITERATIONS,
+        iterations=len(span_sets),
+        initial_rate=1e9,
+        min_rate=1e9,
+        max_rate=1e9,
+    )
+
+    def run_iteration(i: int) -> IterationResult:
+        return IterationResult(passed=True, status="passed", spans=span_sets[i], duration_ms=1.0)
+
+    run_soak(config, run_iteration, on_iteration=aggregates.add_iteration)
+    return len(span_sets)
+
+
+def _identity(events: list[dict[str, Any]]) -> list[dict[str, Any]]:
+    return events
+
+
+BENCHMARKS: dict[str, tuple[str, Callable[[list[dict[str, Any]]], Any], Callable[[Any], int]]] = {
+    "parse": ("lines", _identity, _parse),
+    "correlate": ("lines", _identity, _correlate),
+    "stitch": ("spans", _prepare_spans, _stitch),
+    "redact": ("lines", _prepare_redact, _redact),
+    "render": ("traces", _traces, _render),
+    "compare": ("traces", _traces, _compare),
+    "soak": ("iterations", _prepare_soak, _soak),
+}
+
+
+def _windows(lines: int, seed: int, window_lines: int) -> Iterator[list[dict[str, Any]]]:
+    events = generate_log_lines(lines, seed)
+    while True:
+        window = list(islice(events, window_lines))
+        if not window:
+            return
+        yield window
+
+
+def peak_rss_mb() -> Optional[float]:
+    """Peak resident set size of this process, or None where unsupported."""
+    try:
+        import resource
+    except ImportError:  # Windows
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports KiB, macOS bytes
+    return peak / (1024 * 1024) if sys.platform == "darwin" else peak / 1024
+
+
+def run_benchmark(
+    name: str,
+    lines: int,
+    seed: int = DEFAULT_SEED,
+    repeat: int = DEFAULT_REPEAT,
+    window_lines: int = DEFAULT_WINDOW_LINES,
+) -> BenchmarkResult:
+    """Run one benchmark in this process.
+
+    Raises:
+        KeyError: If `name` is not a known benchmark
+    """
+    unit, prepare, operation = BENCHMARKS[name]
+    result = BenchmarkResult(name=name, unit=unit, items=0)
+    for _ in range(repeat):
+        items = 0
+        elapsed = 0.0
+        for window in _windows(lines, seed, window_lines):
+            prepared = prepare(window)
+            start = time.perf_counter()
+            items += operation(prepared)
+            took = time.perf_counter() - start
+            elapsed += took
+            result.window_ms.append(took * 1000)
+        result.items = items
+        result.run_seconds.append(elapsed)
+    result.peak_rss_mb = peak_rss_mb()
+    return result
+
+
+def _environment() -> dict[str, str]:
+    return {
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "machine": platform.machine(),
+    }
+
+
+def run_benchmarks(
+    lines: int,
+    seed: int = DEFAULT_SEED,
+    repeat: int = DEFAULT_REPEAT,
+    only: Optional[Iterable[str]] = None,
+    window_lines: int = DEFAULT_WINDOW_LINES,
+    isolate: bool = True,
+    on_result: Optional[Callable[[BenchmarkResult], None]] = None,
+) -> BenchReport:
+    """Run the selected benchmarks over a synthetic corpus.
+
+    Args:
+        lines: Corpus size in log lines
+        seed: Corpus seed
+        repeat: Full runs per benchmark
+        only: Benchmark names to run (default: all, in BENCHMARKS order)
+        window_lines: Lines per streamed window
+        isolate: Run each benchmark in a fresh process so peak RSS is its own
+        on_result: Called with each result as it completes
+
+    Raises:
+        ValueError: If `only` names an unknown benchmark
+    """
+    names = list(only) if only else list(BENCHMARKS)
+    unknown = [n for n in names if n not in BENCHMARKS]
+    if unknown:
+        raise ValueError(f"Unknown benchmark(s): {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})")
+
+    report = BenchReport(lines=lines, seed=seed, repeat=repeat, window_lines=window_lines, environment=_environment())
+    for name in names:
+        if isolate:
+            import multiprocessing
+
+            with ProcessPoolExecutor(max_workers=1, mp_context=multiprocessing.get_context("spawn")) as pool:
+                result = pool.submit(run_benchmark, name, lines, seed, repeat, window_lines).result()
+        else:
+            result = run_benchmark(name, lines, seed, repeat, window_lines)
+        report.results.append(result)
+        if on_result:
+            on_result(result)
+    return report
+
+
+def baseline_mismatch(baseline: dict[str, Any], lines: int, seed: int, window_lines: int) -> Optional[str]:
+    """Explain why a baseline isn't comparable with a run, or None if it is."""
+    for key, value in (("lines", lines), ("seed", seed), ("window_lines", window_lines)):
+        if baseline.get(key) != value:
+            return f"Baseline {key}={baseline.get(key)} does not match this run ({key}={value})"
+    return None
+
+
+def check_regressions(
+    report: BenchReport,
+    baseline: dict[str, Any],
+    tolerance: float = DEFAULT_TOLERANCE,
+) -> list[Regression]:
+    """Compare a report with a stored baseline report (as written by `write`).
+
+    Throughput may not drop, and p99 latency and peak RSS may not rise, by
+    more than `tolerance` (a fraction). Benchmarks missing from either side
+    are ignored.
+
+    Raises:
+        ValueError: If the baseline was recorded on a different corpus
+    """
+    mismatch = baseline_mismatch(baseline, report.lines, report.seed, report.window_lines)
+    if mismatch:
+        raise ValueError(mismatch)
+
+    previous = {r["name"]: r for r in baseline.get("results", [])}
+    regressions: list[Regression] = []
+    for result in report.results:
+        old = previous.get(result.name)
+        if not old:
+            continue
+        current = result.to_dict()
+        if old.get("throughput") and current["throughput"] < old["throughput"] * (1 - tolerance):
+            regressions.append(Regression(result.name, "throughput", old["throughput"], current["throughput"]))
+        for metric in ("p99_ms", "peak_rss_mb"):
+            if old.get(metric) and current[metric] is not None and current[metric] > old[metric] * (1 + tolerance):
+                regressions.append(Regression(result.name, metric, old[metric], current[metric]))
+    return regressions
@@ -1,13 +1,16 @@
 """Load and validate ITK case YAML files."""
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Optional
 
 import yaml
 
+from itk import perf
+from itk.utils.schema_cache import cached_parse, compiled_validator
+
 try:
     from jsonschema import Draft202012Validator, ValidationError
 except ImportError:
@@ -44,6 +47,7 @@ class CaseConfig:
     fixture_path: Optional[Path] = None  # Optional: path to fixture for offline mode
 
 
+@lru_cache(maxsize=1)
 def _find_schema_path() -> Optional[Path]:
     """Locate itk.case.schema.json relative to this file."""
     # Traverse upward to find schemas directory
@@ -64,16 +68,20 @@ def validate_case_against_schema(data: dict[str, Any]) -> list[str]:
     if schema_path is None:
         return ["Could not locate itk.case.schema.json"]
 
-    schema = json.loads(schema_path.read_text(encoding="utf-8"))
-    validator = Draft202012Validator(schema)
+    validator = compiled_validator(schema_path)
     errors: list[str] = []
     for error in validator.iter_errors(data):
         errors.append(f"{error.json_path}: {error.message}")
     return errors
 
 
+@perf.timed("load.case")
 def load_case(path: Path) -> CaseConfig:
     """Load a case YAML file and return a validated CaseConfig.
+
+    Parsed cases are cached per process and reused until the file (or the
+    case schema) changes, so repeated loads (one per soak iteration) cost a
+    stat call. The returned CaseConfig is shared and must not be mutated.
     
     Args:
         path: Path to the case YAML file
@@ -91,7 +99,11 @@ def load_case(path: Path) -> CaseConfig:
             f"To create a case file, see: docs/02-test-case-format.md\n"
             f"Or copy from: examples/example-001.yaml"
         )
-    
+    return cached_parse(path, _parse_case, kind="case", depends_on=_find_schema_path())
+
+
+def _parse_case(path: Path) -> CaseConfig:
+    """Read, validate and build a CaseConfig (uncached)."""
     try:
         text = path.read_text(encoding="utf-8")
     except UnicodeDecodeError as e:
@@ -4,21 +4,33 @@ import argparse
 import json
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, Callable, Optional
 
-from itk.assertions.invariants import run_invariants
-from itk.cases.loader import load_case
-from itk.config import Config, Mode, load_config, set_config
-from itk.diagrams.mermaid_seq import render_mermaid_sequence
-from itk.logs.parse import load_fixture_jsonl_as_spans, load_realistic_logs_as_spans, parse_cloudwatch_logs
-from itk.trace.build_trace import build_trace_from_spans
-from itk.trace.span_model import Span
-from itk.trace.trace_model import Trace
-from itk.utils.artifacts import (
-    write_run_artifacts,
-    write_audit_artifacts,
-    write_compare_artifacts,
-    disable_redaction,
-)
+# Keep this module cheap to import: `itk --help` and quick commands should not
+# pay for jsonschema, yaml or the renderers. Import heavy modules inside the
+# command functions that use them.
+if TYPE_CHECKING:
+    from datetime import datetime
+
+    from itk.aws.retry import RetryTelemetry
+    from itk.cases.loader import CaseConfig
+    from itk.config import Config
+    from itk.entrypoints.lambda_direct import LambdaDirectAdapter
+    from itk.entrypoints.sqs_event import SqsEventAdapter
+    from itk.perf import ProfileSession
+    from itk.trace.span_model import Span
+    from itk.trace.trace_model import Trace
+
+
+def load_case(path: Path) -> "CaseConfig":
+    """Load a case YAML file (see `itk.cases.loader.load_case`).
+
+    Wrapped so the loader and its schema dependencies are only imported when
+    a case is actually loaded.
+    """
+    from itk.cases.loader import load_case as _load_case
+
+    return _load_case(path)
 
 
 def _check_startup() -> None:
@@ -131,6 +143,10 @@ OUTPUT_FORMATS = ["all", "html", "mermaid", "json", "svg"]
 
 
 def _cmd_render_fixture(args: argparse.Namespace) -> int:
+    from itk.diagrams.mermaid_seq import render_mermaid_sequence
+    from itk.logs.parse import load_fixture_jsonl_as_spans
+    from itk.trace.build_trace import build_trace_from_spans
+    from itk.utils.artifacts import write_run_artifacts
     fixture_path = Path(args.fixture)
     out_dir = Path(args.out)
     output_format = getattr(args, "format", "all")
@@ -281,9 +297,9 @@ def _auto_discover_log_groups(region: str, agent_id: str | None = None) -> list[
     Returns up to 5 most relevant log groups.
     """
     try:
-        import boto3
+        from itk.aws import get_client
 
-        logs = boto3.client("logs", region_name=region)
+        logs = get_client("logs", region)
         paginator = logs.get_paginator("describe_log_groups")
 
         found: list[str] = []
@@ -356,12 +372,25 @@ def _run_live_mode(case_path: Path, config: Config) -> tuple[Trace, dict]:
         )
 
 
-def _run_bedrock_agent(case: "Case", config: Config) -> tuple[Trace, dict]:
+def _retry_summary(telemetry: "RetryTelemetry | None") -> dict | None:
+    """Print and serialize an adapter's client-side retry telemetry."""
+    if telemetry is None:
+        return None
+    if telemetry.client_retries:
+        print(
+            f"[live] Client retries: {telemetry.client_retries} "
+            f"(backoff {telemetry.total_delay_ms:.0f}ms, SDK retries: {telemetry.sdk_retries})"
+        )
+    return telemetry.to_dict()
+
+
+def _run_bedrock_agent(case: "CaseConfig", config: Config) -> tuple[Trace, dict]:
     """Run a Bedrock Agent invocation.
     
     Returns:
         Tuple of (trace, response_dict)
     """
+    from itk.trace.build_trace import build_trace_from_spans
     import os
     import time
     from datetime import datetime, timezone, timedelta
@@ -424,6 +453,13 @@ def _run_bedrock_agent(case: "Case", config: Config) -> tuple[Trace, dict]:
     
     print(f"[live] Response: {response.completion[:100]}...")
     print(f"[live] Traces captured: {len(response.traces)}")
+    timing = response.timing
+    if timing is not None:
+        ttft = f"{timing.ttft_ms:.0f}ms" if timing.ttft_ms is not None else "n/a"
+        print(
+            f"[live] TTFT: {ttft}, stream: {timing.total_ms:.0f}ms, "
+            f"{timing.chunk_count} chunks ({timing.chunk_bytes} bytes)"
+        )
     
     # Fetch CloudWatch logs
     spans = _fetch_cloudwatch_spans(config, region, start_time, end_time, agent_id)
@@ -435,9 +471,12 @@ def _run_bedrock_agent(case: "Case", config: Config) -> tuple[Trace, dict]:
     for i, raw_trace in enumerate(response.traces):
         raw_trace.setdefault("sessionId", response.session_id)
         raw_trace.setdefault("traceId", f"trace-{i:03d}")
+        if timing is not None:
+            # Order events by client arrival when Bedrock omits eventTime
+            raw_trace.setdefault("eventTime", timing.timestamp_at(timing.trace_offsets_ms[i]))
         trace_events.append(parse_bedrock_trace_event(raw_trace))
     
-    bedrock_spans = bedrock_traces_to_spans(trace_events, response.session_id)
+    bedrock_spans = bedrock_traces_to_spans(trace_events, response.session_id, client_timing=timing)
     print(f"[live] Converted {len(bedrock_spans)} spans from Bedrock traces")
     
     # Combine all spans
@@ -450,15 +489,21 @@ def _run_bedrock_agent(case: "Case", config: Config) -> tuple[Trace, dict]:
         "trace_count": len(response.traces),
         "start_time": start_time.isoformat(),
         "end_time": end_time.isoformat(),
+        "client_timing": timing.to_dict() if timing is not None else None,
+        "retry": _retry_summary(response.retry),
     }
 
 
-def _run_lambda_invoke(case: "Case", config: Config) -> tuple[Trace, dict]:
+def _run_lambda_invoke(case: "CaseConfig", config: Config) -> tuple[Trace, dict]:
     """Run a direct Lambda invocation.
     
+    With `entrypoint.target.fanout` set, fires async invocations at a fixed
+    rate instead (see `_run_lambda_fanout`).
+    
     Returns:
         Tuple of (trace, response_dict)
     """
+    from itk.trace.build_trace import build_trace_from_spans
     import os
     import time
     from datetime import datetime, timezone, timedelta
@@ -496,6 +541,9 @@ def _run_lambda_invoke(case: "Case", config: Config) -> tuple[Trace, dict]:
     
     adapter = LambdaDirectAdapter(target, offline=False)
     
+    if target_config.get("fanout"):
+        return _run_lambda_fanout(adapter, payload, target_config["fanout"], config, start_time)
+    
     print(f"[live] Invoking Lambda...")
     response = adapter.invoke(payload=payload)
     
@@ -518,20 +566,95 @@ def _run_lambda_invoke(case: "Case", config: Config) -> tuple[Trace, dict]:
         "payload": response.payload,
         "start_time": start_time.isoformat(),
         "end_time": end_time.isoformat(),
+        "retry": _retry_summary(response.retry),
+    }
+
+
+def _run_lambda_fanout(
+    adapter: "LambdaDirectAdapter",
+    payload: dict,
+    fanout_config: dict,
+    config: Config,
+    start_time: "datetime",
+) -> tuple[Trace, dict]:
+    """Fire async Lambda invocations and measure acceptance vs end-to-end latency.
+    
+    `fanout_config` keys: count (default 10), rate (per second), concurrency,
+    correlation_key, settle_seconds (wait before collecting logs, default 10).
+    """
+    from itk.trace.build_trace import build_trace_from_spans
+    from datetime import datetime, timezone
+    
+    from itk.entrypoints.lambda_fanout import (
+        DEFAULT_CORRELATION_KEY,
+        DEFAULT_FANOUT_CONCURRENCY,
+        DEFAULT_FANOUT_RATE,
+        LambdaFanout,
+    )
+    
+    fanout = LambdaFanout(
+        adapter,
+        rate_per_second=float(fanout_config.get("rate", DEFAULT_FANOUT_RATE)),
+        concurrency=int(fanout_config.get("concurrency", DEFAULT_FANOUT_CONCURRENCY)),
+        correlation_key=fanout_config.get("correlation_key", DEFAULT_CORRELATION_KEY),
+    )
+    count = int(fanout_config.get("count", 10))
+    print(f"[live] Fan-out: {count} async invocations at {fanout.rate_per_second:g}/s...")
+    result = fanout.fire(payload, count)
+    accept = result.acceptance_latency()
+    print(
+        f"[live] Accepted {len(result.accepted)}/{count} "
+        f"(p50 {accept.p50_ms:.0f}ms, p99 {accept.p99_ms:.0f}ms, {result.achieved_rate:.1f}/s)"
+    )
+    
+    log_groups = list(config.targets.log_groups or [])
+    if log_groups:
+        settle = float(fanout_config.get("settle_seconds", 10))
+        print(f"[live] Waiting {settle:g}s, then collecting completions from {log_groups}")
+        fanout.collect(result, log_groups, settle_seconds=settle)
+        e2e = result.end_to_end_latency()
+        print(
+            f"[live] Completed {len(result.completed)}/{count} "
+            f"(end-to-end p50 {e2e.p50_ms:.0f}ms, p99 {e2e.p99_ms:.0f}ms)"
+        )
+        if result.collect_truncated:
+            print("[live] ⚠️  Log query hit its row limit; some completions are missing")
+    else:
+        print("[live] ⚠️  No log groups configured, skipping end-to-end latency")
+    end_time = datetime.now(timezone.utc)
+    
+    # Spans for the trace come from the same window as a single invocation
+    spans = _fetch_cloudwatch_spans(config, adapter._target.region, start_time, end_time)
+    trace = build_trace_from_spans(spans)
+    
+    return trace, {
+        "fanout": result.to_dict(),
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
     }
 
 
-def _run_sqs_event(case: "Case", config: Config) -> tuple[Trace, dict]:
+def _run_sqs_event(case: "CaseConfig", config: Config) -> tuple[Trace, dict]:
     """Run an SQS event (publish to SQS or invoke Lambda with SQS shape).
     
+    In publish_sqs mode, multi-record events (or targets with `repeat`) are
+    published with batched, concurrent SendMessageBatch calls; the resulting
+    message IDs seed the trace so consumer logs correlate to the replay.
+    
     Returns:
         Tuple of (trace, response_dict)
     """
+    from itk.trace.build_trace import build_trace_from_spans
     import os
     import time
     from datetime import datetime, timezone, timedelta
     
-    from itk.entrypoints.sqs_event import SqsEventAdapter, SqsEventTarget, SqsPublishResult, LambdaInvokeResult
+    from itk.entrypoints.sqs_event import (
+        DEFAULT_BATCH_CONCURRENCY,
+        SqsEventAdapter,
+        SqsEventTarget,
+        SqsPublishResult,
+    )
     
     entrypoint = case.entrypoint
     target_config = entrypoint.target or {}
@@ -561,6 +684,18 @@ def _run_sqs_event(case: "Case", config: Config) -> tuple[Trace, dict]:
     
     adapter = SqsEventAdapter(target, offline=False)
     
+    repeat = int(target_config.get("repeat", 1))
+    if mode == "publish_sqs" and (len(payload.get("Records") or []) > 1 or repeat > 1):
+        return _run_sqs_batch(
+            adapter,
+            payload,
+            config,
+            region,
+            start_time,
+            repeat=repeat,
+            concurrency=int(target_config.get("batch_concurrency", DEFAULT_BATCH_CONCURRENCY)),
+        )
+    
     print(f"[live] Replaying SQS event...")
     response = adapter.replay(payload=payload)
     
@@ -593,6 +728,50 @@ def _run_sqs_event(case: "Case", config: Config) -> tuple[Trace, dict]:
         **response_dict,
         "start_time": start_time.isoformat(),
         "end_time": end_time.isoformat(),
+        "retry": _retry_summary(response.retry),
+    }
+
+
+def _run_sqs_batch(
+    adapter: "SqsEventAdapter",
+    payload: dict,
+    config: Config,
+    region: str,
+    start_time: "datetime",
+    *,
+    repeat: int,
+    concurrency: int,
+) -> tuple[Trace, dict]:
+    """Publish all records of an SQS event in batches and build the trace."""
+    from itk.trace.build_trace import build_trace_from_spans
+    import uuid
+    from datetime import datetime, timezone
+    
+    itk_trace_id = f"itk-{uuid.uuid4()}"
+    print(f"[live] Replaying SQS records in batches (concurrency {concurrency})...")
+    result = adapter.replay_batch(
+        payload, itk_trace_id=itk_trace_id, repeat=repeat, concurrency=concurrency
+    )
+    end_time = datetime.now(timezone.utc)
+    
+    print(
+        f"[live] Sent {result.sent_count}/{len(result.records)} messages in "
+        f"{result.batch_count} batches ({result.messages_per_second:.0f} msg/s)"
+    )
+    retry = _retry_summary(result.retry)
+    if result.failed:
+        print(f"[live] ⚠️  {len(result.failed)} messages failed (first: {result.failed[0].error_code})")
+    
+    spans = result.seed_spans() + _fetch_cloudwatch_spans(config, region, start_time, end_time)
+    trace = build_trace_from_spans(spans)
+    
+    return trace, {
+        "message_ids": result.message_ids,
+        "itk_trace_id": itk_trace_id,
+        "batch": result.to_dict(),
+        "retry": retry,
+        "start_time": start_time.isoformat(),
+        "end_time": end_time.isoformat(),
     }
 
 
@@ -615,6 +794,7 @@ def _fetch_cloudwatch_spans(
     Returns:
         List of parsed spans
     """
+    from itk.logs.parse import parse_cloudwatch_logs
     import time
     from datetime import timedelta
     
@@ -666,6 +846,13 @@ def _cmd_run(args: argparse.Namespace) -> int:
     In dev-fixtures mode: load fixture, build trace, emit artifacts.
     In live mode (Tier 3): replay entrypoint, pull logs, build trace, emit artifacts.
     """
+    from itk import perf
+    from itk.config import load_config, set_config
+    from itk.assertions.invariants import run_invariants
+    from itk.diagrams.mermaid_seq import render_mermaid_sequence
+    from itk.logs.parse import load_fixture_jsonl_as_spans
+    from itk.trace.build_trace import build_trace_from_spans
+    from itk.utils.artifacts import disable_redaction, write_run_artifacts
     case_path = Path(args.case)
     out_dir = Path(args.out)
     no_redact = getattr(args, "no_redact", False)
@@ -729,7 +916,8 @@ def _cmd_run(args: argparse.Namespace) -> int:
         
         # Live mode: invoke agent, fetch logs, build trace
         try:
-            trace, agent_response = _run_live_mode(case_path, config)
+            with perf.stage("load.live"):
+                trace, agent_response = _run_live_mode(case_path, config)
             
             # Write agent response to artifacts
             out_dir.mkdir(parents=True, exist_ok=True)
@@ -751,7 +939,7 @@ def _cmd_run(args: argparse.Namespace) -> int:
             return 1
 
     # Run invariant checks
-    invariant_results = run_invariants(trace)
+    invariant_results = run_invariants(trace, extra=case.invariants)
 
     # Render mermaid
     mermaid = render_mermaid_sequence(trace)
@@ -765,6 +953,8 @@ def _cmd_run(args: argparse.Namespace) -> int:
         invariant_results=invariant_results,
         agent_response=agent_response,
         mode=effective_mode,
+        render_workers=getattr(args, "render_workers", 0),
+        pack_payloads=getattr(args, "pack_payloads", False),
     )
 
     # Report summary
@@ -1034,6 +1224,8 @@ def _build_case_from_chain(
 
 def _derive_from_cloudwatch(args) -> int:
     """Legacy mode: fetch from CloudWatch and derive."""
+    from itk.config import load_config, set_config
+    from itk.logs.parse import parse_cloudwatch_logs
     import os
     import yaml
     from datetime import datetime, timezone, timedelta
@@ -1193,6 +1385,10 @@ def _cmd_audit(args: argparse.Namespace) -> int:
     In dev-fixtures mode: analyze fixture spans for missing fields.
     In live mode (Tier 3): pull logs and analyze.
     """
+    from itk.config import load_config, set_config
+    from itk.logs.parse import load_fixture_jsonl_as_spans
+    from itk.trace.build_trace import build_trace_from_spans
+    from itk.utils.artifacts import write_audit_artifacts
     case_path = Path(args.case)
     out_dir = Path(args.out)
 
@@ -1239,69 +1435,187 @@ def _cmd_audit(args: argparse.Namespace) -> int:
     return 0
 
 
+def _load_run_spans(run_dir: Path) -> list[Span]:
+    """Load spans.jsonl from a run artifacts directory."""
+    from itk.trace.span_model import Span
+    spans: list[Span] = []
+    for line in (run_dir / "spans.jsonl").read_text(encoding="utf-8").splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        spans.append(Span(**json.loads(line)))
+    return spans
+
+
+def _split_executions(spans: list[Span]) -> list[Trace]:
+    """Split a run's spans into one trace per execution."""
+    from itk.trace.trace_model import Trace
+    from itk.report.historical_viewer import group_spans_by_execution
+
+    groups, orphans = group_spans_by_execution(spans)
+    traces = [Trace(spans=group) for group in groups.values()]
+    if orphans:
+        traces.append(Trace(spans=orphans))
+    return traces
+
+
+def _load_run_or_suite(run_dir: Path) -> Optional[tuple[list[Trace], Optional[list[str]]]]:
+    """Load traces from run artifacts or a suite output directory.
+
+    A run directory (spans.jsonl at its root) gives one trace per execution.
+    A suite output directory gives one trace per case directory, the same
+    way `itk suite --record-baseline` records them, along with the case IDs.
+
+    Returns:
+        (traces, case IDs or None for a run directory), or None if the
+        directory holds neither.
+    """
+    from itk.trace.trace_model import Trace
+
+    if (run_dir / "spans.jsonl").exists():
+        return _split_executions(_load_run_spans(run_dir)), None
+    case_dirs = sorted(p.parent for p in run_dir.glob("*/spans.jsonl"))
+    if not case_dirs:
+        return None
+    return [Trace(spans=_load_run_spans(d)) for d in case_dirs], [d.name for d in case_dirs]
+
+
 def _cmd_compare(args: argparse.Namespace) -> int:
     """Compare two run outputs and produce a delta report.
 
     Loads spans.jsonl from both directories and compares path signatures,
-    latencies, and error rates.
+    latencies, and error rates. When a run holds several executions they
+    are compared as trace sets, with latency percentiles and bootstrap
+    confidence intervals per path. Either side may be a suite output
+    directory, compared as one trace per case. With --baseline, the current
+    run is compared against a recorded baseline store instead of --a.
     """
-    dir_a = Path(args.a)
-    dir_b = Path(args.b)
-    out_dir = Path(args.out)
-
-    # Load spans from both directories
-    spans_a_path = dir_a / "spans.jsonl"
-    spans_b_path = dir_b / "spans.jsonl"
-
-    if not spans_a_path.exists():
-        print(f"ERROR: spans.jsonl not found in {dir_a}", file=sys.stderr)
+    from itk.trace.trace_model import Trace
+    from itk.utils.artifacts import write_compare_artifacts
+    baseline_name = getattr(args, "baseline", None)
+    if bool(args.a) == bool(baseline_name):
+        print("ERROR: Specify exactly one of --a or --baseline", file=sys.stderr)
         return 1
 
-    if not spans_b_path.exists():
-        print(f"ERROR: spans.jsonl not found in {dir_b}", file=sys.stderr)
-        return 1
+    dir_b = Path(args.b)
+    out_dir = Path(args.out)
 
-    # Load and build traces
-    def load_spans_jsonl(path: Path) -> list[Span]:
-        spans: list[Span] = []
-        for line in path.read_text(encoding="utf-8").splitlines():
-            line = line.strip()
-            if not line:
-                continue
-            data = json.loads(line)
-            spans.append(Span(**data))
-        return spans
+    loaded: dict[str, tuple[list[Trace], Optional[list[str]]]] = {}
+    for run_dir in filter(None, (args.a, args.b)):
+        result = _load_run_or_suite(Path(run_dir))
+        if result is None:
+            print(f"ERROR: spans.jsonl not found in {run_dir} or its case directories", file=sys.stderr)
+            return 1
+        loaded[run_dir] = result
 
-    spans_a = load_spans_jsonl(spans_a_path)
-    spans_b = load_spans_jsonl(spans_b_path)
+    from itk.compare.compare import compare_to_baseline, compare_trace_sets, compare_traces
 
-    trace_a = Trace(spans=spans_a)
-    trace_b = Trace(spans=spans_b)
+    traces_b, cases_b = loaded[args.b]
 
     # Compare
-    from itk.compare.compare import compare_traces
+    if baseline_name:
+        from itk.compare.baseline_store import BaselineStore
 
-    result = compare_traces(
-        baseline=trace_a,
-        current=trace_b,
-        baseline_label=str(dir_a),
-        current_label=str(dir_b),
-    )
+        baseline_dir = Path(args.baseline_dir)
+        if not (baseline_dir / f"{baseline_name}.db").exists():
+            print(f"ERROR: Baseline not found: {baseline_dir / baseline_name}.db", file=sys.stderr)
+            return 1
+        last_n = getattr(args, "last", None)
+        with BaselineStore.open(baseline_name, root=baseline_dir) as store:
+            baseline = store.load(last_n=last_n)
+        baseline_label = f"baseline:{baseline_name}" + (f" (last {last_n} runs)" if last_n else "")
+        if cases_b is None and any(dir_b.name in path.cases for path in baseline.values()):
+            # One case directory of a suite output: load it the way suites record cases
+            traces_b, cases_b = [Trace(spans=_load_run_spans(dir_b))], [dir_b.name]
+        result = compare_to_baseline(
+            baseline,
+            traces_b,
+            baseline_label=baseline_label,
+            current_label=str(dir_b),
+            confidence=args.confidence,
+            bootstrap_resamples=args.bootstrap,
+            match_distance=args.match_distance,
+            current_cases=cases_b,
+        )
+    else:
+        baseline_label = str(args.a)
+        traces_a, _ = loaded[args.a]
+        if len(traces_a) > 1 or len(traces_b) > 1:
+            result = compare_trace_sets(
+                traces_a,
+                traces_b,
+                baseline_label=baseline_label,
+                current_label=str(dir_b),
+                confidence=args.confidence,
+                bootstrap_resamples=args.bootstrap,
+                match_distance=args.match_distance,
+            )
+        else:
+            result = compare_traces(
+                baseline=Trace(spans=[s for t in traces_a for s in t.spans]),
+                current=Trace(spans=[s for t in traces_b for s in t.spans]),
+                baseline_label=baseline_label,
+                current_label=str(dir_b),
+                match_distance=args.match_distance,
+            )
 
     # Write artifacts
     write_compare_artifacts(out_dir=out_dir, result=result)
 
     # Report summary
-    print(f"Baseline: {dir_a}")
+    print(f"Baseline: {baseline_label}")
     print(f"Current: {dir_b}")
     print(f"New paths: {len(result.new_paths)}")
     print(f"Missing paths: {len(result.missing_paths)}")
+    if result.path_matches:
+        print(f"Changed paths (near matches): {len(result.path_matches)}")
+    print(f"Latency regressions: {len(result.latency_regressions)}")
     print(f"Regressions: {'YES' if result.has_regressions else 'NO'}")
     print(f"Comparison artifacts: {out_dir}")
 
     return 1 if result.has_regressions else 0
 
 
+def _cmd_record_baseline(args: argparse.Namespace) -> int:
+    """Record run artifacts into a persistent baseline store."""
+    from itk.compare.baseline_store import BaselineStore, PathAggregator
+
+    aggregate = PathAggregator()
+    for run in args.run:
+        loaded = _load_run_or_suite(Path(run))
+        if loaded is None:
+            print(f"ERROR: spans.jsonl not found in {run} or its case directories", file=sys.stderr)
+            return 1
+        traces, case_ids = loaded
+        for i, trace in enumerate(traces):
+            aggregate.add(trace, case_ids[i] if case_ids else None)
+
+    label = args.label or ", ".join(args.run)
+    with BaselineStore.open(args.name, root=Path(args.baseline_dir)) as store:
+        run_id = store.record(aggregate, label=label, keep_runs=args.keep)
+        runs = store.runs()
+
+    print(f"Baseline: {store.path}")
+    print(f"Recorded run {run_id}: {aggregate.trace_count} trace(s), {len(aggregate.paths)} path(s)")
+    print(f"Runs stored: {len(runs)}")
+    return 0
+
+
+def _record_baseline(
+    name: str,
+    baseline_dir: Path,
+    traces: list[Trace],
+    label: str,
+    case_ids: Optional[list[str]] = None,
+) -> None:
+    """Append a suite/soak run to a baseline store and report where."""
+    from itk.compare.baseline_store import BaselineStore
+
+    with BaselineStore.open(name, root=baseline_dir) as store:
+        run_id = store.record_run(traces, label=label, case_ids=case_ids)
+    print(f"Baseline: recorded run {run_id} in {store.path}")
+
+
 def _cmd_generate_fixture(args: argparse.Namespace) -> int:
     """Generate a JSONL fixture from a YAML definition."""
     yaml_path = Path(args.definition)
@@ -1324,7 +1638,8 @@ def _cmd_generate_fixture(args: argparse.Namespace) -> int:
 
 def _cmd_validate(args: argparse.Namespace) -> int:
     """Validate case YAML or fixture JSONL against schemas."""
-    from itk.validation import validate_case, validate_fixture
+    from itk.validation import validate_case
+    from itk.validation.streaming import validate_fixture_stream
 
     results = []
 
@@ -1338,7 +1653,11 @@ def _cmd_validate(args: argparse.Namespace) -> int:
     # Validate fixture files
     fixture_paths = getattr(args, "fixture", None) or []
     for fixture_path in fixture_paths:
-        result = validate_fixture(fixture_path)
+        result = validate_fixture_stream(
+            fixture_path,
+            workers=getattr(args, "workers", None),
+            max_errors=getattr(args, "max_errors", None),
+        )
         results.append(result)
         print(result.summary())
 
@@ -1560,6 +1879,8 @@ def _cmd_scan(args: argparse.Namespace) -> int:
         generate_coverage_report,
         generate_skeleton_cases,
     )
+    from itk.scanner.cache import DEFAULT_SCAN_CACHE_DIR
+    import os
 
     repo_path = Path(args.repo)
     out_dir = Path(args.out)
@@ -1591,7 +1912,15 @@ def _cmd_scan(args: argparse.Namespace) -> int:
     print()
 
     # Scan the codebase
-    result = scan_codebase(repo_path)
+    cache_dir = None if args.no_cache else Path(args.cache_dir or DEFAULT_SCAN_CACHE_DIR)
+    result = scan_codebase(
+        repo_path,
+        workers=args.workers or os.cpu_count() or 1,
+        cache_dir=cache_dir,
+    )
+    if cache_dir is not None:
+        print(f"Reused cached results for {result.cached_files}/{result.scanned_files} files")
+        print()
 
     print(f"Found {len(result.components)} components:")
     for comp in result.components:
@@ -1704,8 +2033,11 @@ def _cmd_scan(args: argparse.Namespace) -> int:
 
 def _cmd_suite(args: argparse.Namespace) -> int:
     """Run a test suite and generate consolidated report."""
+    from itk.config import load_config, set_config
+    from itk.trace.trace_model import Trace
     from itk.report.suite_runner import run_suite
     from itk.report.hierarchical_report import write_hierarchical_report
+    from itk.utils.render_cache import RenderCache
 
     cases_dir = Path(args.cases_dir)
     out_dir = Path(args.out)
@@ -1738,12 +2070,15 @@ def _cmd_suite(args: argparse.Namespace) -> int:
         print(f"  {status_icon} {result.case_id} ({result.duration_ms:.0f}ms)")
 
     # Run suite
+    render_cache = RenderCache(force=getattr(args, "force_render", False))
     suite = run_suite(
         cases_dir=cases_dir,
         out_dir=out_dir,
         suite_name=suite_name,
         on_case_complete=on_case_complete,
+        render_cache=render_cache,
     )
+    render_cache.flush()
 
     # Write report (use hierarchical by default, flat with --flat flag)
     if use_flat_report:
@@ -1757,16 +2092,34 @@ def _cmd_suite(args: argparse.Namespace) -> int:
     print(f"Suite: {suite.suite_name}")
     print(f"Results: {suite.passed_count}/{suite.total_cases} passed ({suite.pass_rate:.0f}%)")
     print(f"Duration: {suite.duration_ms:.0f}ms")
+    if suite.rendered_count:
+        print(
+            f"Render cache: {suite.render_cache_hits}/{suite.rendered_count} hits "
+            f"({suite.render_cache_hit_rate:.0f}%)"
+        )
     print(f"Report: {out_dir / 'index.html'}")
 
+    baseline_name = getattr(args, "record_baseline", None)
+    if baseline_name:
+        recorded = [case for case in suite.cases if case.spans]
+        _record_baseline(
+            baseline_name,
+            Path(args.baseline_dir),
+            [Trace(spans=case.spans) for case in recorded],
+            label=suite.suite_name,
+            case_ids=[case.case_id for case in recorded],
+        )
+
     return 0 if suite.all_passed else 1
 
 
 def _cmd_soak(args: argparse.Namespace) -> int:
     """Run a soak/endurance test with adaptive rate control."""
+    from itk.config import load_config, set_config
+    from itk.trace.trace_model import Trace
     from itk.soak import SoakConfig, SoakMode
     from itk.soak.soak_runner import run_soak_with_case
-    from itk.soak.soak_report import write_soak_report
+    from itk.soak.soak_report import LiveSoakReport
 
     case_path = Path(args.case)
     out_dir = Path(args.out)
@@ -1815,6 +2168,21 @@ def _cmd_soak(args: argparse.Namespace) -> int:
     print(f"Mode: {soak_mode.value} ({duration}s)" if duration else f"Mode: {soak_mode.value} ({iterations} iterations)")
     print(f"Initial rate: {initial_rate} req/s")
     print(f"Detailed: {'yes (per-iteration artifacts)' if detailed else 'no (summary only)'}")
+
+    # Baseline recording reads each iteration's spans.jsonl, so needs detailed mode
+    baseline_name = getattr(args, "record_baseline", None)
+    baseline_paths = None
+    if baseline_name:
+        if detailed:
+            from itk.compare.baseline_store import PathAggregator
+
+            baseline_paths = PathAggregator()
+        else:
+            print("WARNING: --record-baseline needs per-iteration artifacts; ignored with --summary-only")
+
+    # Live report: written once up front, then progress.json and progress.js are updated per iteration
+    live = LiveSoakReport(out_dir, case_name=case_path.stem, mode=soak_mode.value)
+    print(f"Live report: {live.start()}")
     print()
 
     # Progress callback with status icons (ASCII-safe for Windows)
@@ -1828,7 +2196,14 @@ def _cmd_soak(args: argparse.Namespace) -> int:
         icon = status_icons.get(iteration.status, "[????]")
         throttle = " [THROTTLE]" if iteration.throttle_events else ""
         retry_info = f" (retries: {iteration.retry_count})" if iteration.retry_count > 0 else ""
+        if iteration.client_retry_count:
+            retry_info += f" (client retries: {iteration.client_retry_count})"
         print(f"  {icon} Iteration {iteration.iteration}: {iteration.duration_ms:.0f}ms{retry_info}{throttle}")
+        live.add_iteration(iteration)
+        if baseline_paths is not None and iteration.artifacts_dir:
+            iteration_dir = Path(iteration.artifacts_dir)
+            if (iteration_dir / "spans.jsonl").exists():
+                baseline_paths.add(Trace(spans=_load_run_spans(iteration_dir)))
 
     # Run soak
     result = run_soak_with_case(
@@ -1838,10 +2213,11 @@ def _cmd_soak(args: argparse.Namespace) -> int:
         mode=config.mode.value,
         detailed=detailed,
         on_iteration=on_iteration,
+        on_rate_change=live.add_rate_change,
     )
 
-    # Write report
-    report_path = write_soak_report(result, out_dir)
+    # Write final report
+    report_path = live.finish(result)
 
     # Summary with consistency metrics
     print()
@@ -1851,14 +2227,145 @@ def _cmd_soak(args: argparse.Namespace) -> int:
     print(f"Consistency: {result.consistency_score * 100:.1f}% (clean passes / total passes)")
     print(f"  Clean: {result.total_clean_passes} | Warnings: {result.total_warnings} | Failed: {result.total_failures}")
     print(f"Retries: {result.total_retries} total (avg {result.avg_retries_per_iteration:.1f}/iter, max {result.max_retries})")
+    print(f"Client retries: {result.total_client_retries} (ITK adapter backoff, not counted above)")
     print(f"Throttle events: {len(result.all_throttle_events)}")
     print(f"Final rate: {result.final_rate:.2f} req/s")
     print(f"Report: {report_path}")
 
+    if baseline_paths is not None:
+        from itk.compare.baseline_store import BaselineStore
+
+        with BaselineStore.open(baseline_name, root=Path(args.baseline_dir)) as store:
+            run_id = store.record(baseline_paths, label=result.soak_id)
+        print(f"Baseline: recorded run {run_id} in {store.path}")
+
     # Return 0 if pass rate is acceptable (>90%)
     return 0 if result.pass_rate >= 0.9 else 1
 
 
+def _cmd_stubs(args: argparse.Namespace) -> int:
+    """Run the local AWS stand-in server until interrupted."""
+    from itk.stubs import ServiceBehavior, StubConfig, StubServer
+    
+    consumers: dict[str, str] = {}
+    for mapping in args.consumers or []:
+        queue, sep, function = mapping.partition("=")
+        if not sep or not queue or not function:
+            print(f"ERROR: --consumer expects QUEUE=FUNCTION, got {mapping!r}", file=sys.stderr)
+            return 1
+        consumers[queue] = function
+    
+    config = StubConfig(
+        default=ServiceBehavior(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            throttle_rate=args.throttle_rate,
+            throttle_every=args.throttle_every,
+        ),
+        seed=args.seed,
+        emit_logs=not args.no_logs,
+        chunk_delay_ms=args.chunk_delay_ms,
+        trace_steps=args.trace_steps,
+        lambda_duration_ms=args.lambda_duration_ms,
+        sqs_consumers=consumers,
+    )
+    server = StubServer(config, host=args.host, port=args.port)
+    
+    print(f"🧪 ITK stub AWS endpoint on {server.url}")
+    print("   Emulates: bedrock-agent-runtime InvokeAgent, lambda Invoke, sqs SendMessage[Batch], logs")
+    print("   Preflight: sts GetCallerIdentity, bedrock-agent GetAgent")
+    print("   Point live mode at it:")
+    for key, value in server.environ(args.region).items():
+        print(f"     export {key}={value}")
+    print("   Log groups exist once the stub has written to them; until then a")
+    print("   preflight with ITK_LOG_GROUPS set fails (use --skip-preflight)")
+    print(f"   Stats: {server.url}/_stub/stats")
+    print("   Press Ctrl+C to stop")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\nStopping stub server")
+    finally:
+        server.stop()
+    return 0
+
+
+def _cmd_bench(args: argparse.Namespace) -> int:
+    """Run the built-in benchmarks over a synthetic corpus."""
+    import json
+    
+    from itk.bench import (
+        BENCHMARKS,
+        SIZE_PRESETS,
+        baseline_mismatch,
+        check_regressions,
+        run_benchmarks,
+        write_corpus,
+    )
+    
+    lines = args.lines if args.lines else SIZE_PRESETS[args.size]
+    
+    if args.write_corpus:
+        path = Path(args.write_corpus)
+        written = write_corpus(path, lines, seed=args.seed)
+        print(f"📝 Wrote {lines:,} lines ({written / 1e6:.1f} MB) to {path}")
+        return 0
+    
+    only = [n.strip() for n in args.only.split(",") if n.strip()] if args.only else None
+    unknown = [n for n in only or [] if n not in BENCHMARKS]
+    if unknown:
+        print(f"ERROR: Unknown benchmark(s): {', '.join(unknown)} (choose from {', '.join(BENCHMARKS)})", file=sys.stderr)
+        return 1
+    
+    baseline = None
+    if args.baseline:
+        baseline_path = Path(args.baseline)
+        if not baseline_path.exists():
+            print(f"ERROR: Baseline not found: {baseline_path}", file=sys.stderr)
+            return 1
+        baseline = json.loads(baseline_path.read_text(encoding="utf-8"))
+        mismatch = baseline_mismatch(baseline, lines, args.seed, args.window)
+        if mismatch:
+            print(f"ERROR: {mismatch}", file=sys.stderr)
+            return 1
+    
+    print(f"⏱️  Benchmarking {lines:,} synthetic lines (seed {args.seed}, {args.repeat} run(s), window {args.window:,})")
+    print(f"   {'benchmark':<10} {'items':>10} {'throughput/s':>14} {'p50 ms':>10} {'p99 ms':>10} {'peak RSS MB':>12}")
+    
+    def show(result) -> None:
+        rss = f"{result.peak_rss_mb:.1f}" if result.peak_rss_mb is not None else "-"
+        print(
+            f"   {result.name:<10} {result.items:>10,} {result.throughput:>14,.1f} "
+            f"{result.p50_ms:>10.2f} {result.p99_ms:>10.2f} {rss:>12}"
+        )
+    
+    report = run_benchmarks(
+        lines,
+        seed=args.seed,
+        repeat=args.repeat,
+        only=only,
+        window_lines=args.window,
+        isolate=not args.no_isolate,
+        on_result=show,
+    )
+    
+    if args.out:
+        out_path = Path(args.out)
+        report.write(out_path)
+        print(f"📄 Results: {out_path}")
+    
+    if baseline is None:
+        return 0
+    regressions = check_regressions(report, baseline, tolerance=args.tolerance)
+    if regressions:
+        print(f"❌ {len(regressions)} regression(s) beyond {args.tolerance:.0%} of baseline:")
+        for r in regressions:
+            print(f"   {r.benchmark} {r.metric}: {r.baseline:,.2f} → {r.current:,.2f} ({r.change_pct:+.1f}%)")
+        return 1
+    print(f"✅ No regressions beyond {args.tolerance:.0%} of baseline")
+    return 0
+
+
 def _cmd_serve(args: argparse.Namespace) -> int:
     """Serve artifacts directory with live reload."""
     import http.server
@@ -2307,6 +2814,11 @@ def _cmd_discover(args: argparse.Namespace) -> int:
             
             discovered["bedrock_agents"].append(agent_info)
         print(f"   Found {len(discovered['bedrock_agents'])} agents")
+
+        # Versions may have been prepared since the last live run resolved them
+        from itk.entrypoints.version_resolver import get_resolution_cache
+
+        get_resolution_cache().invalidate(region=region)
     except Exception as e:
         err = str(e)
         if "AccessDenied" in err or "not authorized" in err.lower():
@@ -2508,20 +3020,31 @@ def _cmd_view(args: argparse.Namespace) -> int:
     Fetches logs for a time window, groups by execution (trace_id/session_id),
     and generates browsable artifacts including a gallery page.
     """
+    from itk.config import load_config
+    from itk.logs.parse import parse_cloudwatch_logs
+    from itk.trace.build_trace import build_trace_from_spans
     import os
     from datetime import datetime, timezone, timedelta
     
     from itk.report.historical_viewer import (
+        DEFAULT_GALLERY_PAGE_SIZE,
         ViewResult,
         group_spans_by_execution,
         build_execution_summary,
         filter_executions,
-        render_gallery_html,
+        select_executions_to_render,
+        stream_gallery_html,
+        stream_sharded_gallery_html,
+        write_gallery_index,
         load_logs_from_file,
         fetch_logs_for_time_window,
     )
     from itk.diagrams.trace_viewer import render_trace_viewer
     from itk.diagrams.timeline_view import render_timeline_viewer, render_mini_timeline
+    from itk.utils.html_stream import stream_to_file
+    from itk.utils.render_cache import RenderCache, trace_fingerprint
+    from itk.utils.write_pipeline import atomic_write_text
+    from dataclasses import asdict
     
     # Parse args
     since = args.since
@@ -2532,6 +3055,10 @@ def _cmd_view(args: argparse.Namespace) -> int:
     log_groups_arg = getattr(args, "log_groups", None)
     region = getattr(args, "region", None) or os.environ.get("AWS_REGION", "us-east-1")
     profile = getattr(args, "profile", None)
+    top = getattr(args, "top", None)
+    # --top only makes sense when rendering a subset, so it implies lazy
+    render_mode = getattr(args, "render", None) or ("lazy" if top is not None else "all")
+    page_size = getattr(args, "page_size", None) or DEFAULT_GALLERY_PAGE_SIZE
     
     print("ITK View - Historical Execution Viewer")
     print("=" * 40)
@@ -2644,43 +3171,10 @@ def _cmd_view(args: argparse.Namespace) -> int:
     # Create output directory
     out_dir.mkdir(parents=True, exist_ok=True)
     
-    # Process each execution
-    print()
-    print("Generating artifacts...")
-    
+    # Summarize every execution (cheap) before deciding what to render
     execution_summaries = []
-    
     for exec_id, exec_spans in groups.items():
-        # Create execution subdirectory
         short_id = exec_id[:12] if len(exec_id) > 12 else exec_id
-        exec_dir = out_dir / short_id
-        exec_dir.mkdir(exist_ok=True)
-        
-        # Build trace
-        trace = build_trace_from_spans(exec_spans)
-        
-        # Render trace viewer
-        viewer_html = render_trace_viewer(trace)
-        (exec_dir / "trace-viewer.html").write_text(viewer_html, encoding="utf-8")
-        
-        # Render timeline
-        timeline_html = render_timeline_viewer(trace)
-        (exec_dir / "timeline.html").write_text(timeline_html, encoding="utf-8")
-        
-        # Render thumbnail
-        try:
-            thumbnail_svg = render_mini_timeline(trace)
-            (exec_dir / "thumbnail.svg").write_text(thumbnail_svg, encoding="utf-8")
-        except Exception:
-            pass  # Thumbnail is optional
-        
-        # Write spans.jsonl
-        from dataclasses import asdict
-        with (exec_dir / "spans.jsonl").open("w", encoding="utf-8") as f:
-            for span in exec_spans:
-                f.write(json.dumps(asdict(span), ensure_ascii=False) + "\n")
-        
-        # Build summary
         summary = build_execution_summary(
             exec_id=exec_id,
             spans=exec_spans,
@@ -2694,7 +3188,56 @@ def _cmd_view(args: argparse.Namespace) -> int:
     # Apply filter
     filtered = filter_executions(execution_summaries, filter_type)
     
-    print(f"  Generated artifacts for {len(execution_summaries)} executions")
+    # Lazy mode renders detail pages only for the filtered/top subset
+    if render_mode == "lazy":
+        to_render = select_executions_to_render(filtered, top)
+    else:
+        to_render = execution_summaries
+    
+    # Process each execution
+    print()
+    print("Generating artifacts...")
+    
+    render_cache = RenderCache(force=getattr(args, "force_render", False))
+    
+    for summary in to_render:
+        exec_spans = groups[summary.execution_id]
+        
+        # Create execution subdirectory
+        exec_dir = out_dir / summary.artifact_dir
+        exec_dir.mkdir(exist_ok=True)
+        
+        # Build trace
+        trace = build_trace_from_spans(exec_spans)
+        
+        def _render_execution() -> None:
+            # Render trace viewer
+            atomic_write_text(exec_dir / "trace-viewer.html", render_trace_viewer(trace))
+            
+            # Render timeline
+            atomic_write_text(exec_dir / "timeline.html", render_timeline_viewer(trace))
+            
+            # Render thumbnail
+            try:
+                atomic_write_text(exec_dir / "thumbnail.svg", render_mini_timeline(trace))
+            except Exception:
+                pass  # Thumbnail is optional
+            
+            # Write spans.jsonl
+            atomic_write_text(
+                exec_dir / "spans.jsonl",
+                "".join(json.dumps(asdict(span), ensure_ascii=False) + "\n" for span in exec_spans),
+            )
+        
+        render_cache.render(exec_dir, trace_fingerprint(exec_spans), _render_execution)
+    
+    render_cache.flush()
+    
+    print(f"  Generated artifacts for {len(to_render)} executions")
+    if len(to_render) < len(execution_summaries):
+        print(f"  Deferred {len(execution_summaries) - len(to_render)} executions (--render lazy)")
+    stats = render_cache.stats
+    print(f"  Render cache: {stats.hits + stats.links}/{stats.lookups} hits ({stats.hit_rate * 100:.0f}%)")
     if filter_type != "all":
         print(f"  Showing {len(filtered)} after filter: {filter_type}")
     
@@ -2707,9 +3250,17 @@ def _cmd_view(args: argparse.Namespace) -> int:
         orphan_span_count=len(orphans),
     )
     
-    # Render gallery
-    gallery_html = render_gallery_html(result)
-    (out_dir / "index.html").write_text(gallery_html, encoding="utf-8")
+    # Render gallery: a single table when it fits on one page, otherwise a
+    # sharded index that the page loads and filters client-side
+    gallery_pages = 0
+    if render_mode == "lazy" or len(filtered) > page_size:
+        rendered_ids = {s.execution_id for s in to_render}
+        index = write_gallery_index(filtered, out_dir, page_size, rendered_ids)
+        gallery_pages = len(index.pages)
+        stream_to_file(out_dir / "index.html", stream_sharded_gallery_html, result, index)
+        print(f"  Gallery index: {gallery_pages} pages of up to {page_size} executions")
+    else:
+        stream_to_file(out_dir / "index.html", stream_gallery_html, result)
     
     # Write result.json
     result_data = {
@@ -2719,6 +3270,9 @@ def _cmd_view(args: argparse.Namespace) -> int:
         "total_executions": len(execution_summaries),
         "filtered_executions": len(filtered),
         "filter": filter_type,
+        "render_mode": render_mode,
+        "rendered_executions": len(to_render),
+        "gallery_pages": gallery_pages,
         "passed": result.passed_count,
         "warnings": result.warning_count,
         "errors": result.error_count,
@@ -2743,6 +3297,7 @@ def _cmd_view(args: argparse.Namespace) -> int:
 
 def _cmd_show_config(args: argparse.Namespace) -> int:
     """Show effective configuration from all sources."""
+    from itk.config import load_config
     import os
     
     env_file = getattr(args, "env_file", None)
@@ -2816,6 +3371,7 @@ def _cmd_show_config(args: argparse.Namespace) -> int:
 
 def _cmd_status(args: argparse.Namespace) -> int:
     """Show current ITK status."""
+    from itk.config import load_config
     import os
     from datetime import datetime
     
@@ -3567,6 +4123,7 @@ def _cmd_trace(args: argparse.Namespace) -> int:
     3. Converts each chain to Spans
     4. Generates sequence diagrams for each chain
     """
+    from itk import perf
     from itk.correlation.dynamic_discovery import (
         discover_correlations,
         summarize_chains,
@@ -3575,6 +4132,8 @@ def _cmd_trace(args: argparse.Namespace) -> int:
     from itk.diagrams.trace_viewer import render_trace_viewer
     from itk.diagrams.timeline_view import render_mini_timeline
     from itk.trace.trace_model import Trace
+    from itk.utils.render_cache import RenderCache, trace_fingerprint
+    from itk.utils.write_pipeline import atomic_write_text
     
     logs_path = Path(args.logs)
     out_dir = Path(args.out)
@@ -3593,28 +4152,30 @@ def _cmd_trace(args: argparse.Namespace) -> int:
     print(f"Loading logs from: {logs_path}")
     logs: list[dict] = []
     
-    # Try loading as JSON array first
-    content = logs_path.read_text(encoding="utf-8").strip()
-    if content.startswith("["):
-        try:
-            parsed = json.loads(content)
-            if isinstance(parsed, list):
-                logs = [e for e in parsed if isinstance(e, dict)]
-                print(f"  (Detected JSON array format)")
-        except json.JSONDecodeError:
-            pass
+    with perf.stage("load.logs"):
+        # Try loading as JSON array first
+        content = logs_path.read_text(encoding="utf-8").strip()
+        if content.startswith("["):
+            try:
+                parsed = json.loads(content)
+                if isinstance(parsed, list):
+                    logs = [e for e in parsed if isinstance(e, dict)]
+                    print(f"  (Detected JSON array format)")
+            except json.JSONDecodeError:
+                pass
     
-    # Fall back to JSONL
-    if not logs:
-        with open(logs_path, "r", encoding="utf-8") as f:
-            for line in f:
-                line = line.strip()
-                if line:
-                    try:
-                        logs.append(json.loads(line))
-                    except json.JSONDecodeError:
-                        pass
-
+        # Fall back to JSONL
+        if not logs:
+            with open(logs_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    line = line.strip()
+                    if line:
+                        try:
+                            logs.append(json.loads(line))
+                        except json.JSONDecodeError:
+                            pass
+
+    perf.count("load.lines", len(logs))
     print(f"Loaded {len(logs)} log entries")
     
     if not logs:
@@ -3652,6 +4213,7 @@ def _cmd_trace(args: argparse.Namespace) -> int:
     print("Step 2: Generating diagrams...")
     
     gallery_data: list[dict] = []
+    render_cache = RenderCache(force=getattr(args, "force_render", False))
     
     for i, chain in enumerate(multi_component_chains, 1):
         chain_id = f"chain-{i:03d}"
@@ -3662,54 +4224,61 @@ def _cmd_trace(args: argparse.Namespace) -> int:
         spans = chain_to_spans(chain, chain_id)
         trace = Trace(spans=spans)
         
-        # Generate timeline HTML
-        try:
-            timeline_html = render_trace_viewer(trace, title=f"Trace: {chain_id}")
-            timeline_path = chain_dir / "timeline.html"
-            timeline_path.write_text(timeline_html, encoding="utf-8")
-        except Exception as e:
-            if debug:
-                print(f"  Warning: Could not generate timeline for {chain_id}: {e}")
+        def _render_chain() -> None:
+            # Generate timeline HTML
+            try:
+                timeline_html = render_trace_viewer(trace, title=f"Trace: {chain_id}")
+                atomic_write_text(chain_dir / "timeline.html", timeline_html)
+            except Exception as e:
+                if debug:
+                    print(f"  Warning: Could not generate timeline for {chain_id}: {e}")
+            
+            # Generate mini timeline for gallery
+            try:
+                atomic_write_text(chain_dir / "mini_timeline.html", render_mini_timeline(trace))
+            except Exception:
+                pass
         
-        # Generate mini timeline for gallery
-        try:
-            mini_html = render_mini_timeline(trace)
-            (chain_dir / "mini_timeline.html").write_text(mini_html, encoding="utf-8")
-        except Exception:
-            pass
+        render_cache.render(
+            chain_dir,
+            trace_fingerprint(spans, extra={"title": f"Trace: {chain_id}"}),
+            _render_chain,
+            files=["timeline.html", "mini_timeline.html"],
+        )
         
-        # Write spans.jsonl
-        spans_path = chain_dir / "spans.jsonl"
-        with open(spans_path, "w", encoding="utf-8") as f:
-            for span in spans:
-                f.write(json.dumps({
-                    "span_id": span.span_id,
-                    "parent_span_id": span.parent_span_id,
-                    "component": span.component,
-                    "operation": span.operation,
-                    "ts_start": span.ts_start,
-                    "thread_id": span.thread_id,
-                    "session_id": span.session_id,
-                }, default=str) + "\n")
+        with perf.stage("write.chain"):
+            # Write spans.jsonl
+            spans_path = chain_dir / "spans.jsonl"
+            with open(spans_path, "w", encoding="utf-8") as f:
+                for span in spans:
+                    f.write(json.dumps({
+                        "span_id": span.span_id,
+                        "parent_span_id": span.parent_span_id,
+                        "component": span.component,
+                        "operation": span.operation,
+                        "ts_start": span.ts_start,
+                        "thread_id": span.thread_id,
+                        "session_id": span.session_id,
+                    }, default=str) + "\n")
         
-        # Write chain metadata
-        meta = {
-            "chain_id": chain_id,
-            "components": chain.components,
-            "component_count": chain.component_count,
-            "entry_count": len(chain.entries),
-            "span_count": len(spans),
-            "bridge_values": {v: list(c) for v, c in chain.bridge_values.items()},
-        }
-        (chain_dir / "chain_meta.json").write_text(
-            json.dumps(meta, indent=2), encoding="utf-8"
-        )
+            # Write chain metadata
+            meta = {
+                "chain_id": chain_id,
+                "components": chain.components,
+                "component_count": chain.component_count,
+                "entry_count": len(chain.entries),
+                "span_count": len(spans),
+                "bridge_values": {v: list(c) for v, c in chain.bridge_values.items()},
+            }
+            (chain_dir / "chain_meta.json").write_text(
+                json.dumps(meta, indent=2), encoding="utf-8"
+            )
         
-        # Write raw logs for this chain (for derive to use later)
-        fixture_path = chain_dir / "raw_logs.jsonl"
-        with open(fixture_path, "w", encoding="utf-8") as f:
-            for entry in chain.entries:
-                f.write(json.dumps(entry.raw, default=str) + "\n")
+            # Write raw logs for this chain (for derive to use later)
+            fixture_path = chain_dir / "raw_logs.jsonl"
+            with open(fixture_path, "w", encoding="utf-8") as f:
+                for entry in chain.entries:
+                    f.write(json.dumps(entry.raw, default=str) + "\n")
         
         gallery_data.append({
             "chain_id": chain_id,
@@ -3721,6 +4290,10 @@ def _cmd_trace(args: argparse.Namespace) -> int:
         
         print(f"  ✓ {chain_id}: {' → '.join(chain.components)} ({len(spans)} spans)")
     
+    render_cache.flush()
+    stats = render_cache.stats
+    print(f"  Render cache: {stats.hits + stats.links}/{stats.lookups} hits ({stats.hit_rate * 100:.0f}%)")
+    
     # Step 3: Generate gallery index
     print()
     print("Step 3: Generating gallery...")
@@ -3828,40 +4401,9 @@ def _render_trace_gallery(chains: list[dict], out_dir: Path) -> str:
 """
 
 
-def main() -> None:
-    # Force UTF-8 output on Windows to handle emoji in output
-    import io
-    if sys.platform == "win32":
-        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
-        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
-    
-    # Perform startup checks
-    _check_startup()
-    
-    p = argparse.ArgumentParser(
-        prog="itk",
-        description="Integration Test Kit: sequence diagram generation and log analysis",
-    )
-    
-    # Global flags
-    p.add_argument(
-        "--verbose", "-v",
-        action="store_true",
-        help="Show full tracebacks on errors",
-    )
-    p.add_argument(
-        "--version",
-        action="version",
-        version="%(prog)s 0.1.0",
-    )
-    
-    sub = p.add_subparsers(dest="cmd", required=True)
-
-    # render-fixture (Tier 2 offline)
-    p_fx = sub.add_parser(
-        "render-fixture",
-        help="Offline: render sequence diagram from fixture logs",
-    )
+# render-fixture (Tier 2 offline)
+def _add_render_fixture_args(p_fx: argparse.ArgumentParser) -> None:
+    """Register `itk render-fixture` arguments."""
     p_fx.add_argument("--fixture", required=True, help="Path to a JSONL fixture file")
     p_fx.add_argument("--out", required=True, help="Output directory for artifacts")
     p_fx.add_argument(
@@ -3872,11 +4414,10 @@ def main() -> None:
     )
     p_fx.set_defaults(func=_cmd_render_fixture)
 
-    # run (both dev-fixtures and live)
-    p_run = sub.add_parser(
-        "run",
-        help="Run a case (dev-fixtures mode or live against QA)",
-    )
+
+# run (both dev-fixtures and live)
+def _add_run_args(p_run: argparse.ArgumentParser) -> None:
+    """Register `itk run` arguments."""
     p_run.add_argument("--case", required=True, help="Path to case YAML file")
     p_run.add_argument("--out", required=True, help="Output directory for artifacts")
     p_run.add_argument(
@@ -3901,13 +4442,25 @@ def main() -> None:
         dest="skip_preflight",
         help="Skip pre-flight checks in live mode (not recommended)",
     )
+    p_run.add_argument(
+        "--pack-payloads",
+        action="store_true",
+        dest="pack_payloads",
+        help="Write payloads into a single payloads.zip instead of payloads/*.json",
+    )
+    p_run.add_argument(
+        "--render-workers",
+        type=int,
+        default=0,
+        dest="render_workers",
+        help="Render HTML viewers in N worker processes (default: 0, in-process)",
+    )
     p_run.set_defaults(func=_cmd_run)
 
-    # derive - create test cases from traces or logs
-    p_der = sub.add_parser(
-        "derive",
-        help="Create test cases from traces or logs",
-    )
+
+# derive - create test cases from traces or logs
+def _add_derive_args(p_der: argparse.ArgumentParser) -> None:
+    """Register `itk derive` arguments."""
     p_der.add_argument(
         "--traces",
         help="Path to itk trace output directory (use with 'itk trace' output)",
@@ -3928,11 +4481,9 @@ def main() -> None:
     p_der.add_argument("--out", required=True, help="Output directory for derived cases")
     p_der.set_defaults(func=_cmd_derive)
 
-    # audit
-    p_aud = sub.add_parser(
-        "audit",
-        help="Audit logging gaps for a case",
-    )
+
+def _add_audit_args(p_aud: argparse.ArgumentParser) -> None:
+    """Register `itk audit` arguments."""
     p_aud.add_argument("--case", required=True, help="Path to case YAML file")
     p_aud.add_argument("--out", required=True, help="Output directory for audit report")
     p_aud.add_argument(
@@ -3947,32 +4498,91 @@ def main() -> None:
     )
     p_aud.set_defaults(func=_cmd_audit)
 
-    # compare
-    p_cmp = sub.add_parser(
-        "compare",
-        help="Compare two run outputs",
-    )
-    p_cmp.add_argument("--a", required=True, help="First run artifacts directory")
-    p_cmp.add_argument("--b", required=True, help="Second run artifacts directory")
+
+def _add_compare_args(p_cmp: argparse.ArgumentParser) -> None:
+    """Register `itk compare` arguments."""
+    p_cmp.add_argument("--a", help="First (baseline) run artifacts directory")
+    p_cmp.add_argument("--b", required=True, help="Second run artifacts directory (or suite output directory)")
     p_cmp.add_argument("--out", required=True, help="Output directory for comparison")
+    p_cmp.add_argument(
+        "--baseline",
+        dest="baseline",
+        help="Compare against a recorded baseline store instead of --a",
+    )
+    p_cmp.add_argument(
+        "--last",
+        dest="last",
+        type=int,
+        default=None,
+        help="Use only the last N runs of the baseline store (default: all)",
+    )
+    p_cmp.add_argument(
+        "--baseline-dir",
+        dest="baseline_dir",
+        default=".itk/baselines",
+        help="Directory holding baseline stores (default: .itk/baselines)",
+    )
+    p_cmp.add_argument(
+        "--confidence",
+        dest="confidence",
+        type=float,
+        default=0.95,
+        help="Confidence level for latency intervals (default: 0.95)",
+    )
+    p_cmp.add_argument(
+        "--bootstrap",
+        dest="bootstrap",
+        type=int,
+        default=1000,
+        help="Bootstrap resamples per path; 0 uses the 10%% rule (default: 1000)",
+    )
+    p_cmp.add_argument(
+        "--match-distance",
+        dest="match_distance",
+        type=int,
+        default=2,
+        help="Max step edits to pair a new path with a missing one; -1 disables (default: 2)",
+    )
     p_cmp.set_defaults(func=_cmd_compare)
 
-    # generate-fixture
-    p_gen = sub.add_parser(
-        "generate-fixture",
-        help="Generate JSONL fixture from YAML definition",
+
+def _add_record_baseline_args(p_rb: argparse.ArgumentParser) -> None:
+    """Register `itk record-baseline` arguments."""
+    p_rb.add_argument("--name", required=True, help="Baseline name (stored as <baseline-dir>/<name>.db)")
+    p_rb.add_argument(
+        "--run",
+        action="append",
+        required=True,
+        help="Run artifacts directory with spans.jsonl, or a suite output directory (can be repeated)",
+    )
+    p_rb.add_argument("--label", default=None, help="Label for the recorded run (default: run paths)")
+    p_rb.add_argument(
+        "--keep",
+        dest="keep",
+        type=int,
+        default=None,
+        help="Keep only the most recent N runs in the store",
+    )
+    p_rb.add_argument(
+        "--baseline-dir",
+        dest="baseline_dir",
+        default=".itk/baselines",
+        help="Directory holding baseline stores (default: .itk/baselines)",
     )
+    p_rb.set_defaults(func=_cmd_record_baseline)
+
+
+def _add_generate_fixture_args(p_gen: argparse.ArgumentParser) -> None:
+    """Register `itk generate-fixture` arguments."""
     p_gen.add_argument(
         "--definition", required=True, help="Path to YAML fixture definition file"
     )
     p_gen.add_argument("--out", required=True, help="Output path for JSONL fixture")
     p_gen.set_defaults(func=_cmd_generate_fixture)
 
-    # validate
-    p_val = sub.add_parser(
-        "validate",
-        help="Validate case YAML or fixture JSONL against schemas",
-    )
+
+def _add_validate_args(p_val: argparse.ArgumentParser) -> None:
+    """Register `itk validate` arguments."""
     p_val.add_argument(
         "--case",
         action="append",
@@ -3983,13 +4593,25 @@ def main() -> None:
         action="append",
         help="Path to fixture JSONL file to validate (can be repeated)",
     )
+    p_val.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=None,
+        help="Worker processes for large fixtures (default: CPU count)",
+    )
+    p_val.add_argument(
+        "--max-errors",
+        dest="max_errors",
+        type=int,
+        default=None,
+        help="Stop validating a fixture after this many errors",
+    )
     p_val.set_defaults(func=_cmd_validate)
 
-    # explain-schema
-    p_explain = sub.add_parser(
-        "explain-schema",
-        help="Pretty-print a schema with field descriptions and examples",
-    )
+
+def _add_explain_schema_args(p_explain: argparse.ArgumentParser) -> None:
+    """Register `itk explain-schema` arguments."""
     p_explain.add_argument(
         "schema",
         nargs="?",
@@ -3999,11 +4621,9 @@ def main() -> None:
     )
     p_explain.set_defaults(func=_cmd_explain_schema)
 
-    # validate-log
-    p_vallog = sub.add_parser(
-        "validate-log",
-        help="Validate each line of a JSONL file against the span schema",
-    )
+
+def _add_validate_log_args(p_vallog: argparse.ArgumentParser) -> None:
+    """Register `itk validate-log` arguments."""
     p_vallog.add_argument(
         "--file", "-f",
         required=True,
@@ -4011,11 +4631,9 @@ def main() -> None:
     )
     p_vallog.set_defaults(func=_cmd_validate_log)
 
-    # scan
-    p_scan = sub.add_parser(
-        "scan",
-        help="Scan a codebase for components and compare against test coverage",
-    )
+
+def _add_scan_args(p_scan: argparse.ArgumentParser) -> None:
+    """Register `itk scan` arguments."""
     p_scan.add_argument(
         "--repo",
         required=True,
@@ -4040,13 +4658,30 @@ def main() -> None:
         dest="generate_skeletons",
         help="Generate skeleton case YAMLs for uncovered components",
     )
+    p_scan.add_argument(
+        "--workers",
+        dest="workers",
+        type=int,
+        default=None,
+        help="Processes used to parse files (default: CPU count)",
+    )
+    p_scan.add_argument(
+        "--no-cache",
+        action="store_true",
+        dest="no_cache",
+        help="Parse every file instead of reusing the incremental scan cache",
+    )
+    p_scan.add_argument(
+        "--cache-dir",
+        dest="cache_dir",
+        default=None,
+        help="Scan cache directory (default: .itk/scan-cache)",
+    )
     p_scan.set_defaults(func=_cmd_scan)
 
-    # suite
-    p_suite = sub.add_parser(
-        "suite",
-        help="Run a test suite (multiple cases) and generate report",
-    )
+
+def _add_suite_args(p_suite: argparse.ArgumentParser) -> None:
+    """Register `itk suite` arguments."""
     p_suite.add_argument(
         "--cases-dir",
         required=True,
@@ -4077,13 +4712,29 @@ def main() -> None:
         dest="env_file",
         help="Path to .env file (default: ./.env)",
     )
+    p_suite.add_argument(
+        "--force-render",
+        action="store_true",
+        dest="force_render",
+        help="Re-render all artifacts even if the render cache is up to date",
+    )
+    p_suite.add_argument(
+        "--record-baseline",
+        dest="record_baseline",
+        metavar="NAME",
+        help="Append this run's path latencies to baseline store NAME",
+    )
+    p_suite.add_argument(
+        "--baseline-dir",
+        dest="baseline_dir",
+        default=".itk/baselines",
+        help="Directory holding baseline stores (default: .itk/baselines)",
+    )
     p_suite.set_defaults(func=_cmd_suite)
 
-    # soak
-    p_soak = sub.add_parser(
-        "soak",
-        help="Run a soak/endurance test with adaptive rate control",
-    )
+
+def _add_soak_args(p_soak: argparse.ArgumentParser) -> None:
+    """Register `itk soak` arguments."""
     p_soak.add_argument(
         "--case",
         required=True,
@@ -4133,13 +4784,23 @@ def main() -> None:
         dest="env_file",
         help="Path to .env file (default: ./.env)",
     )
+    p_soak.add_argument(
+        "--record-baseline",
+        dest="record_baseline",
+        metavar="NAME",
+        help="Append this run's path latencies to baseline store NAME",
+    )
+    p_soak.add_argument(
+        "--baseline-dir",
+        dest="baseline_dir",
+        default=".itk/baselines",
+        help="Directory holding baseline stores (default: .itk/baselines)",
+    )
     p_soak.set_defaults(func=_cmd_soak)
 
-    # serve
-    p_serve = sub.add_parser(
-        "serve",
-        help="Serve artifacts directory with HTTP server for preview",
-    )
+
+def _add_serve_args(p_serve: argparse.ArgumentParser) -> None:
+    """Register `itk serve` arguments."""
     p_serve.add_argument(
         "directory",
         nargs="?",
@@ -4167,11 +4828,163 @@ def main() -> None:
     )
     p_serve.set_defaults(func=_cmd_serve)
 
-    # doctor
-    p_doctor = sub.add_parser(
-        "doctor",
-        help="Check ITK environment, dependencies, and configuration",
+
+def _add_stubs_args(p_stubs: argparse.ArgumentParser) -> None:
+    """Register `itk stubs` arguments."""
+    p_stubs.add_argument(
+        "--host",
+        default="127.0.0.1",
+        help="Interface to bind (default: 127.0.0.1)",
+    )
+    p_stubs.add_argument(
+        "--port",
+        "-p",
+        type=int,
+        default=4580,
+        help="Port to serve on (default: 4580)",
+    )
+    p_stubs.add_argument(
+        "--region",
+        default="us-east-1",
+        help="Region to print in the suggested environment (default: us-east-1)",
+    )
+    p_stubs.add_argument(
+        "--latency-ms",
+        type=float,
+        default=0.0,
+        dest="latency_ms",
+        help="Delay before every response (default: 0)",
+    )
+    p_stubs.add_argument(
+        "--jitter-ms",
+        type=float,
+        default=0.0,
+        dest="jitter_ms",
+        help="Extra uniform random delay per response (default: 0)",
+    )
+    p_stubs.add_argument(
+        "--throttle-rate",
+        type=float,
+        default=0.0,
+        dest="throttle_rate",
+        help="Probability that a call is throttled (default: 0)",
+    )
+    p_stubs.add_argument(
+        "--throttle-every",
+        type=int,
+        default=0,
+        dest="throttle_every",
+        help="Throttle every Nth call per service (default: never)",
+    )
+    p_stubs.add_argument(
+        "--seed",
+        type=int,
+        help="Seed for jitter and throttle sampling",
+    )
+    p_stubs.add_argument(
+        "--chunk-delay-ms",
+        type=float,
+        default=0.0,
+        dest="chunk_delay_ms",
+        help="Delay between streamed agent events (default: 0)",
+    )
+    p_stubs.add_argument(
+        "--trace-steps",
+        type=int,
+        default=1,
+        dest="trace_steps",
+        help="Model + action group steps per agent invocation (default: 1)",
+    )
+    p_stubs.add_argument(
+        "--lambda-duration-ms",
+        type=float,
+        default=5.0,
+        dest="lambda_duration_ms",
+        help="Simulated Lambda run time (default: 5)",
+    )
+    p_stubs.add_argument(
+        "--consumer",
+        action="append",
+        dest="consumers",
+        metavar="QUEUE=FUNCTION",
+        help="Deliver messages sent to QUEUE to FUNCTION (repeatable)",
+    )
+    p_stubs.add_argument(
+        "--no-logs",
+        action="store_true",
+        dest="no_logs",
+        help="Don't write span and runtime log lines",
+    )
+    p_stubs.set_defaults(func=_cmd_stubs)
+
+
+def _add_bench_args(p_bench: argparse.ArgumentParser) -> None:
+    """Register `itk bench` arguments."""
+    p_bench.add_argument(
+        "--size",
+        choices=["10k", "1m", "10m"],
+        default="10k",
+        help="Corpus size preset in log lines (default: 10k)",
+    )
+    p_bench.add_argument(
+        "--lines",
+        type=int,
+        help="Exact corpus size in lines (overrides --size)",
+    )
+    p_bench.add_argument(
+        "--only",
+        help="Comma-separated benchmarks: parse,correlate,stitch,redact,render,compare,soak (default: all)",
+    )
+    p_bench.add_argument(
+        "--repeat",
+        type=int,
+        default=3,
+        help="Full runs per benchmark; throughput uses the median (default: 3)",
+    )
+    p_bench.add_argument(
+        "--seed",
+        type=int,
+        default=42,
+        help="Corpus seed (default: 42)",
+    )
+    p_bench.add_argument(
+        "--window",
+        type=int,
+        default=10_000,
+        help="Lines per streamed window; p50/p99 are per window (default: 10000)",
+    )
+    p_bench.add_argument(
+        "--out",
+        "-o",
+        help="Write results JSON to this path",
+    )
+    p_bench.add_argument(
+        "--baseline",
+        help="Results JSON to gate against; exit 1 on regressions",
+    )
+    p_bench.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed fractional slowdown vs baseline (default: 0.2)",
+    )
+    p_bench.add_argument(
+        "--no-isolate",
+        action="store_true",
+        dest="no_isolate",
+        help="Run in-process instead of one process per benchmark (peak RSS becomes cumulative)",
     )
+    p_bench.add_argument(
+        "--write-corpus",
+        dest="write_corpus",
+        metavar="PATH",
+        help="Only write the synthetic corpus as JSONL to PATH",
+    )
+    p_bench.set_defaults(func=_cmd_bench)
+
+
+def _add_doctor_args(p_doctor: argparse.ArgumentParser) -> None:
+    """Register `itk doctor` arguments."""
     p_doctor.add_argument(
         "--mode",
         choices=["dev-fixtures", "live"],
@@ -4185,11 +4998,9 @@ def main() -> None:
     )
     p_doctor.set_defaults(func=_cmd_doctor)
 
-    # discover
-    p_discover = sub.add_parser(
-        "discover",
-        help="Discover AWS resources and generate .env.discovered file",
-    )
+
+def _add_discover_args(p_discover: argparse.ArgumentParser) -> None:
+    """Register `itk discover` arguments."""
     p_discover.add_argument(
         "--region",
         help="AWS region to scan (default: from env or us-east-1)",
@@ -4210,11 +5021,10 @@ def main() -> None:
     )
     p_discover.set_defaults(func=_cmd_discover)
 
-    # view - historical execution viewer
-    p_view = sub.add_parser(
-        "view",
-        help="View historical executions from CloudWatch logs or local files",
-    )
+
+# view - historical execution viewer
+def _add_view_args(p_view: argparse.ArgumentParser) -> None:
+    """Register `itk view` arguments."""
     p_view.add_argument(
         "--since",
         required=True,
@@ -4258,13 +5068,34 @@ def main() -> None:
         dest="env_file",
         help="Path to .env file (default: ./.env)",
     )
+    p_view.add_argument(
+        "--force-render",
+        action="store_true",
+        dest="force_render",
+        help="Re-render all artifacts even if the render cache is up to date",
+    )
+    p_view.add_argument(
+        "--render",
+        choices=["all", "lazy"],
+        help="all: detail pages for every execution (default); "
+        "lazy: only for the --filter/--top subset",
+    )
+    p_view.add_argument(
+        "--top",
+        type=int,
+        help="Render detail pages for only the N most recent matching executions (implies --render lazy)",
+    )
+    p_view.add_argument(
+        "--page-size",
+        dest="page_size",
+        type=int,
+        help="Executions per gallery index page; larger views use a sharded gallery (default: 500)",
+    )
     p_view.set_defaults(func=_cmd_view)
 
-    # show-config
-    p_show_config = sub.add_parser(
-        "show-config",
-        help="Show effective configuration from all sources",
-    )
+
+def _add_show_config_args(p_show_config: argparse.ArgumentParser) -> None:
+    """Register `itk show-config` arguments."""
     p_show_config.add_argument(
         "--mode",
         choices=["dev-fixtures", "live"],
@@ -4277,11 +5108,9 @@ def main() -> None:
     )
     p_show_config.set_defaults(func=_cmd_show_config)
 
-    # status
-    p_status = sub.add_parser(
-        "status",
-        help="Show current ITK status, mode, and last run info",
-    )
+
+def _add_status_args(p_status: argparse.ArgumentParser) -> None:
+    """Register `itk status` arguments."""
     p_status.add_argument(
         "--env-file",
         dest="env_file",
@@ -4289,11 +5118,9 @@ def main() -> None:
     )
     p_status.set_defaults(func=_cmd_status)
 
-    # validate-env
-    p_validate_env = sub.add_parser(
-        "validate-env",
-        help="Validate .env file configuration",
-    )
+
+def _add_validate_env_args(p_validate_env: argparse.ArgumentParser) -> None:
+    """Register `itk validate-env` arguments."""
     p_validate_env.add_argument(
         "--env-file",
         dest="env_file",
@@ -4306,18 +5133,15 @@ def main() -> None:
     )
     p_validate_env.set_defaults(func=_cmd_validate_env)
 
-    # quickstart
-    p_quickstart = sub.add_parser(
-        "quickstart",
-        help="Run quickstart workflow for new users",
-    )
+
+def _add_quickstart_args(p_quickstart: argparse.ArgumentParser) -> None:
+    """Register `itk quickstart` arguments."""
     p_quickstart.set_defaults(func=_cmd_quickstart)
 
-    # bootstrap - zero-config initialization
-    p_bootstrap = sub.add_parser(
-        "bootstrap",
-        help="Zero-config initialization: discover, configure, scaffold, run",
-    )
+
+# bootstrap - zero-config initialization
+def _add_bootstrap_args(p_bootstrap: argparse.ArgumentParser) -> None:
+    """Register `itk bootstrap` arguments."""
     p_bootstrap.add_argument(
         "--region",
         help="AWS region (auto-detected if not specified)",
@@ -4338,11 +5162,10 @@ def main() -> None:
     )
     p_bootstrap.set_defaults(func=_cmd_bootstrap)
 
-    # init - lightweight scaffolding only
-    p_init = sub.add_parser(
-        "init",
-        help="Initialize ITK directory structure (no AWS required)",
-    )
+
+# init - lightweight scaffolding only
+def _add_init_args(p_init: argparse.ArgumentParser) -> None:
+    """Register `itk init` arguments."""
     p_init.add_argument(
         "--force",
         action="store_true",
@@ -4350,11 +5173,10 @@ def main() -> None:
     )
     p_init.set_defaults(func=_cmd_init)
 
-    # profile - deep extraction from messy logs
-    p_profile = sub.add_parser(
-        "profile",
-        help="Deep extraction of structured data from messy logs",
-    )
+
+# profile - deep extraction from messy logs
+def _add_profile_args(p_profile: argparse.ArgumentParser) -> None:
+    """Register `itk profile` arguments."""
     p_profile.add_argument(
         "--logs",
         required=True,
@@ -4372,11 +5194,10 @@ def main() -> None:
     )
     p_profile.set_defaults(func=_cmd_profile)
 
-    # trace - unified e2e command (recommended)
-    p_trace = sub.add_parser(
-        "trace",
-        help="Discover correlations and generate diagrams (recommended e2e command)",
-    )
+
+# trace - unified e2e command (recommended)
+def _add_trace_args(p_trace: argparse.ArgumentParser) -> None:
+    """Register `itk trace` arguments."""
     p_trace.add_argument(
         "--logs",
         required=True,
@@ -4398,13 +5219,18 @@ def main() -> None:
         action="store_true",
         help="Show debug output during processing",
     )
+    p_trace.add_argument(
+        "--force-render",
+        action="store_true",
+        dest="force_render",
+        help="Re-render all artifacts even if the render cache is up to date",
+    )
     p_trace.set_defaults(func=_cmd_trace)
 
-    # discover-correlations - dynamic correlation discovery (lower-level)
-    p_discover_corr = sub.add_parser(
-        "discover-correlations",
-        help="Discover correlation chains from logs (low-level, use 'trace' instead)",
-    )
+
+# discover-correlations - dynamic correlation discovery (lower-level)
+def _add_discover_correlations_args(p_discover_corr: argparse.ArgumentParser) -> None:
+    """Register `itk discover-correlations` arguments."""
     p_discover_corr.add_argument(
         "--logs",
         required=True,
@@ -4422,6 +5248,242 @@ def main() -> None:
     )
     p_discover_corr.set_defaults(func=_cmd_discover_correlations)
 
+
+# Subcommands: name -> (help, function registering the command's arguments).
+# Only the command being run registers its arguments, so startup does not
+# build a full parser for every command.
+COMMANDS: dict[str, tuple[str, Callable[[argparse.ArgumentParser], None]]] = {
+    "render-fixture": (
+        "Offline: render sequence diagram from fixture logs",
+        _add_render_fixture_args,
+    ),
+    "run": (
+        "Run a case (dev-fixtures mode or live against QA)",
+        _add_run_args,
+    ),
+    "derive": (
+        "Create test cases from traces or logs",
+        _add_derive_args,
+    ),
+    "audit": (
+        "Audit logging gaps for a case",
+        _add_audit_args,
+    ),
+    "compare": (
+        "Compare two run outputs",
+        _add_compare_args,
+    ),
+    "record-baseline": (
+        "Record run artifacts into a persistent baseline store",
+        _add_record_baseline_args,
+    ),
+    "generate-fixture": (
+        "Generate JSONL fixture from YAML definition",
+        _add_generate_fixture_args,
+    ),
+    "validate": (
+        "Validate case YAML or fixture JSONL against schemas",
+        _add_validate_args,
+    ),
+    "explain-schema": (
+        "Pretty-print a schema with field descriptions and examples",
+        _add_explain_schema_args,
+    ),
+    "validate-log": (
+        "Validate each line of a JSONL file against the span schema",
+        _add_validate_log_args,
+    ),
+    "scan": (
+        "Scan a codebase for components and compare against test coverage",
+        _add_scan_args,
+    ),
+    "suite": (
+        "Run a test suite (multiple cases) and generate report",
+        _add_suite_args,
+    ),
+    "soak": (
+        "Run a soak/endurance test with adaptive rate control",
+        _add_soak_args,
+    ),
+    "serve": (
+        "Serve artifacts directory with HTTP server for preview",
+        _add_serve_args,
+    ),
+    "stubs": (
+        "Run a local AWS stand-in server for offline live-mode testing",
+        _add_stubs_args,
+    ),
+    "bench": (
+        "Benchmark parse/correlate/render/... on a synthetic log corpus",
+        _add_bench_args,
+    ),
+    "doctor": (
+        "Check ITK environment, dependencies, and configuration",
+        _add_doctor_args,
+    ),
+    "discover": (
+        "Discover AWS resources and generate .env.discovered file",
+        _add_discover_args,
+    ),
+    "view": (
+        "View historical executions from CloudWatch logs or local files",
+        _add_view_args,
+    ),
+    "show-config": (
+        "Show effective configuration from all sources",
+        _add_show_config_args,
+    ),
+    "status": (
+        "Show current ITK status, mode, and last run info",
+        _add_status_args,
+    ),
+    "validate-env": (
+        "Validate .env file configuration",
+        _add_validate_env_args,
+    ),
+    "quickstart": (
+        "Run quickstart workflow for new users",
+        _add_quickstart_args,
+    ),
+    "bootstrap": (
+        "Zero-config initialization: discover, configure, scaffold, run",
+        _add_bootstrap_args,
+    ),
+    "init": (
+        "Initialize ITK directory structure (no AWS required)",
+        _add_init_args,
+    ),
+    "profile": (
+        "Deep extraction of structured data from messy logs",
+        _add_profile_args,
+    ),
+    "trace": (
+        "Discover correlations and generate diagrams (recommended e2e command)",
+        _add_trace_args,
+    ),
+    "discover-correlations": (
+        "Discover correlation chains from logs (low-level, use 'trace' instead)",
+        _add_discover_correlations_args,
+    ),
+}
+
+
+# Pipeline commands that also accept the profiling flags after the command name
+_PROFILED_COMMANDS = ("render-fixture", "run", "suite", "soak", "trace")
+
+
+def _add_perf_args(parser: argparse.ArgumentParser, *, subcommand: bool = False) -> None:
+    """Register the `--profile` flags (global, and again on pipeline commands).
+
+    On subcommands the defaults are suppressed so they never overwrite a
+    flag given before the command name.
+    """
+    default: object = argparse.SUPPRESS if subcommand else False
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        dest="perf_profile",
+        default=default,
+        help="Time pipeline stages and write perf.json",
+    )
+    parser.add_argument(
+        "--profile-cpu",
+        action="store_true",
+        dest="perf_cpu",
+        default=default,
+        help="Also write profile.pstats and flamegraph-ready profile.collapsed (implies --profile)",
+    )
+    parser.add_argument(
+        "--self-timeline",
+        action="store_true",
+        dest="self_timeline",
+        default=default,
+        help="Record ITK's own stages as spans and write self-timeline.html next to the artifacts",
+    )
+    if subcommand:
+        parser.add_argument(
+            "--profile-out",
+            dest="perf_out",
+            metavar="DIR",
+            default=argparse.SUPPRESS,
+            help="Directory for profile output (default: --out directory, else ./itk-profile)",
+        )
+
+
+def _run_instrumented(args: argparse.Namespace) -> int:
+    """Run a command with stage timers on; write its profile and/or self-timeline."""
+    from itk.perf import ProfileSession
+    
+    session = ProfileSession(cpu=args.perf_cpu, record_spans=args.self_timeline)
+    try:
+        with session:
+            return args.func(args)
+    finally:
+        command_out = getattr(args, "out", None)
+        artifacts_dir = Path(command_out) if command_out and Path(command_out).is_dir() else Path("itk-profile")
+        if args.self_timeline:
+            artifacts_dir.mkdir(parents=True, exist_ok=True)
+            timeline_path = session.write_self_timeline(artifacts_dir, command=args.cmd)
+            print(f"🪞 Self-timeline: {timeline_path}", file=sys.stderr)
+        if args.perf_profile or args.perf_cpu:
+            _write_profile(session, Path(getattr(args, "perf_out", None) or artifacts_dir), args.cmd)
+
+
+def _write_profile(session: "ProfileSession", out_dir: Path, command: str) -> None:
+    """Write perf.json (and CPU profiles) and print the slowest stages."""
+    paths = session.write(out_dir, command=command)
+    data = session.recorder.to_dict() if session.recorder else {}
+    print(f"⏱️  Profile ({data.get('wall_ms', 0):,.0f} ms wall): {', '.join(str(p) for p in paths)}", file=sys.stderr)
+    for stage in sorted(data.get("stages", []), key=lambda s: s["self_ms"], reverse=True)[:5]:
+        print(
+            f"   {stage['name']:<24} self {stage['self_ms']:>10,.1f} ms  "
+            f"total {stage['total_ms']:>10,.1f} ms  ×{stage['calls']}",
+            file=sys.stderr,
+        )
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    """Return the subcommand named on the command line (global flags take no values)."""
+    return next((arg for arg in argv if not arg.startswith("-")), None)
+
+
+def main() -> None:
+    # Force UTF-8 output on Windows to handle emoji in output
+    import io
+    if sys.platform == "win32":
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+        sys.stderr = io.TextIOWrapper(sys.stderr.buffer, encoding='utf-8', errors='replace')
+    
+    # Perform startup checks
+    _check_startup()
+    
+    p = argparse.ArgumentParser(
+        prog="itk",
+        description="Integration Test Kit: sequence diagram generation and log analysis",
+    )
+    
+    # Global flags
+    p.add_argument(
+        "--verbose", "-v",
+        action="store_true",
+        help="Show full tracebacks on errors",
+    )
+    p.add_argument(
+        "--version",
+        action="version",
+        version="%(prog)s 0.1.0",
+    )
+    _add_perf_args(p)
+    
+    sub = p.add_subparsers(dest="cmd", required=True)
+    requested = _requested_command(sys.argv[1:])
+    for name, (help_text, add_args) in COMMANDS.items():
+        sub_parser = sub.add_parser(name, help=help_text)
+        if name == requested:
+            add_args(sub_parser)
+            if name in _PROFILED_COMMANDS:
+                _add_perf_args(sub_parser, subcommand=True)
+
     args = p.parse_args()
     
     # Set verbose mode for error handling
@@ -4429,7 +5491,10 @@ def main() -> None:
     set_verbose(args.verbose)
     
     try:
-        rc = args.func(args)
+        if args.perf_profile or args.perf_cpu or args.self_timeline:
+            rc = _run_instrumented(args)
+        else:
+            rc = args.func(args)
         raise SystemExit(rc)
     except SystemExit:
         raise
@@ -1,10 +1,17 @@
 """Compare module for path signatures and delta reporting."""
 from itk.compare.path_signature import PathSignature, extract_path_signature
-from itk.compare.compare import CompareResult, compare_traces
+from itk.compare.compare import (
+    CompareResult,
+    compare_to_baseline,
+    compare_trace_sets,
+    compare_traces,
+)
 
 __all__ = [
     "PathSignature",
     "extract_path_signature",
     "CompareResult",
     "compare_traces",
+    "compare_trace_sets",
+    "compare_to_baseline",
 ]
@@ -0,0 +1,348 @@
+"""Persistent baseline store for path signatures and latency sketches.
+
+`itk compare` against raw artifacts reloads and re-summarizes every span of
+the baseline run each time. A baseline store keeps only what comparison
+needs, per run and per path signature:
+
+- trace count and error count
+- a mergeable `LatencyHistogram` sketch of trace latencies
+- the suite case IDs the path was seen in, when recorded from a suite
+
+Stores are SQLite files under `.itk/baselines/<name>.db`. Each suite or soak
+run appends one row per path, so recording is incremental and a rolling
+baseline over the last N runs is a merge of N small sketches per path.
+
+Example:
+    with BaselineStore.open("nightly") as store:
+        store.record_run(traces, label="2026-01-15")
+        baseline = store.load(last_n=5)
+    result = compare_to_baseline(baseline, current_traces)
+"""
+from __future__ import annotations
+
+import json
+import sqlite3
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from itk.compare.path_signature import PathSignature, SignatureInterner, summarize_trace
+from itk.utils.histogram import LatencyHistogram
+from itk.trace.trace_model import Trace
+
+# Default directory holding one <name>.db per baseline
+DEFAULT_BASELINE_DIR = Path(".itk") / "baselines"
+
+# Bump when the table layout changes; older stores are rejected
+SCHEMA_VERSION = 1
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS runs (
+    run_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    label TEXT NOT NULL,
+    recorded_at TEXT NOT NULL,
+    trace_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS signatures (
+    sig_id INTEGER PRIMARY KEY AUTOINCREMENT,
+    sig_key TEXT NOT NULL UNIQUE,
+    retry_count INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS path_stats (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    sig_id INTEGER NOT NULL REFERENCES signatures(sig_id),
+    count INTEGER NOT NULL,
+    error_count INTEGER NOT NULL,
+    sketch TEXT NOT NULL,
+    PRIMARY KEY (run_id, sig_id)
+);
+-- Added after schema version 1 shipped; stores without it load with no cases
+CREATE TABLE IF NOT EXISTS path_cases (
+    run_id INTEGER NOT NULL REFERENCES runs(run_id) ON DELETE CASCADE,
+    sig_id INTEGER NOT NULL REFERENCES signatures(sig_id),
+    case_id TEXT NOT NULL,
+    PRIMARY KEY (run_id, sig_id, case_id)
+);
+"""
+
+
+@dataclass
+class PathBaseline:
+    """Aggregated baseline for one path signature."""
+
+    signature: PathSignature
+    count: int = 0
+    error_count: int = 0
+    latency: LatencyHistogram = field(default_factory=LatencyHistogram)
+    cases: set[str] = field(default_factory=set)  # Suite case IDs; empty if unknown
+
+    def merge(self, other: "PathBaseline") -> None:
+        """Add another baseline for the same signature into this one."""
+        self.count += other.count
+        self.error_count += other.error_count
+        self.latency.merge(other.latency)
+        self.cases |= other.cases
+
+
+@dataclass
+class BaselineRun:
+    """A run recorded in a baseline store."""
+
+    run_id: int
+    label: str
+    recorded_at: str
+    trace_count: int
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "run_id": self.run_id,
+            "label": self.label,
+            "recorded_at": self.recorded_at,
+            "trace_count": self.trace_count,
+        }
+
+
+class PathAggregator:
+    """Accumulate traces into per-signature counts and latency sketches.
+
+    Use this to build up a run incrementally (e.g. one soak iteration at a
+    time) before handing it to `BaselineStore.record`.
+    """
+
+    def __init__(self) -> None:
+        self._interner = SignatureInterner()
+        self._paths: dict[int, PathBaseline] = {}
+        self.trace_count = 0
+
+    def add(self, trace: Trace, case_id: Optional[str] = None) -> None:
+        """Summarize one trace into the aggregate.
+
+        Args:
+            trace: Trace to summarize.
+            case_id: Suite case the trace came from, if known.
+        """
+        steps, has_error, retry_count, latency_ms = summarize_trace(trace)
+        if not steps:
+            return
+        sig_id = self._interner.intern(steps, has_error, retry_count)
+        path = self._paths.get(sig_id)
+        if path is None:
+            path = self._paths[sig_id] = PathBaseline(signature=self._interner.signatures[sig_id])
+        path.count += 1
+        if has_error:
+            path.error_count += 1
+        path.latency.record(latency_ms)
+        if case_id is not None:
+            path.cases.add(case_id)
+        self.trace_count += 1
+
+    def add_all(self, traces: Iterable[Trace]) -> None:
+        """Summarize several traces."""
+        for trace in traces:
+            self.add(trace)
+
+    @property
+    def paths(self) -> list[PathBaseline]:
+        """Per-signature aggregates in first-seen order."""
+        return list(self._paths.values())
+
+
+def _sig_key(signature: PathSignature) -> str:
+    """Storage key matching `PathSignature` equality (steps + error flag)."""
+    return json.dumps([signature.steps, signature.has_error], separators=(",", ":"))
+
+
+def _sig_from_key(key: str, retry_count: int) -> PathSignature:
+    steps, has_error = json.loads(key)
+    return PathSignature(
+        steps=tuple((comp, op) for comp, op in steps),
+        has_error=has_error,
+        retry_count=retry_count,
+    )
+
+
+class BaselineStore:
+    """SQLite-backed store of per-run path aggregates."""
+
+    def __init__(self, path: Path) -> None:
+        """Open (creating if needed) the store at `path`.
+
+        Raises:
+            ValueError: If the file was written by an incompatible version.
+        """
+        self.path = Path(path)
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(self.path)
+        self._conn.execute("PRAGMA foreign_keys = ON")
+        self._conn.executescript(_SCHEMA)
+        row = self._conn.execute("SELECT value FROM meta WHERE key = 'schema_version'").fetchone()
+        if row is None:
+            with self._conn:
+                self._conn.execute(
+                    "INSERT INTO meta (key, value) VALUES ('schema_version', ?)",
+                    (str(SCHEMA_VERSION),),
+                )
+        elif int(row[0]) != SCHEMA_VERSION:
+            self._conn.close()
+            raise ValueError(
+                f"Baseline store {self.path} has schema version {row[0]}, expected {SCHEMA_VERSION}"
+            )
+
+    @classmethod
+    def open(cls, name: str, root: Path = DEFAULT_BASELINE_DIR) -> "BaselineStore":
+        """Open the named store `<root>/<name>.db`."""
+        if not name or "/" in name or "\\" in name or name.startswith("."):
+            raise ValueError(f"Invalid baseline name: {name!r}")
+        return cls(Path(root) / f"{name}.db")
+
+    def close(self) -> None:
+        """Close the underlying database."""
+        self._conn.close()
+
+    def __enter__(self) -> "BaselineStore":
+        return self
+
+    def __exit__(self, *exc: object) -> None:
+        self.close()
+
+    # -- writing -----------------------------------------------------------
+
+    def record(
+        self,
+        aggregate: PathAggregator,
+        label: str = "",
+        keep_runs: Optional[int] = None,
+    ) -> int:
+        """Append one run's aggregates.
+
+        Args:
+            aggregate: Per-path aggregates for the run.
+            label: Free-form run label (run directory, suite name, ...).
+            keep_runs: If set, prune to the most recent N runs afterwards.
+
+        Returns:
+            The new run ID.
+        """
+        recorded_at = datetime.now(timezone.utc).isoformat()
+        with self._conn:
+            cur = self._conn.execute(
+                "INSERT INTO runs (label, recorded_at, trace_count) VALUES (?, ?, ?)",
+                (label, recorded_at, aggregate.trace_count),
+            )
+            run_id = int(cur.lastrowid)
+            for path in aggregate.paths:
+                sig_id = self._signature_id(path.signature)
+                self._conn.execute(
+                    "INSERT INTO path_stats (run_id, sig_id, count, error_count, sketch) "
+                    "VALUES (?, ?, ?, ?, ?)",
+                    (
+                        run_id,
+                        sig_id,
+                        path.count,
+                        path.error_count,
+                        json.dumps(path.latency.to_state(), separators=(",", ":")),
+                    ),
+                )
+                self._conn.executemany(
+                    "INSERT INTO path_cases (run_id, sig_id, case_id) VALUES (?, ?, ?)",
+                    [(run_id, sig_id, case_id) for case_id in sorted(path.cases)],
+                )
+        if keep_runs is not None:
+            self.prune(keep_runs)
+        return run_id
+
+    def record_run(
+        self,
+        traces: Iterable[Trace],
+        label: str = "",
+        keep_runs: Optional[int] = None,
+        case_ids: Optional[Iterable[str]] = None,
+    ) -> int:
+        """Summarize traces and append them as one run (see `record`).
+
+        `case_ids`, if given, names the suite case of each trace in order.
+        """
+        aggregate = PathAggregator()
+        if case_ids is None:
+            aggregate.add_all(traces)
+        else:
+            for trace, case_id in zip(traces, case_ids, strict=True):
+                aggregate.add(trace, case_id)
+        return self.record(aggregate, label=label, keep_runs=keep_runs)
+
+    def prune(self, keep_runs: int) -> int:
+        """Delete all but the most recent `keep_runs` runs; returns runs deleted."""
+        with self._conn:
+            cur = self._conn.execute(
+                "DELETE FROM runs WHERE run_id NOT IN "
+                "(SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?)",
+                (max(keep_runs, 0),),
+            )
+        return cur.rowcount
+
+    def _signature_id(self, signature: PathSignature) -> int:
+        key = _sig_key(signature)
+        row = self._conn.execute("SELECT sig_id FROM signatures WHERE sig_key = ?", (key,)).fetchone()
+        if row is not None:
+            return int(row[0])
+        cur = self._conn.execute(
+            "INSERT INTO signatures (sig_key, retry_count) VALUES (?, ?)",
+            (key, signature.retry_count),
+        )
+        return int(cur.lastrowid)
+
+    # -- reading -----------------------------------------------------------
+
+    def runs(self) -> list[BaselineRun]:
+        """Recorded runs, oldest first."""
+        rows = self._conn.execute(
+            "SELECT run_id, label, recorded_at, trace_count FROM runs ORDER BY run_id"
+        ).fetchall()
+        return [BaselineRun(*row) for row in rows]
+
+    def load(self, last_n: Optional[int] = None) -> dict[PathSignature, PathBaseline]:
+        """Merge per-path aggregates across runs.
+
+        Args:
+            last_n: Only include the most recent N runs (default: all).
+
+        Returns:
+            Mapping of signature to merged baseline.
+        """
+        query = (
+            "SELECT s.sig_key, s.retry_count, p.count, p.error_count, p.sketch "
+            "FROM path_stats p JOIN signatures s ON s.sig_id = p.sig_id"
+        )
+        cases_query = (
+            "SELECT s.sig_key, s.retry_count, c.case_id "
+            "FROM path_cases c JOIN signatures s ON s.sig_id = c.sig_id"
+        )
+        params: tuple[Any, ...] = ()
+        if last_n is not None:
+            query += " WHERE p.run_id IN (SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?)"
+            cases_query += " WHERE c.run_id IN (SELECT run_id FROM runs ORDER BY run_id DESC LIMIT ?)"
+            params = (max(last_n, 0),)
+        query += " ORDER BY p.sig_id, p.run_id"
+
+        merged: dict[PathSignature, PathBaseline] = {}
+        for key, retry_count, count, error_count, sketch in self._conn.execute(query, params):
+            part = PathBaseline(
+                signature=_sig_from_key(key, retry_count),
+                count=count,
+                error_count=error_count,
+                latency=LatencyHistogram.from_state(json.loads(sketch)),
+            )
+            existing = merged.get(part.signature)
+            if existing is None:
+                merged[part.signature] = part
+            else:
+                existing.merge(part)
+        for key, retry_count, case_id in self._conn.execute(cases_query, params):
+            merged[_sig_from_key(key, retry_count)].cases.add(case_id)
+        return merged
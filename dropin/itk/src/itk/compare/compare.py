@@ -5,20 +5,43 @@ Comparison detects:
 - Missing paths (in A but not B)
 - Latency changes (for paths in both)
 - Error rate changes (for paths in both)
+
+For trace sets, latency changes are judged by a bootstrap confidence
+interval on the median delta rather than a fixed percentage, so large
+baselines flag small but real regressions and small samples do not flag
+noise. `compare_to_baseline` does the same against latency sketches kept
+in a `BaselineStore`, without reloading the baseline's spans.
 """
 from __future__ import annotations
 
+import random
+from array import array
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Optional
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping, Optional, Sequence
 
 from itk.trace.trace_model import Trace
 from itk.compare.path_signature import (
     PathSignature,
+    SignatureInterner,
     extract_path_signature,
     compute_trace_latency_ms,
+    summarize_trace,
+)
+from itk.compare.path_match import DEFAULT_MATCH_DISTANCE, PathMatch, match_near_paths
+from itk.compare.stats import (
+    DEFAULT_BOOTSTRAP_RESAMPLES,
+    DEFAULT_CONFIDENCE,
+    LatencyDistribution,
+    bootstrap_median_delta_pct,
 )
 
+if TYPE_CHECKING:
+    from itk.compare.baseline_store import PathBaseline
+
+# Fallback threshold when no confidence interval is available
+LATENCY_CHANGE_THRESHOLD_PCT = 10.0
+
 
 @dataclass
 class PathDelta:
@@ -31,6 +54,10 @@ class PathDelta:
     current_avg_latency_ms: float = 0.0
     baseline_error_count: int = 0
     current_error_count: int = 0
+    # Set by compare_trace_sets
+    baseline_latency: Optional[LatencyDistribution] = None
+    current_latency: Optional[LatencyDistribution] = None
+    p50_delta_ci_pct: Optional[tuple[float, float]] = None
 
     @property
     def is_new(self) -> bool:
@@ -56,6 +83,39 @@ class PathDelta:
             return 0.0
         return (self.latency_delta_ms / self.baseline_avg_latency_ms) * 100.0
 
+    @property
+    def p50_delta_pct(self) -> float:
+        """Percentage change in median latency (0.0 without distributions)."""
+        if not self.baseline_latency or not self.current_latency:
+            return 0.0
+        if self.baseline_latency.p50_ms == 0:
+            return 0.0
+        base = self.baseline_latency.p50_ms
+        return (self.current_latency.p50_ms - base) / base * 100.0
+
+    @property
+    def latency_significant(self) -> bool:
+        """Whether latency changed significantly.
+
+        Uses the confidence interval of the median delta when available
+        (significant if it excludes zero), otherwise a >10% change in mean.
+        """
+        if self.baseline_count == 0 or self.current_count == 0:
+            return False
+        if self.p50_delta_ci_pct is not None:
+            low, high = self.p50_delta_ci_pct
+            return low > 0.0 or high < 0.0
+        return abs(self.latency_delta_pct) > LATENCY_CHANGE_THRESHOLD_PCT
+
+    @property
+    def is_latency_regression(self) -> bool:
+        """Whether latency got significantly worse."""
+        if not self.latency_significant:
+            return False
+        if self.p50_delta_ci_pct is not None:
+            return self.p50_delta_ci_pct[0] > 0.0
+        return self.latency_delta_pct > 0.0
+
     @property
     def error_rate_baseline(self) -> float:
         """Error rate in baseline (0.0 to 1.0)."""
@@ -83,6 +143,8 @@ class CompareResult:
     baseline_label: str
     current_label: str
     deltas: list[PathDelta] = field(default_factory=list)
+    # New paths paired with the missing paths they most likely replace
+    path_matches: list[PathMatch] = field(default_factory=list)
 
     @property
     def new_paths(self) -> list[PathDelta]:
@@ -101,8 +163,13 @@ class CompareResult:
 
     @property
     def significant_latency_changes(self) -> list[PathDelta]:
-        """Paths with >10% latency change."""
-        return [d for d in self.changed_paths if abs(d.latency_delta_pct) > 10.0]
+        """Paths with a significant latency change (see `PathDelta.latency_significant`)."""
+        return [d for d in self.changed_paths if d.latency_significant]
+
+    @property
+    def latency_regressions(self) -> list[PathDelta]:
+        """Paths that got significantly slower."""
+        return [d for d in self.changed_paths if d.is_latency_regression]
 
     @property
     def error_regressions(self) -> list[PathDelta]:
@@ -111,8 +178,13 @@ class CompareResult:
 
     @property
     def has_regressions(self) -> bool:
-        """True if there are any regressions (new errors or missing paths)."""
-        return bool(self.missing_paths) or bool(self.error_regressions)
+        """True if there are any regressions.
+
+        Missing paths, increased error rates and significant slowdowns (see
+        `PathDelta.is_latency_regression`) all count; `itk compare` exits
+        non-zero on any of them.
+        """
+        return bool(self.missing_paths or self.error_regressions or self.latency_regressions)
 
 
 def compare_traces(
@@ -120,11 +192,15 @@ def compare_traces(
     current: Trace,
     baseline_label: str = "baseline",
     current_label: str = "current",
+    match_distance: int = DEFAULT_MATCH_DISTANCE,
 ) -> CompareResult:
     """Compare two traces and produce a delta report.
 
     This compares single traces. For comparing multiple traces,
     use compare_trace_sets().
+
+    A new path within `match_distance` step edits of a missing path is
+    reported as a near match (see `CompareResult.path_matches`).
     """
     baseline_sig = extract_path_signature(baseline)
     current_sig = extract_path_signature(current)
@@ -161,93 +237,226 @@ def compare_traces(
 
         deltas.append(delta)
 
-    return CompareResult(
+    result = CompareResult(
         baseline_label=baseline_label,
         current_label=current_label,
         deltas=deltas,
     )
+    result.path_matches = match_near_paths(result.missing_paths, result.new_paths, match_distance)
+    return result
+
+
+def _gather(
+    traces: Iterable[Trace], interner: SignatureInterner
+) -> tuple[dict[int, array], dict[int, int]]:
+    """Group trace latencies and error counts by interned signature ID."""
+    latencies: dict[int, array] = {}
+    errors: dict[int, int] = {}
+    for trace in traces:
+        steps, has_error, retry_count, latency_ms = summarize_trace(trace)
+        if not steps:
+            continue
+        sig_id = interner.intern(steps, has_error, retry_count)
+        bucket = latencies.get(sig_id)
+        if bucket is None:
+            bucket = latencies[sig_id] = array("d")
+            errors[sig_id] = 0
+        bucket.append(latency_ms)
+        if has_error:
+            errors[sig_id] += 1
+    return latencies, errors
 
 
 def compare_trace_sets(
-    baselines: list[Trace],
-    currents: list[Trace],
+    baselines: Iterable[Trace],
+    currents: Iterable[Trace],
     baseline_label: str = "baseline",
     current_label: str = "current",
+    *,
+    confidence: float = DEFAULT_CONFIDENCE,
+    bootstrap_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    seed: int = 0,
+    match_distance: int = DEFAULT_MATCH_DISTANCE,
 ) -> CompareResult:
     """Compare sets of traces and produce aggregate delta report.
 
-    Groups traces by path signature and computes aggregate statistics.
+    Each trace is summarized once; signatures are interned to integer IDs
+    and latencies gathered into per-signature arrays. For every path seen in
+    both sets the result carries latency percentiles and a bootstrap
+    confidence interval for the change in median latency.
+
+    Args:
+        baselines: Baseline traces.
+        currents: Current traces.
+        baseline_label: Label for the baseline set.
+        current_label: Label for the current set.
+        confidence: Confidence level for latency intervals.
+        bootstrap_resamples: Bootstrap resamples per path (0 disables the
+            intervals and falls back to the 10% rule).
+        seed: Random seed, so repeated comparisons give identical intervals.
+        match_distance: Maximum step edits for pairing new and missing
+            paths as near matches (negative disables).
     """
-    # Aggregate baseline stats by signature
-    baseline_stats: dict[PathSignature, dict] = {}
-    for trace in baselines:
-        sig = extract_path_signature(trace)
-        if sig.steps:
-            if sig not in baseline_stats:
-                baseline_stats[sig] = {
-                    "count": 0,
-                    "total_latency": 0.0,
-                    "error_count": 0,
-                }
-            stats = baseline_stats[sig]
-            stats["count"] += 1
-            stats["total_latency"] += compute_trace_latency_ms(trace)
-            if sig.has_error:
-                stats["error_count"] += 1
-
-    # Aggregate current stats by signature
-    current_stats: dict[PathSignature, dict] = {}
-    for trace in currents:
-        sig = extract_path_signature(trace)
-        if sig.steps:
-            if sig not in current_stats:
-                current_stats[sig] = {
-                    "count": 0,
-                    "total_latency": 0.0,
-                    "error_count": 0,
-                }
-            stats = current_stats[sig]
-            stats["count"] += 1
-            stats["total_latency"] += compute_trace_latency_ms(trace)
-            if sig.has_error:
-                stats["error_count"] += 1
-
-    # Build deltas for all signatures
-    all_sigs = set(baseline_stats.keys()) | set(current_stats.keys())
+    interner = SignatureInterner()
+    base_latencies, base_errors = _gather(baselines, interner)
+    cur_latencies, cur_errors = _gather(currents, interner)
+    rng = random.Random(seed)
+
     deltas: list[PathDelta] = []
+    for sig_id, sig in enumerate(interner.signatures):
+        base = sorted(base_latencies.get(sig_id, ()))
+        cur = sorted(cur_latencies.get(sig_id, ()))
+        deltas.append(
+            _path_delta(
+                sig,
+                LatencyDistribution.from_sorted(base) if base else None,
+                base,
+                base_errors.get(sig_id, 0),
+                cur,
+                cur_errors.get(sig_id, 0),
+                rng=rng,
+                confidence=confidence,
+                resamples=bootstrap_resamples,
+            )
+        )
 
-    for sig in all_sigs:
-        delta = PathDelta(signature=sig)
+    return _sorted_result(deltas, baseline_label, current_label, match_distance)
 
-        if sig in baseline_stats:
-            stats = baseline_stats[sig]
-            delta.baseline_count = stats["count"]
-            delta.baseline_avg_latency_ms = (
-                stats["total_latency"] / stats["count"] if stats["count"] > 0 else 0.0
-            )
-            delta.baseline_error_count = stats["error_count"]
 
-        if sig in current_stats:
-            stats = current_stats[sig]
-            delta.current_count = stats["count"]
-            delta.current_avg_latency_ms = (
-                stats["total_latency"] / stats["count"] if stats["count"] > 0 else 0.0
-            )
-            delta.current_error_count = stats["error_count"]
+def compare_to_baseline(
+    baseline: Mapping[PathSignature, PathBaseline],
+    currents: Iterable[Trace],
+    baseline_label: str = "baseline",
+    current_label: str = "current",
+    *,
+    confidence: float = DEFAULT_CONFIDENCE,
+    bootstrap_resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    seed: int = 0,
+    match_distance: int = DEFAULT_MATCH_DISTANCE,
+    current_cases: Optional[Iterable[str]] = None,
+) -> CompareResult:
+    """Compare traces against a stored baseline.
+
+    Like `compare_trace_sets`, but the baseline side comes from latency
+    sketches (see `BaselineStore.load`) rather than raw traces. Baseline
+    percentiles and the bootstrap resamples are taken from the sketch, so
+    they carry its ~1% bucket error.
+
+    When the baseline was recorded from a suite, its paths carry case IDs.
+    Given `current_cases`, a baseline path only counts as missing if one of
+    its cases is in the current set, so one case (or part of a suite) can be
+    compared against a whole-suite baseline. Paths with no recorded cases,
+    or a `current_cases` that shares no case with the baseline, are always
+    compared.
+
+    Args:
+        baseline: Merged per-path baselines.
+        currents: Current traces.
+        baseline_label: Label for the baseline.
+        current_label: Label for the current set.
+        confidence: Confidence level for latency intervals.
+        bootstrap_resamples: Bootstrap resamples per path.
+        seed: Random seed, so repeated comparisons give identical intervals.
+        match_distance: Maximum step edits for pairing new and missing
+            paths as near matches (negative disables).
+        current_cases: Suite case IDs the current traces cover.
+    """
+    in_scope = _case_scope(baseline.values(), current_cases)
+    interner = SignatureInterner()
+    stored: dict[int, PathBaseline] = {}
+    for path in baseline.values():
+        sig = path.signature
+        stored[interner.intern(sig.steps, sig.has_error, sig.retry_count)] = path
+    cur_latencies, cur_errors = _gather(currents, interner)
+    rng = random.Random(seed)
 
-        deltas.append(delta)
+    deltas: list[PathDelta] = []
+    for sig_id, sig in enumerate(interner.signatures):
+        path = stored.get(sig_id)
+        if path is not None and sig_id not in cur_latencies and not in_scope(path):
+            continue
+        deltas.append(
+            _path_delta(
+                sig,
+                LatencyDistribution.from_histogram(path.latency) if path else None,
+                path.latency.ranked() if path else (),
+                path.error_count if path else 0,
+                sorted(cur_latencies.get(sig_id, ())),
+                cur_errors.get(sig_id, 0),
+                rng=rng,
+                confidence=confidence,
+                resamples=bootstrap_resamples,
+            )
+        )
+
+    return _sorted_result(deltas, baseline_label, current_label, match_distance)
+
+
+def _case_scope(
+    paths: Iterable["PathBaseline"], current_cases: Optional[Iterable[str]]
+) -> Callable[["PathBaseline"], bool]:
+    """Predicate telling whether a baseline path's cases were run this time."""
+    cases = set(current_cases or ())
+    recorded: set[str] = set()
+    for path in paths:
+        recorded |= path.cases
+    if not cases & recorded:
+        return lambda path: True
+    return lambda path: not path.cases or bool(path.cases & cases)
+
+
+def _path_delta(
+    sig: PathSignature,
+    base_dist: Optional[LatencyDistribution],
+    base: Sequence[float],
+    base_error_count: int,
+    cur: Sequence[float],
+    cur_error_count: int,
+    *,
+    rng: random.Random,
+    confidence: float,
+    resamples: int,
+) -> PathDelta:
+    """Build the delta for one path from sorted latencies on each side."""
+    delta = PathDelta(signature=sig)
+
+    if base_dist is not None and base_dist.count:
+        delta.baseline_latency = base_dist
+        delta.baseline_count = base_dist.count
+        delta.baseline_avg_latency_ms = base_dist.mean_ms
+        delta.baseline_error_count = base_error_count
+
+    if cur:
+        delta.current_latency = LatencyDistribution.from_sorted(cur)
+        delta.current_count = len(cur)
+        delta.current_avg_latency_ms = delta.current_latency.mean_ms
+        delta.current_error_count = cur_error_count
+
+    if delta.baseline_count and delta.current_count:
+        delta.p50_delta_ci_pct = bootstrap_median_delta_pct(
+            base, cur, confidence=confidence, resamples=resamples, rng=rng
+        )
+
+    return delta
+
+
+def _sorted_result(
+    deltas: list[PathDelta], baseline_label: str, current_label: str, match_distance: int
+) -> CompareResult:
+    """Order deltas (regressions first, then by impact) and match near paths."""
 
-    # Sort deltas: regressions first, then by impact
     def sort_key(d: PathDelta) -> tuple:
-        # Regressions first (missing paths, error increases)
-        is_regression = d.is_missing or d.error_rate_delta > 0
+        # Regressions first (missing paths, error increases, slower paths)
+        is_regression = d.is_missing or d.error_rate_delta > 0 or d.is_latency_regression
         # Then by impact (latency change magnitude)
         return (not is_regression, -abs(d.latency_delta_pct))
 
     deltas.sort(key=sort_key)
 
-    return CompareResult(
+    result = CompareResult(
         baseline_label=baseline_label,
         current_label=current_label,
         deltas=deltas,
     )
+    result.path_matches = match_near_paths(result.missing_paths, result.new_paths, match_distance)
+    return result
@@ -0,0 +1,282 @@
+"""Near-match search between path signatures.
+
+Signature equality is exact, so one extra retry or rationale step turns a
+path into a "new" path plus a "missing" one. This module pairs such paths
+up by edit distance over their step sequences (insert, delete or change
+one `(component, operation)` step) and describes the structural diff.
+
+Missing baseline signatures are indexed by step bigrams (with start/end
+sentinels). One step edit destroys at most two bigrams, so a candidate within
+k edits must share at least `max(len) + 1 - 2k` of them; counting shared
+bigrams over the inverted index discards almost every signature before the
+(banded) edit distance is computed. That keeps matching fast with thousands
+of distinct signatures.
+"""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Iterable, Optional, Sequence
+
+from itk.compare.path_signature import PathSignature
+
+if TYPE_CHECKING:
+    from itk.compare.compare import PathDelta
+
+# Maximum number of step edits for two paths to count as the same path
+DEFAULT_MATCH_DISTANCE = 2
+
+Step = tuple[str, str]
+
+
+def step_edit_distance(a: Sequence[Step], b: Sequence[Step], limit: Optional[int] = None) -> int:
+    """Levenshtein distance between two step sequences.
+
+    Args:
+        a: First step sequence.
+        b: Second step sequence.
+        limit: If set, stop early and return `limit + 1` once the distance
+            is known to exceed it (only cells within the band are computed).
+    """
+    if len(a) < len(b):
+        a, b = b, a
+    if limit is not None and len(a) - len(b) > limit:
+        return limit + 1
+    if not b:
+        return len(a)
+    too_far = len(a) + 1 if limit is None else limit + 1
+    band = len(a) if limit is None else limit
+    previous = list(range(len(b) + 1))
+    for i, step_a in enumerate(a, 1):
+        lo = max(1, i - band)
+        hi = min(len(b), i + band)
+        current = [too_far] * (len(b) + 1)
+        if lo == 1:
+            current[0] = i
+        row_min = current[0]
+        for j in range(lo, hi + 1):
+            value = min(
+                previous[j] + 1,  # delete from a
+                current[j - 1] + 1,  # insert into a
+                previous[j - 1] + (step_a != b[j - 1]),  # change
+            )
+            current[j] = value
+            if value < row_min:
+                row_min = value
+        if limit is not None and row_min > limit:
+            return limit + 1
+        previous = current
+    return min(previous[-1], too_far)
+
+
+@dataclass
+class StepEdit:
+    """One structural difference between a baseline and current path."""
+
+    op: str  # "insert", "delete" or "change"
+    index: int  # position in the current path (baseline path for deletes)
+    baseline_step: Optional[Step] = None
+    current_step: Optional[Step] = None
+
+    @property
+    def description(self) -> str:
+        """Human-readable description of the edit."""
+        def fmt(step: Optional[Step]) -> str:
+            return f"{step[0]}:{step[1]}" if step else ""
+
+        if self.op == "insert":
+            return f"+ {fmt(self.current_step)} (step {self.index + 1})"
+        if self.op == "delete":
+            return f"- {fmt(self.baseline_step)} (step {self.index + 1})"
+        return f"~ {fmt(self.baseline_step)} → {fmt(self.current_step)} (step {self.index + 1})"
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "op": self.op,
+            "index": self.index,
+            "baseline_step": list(self.baseline_step) if self.baseline_step else None,
+            "current_step": list(self.current_step) if self.current_step else None,
+        }
+
+
+def step_diff(baseline: Sequence[Step], current: Sequence[Step]) -> list[StepEdit]:
+    """Return a minimal list of edits turning `baseline` into `current`."""
+    n, m = len(baseline), len(current)
+    table = [[0] * (m + 1) for _ in range(n + 1)]
+    for i in range(n + 1):
+        table[i][0] = i
+    for j in range(m + 1):
+        table[0][j] = j
+    for i in range(1, n + 1):
+        for j in range(1, m + 1):
+            table[i][j] = min(
+                table[i - 1][j] + 1,
+                table[i][j - 1] + 1,
+                table[i - 1][j - 1] + (baseline[i - 1] != current[j - 1]),
+            )
+
+    edits: list[StepEdit] = []
+    i, j = n, m
+    while i or j:
+        if i and j and table[i][j] == table[i - 1][j - 1] + (baseline[i - 1] != current[j - 1]):
+            if baseline[i - 1] != current[j - 1]:
+                edits.append(StepEdit("change", j - 1, baseline[i - 1], current[j - 1]))
+            i, j = i - 1, j - 1
+        elif j and table[i][j] == table[i][j - 1] + 1:
+            edits.append(StepEdit("insert", j - 1, current_step=current[j - 1]))
+            j -= 1
+        else:
+            edits.append(StepEdit("delete", i - 1, baseline_step=baseline[i - 1]))
+            i -= 1
+    edits.reverse()
+    return edits
+
+
+class PathIndex:
+    """Inverted index of path signatures by step bigram."""
+
+    def __init__(self, signatures: Iterable[PathSignature] = ()) -> None:
+        self._signatures: list[PathSignature] = []
+        self._step_ids: dict[Step, int] = {}
+        # bigram -> [(signature position, occurrences)]
+        self._postings: dict[tuple[int, int], list[tuple[int, int]]] = {}
+        # length -> signature positions (for paths too short to filter)
+        self._by_length: dict[int, list[int]] = {}
+        for sig in signatures:
+            self.add(sig)
+
+    def __len__(self) -> int:
+        return len(self._signatures)
+
+    def _bigrams(self, steps: Sequence[Step], assign: bool) -> dict[tuple[int, int], int]:
+        ids = [-1]  # start sentinel
+        for step in steps:
+            step_id = self._step_ids.get(step)
+            if step_id is None:
+                if not assign:
+                    step_id = -3  # never indexed, matches nothing
+                else:
+                    step_id = self._step_ids[step] = len(self._step_ids)
+            ids.append(step_id)
+        ids.append(-2)  # end sentinel
+        grams: dict[tuple[int, int], int] = {}
+        for gram in zip(ids, ids[1:]):
+            grams[gram] = grams.get(gram, 0) + 1
+        return grams
+
+    def add(self, signature: PathSignature) -> None:
+        """Index a signature."""
+        position = len(self._signatures)
+        self._signatures.append(signature)
+        for gram, count in self._bigrams(signature.steps, assign=True).items():
+            self._postings.setdefault(gram, []).append((position, count))
+        self._by_length.setdefault(len(signature.steps), []).append(position)
+
+    def search(self, steps: Sequence[Step], max_distance: int) -> list[tuple[int, PathSignature]]:
+        """Return (distance, signature) pairs within max_distance, closest first."""
+        length = len(steps)
+        shared: dict[int, int] = {}
+        for gram, query_count in self._bigrams(steps, assign=False).items():
+            for position, count in self._postings.get(gram, ()):
+                shared[position] = shared.get(position, 0) + min(query_count, count)
+
+        candidates: set[int] = set()
+        for position, count in shared.items():
+            other_length = len(self._signatures[position].steps)
+            # Each edit destroys at most two of the len + 1 bigrams
+            if (
+                abs(other_length - length) <= max_distance
+                and count >= max(length, other_length) + 1 - 2 * max_distance
+            ):
+                candidates.add(position)
+        # Paths short enough to share no bigram at all are never filtered
+        for other_length in range(max(0, length - max_distance), 2 * max_distance):
+            if max(length, other_length) + 1 <= 2 * max_distance:
+                candidates.update(self._by_length.get(other_length, ()))
+
+        found: list[tuple[int, PathSignature]] = []
+        for position in candidates:
+            signature = self._signatures[position]
+            distance = step_edit_distance(steps, signature.steps, limit=max_distance)
+            if distance <= max_distance:
+                found.append((distance, signature))
+        found.sort(key=lambda item: item[0])
+        return found
+
+
+@dataclass
+class PathMatch:
+    """A missing baseline path paired with the new current path replacing it."""
+
+    baseline: PathDelta
+    current: PathDelta
+    distance: int
+    edits: list[StepEdit] = field(default_factory=list)
+
+    @property
+    def error_changed(self) -> bool:
+        """Whether the error flag differs between the two paths."""
+        return self.baseline.signature.has_error != self.current.signature.has_error
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "baseline_signature": self.baseline.signature.signature_string,
+            "current_signature": self.current.signature.signature_string,
+            "distance": self.distance,
+            "error_changed": self.error_changed,
+            "edits": [edit.to_dict() for edit in self.edits],
+        }
+
+
+def match_near_paths(
+    missing: Sequence[PathDelta],
+    new: Sequence[PathDelta],
+    max_distance: int = DEFAULT_MATCH_DISTANCE,
+) -> list[PathMatch]:
+    """Pair new paths with the closest missing paths.
+
+    Each path is used at most once; pairs are assigned closest first, with
+    ties broken by input order.
+
+    Args:
+        missing: Deltas for paths only in the baseline.
+        new: Deltas for paths only in the current run.
+        max_distance: Maximum step edits for a pair (negative disables).
+
+    Returns:
+        Matches ordered by distance.
+    """
+    if max_distance < 0 or not missing or not new:
+        return []
+
+    # Error and success variants of one step sequence share an index entry
+    by_steps: dict[tuple[Step, ...], list[PathDelta]] = {}
+    for delta in missing:
+        by_steps.setdefault(delta.signature.steps, []).append(delta)
+    index = PathIndex(PathSignature(steps=steps) for steps in by_steps)
+
+    candidates: list[tuple[int, int, int, PathDelta, PathDelta]] = []
+    order = {id(d): i for i, d in enumerate(missing)}
+    for new_index, current in enumerate(new):
+        for distance, sig in index.search(current.signature.steps, max_distance):
+            for baseline in by_steps[sig.steps]:
+                # Prefer the variant with the same error flag
+                penalty = baseline.signature.has_error != current.signature.has_error
+                candidates.append(
+                    (distance * 2 + penalty, new_index, order[id(baseline)], baseline, current)
+                )
+    candidates.sort(key=lambda c: c[:3])
+
+    used_missing: set[int] = set()
+    used_new: set[int] = set()
+    matches: list[PathMatch] = []
+    for _, new_index, missing_index, baseline, current in candidates:
+        if new_index in used_new or missing_index in used_missing:
+            continue
+        used_new.add(new_index)
+        used_missing.add(missing_index)
+        edits = step_diff(baseline.signature.steps, current.signature.steps)
+        matches.append(PathMatch(baseline=baseline, current=current, distance=len(edits), edits=edits))
+    matches.sort(key=lambda m: m.distance)
+    return matches
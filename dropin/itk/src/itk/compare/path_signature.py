@@ -7,6 +7,7 @@ This allows comparing traces to detect structural changes in behavior.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
+from datetime import datetime
 from typing import Optional
 
 from itk.trace.trace_model import Trace
@@ -151,3 +152,86 @@ def compute_trace_latency_ms(trace: Trace) -> float:
         return delta.total_seconds() * 1000.0
     except (ValueError, TypeError):
         return 0.0
+
+
+def _parse_ts(ts: str) -> datetime:
+    # fromisoformat accepts a trailing "Z" from Python 3.11
+    return datetime.fromisoformat(ts)
+
+
+def summarize_trace(trace: Trace) -> tuple[tuple[tuple[str, str], ...], bool, int, float]:
+    """Extract signature parts and latency from a trace in one pass.
+
+    Equivalent to `extract_path_signature` plus `compute_trace_latency_ms`,
+    without building an intermediate signature object; used by the batch
+    comparison engine.
+
+    Returns:
+        Tuple of (steps, has_error, retry_count, latency_ms).
+    """
+    spans = trace.spans
+    if not spans:
+        return (), False, 0, 0.0
+
+    sorted_spans = sorted(spans, key=lambda s: s.ts_start or s.span_id)
+    steps = tuple((s.component, s.operation) for s in sorted_spans)
+    has_error = False
+    max_attempt = 0
+    first_start: Optional[datetime] = None
+    last_end: Optional[datetime] = None
+    latency_ok = True
+
+    for span in spans:
+        if span.error:
+            has_error = True
+        if span.attempt is not None and span.attempt > max_attempt:
+            max_attempt = span.attempt
+        if not latency_ok:
+            continue
+        try:
+            if span.ts_start:
+                start = _parse_ts(span.ts_start)
+                if first_start is None or start < first_start:
+                    first_start = start
+            if span.ts_end:
+                end = _parse_ts(span.ts_end)
+                if last_end is None or end > last_end:
+                    last_end = end
+        except (ValueError, TypeError):
+            latency_ok = False
+
+    latency_ms = 0.0
+    if latency_ok and first_start is not None and last_end is not None:
+        try:
+            latency_ms = (last_end - first_start).total_seconds() * 1000.0
+        except TypeError:
+            pass
+
+    return steps, has_error, max(0, max_attempt - 1), latency_ms
+
+
+class SignatureInterner:
+    """Map path signatures to dense integer IDs.
+
+    Signatures compare by (steps, has_error); the first signature seen for a
+    key is kept, matching how a dict keyed by `PathSignature` behaves.
+    """
+
+    def __init__(self) -> None:
+        self._ids: dict[tuple[tuple[tuple[str, str], ...], bool], int] = {}
+        self.signatures: list[PathSignature] = []
+
+    def __len__(self) -> int:
+        return len(self.signatures)
+
+    def intern(self, steps: tuple[tuple[str, str], ...], has_error: bool, retry_count: int = 0) -> int:
+        """Return the ID for a signature, assigning one if new."""
+        key = (steps, has_error)
+        sig_id = self._ids.get(key)
+        if sig_id is None:
+            sig_id = len(self.signatures)
+            self._ids[key] = sig_id
+            self.signatures.append(
+                PathSignature(steps=steps, has_error=has_error, retry_count=retry_count)
+            )
+        return sig_id
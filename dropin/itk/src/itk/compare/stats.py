@@ -0,0 +1,152 @@
+"""Latency statistics for trace-set comparison.
+
+Percentiles use linear interpolation between closest ranks (the common
+"type 7" definition). Confidence intervals for latency deltas come from a
+percentile bootstrap of the median, which makes no assumption about the
+(typically long-tailed) latency distribution.
+
+Only the standard library is used: latencies are kept in `array('d')`
+buffers and sorted once per signature. Instead of materializing each
+resample, the bootstrap draws the resample median directly: the m-th
+smallest of n uniform draws is Beta(m, n - m + 1) distributed, so the
+median of a resample of sorted data is `values[floor(n * Beta(m, n-m+1))]`.
+Each replicate is O(1) regardless of sample size.
+"""
+from __future__ import annotations
+
+import math
+import random
+from array import array
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, Optional, Sequence
+
+if TYPE_CHECKING:
+    from itk.utils.histogram import LatencyHistogram
+
+DEFAULT_CONFIDENCE = 0.95
+DEFAULT_BOOTSTRAP_RESAMPLES = 1000
+
+# Fewer samples than this on either side: no significance test
+MIN_SAMPLES_FOR_SIGNIFICANCE = 5
+
+
+def percentile(sorted_values: Sequence[float], pct: float) -> float:
+    """Return the pct-th percentile (0-100) of already-sorted values."""
+    n = len(sorted_values)
+    if n == 0:
+        return 0.0
+    rank = (n - 1) * pct / 100.0
+    lo = math.floor(rank)
+    hi = min(lo + 1, n - 1)
+    frac = rank - lo
+    return sorted_values[lo] + (sorted_values[hi] - sorted_values[lo]) * frac
+
+
+@dataclass
+class LatencyDistribution:
+    """Summary of the latencies observed for one path signature."""
+
+    count: int = 0
+    mean_ms: float = 0.0
+    min_ms: float = 0.0
+    p50_ms: float = 0.0
+    p90_ms: float = 0.0
+    p99_ms: float = 0.0
+    max_ms: float = 0.0
+
+    @classmethod
+    def from_sorted(cls, values: Sequence[float]) -> "LatencyDistribution":
+        """Build from latencies sorted ascending."""
+        if not values:
+            return cls()
+        return cls(
+            count=len(values),
+            mean_ms=math.fsum(values) / len(values),
+            min_ms=values[0],
+            p50_ms=percentile(values, 50),
+            p90_ms=percentile(values, 90),
+            p99_ms=percentile(values, 99),
+            max_ms=values[-1],
+        )
+
+    @classmethod
+    def from_histogram(cls, hist: "LatencyHistogram") -> "LatencyDistribution":
+        """Build from a latency sketch (percentiles within bucket error)."""
+        if not hist.count:
+            return cls()
+        return cls(
+            count=hist.count,
+            mean_ms=hist.mean_ms,
+            min_ms=hist.min_ms or 0.0,
+            p50_ms=hist.percentile(50),
+            p90_ms=hist.percentile(90),
+            p99_ms=hist.percentile(99),
+            max_ms=hist.max_ms or 0.0,
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "count": self.count,
+            "mean_ms": self.mean_ms,
+            "min_ms": self.min_ms,
+            "p50_ms": self.p50_ms,
+            "p90_ms": self.p90_ms,
+            "p99_ms": self.p99_ms,
+            "max_ms": self.max_ms,
+        }
+
+
+def _resample_median(sorted_values: Sequence[float], rng: random.Random) -> float:
+    """Draw the median of one bootstrap resample of sorted values."""
+    n = len(sorted_values)
+    if n % 2:
+        m = (n + 1) // 2
+        u = rng.betavariate(m, n - m + 1)
+        return sorted_values[min(int(u * n), n - 1)]
+    # Even n: average the m-th and (m+1)-th order statistics; the latter is
+    # the smallest of the remaining n - m draws above the m-th
+    m = n // 2
+    u = rng.betavariate(m, n - m + 1)
+    u_next = u + (1.0 - u) * rng.betavariate(1, n - m)
+    return (sorted_values[min(int(u * n), n - 1)] + sorted_values[min(int(u_next * n), n - 1)]) / 2.0
+
+
+def bootstrap_median_delta_pct(
+    baseline: Sequence[float],
+    current: Sequence[float],
+    *,
+    confidence: float = DEFAULT_CONFIDENCE,
+    resamples: int = DEFAULT_BOOTSTRAP_RESAMPLES,
+    rng: Optional[random.Random] = None,
+) -> Optional[tuple[float, float]]:
+    """Confidence interval for the relative change in median latency.
+
+    Args:
+        baseline: Baseline latencies, sorted ascending.
+        current: Current latencies, sorted ascending.
+        confidence: Two-sided confidence level (e.g. 0.95).
+        resamples: Number of bootstrap resamples.
+        rng: Random source (seed it for reproducible intervals).
+
+    Returns:
+        (low, high) percentage change of current vs baseline median, or None
+        if either side has too few samples or the baseline median is zero.
+    """
+    if min(len(baseline), len(current)) < MIN_SAMPLES_FOR_SIGNIFICANCE or resamples <= 0:
+        return None
+    rng = rng or random.Random(0)
+
+    deltas = array("d")
+    for _ in range(resamples):
+        base_median = _resample_median(baseline, rng)
+        if base_median <= 0:
+            continue
+        cur_median = _resample_median(current, rng)
+        deltas.append((cur_median - base_median) / base_median * 100.0)
+    if not deltas:
+        return None
+
+    ordered = sorted(deltas)
+    tail = (1.0 - confidence) / 2.0 * 100.0
+    return percentile(ordered, tail), percentile(ordered, 100.0 - tail)
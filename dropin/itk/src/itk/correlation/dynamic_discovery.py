@@ -28,6 +28,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Any, Iterator, Optional
 
+from itk import perf
 from itk.correlation.log_profiler import FactSheet, LogProfiler
 from itk.logs.parse import try_parse_python_dict_repr
 
@@ -631,6 +632,7 @@ def build_correlation_chains(entries: list[LogEntry]) -> list[CorrelationChain]:
     return chains
 
 
+@perf.timed("correlate.discover")
 def discover_correlations(logs: list[dict[str, Any]]) -> list[CorrelationChain]:
     """
     Main entry point: discover correlation chains from raw logs.
@@ -643,7 +645,10 @@ def discover_correlations(logs: list[dict[str, Any]]) -> list[CorrelationChain]:
         correlated log entries across components.
     """
     entries = parse_log_stream(logs)
-    return build_correlation_chains(entries)
+    chains = build_correlation_chains(entries)
+    perf.count("correlate.lines", len(logs))
+    perf.count("correlate.chains", len(chains))
+    return chains
 
 
 def summarize_chains(chains: list[CorrelationChain]) -> str:
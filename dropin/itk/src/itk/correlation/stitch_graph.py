@@ -12,6 +12,7 @@ from collections import defaultdict
 from dataclasses import dataclass, field
 from typing import Iterable, Optional, Set
 
+from itk import perf
 from itk.trace.span_model import Span
 
 
@@ -117,6 +118,7 @@ def _expand_from_seed(
     return discovered
 
 
+@perf.timed("stitch.by_id")
 def stitch_spans_by_id(
     spans: Iterable[Span],
     seed_span_ids: Optional[set[str]] = None,
@@ -168,6 +170,8 @@ def stitch_spans_by_id(
 
     # Return spans in original order, filtered to discovered
     stitched_spans = [s for s in span_list if s.span_id in all_discovered]
+    perf.count("stitch.spans", len(span_list))
+    perf.count("stitch.groups", len(merged_groups))
 
     return StitchResult(
         spans=stitched_spans,
@@ -6,6 +6,7 @@ import json
 from dataclasses import dataclass, field
 from typing import Any
 
+from itk import perf
 from itk.trace.trace_model import Trace
 from itk.trace.span_model import Span
 
@@ -149,6 +150,7 @@ def _format_json_preview(data: dict[str, Any] | None, max_len: int = 100) -> str
         return str(data)[:max_len]
 
 
+@perf.timed("render.html_sequence")
 def render_html_sequence(
     trace: Trace,
     title: str = "Sequence Diagram",
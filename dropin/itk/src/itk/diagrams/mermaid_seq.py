@@ -4,6 +4,7 @@ from collections import OrderedDict
 from dataclasses import dataclass
 from typing import Sequence
 
+from itk import perf
 from itk.trace.span_model import Span
 from itk.trace.trace_model import Trace
 
@@ -137,6 +138,7 @@ def _detect_retry_spans(spans: Sequence[Span]) -> set[str]:
     return retry_span_ids
 
 
+@perf.timed("render.mermaid")
 def render_mermaid_sequence(trace: Trace) -> str:
     """Render a Mermaid sequence diagram from a trace.
 
@@ -16,6 +16,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from itk import perf
 from itk.trace.trace_model import Trace
 from itk.trace.span_model import Span
 from itk.diagrams.trace_viewer import COMPONENT_COLORS, _load_vendor_js
@@ -338,6 +339,7 @@ def _render_time_axis(time_range_ms: float, chart_width: int, num_rows: int) ->
     </g>'''
 
 
+@perf.timed("render.timeline")
 def render_timeline_viewer(
     trace: Trace,
     title: str = "Timeline View",
@@ -933,6 +935,7 @@ def render_timeline_viewer(
 </html>'''
 
 
+@perf.timed("render.mini_timeline")
 def render_mini_timeline(
     trace: Trace,
     width: int = 200,
@@ -17,6 +17,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
 
+from itk import perf
 from itk.trace.trace_model import Trace
 from itk.trace.span_model import Span
 
@@ -550,6 +551,7 @@ def _render_svg_message_legacy(
         </g>'''
 
 
+@perf.timed("render.trace_viewer")
 def render_trace_viewer(
     trace: Trace,
     title: str = "Trace Viewer",
@@ -1560,6 +1562,7 @@ def render_trace_viewer(
 </html>'''
 
 
+@perf.timed("render.mini_svg")
 def render_mini_svg(
     trace: Trace,
     width: int = 200,
@@ -5,14 +5,24 @@ Used for testing agent-based workflows and capturing trace data for analysis.
 
 Tier 2 (offline): Validates configuration and provides mock responses
 Tier 3 (online): Actually invokes Bedrock Agents
+
+Live invocations also record client-side stream timing (`StreamTiming`):
+time to first token, total stream time, chunk count/bytes and the arrival
+offset of every trace event, grouped into phases (pre-processing, model
+invocation, action group, ...). `bedrock_traces_to_spans` turns these into
+client-side spans so the timeline shows client-observed latency.
 """
 from __future__ import annotations
 
 import json
+import time
 import uuid
-from dataclasses import dataclass, field
-from datetime import datetime, timezone
-from typing import Any, Iterator, Optional
+from dataclasses import dataclass, field, replace
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Any, Iterator, Optional
+
+if TYPE_CHECKING:
+    from itk.aws.retry import RetryEngine, RetryTelemetry
 
 # Note: boto3 import is deferred to runtime to avoid issues in offline mode
 
@@ -57,6 +67,140 @@ class BedrockAgentTarget:
     region: Optional[str] = None
 
 
+def trace_phase(trace: dict[str, Any]) -> str:
+    """Classify a trace event into a client-visible phase.
+
+    Accepts both the stream's TracePart (with a nested "trace") and a bare
+    trace dict.
+    """
+    inner = trace.get("trace", trace)
+    if "preProcessingTrace" in inner:
+        return "pre-processing"
+    if "postProcessingTrace" in inner:
+        return "post-processing"
+    if "guardrailTrace" in inner:
+        return "guardrail"
+    if "failureTrace" in inner:
+        return "failure"
+    orch = inner.get("orchestrationTrace")
+    if orch is not None:
+        if "modelInvocationInput" in orch or "modelInvocationOutput" in orch:
+            return "model-invocation"
+        invocation = orch.get("invocationInput") or orch.get("observation") or {}
+        if (invocation.get("invocationType") or invocation.get("type")) == "ACTION_GROUP":
+            return "action-group"
+        return "orchestration"
+    return "unknown"
+
+
+@dataclass
+class StreamPhase:
+    """A run of consecutive trace events of one phase, as seen by the client."""
+
+    name: str
+    start_ms: float  # Arrival of the first event, relative to the request
+    end_ms: float  # Arrival of the next phase's first event (or stream end)
+    event_count: int
+
+    @property
+    def duration_ms(self) -> float:
+        return self.end_ms - self.start_ms
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "name": self.name,
+            "start_ms": round(self.start_ms, 3),
+            "end_ms": round(self.end_ms, 3),
+            "duration_ms": round(self.duration_ms, 3),
+            "event_count": self.event_count,
+        }
+
+
+@dataclass
+class StreamTiming:
+    """Client-side timing of one invoke_agent response stream.
+
+    All offsets are monotonic milliseconds since the request was sent.
+    """
+
+    started_at: str  # Wall-clock ISO timestamp when the request was sent
+    request_ms: float = 0.0  # Until invoke_agent returned (response headers)
+    total_ms: float = 0.0  # Until the stream was fully consumed
+    chunk_count: int = 0
+    chunk_bytes: int = 0
+    chunk_offsets_ms: list[float] = field(default_factory=list)
+    trace_offsets_ms: list[float] = field(default_factory=list)  # Parallel to traces
+    phases: list[StreamPhase] = field(default_factory=list)
+
+    @property
+    def ttft_ms(self) -> Optional[float]:
+        """Time to first completion chunk (None if no chunk arrived)."""
+        return self.chunk_offsets_ms[0] if self.chunk_offsets_ms else None
+
+    @property
+    def chunk_gaps_ms(self) -> list[float]:
+        """Gaps between consecutive completion chunks."""
+        offsets = self.chunk_offsets_ms
+        return [b - a for a, b in zip(offsets, offsets[1:])]
+
+    @property
+    def max_chunk_gap_ms(self) -> Optional[float]:
+        gaps = self.chunk_gaps_ms
+        return max(gaps) if gaps else None
+
+    def timestamp_at(self, offset_ms: float) -> str:
+        """Wall-clock ISO timestamp for an offset."""
+        start = datetime.fromisoformat(self.started_at)
+        return (start + timedelta(milliseconds=offset_ms)).isoformat()
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "started_at": self.started_at,
+            "request_ms": round(self.request_ms, 3),
+            "ttft_ms": round(self.ttft_ms, 3) if self.ttft_ms is not None else None,
+            "total_ms": round(self.total_ms, 3),
+            "chunk_count": self.chunk_count,
+            "chunk_bytes": self.chunk_bytes,
+            "max_chunk_gap_ms": (
+                round(self.max_chunk_gap_ms, 3) if self.max_chunk_gap_ms is not None else None
+            ),
+            "chunk_offsets_ms": [round(o, 3) for o in self.chunk_offsets_ms],
+            "trace_offsets_ms": [round(o, 3) for o in self.trace_offsets_ms],
+            "phases": [p.to_dict() for p in self.phases],
+        }
+
+
+def group_stream_phases(
+    traces: list[dict[str, Any]],
+    offsets_ms: list[float],
+    end_ms: float,
+) -> list[StreamPhase]:
+    """Group trace events by arrival into consecutive phases.
+
+    Args:
+        traces: Trace events in arrival order
+        offsets_ms: Arrival offset of each trace event
+        end_ms: Offset at which the stream ended
+
+    Returns:
+        One StreamPhase per run of same-phase events
+    """
+    phases: list[StreamPhase] = []
+    for trace, offset in zip(traces, offsets_ms):
+        name = trace_phase(trace)
+        if phases and phases[-1].name == name:
+            phases[-1].event_count += 1
+            continue
+        if phases:
+            phases[-1].end_ms = offset
+        phases.append(StreamPhase(name=name, start_ms=offset, end_ms=offset, event_count=1))
+    if phases:
+        phases[-1].end_ms = max(end_ms, phases[-1].start_ms)
+    return phases
+
+
 @dataclass
 class BedrockAgentResponse:
     """Response from a Bedrock Agent invocation."""
@@ -66,6 +210,8 @@ class BedrockAgentResponse:
     traces: list[dict[str, Any]] = field(default_factory=list)
     citations: list[dict[str, Any]] = field(default_factory=list)
     timestamp: str = ""
+    timing: Optional[StreamTiming] = None  # Client-side stream timing (live only)
+    retry: Optional["RetryTelemetry"] = None  # Client-side retries (live only)
 
 
 class BedrockAgentAdapter:
@@ -80,6 +226,8 @@ class BedrockAgentAdapter:
         target: BedrockAgentTarget,
         offline: bool = False,
         timeout_seconds: int = DEFAULT_INVOKE_TIMEOUT,
+        retry: Optional["RetryEngine"] = None,
+        retry_timeouts: bool = False,
     ):
         """Initialize the Bedrock Agent adapter.
 
@@ -87,11 +235,25 @@ class BedrockAgentAdapter:
             target: Target configuration
             offline: If True, operations return mock responses
             timeout_seconds: Timeout for agent invocations (default: 60)
+            retry: Retry engine (default: the process-wide engine)
+            retry_timeouts: Also retry invocations that timed out before the
+                response stream started. Off by default: invoke_agent is not
+                idempotent, and a timed-out invocation may still have run
+                its action groups in the session.
         """
         self._target = target
         self._offline = offline
         self._timeout_seconds = timeout_seconds
         self._client: Any = None
+        self._retry = retry
+        self._retry_timeouts = retry_timeouts
+
+    def _get_retry(self) -> "RetryEngine":
+        if self._retry is None:
+            from itk.aws.retry import get_retry_engine
+
+            self._retry = get_retry_engine()
+        return self._retry
 
     def _validate_target(self) -> None:
         """Validate the target configuration."""
@@ -126,20 +288,14 @@ class BedrockAgentAdapter:
             raise NotImplementedError("Bedrock operations not available in offline mode")
 
         if self._client is None:
-            import boto3
-            from botocore.config import Config
+            from itk.aws import get_client
 
-            # Configure timeouts
-            config = Config(
+            self._client = get_client(
+                "bedrock-agent-runtime",
+                self._target.region,
                 connect_timeout=10,
                 read_timeout=self._timeout_seconds,
-                retries={"max_attempts": 2},
-            )
-
-            self._client = boto3.client(
-                "bedrock-agent-runtime",
-                region_name=self._target.region,
-                config=config,
+                max_attempts=2,
             )
         return self._client
 
@@ -150,6 +306,7 @@ class BedrockAgentAdapter:
         session_attributes: Optional[dict[str, str]] = None,
         prompt_session_attributes: Optional[dict[str, str]] = None,
         enable_trace: bool = True,
+        retry: Optional["RetryEngine"] = None,
     ) -> BedrockAgentResponse:
         """Invoke the Bedrock Agent.
 
@@ -159,9 +316,16 @@ class BedrockAgentAdapter:
             session_attributes: Optional session state attributes
             prompt_session_attributes: Optional prompt-level attributes
             enable_trace: Whether to capture trace data (default True)
+            retry: Retry engine for this call (default: the adapter's)
 
         Returns:
             BedrockAgentResponse with completion and traces
+
+        Throttled and transient failures raised before the response stream
+        starts are retried with backoff (see `itk.aws.retry`); timeouts only
+        if the adapter was created with `retry_timeouts`. Failures once the
+        stream has started are never retried, since the agent has already
+        run. The response's `retry` records what happened.
         """
         self._validate_target()
 
@@ -184,8 +348,33 @@ class BedrockAgentAdapter:
                 timestamp=datetime.now(timezone.utc).isoformat(),
             )
 
+        engine = retry or self._get_retry()
+        if not self._retry_timeouts:
+            engine = engine.with_policy(replace(engine.policy, retry_timeouts=False))
+        response, telemetry = engine.call(
+            self._invoke_once,
+            input_text,
+            session_id,
+            session_attributes,
+            prompt_session_attributes,
+            enable_trace,
+        )
+        response.retry = telemetry
+        return response
+
+    def _invoke_once(
+        self,
+        input_text: str,
+        session_id: str,
+        session_attributes: Optional[dict[str, str]],
+        prompt_session_attributes: Optional[dict[str, str]],
+        enable_trace: bool,
+    ) -> BedrockAgentResponse:
+        """Make one invoke_agent call and consume its stream."""
         from botocore.exceptions import ClientError, ReadTimeoutError
 
+        from itk.aws.retry import mark_not_retryable
+
         client = self._get_client()
 
         # Build session state if attributes provided
@@ -207,6 +396,8 @@ class BedrockAgentAdapter:
         if session_state:
             invoke_params["sessionState"] = session_state
 
+        timing = StreamTiming(started_at=datetime.now(timezone.utc).isoformat())
+        t0 = time.perf_counter()
         try:
             response = client.invoke_agent(**invoke_params)
         except ReadTimeoutError as e:
@@ -228,6 +419,7 @@ class BedrockAgentAdapter:
                     f"Run 'itk discover' to verify agent configuration."
                 ) from e
             raise
+        timing.request_ms = (time.perf_counter() - t0) * 1000
 
         # Process the streaming response
         completion_parts: list[str] = []
@@ -236,22 +428,34 @@ class BedrockAgentAdapter:
 
         try:
             for event in response.get("completion", []):
+                offset_ms = (time.perf_counter() - t0) * 1000
+
                 # Handle different event types in the stream
                 if "chunk" in event:
                     chunk = event["chunk"]
                     if "bytes" in chunk:
                         completion_parts.append(chunk["bytes"].decode("utf-8"))
+                        timing.chunk_count += 1
+                        timing.chunk_bytes += len(chunk["bytes"])
+                        timing.chunk_offsets_ms.append(offset_ms)
                     if "attribution" in chunk:
                         citations.extend(chunk["attribution"].get("citations", []))
 
                 if "trace" in event:
                     traces.append(event["trace"])
+                    timing.trace_offsets_ms.append(offset_ms)
         except ReadTimeoutError as e:
-            raise AgentTimeoutError(
+            raise mark_not_retryable(AgentTimeoutError(
                 f"Agent response stream timed out after {self._timeout_seconds}s. "
                 f"Partial completion received: {len(completion_parts)} chunks.",
                 timeout_seconds=self._timeout_seconds,
-            ) from e
+            )) from e
+        except Exception as e:
+            # The agent has already run; re-sending would repeat its actions
+            mark_not_retryable(e)
+            raise
+        timing.total_ms = (time.perf_counter() - t0) * 1000
+        timing.phases = group_stream_phases(traces, timing.trace_offsets_ms, timing.total_ms)
 
         return BedrockAgentResponse(
             session_id=session_id,
@@ -259,6 +463,7 @@ class BedrockAgentAdapter:
             traces=traces,
             citations=citations,
             timestamp=datetime.now(timezone.utc).isoformat(),
+            timing=timing,
         )
 
     def invoke_with_retries(
@@ -270,33 +475,23 @@ class BedrockAgentAdapter:
     ) -> tuple[BedrockAgentResponse, int]:
         """Invoke the agent with automatic retries on failure.
 
+        Only throttled and transient failures are retried, with backoff,
+        drawing on the same retry budget as `invoke`.
+
         Args:
             input_text: The user input
             session_id: Optional session ID
-            max_retries: Maximum number of retry attempts
+            max_retries: Maximum number of attempts
             **kwargs: Additional arguments for invoke()
 
         Returns:
             Tuple of (response, attempt_count)
         """
-        last_error: Optional[Exception] = None
-
-        for attempt in range(1, max_retries + 1):
-            try:
-                response = self.invoke(
-                    input_text=input_text,
-                    session_id=session_id,
-                    **kwargs,
-                )
-                return response, attempt
-            except Exception as e:
-                last_error = e
-                # Could add exponential backoff here
-                continue
-
-        if last_error:
-            raise last_error
-        raise RuntimeError("Unexpected error in invoke_with_retries")
+        engine = self._get_retry()
+        engine = engine.with_policy(replace(engine.policy, max_attempts=max_retries))
+        response = self.invoke(input_text=input_text, session_id=session_id, retry=engine, **kwargs)
+        attempts = response.retry.attempts if response.retry is not None else 1
+        return response, attempts
 
 
 # Backward compatibility alias
@@ -11,9 +11,12 @@ from __future__ import annotations
 
 import json
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+if TYPE_CHECKING:
+    from itk.aws.retry import RetryEngine, RetryTelemetry
 
 # Note: boto3 import is deferred to runtime to avoid issues in offline mode
 
@@ -38,6 +41,7 @@ class LambdaInvokeResponse:
     function_error: Optional[str] = None
     executed_version: Optional[str] = None
     timestamp: str = ""
+    retry: Optional["RetryTelemetry"] = None  # Client-side retries (live only)
 
 
 class LambdaDirectAdapter:
@@ -51,16 +55,26 @@ class LambdaDirectAdapter:
         self,
         target: LambdaTarget,
         offline: bool = False,
+        retry: Optional["RetryEngine"] = None,
     ):
         """Initialize the Lambda direct adapter.
 
         Args:
             target: Target configuration
             offline: If True, operations return mock responses
+            retry: Retry engine (default: the process-wide engine)
         """
         self._target = target
         self._offline = offline
         self._client: Any = None
+        self._retry = retry
+
+    def _get_retry(self) -> "RetryEngine":
+        if self._retry is None:
+            from itk.aws.retry import get_retry_engine
+
+            self._retry = get_retry_engine()
+        return self._retry
 
     def _validate_target(self) -> None:
         """Validate the target configuration."""
@@ -79,9 +93,9 @@ class LambdaDirectAdapter:
             raise NotImplementedError("Lambda operations not available in offline mode")
 
         if self._client is None:
-            import boto3
+            from itk.aws import get_client
 
-            self._client = boto3.client("lambda", region_name=self._target.region)
+            self._client = get_client("lambda", self._target.region)
         return self._client
 
     def invoke(
@@ -126,7 +140,13 @@ class LambdaDirectAdapter:
         if self._target.qualifier:
             invoke_params["Qualifier"] = self._target.qualifier
 
-        response = client.invoke(**invoke_params)
+        # Throttles (TooManyRequestsException) are rejected before the function runs.
+        # A synchronous invoke that timed out may still be running, so resending
+        # it would run the function twice; queued "Event" invokes are safe to retry.
+        engine = self._get_retry()
+        if invocation_type == "RequestResponse":
+            engine = engine.with_policy(replace(engine.policy, retry_timeouts=False))
+        response, telemetry = engine.call(client.invoke, **invoke_params)
 
         # Parse response payload
         response_payload = {}
@@ -153,6 +173,7 @@ class LambdaDirectAdapter:
             function_error=response.get("FunctionError"),
             executed_version=response.get("ExecutedVersion"),
             timestamp=datetime.now(timezone.utc).isoformat(),
+            retry=telemetry,
         )
 
     def invoke_async(self, payload: dict[str, Any]) -> LambdaInvokeResponse:
@@ -0,0 +1,348 @@
+"""Async Lambda fan-out load generator.
+
+Fires N `InvocationType=Event` invocations through `LambdaDirectAdapter`
+at a controlled rate, each with its own correlation ID injected into the
+payload. Lambda acknowledges async invocations as soon as the event is
+queued (202), so two latencies matter and they differ by orders of
+magnitude under load:
+
+- acceptance latency: Invoke call until the 202 (client-side)
+- end-to-end latency: dispatch until the last log line that mentions the
+  invocation's correlation ID (from CloudWatch, after the run)
+
+Example:
+    fanout = LambdaFanout(LambdaDirectAdapter(target), rate_per_second=20)
+    result = fanout.fire({"action": "ping"}, count=200)
+    fanout.collect(result, log_groups=["/aws/lambda/my-fn"])
+    print(result.to_dict()["end_to_end"])
+"""
+from __future__ import annotations
+
+import copy
+import re
+import threading
+import time
+import uuid
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any, Callable, Iterable, Optional
+
+from itk.compare.stats import LatencyDistribution
+
+if TYPE_CHECKING:
+    from itk.entrypoints.lambda_direct import LambdaDirectAdapter
+    from itk.logs.cloudwatch_fetch import CloudWatchLogsClient
+
+DEFAULT_FANOUT_RATE = 10.0  # Invocations per second
+DEFAULT_FANOUT_CONCURRENCY = 16  # Invoke calls in flight
+
+# Payload key that carries the correlation ID (ITK's log correlation key)
+DEFAULT_CORRELATION_KEY = "itk_trace_id"
+
+
+@dataclass
+class FanoutInvocation:
+    """One async invocation of a fan-out run."""
+
+    index: int
+    correlation_id: str
+    scheduled_at: float  # Epoch seconds the rate schedule asked for
+    dispatched_at: float = 0.0  # Epoch seconds the Invoke call started
+    accept_ms: Optional[float] = None  # Invoke call duration (None if rejected)
+    request_id: Optional[str] = None
+    status_code: Optional[int] = None
+    client_retries: int = 0
+    error: Optional[str] = None
+    completed_at: Optional[float] = None  # Epoch seconds of the last matching log line
+    log_events: int = 0
+
+    @property
+    def accepted(self) -> bool:
+        return self.error is None and self.status_code is not None and self.status_code < 300
+
+    @property
+    def dispatch_lag_ms(self) -> float:
+        """How far behind the rate schedule the call started."""
+        return max(0.0, (self.dispatched_at - self.scheduled_at) * 1000)
+
+    @property
+    def end_to_end_ms(self) -> Optional[float]:
+        if self.completed_at is None:
+            return None
+        return (self.completed_at - self.dispatched_at) * 1000
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "index": self.index,
+            "correlation_id": self.correlation_id,
+            "dispatched_at": datetime.fromtimestamp(self.dispatched_at, timezone.utc).isoformat(),
+            "dispatch_lag_ms": round(self.dispatch_lag_ms, 1),
+            "accept_ms": round(self.accept_ms, 1) if self.accept_ms is not None else None,
+            "end_to_end_ms": round(self.end_to_end_ms, 1) if self.end_to_end_ms is not None else None,
+            "request_id": self.request_id,
+            "status_code": self.status_code,
+            "client_retries": self.client_retries,
+            "log_events": self.log_events,
+            "error": self.error,
+        }
+
+
+@dataclass
+class FanoutResult:
+    """Outcome of a fan-out run."""
+
+    run_id: str
+    function: str
+    rate_per_second: float
+    invocations: list[FanoutInvocation] = field(default_factory=list)
+    duration_ms: float = 0.0  # First dispatch to last acceptance
+    collected: bool = False  # collect() ran
+    collect_truncated: bool = False  # collect() hit its row limit; some completions are missing
+
+    @property
+    def accepted(self) -> list[FanoutInvocation]:
+        return [i for i in self.invocations if i.accepted]
+
+    @property
+    def completed(self) -> list[FanoutInvocation]:
+        return [i for i in self.invocations if i.completed_at is not None]
+
+    @property
+    def achieved_rate(self) -> float:
+        """Invocations dispatched per second."""
+        if self.duration_ms <= 0:
+            return 0.0
+        return len(self.invocations) / (self.duration_ms / 1000)
+
+    def acceptance_latency(self) -> LatencyDistribution:
+        return LatencyDistribution.from_sorted(
+            sorted(i.accept_ms for i in self.invocations if i.accept_ms is not None)
+        )
+
+    def end_to_end_latency(self) -> LatencyDistribution:
+        return LatencyDistribution.from_sorted(
+            sorted(i.end_to_end_ms for i in self.completed if i.end_to_end_ms is not None)
+        )
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "run_id": self.run_id,
+            "function": self.function,
+            "requested": len(self.invocations),
+            "accepted": len(self.accepted),
+            "completed": len(self.completed) if self.collected else None,
+            "collect_truncated": self.collect_truncated,
+            "rate_per_second": self.rate_per_second,
+            "achieved_rate": round(self.achieved_rate, 2),
+            "duration_ms": round(self.duration_ms, 1),
+            "client_retries": sum(i.client_retries for i in self.invocations),
+            "acceptance": self.acceptance_latency().to_dict(),
+            "end_to_end": self.end_to_end_latency().to_dict() if self.collected else None,
+            "invocations": [i.to_dict() for i in self.invocations],
+        }
+
+
+def correlation_pattern(run_id: str) -> re.Pattern[str]:
+    """Regex matching the correlation IDs of one fan-out run."""
+    return re.compile(rf"itk-fanout-{re.escape(run_id)}-\d+")
+
+
+def _event_epoch(value: Any) -> Optional[float]:
+    """Epoch seconds from a CloudWatch timestamp (ms int or Insights string)."""
+    if isinstance(value, (int, float)):
+        return value / 1000
+    if not value:
+        return None
+    text = str(value).strip()
+    if text.isdigit():
+        return int(text) / 1000
+    try:
+        parsed = datetime.fromisoformat(text.replace(" ", "T").replace("Z", "+00:00"))
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)  # Logs Insights timestamps are UTC
+    return parsed.timestamp()
+
+
+def match_completions(result: FanoutResult, log_events: Iterable[dict[str, Any]]) -> int:
+    """Attach log-derived completion times to a fan-out result.
+
+    An invocation's completion is the latest log event that mentions its
+    correlation ID.
+
+    Args:
+        result: Fan-out result to update in place
+        log_events: Events with `timestamp` and `message` keys, and
+            optionally `count` when one event stands for several log lines
+
+    Returns:
+        Number of invocations with at least one matching event
+    """
+    by_id = {i.correlation_id: i for i in result.invocations}
+    pattern = correlation_pattern(result.run_id)
+    for event in log_events:
+        ts = _event_epoch(event.get("timestamp"))
+        if ts is None:
+            continue
+        for correlation_id in set(pattern.findall(str(event.get("message", "")))):
+            invocation = by_id.get(correlation_id)
+            if invocation is None:
+                continue
+            invocation.log_events += int(event.get("count") or 1)
+            if invocation.completed_at is None or ts > invocation.completed_at:
+                invocation.completed_at = ts
+    result.collected = True
+    return len(result.completed)
+
+
+class LambdaFanout:
+    """Fire async Lambda invocations at a controlled rate."""
+
+    def __init__(
+        self,
+        adapter: "LambdaDirectAdapter",
+        rate_per_second: float = DEFAULT_FANOUT_RATE,
+        concurrency: int = DEFAULT_FANOUT_CONCURRENCY,
+        correlation_key: str = DEFAULT_CORRELATION_KEY,
+        clock: Callable[[], float] = time.time,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        """Initialize the fan-out generator.
+
+        Args:
+            adapter: Adapter for the target function (live or offline)
+            rate_per_second: Dispatch rate; calls are spaced 1/rate apart
+            concurrency: Maximum Invoke calls in flight
+            correlation_key: Top-level payload key for the correlation ID
+            clock: Epoch-seconds clock (injectable for tests)
+            sleep: Sleep function (injectable for tests)
+        """
+        if rate_per_second <= 0:
+            raise ValueError("rate_per_second must be positive")
+        self._adapter = adapter
+        self.rate_per_second = rate_per_second
+        self.concurrency = max(1, concurrency)
+        self.correlation_key = correlation_key
+        self._clock = clock
+        self._sleep = sleep
+
+    def fire(self, payload: dict[str, Any], count: int, run_id: Optional[str] = None) -> FanoutResult:
+        """Dispatch `count` async invocations and wait for all acceptances.
+
+        Args:
+            payload: Event payload; each invocation gets a copy with its
+                correlation ID under `correlation_key`
+            count: Number of invocations
+            run_id: Identifier embedded in every correlation ID (default: random)
+
+        Returns:
+            FanoutResult with per-invocation acceptance data
+        """
+        run_id = run_id or uuid.uuid4().hex[:12]
+        result = FanoutResult(
+            run_id=run_id,
+            function=self._adapter._target.function_name_or_arn,
+            rate_per_second=self.rate_per_second,
+        )
+        interval = 1.0 / self.rate_per_second
+        start = self._clock()
+        lock = threading.Lock()
+        last_accept = start
+
+        def invoke(invocation: FanoutInvocation) -> None:
+            nonlocal last_accept
+            event = copy.deepcopy(payload)
+            event[self.correlation_key] = invocation.correlation_id
+            invocation.dispatched_at = self._clock()
+            began = time.perf_counter()
+            try:
+                response = self._adapter.invoke_async(event)
+            except Exception as e:  # Rejected after retries; keep firing the rest
+                invocation.error = f"{type(e).__name__}: {e}"
+                telemetry = getattr(e, "retry_telemetry", None)
+            else:
+                invocation.accept_ms = (time.perf_counter() - began) * 1000
+                invocation.request_id = response.request_id
+                invocation.status_code = response.status_code
+                telemetry = response.retry
+            if telemetry is not None:
+                invocation.client_retries = telemetry.client_retries
+            with lock:
+                last_accept = max(last_accept, self._clock())
+
+        with ThreadPoolExecutor(max_workers=self.concurrency) as pool:
+            for index in range(count):
+                scheduled = start + index * interval
+                delay = scheduled - self._clock()
+                if delay > 0:
+                    self._sleep(delay)
+                invocation = FanoutInvocation(
+                    index=index,
+                    correlation_id=f"itk-fanout-{run_id}-{index:05d}",
+                    scheduled_at=scheduled,
+                )
+                result.invocations.append(invocation)
+                pool.submit(invoke, invocation)
+
+        result.duration_ms = (last_accept - start) * 1000
+        return result
+
+    def collect(
+        self,
+        result: FanoutResult,
+        log_groups: list[str],
+        logs_client: Optional["CloudWatchLogsClient"] = None,
+        settle_seconds: float = 0.0,
+        limit: int = 10000,
+    ) -> int:
+        """Find each invocation's completion in CloudWatch Logs.
+
+        Runs one Logs Insights query that aggregates the log lines
+        mentioning the run ID to the latest timestamp per correlation ID,
+        so the row limit caps invocations rather than log lines.
+
+        Args:
+            result: Result from `fire`, updated in place
+            log_groups: Log groups the function (and its downstreams) log to
+            logs_client: CloudWatch client (default: live client for the adapter's region)
+            settle_seconds: Wait before querying, for processing and log delivery
+            limit: Maximum correlation IDs to fetch; reaching it sets
+                `result.collect_truncated`
+
+        Returns:
+            Number of invocations seen completing
+        """
+        from itk.logs.cloudwatch_fetch import CloudWatchLogsClient, CloudWatchQuery
+
+        if settle_seconds > 0:
+            self._sleep(settle_seconds)
+        if not result.invocations or not log_groups:
+            result.collected = True
+            return 0
+
+        client = logs_client or CloudWatchLogsClient(region=self._adapter._target.region)
+        first = min(i.dispatched_at or i.scheduled_at for i in result.invocations)
+        prefix = f"itk-fanout-{result.run_id}-"
+        query = CloudWatchQuery(
+            log_groups=log_groups,
+            query_string=(
+                "fields @timestamp, @message"
+                f" | filter @message like /{prefix}/"
+                f" | parse @message /(?<cid>{prefix}\\d+)/"
+                " | stats max(@timestamp) as completed_at, count(*) as events by cid"
+                f" | limit {limit}"
+            ),
+            start_time_ms=int((first - 5) * 1000),
+            end_time_ms=int((self._clock() + 5) * 1000),
+        )
+        rows = client.run_query(query).results
+        result.collect_truncated = len(rows) >= limit
+        events = [
+            {"timestamp": r.get("completed_at"), "message": r.get("cid", ""), "count": r.get("events")}
+            for r in rows
+        ]
+        return match_completions(result, events)
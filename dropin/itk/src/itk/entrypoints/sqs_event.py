@@ -5,17 +5,36 @@ SQS is the "golden path" for integration testing as it exercises the full async
 
 Tier 2 (offline): Validates configuration and provides mock responses
 Tier 3 (online): Actually publishes to SQS or invokes Lambda directly
+
+`SqsEventAdapter.replay` publishes one message. `replay_batch` publishes
+every record of a multi-record event (optionally repeated for bursts) with
+concurrent SendMessageBatch calls, resending partially failed batches, and
+returns per-record message IDs that can seed correlation.
 """
 from __future__ import annotations
 
 import json
+import threading
+import time
 import uuid
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
+
+from itk.trace.span_model import Span
+
+if TYPE_CHECKING:
+    from itk.aws.retry import RetryEngine, RetryTelemetry
 
 # Note: boto3 import is deferred to runtime to avoid issues in offline mode
 
+# SendMessageBatch accepts at most 10 entries
+SQS_MAX_BATCH_ENTRIES = 10
+
+# Concurrent SendMessageBatch calls during batch replay
+DEFAULT_BATCH_CONCURRENCY = 8
+
 
 @dataclass(frozen=True)
 class SqsEventTarget:
@@ -34,6 +53,124 @@ class SqsPublishResult:
     sequence_number: Optional[str] = None
     md5_of_body: Optional[str] = None
     timestamp: str = ""
+    retry: Optional["RetryTelemetry"] = None  # Client-side retries (live only)
+
+
+@dataclass
+class SqsRecordResult:
+    """Outcome of publishing one record in a batch replay."""
+
+    index: int  # Position in the replayed record list
+    message_id: Optional[str] = None
+    sequence_number: Optional[str] = None
+    error_code: Optional[str] = None
+    error_message: Optional[str] = None
+    attempts: int = 0
+    sent_at: str = ""
+
+    @property
+    def ok(self) -> bool:
+        return self.message_id is not None
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "index": self.index,
+            "message_id": self.message_id,
+            "sequence_number": self.sequence_number,
+            "error_code": self.error_code,
+            "error_message": self.error_message,
+            "attempts": self.attempts,
+            "sent_at": self.sent_at,
+        }
+
+
+@dataclass
+class SqsBatchReplayResult:
+    """Result of publishing many records with SendMessageBatch."""
+
+    queue_url: str
+    records: list[SqsRecordResult]
+    batch_count: int = 0
+    duration_ms: float = 0.0
+    # Batch resends (throttles, transient and partial failures), merged over batches
+    retry: Optional["RetryTelemetry"] = None
+    itk_trace_id: Optional[str] = None
+
+    @property
+    def client_retries(self) -> int:
+        return self.retry.client_retries if self.retry is not None else 0
+
+    @property
+    def message_ids(self) -> list[Optional[str]]:
+        """Message ID per record, in record order (None if it failed)."""
+        return [r.message_id for r in self.records]
+
+    @property
+    def sent_count(self) -> int:
+        return sum(1 for r in self.records if r.ok)
+
+    @property
+    def failed(self) -> list[SqsRecordResult]:
+        return [r for r in self.records if not r.ok]
+
+    @property
+    def messages_per_second(self) -> float:
+        if self.duration_ms <= 0:
+            return 0.0
+        return self.sent_count / (self.duration_ms / 1000)
+
+    def seed_spans(self) -> list[Span]:
+        """One `SendMessage` span per published record.
+
+        Each span carries the SQS message ID (and ITK trace ID), so the
+        correlation engine can stitch consumer log spans onto the replay.
+        """
+        queue_name = self.queue_url.rstrip("/").rsplit("/", 1)[-1]
+        return [
+            Span(
+                span_id=f"sqs-send-{r.index:04d}",
+                parent_span_id=None,
+                component=f"sqs:{queue_name}",
+                operation="SendMessage",
+                ts_start=r.sent_at,
+                ts_end=r.sent_at,
+                itk_trace_id=self.itk_trace_id,
+                sqs_message_id=r.message_id,
+                request={"record_index": r.index},
+                is_async=True,
+            )
+            for r in self.records
+            if r.ok
+        ]
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "queue_url": self.queue_url,
+            "batch_count": self.batch_count,
+            "duration_ms": round(self.duration_ms, 1),
+            "sent_count": self.sent_count,
+            "failed_count": len(self.failed),
+            "messages_per_second": round(self.messages_per_second, 1),
+            "client_retries": self.client_retries,
+            "records": [r.to_dict() for r in self.records],
+        }
+
+
+class SqsPartialBatchError(Exception):
+    """Some entries of a SendMessageBatch call failed on the server side.
+
+    Carries a botocore-style `response` so the retry engine classifies it by
+    the first failure's code.
+    """
+
+    def __init__(self, failed: list[dict[str, Any]]):
+        code = failed[0].get("Code", "InternalError")
+        message = f"{len(failed)} batch entries failed ({code})"
+        super().__init__(message)
+        self.failed = failed
+        self.response = {"Error": {"Code": code, "Message": message}}
 
 
 @dataclass
@@ -44,6 +181,7 @@ class LambdaInvokeResult:
     status_code: int
     payload: dict[str, Any] = field(default_factory=dict)
     function_error: Optional[str] = None
+    retry: Optional["RetryTelemetry"] = None  # Client-side retries (live only)
 
 
 class SqsEventAdapter:
@@ -58,17 +196,27 @@ class SqsEventAdapter:
         self,
         target: SqsEventTarget,
         offline: bool = False,
+        retry: Optional["RetryEngine"] = None,
     ):
         """Initialize the SQS event adapter.
 
         Args:
             target: Target configuration
             offline: If True, operations return mock responses
+            retry: Retry engine (default: the process-wide engine)
         """
         self._target = target
         self._offline = offline
         self._sqs_client: Any = None
         self._lambda_client: Any = None
+        self._retry = retry
+
+    def _get_retry(self) -> "RetryEngine":
+        if self._retry is None:
+            from itk.aws.retry import get_retry_engine
+
+            self._retry = get_retry_engine()
+        return self._retry
 
     def _validate_target(self) -> None:
         """Validate the target configuration."""
@@ -93,9 +241,9 @@ class SqsEventAdapter:
             raise NotImplementedError("SQS operations not available in offline mode")
 
         if self._sqs_client is None:
-            import boto3
+            from itk.aws import get_client
 
-            self._sqs_client = boto3.client("sqs", region_name=self._target.region)
+            self._sqs_client = get_client("sqs", self._target.region)
         return self._sqs_client
 
     def _get_lambda_client(self) -> Any:
@@ -104,9 +252,9 @@ class SqsEventAdapter:
             raise NotImplementedError("Lambda operations not available in offline mode")
 
         if self._lambda_client is None:
-            import boto3
+            from itk.aws import get_client
 
-            self._lambda_client = boto3.client("lambda", region_name=self._target.region)
+            self._lambda_client = get_client("lambda", self._target.region)
         return self._lambda_client
 
     def replay(
@@ -136,6 +284,137 @@ class SqsEventAdapter:
         else:
             return self._invoke_lambda(enriched_payload)
 
+    def replay_batch(
+        self,
+        payload: dict[str, Any],
+        itk_trace_id: Optional[str] = None,
+        *,
+        repeat: int = 1,
+        concurrency: int = DEFAULT_BATCH_CONCURRENCY,
+    ) -> SqsBatchReplayResult:
+        """Publish every record of an SQS-shaped event with SendMessageBatch.
+
+        Records are grouped into batches of 10 and the batches are sent from
+        `concurrency` threads. Throttled or transient batch failures, and
+        entries the server rejected without a sender fault, are resent with
+        backoff through the retry engine; sender faults are not retried.
+
+        Args:
+            payload: SQS event (each of `Records[*].body` becomes a message),
+                or a single message body
+            itk_trace_id: Optional ITK trace ID attached to every message
+            repeat: Publish the records this many times (for burst tests)
+            concurrency: Maximum concurrent SendMessageBatch calls
+
+        Returns:
+            SqsBatchReplayResult with one SqsRecordResult per published record
+
+        Raises:
+            ValueError: If the target is not in publish_sqs mode
+        """
+        self._validate_target()
+        if self._target.mode != "publish_sqs":
+            raise ValueError("Batch replay requires mode 'publish_sqs'")
+
+        records = payload.get("Records") or [payload]
+        entries: list[dict[str, Any]] = []
+        for _ in range(max(repeat, 1)):
+            for record in records:
+                entry: dict[str, Any] = {
+                    "Id": str(len(entries)),
+                    "MessageBody": json.dumps(record.get("body", record)),
+                }
+                if itk_trace_id:
+                    entry["MessageAttributes"] = {
+                        "itk_trace_id": {"DataType": "String", "StringValue": itk_trace_id},
+                    }
+                entries.append(entry)
+
+        results = [SqsRecordResult(index=i) for i in range(len(entries))]
+        batches = [
+            entries[i:i + SQS_MAX_BATCH_ENTRIES]
+            for i in range(0, len(entries), SQS_MAX_BATCH_ENTRIES)
+        ]
+        result = SqsBatchReplayResult(
+            queue_url=self._target.target_arn_or_url,
+            records=results,
+            batch_count=len(batches),
+            itk_trace_id=itk_trace_id,
+        )
+
+        start = time.perf_counter()
+        if self._offline:
+            now = datetime.now(timezone.utc).isoformat()
+            for r in results:
+                r.message_id = f"offline-{uuid.uuid4()}"
+                r.attempts = 1
+                r.sent_at = now
+        elif batches:
+            from itk.aws.retry import RetryTelemetry
+
+            result.retry = RetryTelemetry()
+            retry_lock = threading.Lock()
+
+            def send(batch: list[dict[str, Any]]) -> None:
+                telemetry = self._send_batch(batch, results)
+                if telemetry is not None:
+                    with retry_lock:
+                        result.retry.merge(telemetry)
+
+            with ThreadPoolExecutor(max_workers=max(1, min(concurrency, len(batches)))) as pool:
+                list(pool.map(send, batches))
+        result.duration_ms = (time.perf_counter() - start) * 1000
+        return result
+
+    def _send_batch(
+        self, batch: list[dict[str, Any]], results: list[SqsRecordResult]
+    ) -> Optional["RetryTelemetry"]:
+        """Send one batch until every entry succeeded or failed for good.
+
+        Returns:
+            Retry telemetry for the batch's resends
+        """
+        client = self._get_sqs_client()
+        pending = {entry["Id"]: entry for entry in batch}
+
+        def attempt() -> None:
+            response = client.send_message_batch(
+                QueueUrl=self._target.target_arn_or_url,
+                Entries=list(pending.values()),
+            )
+            now = datetime.now(timezone.utc).isoformat()
+            for entry_id in pending:
+                results[int(entry_id)].attempts += 1
+            for ok in response.get("Successful", []):
+                r = results[int(ok["Id"])]
+                r.message_id = ok["MessageId"]
+                r.sequence_number = ok.get("SequenceNumber")
+                r.error_code = r.error_message = None
+                r.sent_at = now
+                pending.pop(ok["Id"], None)
+            server_failures = []
+            for failed in response.get("Failed", []):
+                r = results[int(failed["Id"])]
+                r.error_code = failed.get("Code")
+                r.error_message = failed.get("Message")
+                if failed.get("SenderFault"):
+                    pending.pop(failed["Id"], None)  # Bad entry; resending cannot help
+                else:
+                    server_failures.append(failed)
+            if server_failures:
+                raise SqsPartialBatchError(server_failures)
+
+        try:
+            _, telemetry = self._get_retry().call(attempt)
+        except Exception as e:
+            telemetry = getattr(e, "retry_telemetry", None)
+            code = e.response["Error"]["Code"] if hasattr(e, "response") else type(e).__name__
+            for entry_id in pending:
+                r = results[int(entry_id)]
+                r.error_code = r.error_code or code
+                r.error_message = r.error_message or str(e)
+        return telemetry
+
     def _inject_trace_id(
         self,
         payload: dict[str, Any],
@@ -190,7 +469,8 @@ class SqsEventAdapter:
                 "StringValue": itk_trace_id,
             }
 
-        response = client.send_message(
+        response, telemetry = self._get_retry().call(
+            client.send_message,
             QueueUrl=self._target.target_arn_or_url,
             MessageBody=json.dumps(message_body),
             MessageAttributes=message_attributes,
@@ -201,6 +481,7 @@ class SqsEventAdapter:
             sequence_number=response.get("SequenceNumber"),
             md5_of_body=response.get("MD5OfMessageBody"),
             timestamp=datetime.now(timezone.utc).isoformat(),
+            retry=telemetry,
         )
 
     def _invoke_lambda(self, payload: dict[str, Any]) -> LambdaInvokeResult:
@@ -215,7 +496,8 @@ class SqsEventAdapter:
 
         client = self._get_lambda_client()
 
-        response = client.invoke(
+        response, telemetry = self._get_retry().call(
+            client.invoke,
             FunctionName=self._target.target_arn_or_url,
             InvocationType="RequestResponse",
             Payload=json.dumps(payload),
@@ -233,6 +515,7 @@ class SqsEventAdapter:
             status_code=response["StatusCode"],
             payload=response_payload,
             function_error=response.get("FunctionError"),
+            retry=telemetry,
         )
 
 
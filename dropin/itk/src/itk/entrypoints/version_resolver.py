@@ -19,12 +19,36 @@ When agent_version="latest" is specified:
 
 Special aliases:
 - TSTALIASID: Built-in test alias that always points to DRAFT
+
+Version and alias listings are cached across resolvers (and, by default,
+across processes in `.itk/cache/agent-resolution.json`) for a short TTL, so
+consecutive cases and soak iterations do not repeat the control-plane calls.
+"latest" never trusts a cached version listing: it re-lists versions (one
+call) and re-lists aliases only if the newest PREPARED version changed. If
+any other resolution fails against cached listings (e.g. a version was
+prepared since), the agent's entries are dropped and the resolution is
+retried once against fresh listings. `itk discover` also drops cached
+entries.
 """
 from __future__ import annotations
 
+import json
+import os
+import threading
+import time
 from dataclasses import dataclass
 from datetime import datetime
-from typing import Any, Optional
+from pathlib import Path
+from typing import Any, Callable, Optional
+
+# Default on-disk location of cached version/alias listings
+DEFAULT_RESOLUTION_CACHE_PATH = Path(".itk") / "cache" / "agent-resolution.json"
+
+# How long cached listings are trusted (override with ITK_VERSION_CACHE_TTL; 0 disables)
+DEFAULT_RESOLUTION_TTL_SECONDS = 300.0
+
+# Bump when the cache file layout changes
+RESOLUTION_CACHE_VERSION = 1
 
 
 @dataclass
@@ -59,6 +83,187 @@ class ResolvedAgent:
     resolution_method: str  # "alias", "latest", "draft"
 
 
+def _version_to_dict(v: AgentVersion) -> dict[str, Any]:
+    return {
+        "version": v.version,
+        "status": v.status,
+        "created_at": v.created_at.isoformat(),
+        "description": v.description,
+    }
+
+
+def _alias_to_dict(a: AgentAlias) -> dict[str, Any]:
+    return {
+        "alias_id": a.alias_id,
+        "alias_name": a.alias_name,
+        "agent_version": a.agent_version,
+        "status": a.status,
+    }
+
+
+class ResolutionCache:
+    """Version and alias listings shared between resolvers, with a TTL.
+
+    Entries are keyed by region and agent ID. With a `path`, entries are also
+    persisted so separate `itk` processes (one per case in CI) share them.
+    """
+
+    def __init__(
+        self,
+        path: Optional[Path] = None,
+        ttl_seconds: float = DEFAULT_RESOLUTION_TTL_SECONDS,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.path = path
+        self.ttl_seconds = ttl_seconds
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._entries: dict[str, dict[str, Any]] = {}
+        self._loaded = path is None
+        self.hits = 0
+        self.misses = 0
+
+    @property
+    def enabled(self) -> bool:
+        return self.ttl_seconds > 0
+
+    def get_versions(self, region: str, agent_id: str) -> Optional[list[AgentVersion]]:
+        """Return cached versions (newest first), or None if missing or expired."""
+        items = self._get("versions", region, agent_id)
+        if items is None:
+            return None
+        return [
+            AgentVersion(
+                version=v["version"],
+                agent_id=agent_id,
+                status=v["status"],
+                created_at=datetime.fromisoformat(v["created_at"]),
+                description=v["description"],
+            )
+            for v in items
+        ]
+
+    def put_versions(self, region: str, agent_id: str, versions: list[AgentVersion]) -> None:
+        """Cache an agent's versions."""
+        self._put("versions", region, agent_id, [_version_to_dict(v) for v in versions])
+
+    def get_aliases(self, region: str, agent_id: str) -> Optional[list[AgentAlias]]:
+        """Return cached aliases, or None if missing or expired."""
+        items = self._get("aliases", region, agent_id)
+        if items is None:
+            return None
+        return [AgentAlias(agent_id=agent_id, **a) for a in items]
+
+    def put_aliases(self, region: str, agent_id: str, aliases: list[AgentAlias]) -> None:
+        """Cache an agent's aliases."""
+        self._put("aliases", region, agent_id, [_alias_to_dict(a) for a in aliases])
+
+    def invalidate(self, agent_id: Optional[str] = None, region: Optional[str] = None) -> int:
+        """Drop cached listings.
+
+        Args:
+            agent_id: Only drop entries for this agent (default: all agents).
+            region: Only drop entries for this region (default: all regions).
+
+        Returns:
+            Number of entries dropped.
+        """
+        with self._lock:
+            self._load()
+            stale = [
+                key
+                for key, entry in self._entries.items()
+                if (agent_id is None or entry["agent_id"] == agent_id)
+                and (region is None or entry["region"] == region)
+            ]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._save()
+            return len(stale)
+
+    @staticmethod
+    def _key(kind: str, region: str, agent_id: str) -> str:
+        return f"{kind}:{region}:{agent_id}"
+
+    def _expired(self, entry: dict[str, Any]) -> bool:
+        return self._clock() - entry["fetched_at"] > self.ttl_seconds
+
+    def _get(self, kind: str, region: str, agent_id: str) -> Optional[list[dict[str, Any]]]:
+        if not self.enabled:
+            return None
+        with self._lock:
+            self._load()
+            entry = self._entries.get(self._key(kind, region, agent_id))
+            if entry is None or self._expired(entry):
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry["items"]
+
+    def _put(self, kind: str, region: str, agent_id: str, items: list[dict[str, Any]]) -> None:
+        if not self.enabled:
+            return
+        with self._lock:
+            self._load()
+            self._entries[self._key(kind, region, agent_id)] = {
+                "region": region,
+                "agent_id": agent_id,
+                "fetched_at": self._clock(),
+                "items": items,
+            }
+            self._save()
+
+    def _load(self) -> None:
+        """Read the cache file once (caller holds the lock)."""
+        if self._loaded:
+            return
+        self._loaded = True
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return
+        if isinstance(data, dict) and data.get("version") == RESOLUTION_CACHE_VERSION:
+            entries = data.get("entries") or {}
+            self._entries.update(
+                (key, entry) for key, entry in entries.items() if not self._expired(entry)
+            )
+
+    def _save(self) -> None:
+        """Write live entries to the cache file (caller holds the lock)."""
+        if self.path is None:
+            return
+        from itk.utils.write_pipeline import atomic_write_text
+
+        live = {key: entry for key, entry in self._entries.items() if not self._expired(entry)}
+        try:
+            atomic_write_text(
+                self.path,
+                json.dumps({"version": RESOLUTION_CACHE_VERSION, "entries": live}),
+            )
+        except OSError:
+            pass  # Caching is best effort; resolution still works without it
+
+
+_default_cache: Optional[ResolutionCache] = None
+_default_cache_lock = threading.Lock()
+
+
+def get_resolution_cache() -> ResolutionCache:
+    """Return the process-wide resolution cache.
+
+    Persisted to `DEFAULT_RESOLUTION_CACHE_PATH`; the TTL can be overridden
+    with the ITK_VERSION_CACHE_TTL environment variable (seconds, 0 disables).
+    """
+    global _default_cache
+    if _default_cache is None:
+        with _default_cache_lock:
+            if _default_cache is None:
+                ttl = float(os.environ.get("ITK_VERSION_CACHE_TTL", DEFAULT_RESOLUTION_TTL_SECONDS))
+                _default_cache = ResolutionCache(DEFAULT_RESOLUTION_CACHE_PATH, ttl)
+    return _default_cache
+
+
 class VersionResolver:
     """Resolves agent versions from Bedrock APIs.
     
@@ -71,18 +276,27 @@ class VersionResolver:
     # Built-in test alias that always points to DRAFT
     DRAFT_ALIAS_ID = "TSTALIASID"
 
-    def __init__(self, region: str, offline: bool = False):
+    def __init__(
+        self,
+        region: str,
+        offline: bool = False,
+        cache: Optional[ResolutionCache] = None,
+    ):
         """Initialize the version resolver.
         
         Args:
             region: AWS region
             offline: If True, return mock data
+            cache: Shared listing cache (default: in-memory for this resolver only)
         """
         self._region = region
         self._offline = offline
         self._client: Any = None
+        self._shared_cache = cache
         self._version_cache: dict[str, list[AgentVersion]] = {}
         self._alias_cache: dict[str, list[AgentAlias]] = {}
+        # Agents whose listings came from the shared cache rather than the API
+        self._cached_agents: set[str] = set()
 
     def _get_client(self) -> Any:
         """Get or create the bedrock-agent client (not runtime)."""
@@ -90,22 +304,31 @@ class VersionResolver:
             raise NotImplementedError("Version resolution not available offline")
         
         if self._client is None:
-            import boto3
-            self._client = boto3.client("bedrock-agent", region_name=self._region)
+            from itk.aws import get_client
+
+            self._client = get_client("bedrock-agent", self._region)
         return self._client
 
-    def list_aliases(self, agent_id: str) -> list[AgentAlias]:
+    def list_aliases(self, agent_id: str, refresh: bool = False) -> list[AgentAlias]:
         """List all aliases for an agent.
         
         Args:
             agent_id: The agent ID
+            refresh: Skip cached listings and ask the API
             
         Returns:
             List of AgentAlias objects
         """
-        if agent_id in self._alias_cache:
+        if agent_id in self._alias_cache and not refresh:
             return self._alias_cache[agent_id]
         
+        if self._shared_cache is not None and not self._offline and not refresh:
+            cached_aliases = self._shared_cache.get_aliases(self._region, agent_id)
+            if cached_aliases is not None:
+                self._cached_agents.add(agent_id)
+                self._alias_cache[agent_id] = cached_aliases
+                return cached_aliases
+        
         if self._offline:
             # Return mock aliases for testing
             return [
@@ -145,6 +368,8 @@ class VersionResolver:
                 ))
         
         self._alias_cache[agent_id] = aliases
+        if self._shared_cache is not None:
+            self._shared_cache.put_aliases(self._region, agent_id, aliases)
         return aliases
 
     def find_alias_for_version(self, agent_id: str, version: str) -> Optional[AgentAlias]:
@@ -165,28 +390,26 @@ class VersionResolver:
         
         return None
 
-    def _get_client(self) -> Any:
-        """Get or create the bedrock-agent client (not runtime)."""
-        if self._offline:
-            raise NotImplementedError("Version resolution not available offline")
-        
-        if self._client is None:
-            import boto3
-            self._client = boto3.client("bedrock-agent", region_name=self._region)
-        return self._client
-
-    def list_versions(self, agent_id: str) -> list[AgentVersion]:
+    def list_versions(self, agent_id: str, refresh: bool = False) -> list[AgentVersion]:
         """List all versions for an agent.
         
         Args:
             agent_id: The agent ID
+            refresh: Skip cached listings and ask the API
             
         Returns:
             List of AgentVersion objects, sorted by createdAt descending
         """
-        if agent_id in self._version_cache:
+        if agent_id in self._version_cache and not refresh:
             return self._version_cache[agent_id]
         
+        if self._shared_cache is not None and not self._offline and not refresh:
+            cached_versions = self._shared_cache.get_versions(self._region, agent_id)
+            if cached_versions is not None:
+                self._cached_agents.add(agent_id)
+                self._version_cache[agent_id] = cached_versions
+                return cached_versions
+        
         if self._offline:
             # Return mock versions for testing
             return [
@@ -231,11 +454,25 @@ class VersionResolver:
         # Sort by createdAt descending (newest first)
         versions.sort(key=lambda v: v.created_at, reverse=True)
         
-        # Cache for this session
+        # Cache for this session (and for later resolvers)
         self._version_cache[agent_id] = versions
+        if self._shared_cache is not None:
+            self._shared_cache.put_versions(self._region, agent_id, versions)
         
         return versions
 
+    def invalidate(self, agent_id: str) -> None:
+        """Forget cached listings for an agent, e.g. after preparing a new version.
+        
+        Args:
+            agent_id: The agent ID
+        """
+        self._version_cache.pop(agent_id, None)
+        self._alias_cache.pop(agent_id, None)
+        self._cached_agents.discard(agent_id)
+        if self._shared_cache is not None:
+            self._shared_cache.invalidate(agent_id=agent_id, region=self._region)
+
     def get_latest_prepared_version(self, agent_id: str) -> Optional[str]:
         """Get the latest PREPARED version for an agent.
         
@@ -256,6 +493,29 @@ class VersionResolver:
         # Already sorted by createdAt desc, so first is newest
         return prepared[0].version
 
+    def _revalidated_latest_version(self, agent_id: str) -> Optional[str]:
+        """Get the latest PREPARED version, re-listing if it came from the cache.
+        
+        A cached listing hides versions prepared since it was fetched, and
+        "latest" would silently keep testing the old one, so it is always
+        checked against the API. Aliases are re-listed too if the newest
+        version changed, since the alias for it is probably new as well.
+        
+        Args:
+            agent_id: The agent ID
+            
+        Returns:
+            Version ID string, or None if no prepared versions exist
+        """
+        cached_latest = self.get_latest_prepared_version(agent_id)
+        if agent_id not in self._cached_agents:
+            return cached_latest
+        self.list_versions(agent_id, refresh=True)
+        latest = self.get_latest_prepared_version(agent_id)
+        if latest != cached_latest:
+            self.list_aliases(agent_id, refresh=True)
+        return latest
+
     def get_draft_version(self, agent_id: str) -> Optional[str]:
         """Get the DRAFT version for an agent.
         
@@ -298,6 +558,21 @@ class VersionResolver:
         Raises:
             ValueError: If no valid targeting specified or resolution fails
         """
+        try:
+            return self._resolve(agent_id, agent_alias_id, agent_version)
+        except ValueError:
+            if agent_id not in self._cached_agents:
+                raise
+        # Cached listings may predate a newly prepared version or alias update
+        self.invalidate(agent_id)
+        return self._resolve(agent_id, agent_alias_id, agent_version)
+
+    def _resolve(
+        self,
+        agent_id: str,
+        agent_alias_id: Optional[str],
+        agent_version: Optional[str],
+    ) -> ResolvedAgent:
         if not agent_id:
             raise ValueError("agent_id is required")
         
@@ -316,7 +591,7 @@ class VersionResolver:
             
             if version_lower == "latest":
                 # Find the latest PREPARED version
-                latest_version = self.get_latest_prepared_version(agent_id)
+                latest_version = self._revalidated_latest_version(agent_id)
                 if not latest_version:
                     raise ValueError(
                         f"No PREPARED versions found for agent {agent_id}. "
@@ -391,6 +666,7 @@ def resolve_agent_target(
     agent_version: Optional[str] = None,
     region: str = "us-east-1",
     offline: bool = False,
+    cache: Optional[ResolutionCache] = None,
 ) -> ResolvedAgent:
     """Convenience function to resolve agent targeting.
     
@@ -400,11 +676,14 @@ def resolve_agent_target(
         agent_version: Optional version or "latest"/"draft"
         region: AWS region
         offline: If True, return mock data
+        cache: Listing cache (default: the process-wide `get_resolution_cache()`)
         
     Returns:
         ResolvedAgent with alias ID for invocation
     """
-    resolver = VersionResolver(region=region, offline=offline)
+    if cache is None and not offline:
+        cache = get_resolution_cache()
+    resolver = VersionResolver(region=region, offline=offline, cache=cache)
     return resolver.resolve(
         agent_id=agent_id,
         agent_alias_id=agent_alias_id,
@@ -73,12 +73,9 @@ class CloudWatchLogsClient:
             )
 
         if self._client is None:
-            import boto3
+            from itk.aws import get_client
 
-            self._client = boto3.client(
-                "logs",
-                region_name=self._region,
-            )
+            self._client = get_client("logs", self._region)
         return self._client
 
     def run_query(
@@ -7,6 +7,7 @@ import uuid
 from pathlib import Path
 from typing import Any
 
+from itk import perf
 from itk.trace.span_model import Span
 
 
@@ -353,6 +354,7 @@ def normalize_log_to_span(obj: dict[str, Any]) -> Span | None:
     )
 
 
+@perf.timed("parse.fixture")
 def load_fixture_jsonl_as_spans(path: Path) -> list[Span]:
     """Load JSONL fixture lines that already resemble the Span model.
 
@@ -386,9 +388,11 @@ def load_fixture_jsonl_as_spans(path: Path) -> list[Span]:
                 error=obj.get("error"),
             )
         )
+    perf.count("parse.spans", len(spans))
     return spans
 
 
+@perf.timed("parse.realistic")
 def load_realistic_logs_as_spans(path: Path) -> list[Span]:
     """
     Load JSONL logs with realistic/varied field names and normalize to Spans.
@@ -432,9 +436,12 @@ def load_realistic_logs_as_spans(path: Path) -> list[Span]:
         print(f"  JSON errors: {parse_stats['json_errors']}, Skipped (not span-like): {parse_stats['skipped']}", file=sys.stderr)
         print(f"  Hint: Logs may not have 'component' or 'operation' fields", file=sys.stderr)
     
+    perf.count("parse.lines", parse_stats["total"])
+    perf.count("parse.spans", parse_stats["spans"])
     return spans
 
 
+@perf.timed("parse.cloudwatch")
 def parse_cloudwatch_logs(log_events: list[dict[str, Any]]) -> list[Span]:
     """
     Parse CloudWatch log events into Spans.
@@ -507,6 +514,8 @@ def parse_cloudwatch_logs(log_events: list[dict[str, Any]]) -> list[Span]:
             print(f"  Hint: Your logs may need 'component' or 'operation' fields", file=sys.stderr)
             print(f"  Supported field names: {list(FIELD_MAPPINGS.get('component', []))}", file=sys.stderr)
     
+    perf.count("parse.lines", stats["total"])
+    perf.count("parse.spans", stats["spans"])
     return spans
 
 
@@ -0,0 +1,406 @@
+"""Lightweight stage timers and counters for finding where ITK spends time.
+
+Instrumentation is off by default: `stage()` returns a shared no-op context
+manager, `count()` returns immediately and `timed()` wrappers call straight
+through, so hot paths pay one global lookup. `itk --profile <command>`
+turns it on for one command and writes `perf.json`; `--profile-cpu` adds a
+cProfile dump and flamegraph-ready collapsed stacks.
+
+With `record_spans` on, every stage entry is also kept as an interval and
+converted to ITK's own `Span` model (component `itk:<step>`), so
+`--self-timeline` can show the tool's time in the regular timeline viewer.
+
+Stage names start with the pipeline step (`load.`, `parse.`, `correlate.`,
+`stitch.`, `render.`, `write.`, `suite.`, `soak.`) so results group by
+step. Stages nest per thread; each reports total time and self time
+(total minus time spent in nested stages).
+
+Usage:
+    from itk import perf
+
+    @perf.timed("parse.cloudwatch")
+    def parse_cloudwatch_logs(events): ...
+
+    with perf.stage("load.logs"):
+        ...
+    perf.count("parse.lines", len(events))
+"""
+from __future__ import annotations
+
+import functools
+import itertools
+import json
+import sys
+import threading
+import time
+from collections import Counter
+from contextlib import nullcontext
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, ContextManager, Optional, TypeVar
+
+if TYPE_CHECKING:
+    from itk.trace.span_model import Span
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+PERF_FILENAME = "perf.json"
+PSTATS_FILENAME = "profile.pstats"
+COLLAPSED_FILENAME = "profile.collapsed"
+SELF_TIMELINE_FILENAME = "self-timeline.html"
+DEFAULT_SAMPLE_INTERVAL_S = 0.005
+DEFAULT_MAX_SPANS = 5000  # Intervals kept for the self-timeline; later ones are counted, not kept
+
+_NOOP: ContextManager[None] = nullcontext()
+
+
+@dataclass
+class StageStats:
+    """Accumulated timings for one stage name."""
+
+    name: str
+    calls: int = 0
+    total_s: float = 0.0
+    self_s: float = 0.0
+    max_s: float = 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        return {
+            "name": self.name,
+            "calls": self.calls,
+            "total_ms": round(self.total_s * 1000, 3),
+            "self_ms": round(self.self_s * 1000, 3),
+            "mean_ms": round(self.total_s * 1000 / self.calls, 3) if self.calls else 0.0,
+            "max_ms": round(self.max_s * 1000, 3),
+        }
+
+
+@dataclass
+class StageInterval:
+    """One recorded entry into a stage (kept only when recording spans)."""
+
+    span_id: int
+    parent_id: Optional[int]
+    name: str
+    start_s: float  # Recorder clock
+    duration_s: float
+    thread: str
+
+
+class _StageTimer:
+    """Context manager timing one entry into a stage."""
+
+    __slots__ = ("_recorder", "_name", "_start", "_span_id", "_parent_id")
+
+    def __init__(self, recorder: "PerfRecorder", name: str) -> None:
+        self._recorder = recorder
+        self._name = name
+        self._start = 0.0
+        self._span_id: Optional[int] = None
+        self._parent_id: Optional[int] = None
+
+    def __enter__(self) -> None:
+        recorder = self._recorder
+        stack = recorder._stack()
+        if recorder.record_spans:
+            self._span_id = next(recorder._span_ids)
+            self._parent_id = stack[-1][1] if stack else None
+        stack.append([0.0, self._span_id])
+        self._start = recorder.clock()
+
+    def __exit__(self, *exc: Any) -> None:
+        recorder = self._recorder
+        elapsed = recorder.clock() - self._start
+        stack = recorder._stack()
+        nested = stack.pop()[0]
+        if stack:
+            stack[-1][0] += elapsed
+        recorder._finish(self._name, self._start, elapsed, elapsed - nested)
+        if self._span_id is not None:
+            thread = threading.current_thread().name
+            recorder._record_interval(
+                StageInterval(self._span_id, self._parent_id, self._name, self._start, elapsed, thread)
+            )
+
+
+class PerfRecorder:
+    """Thread-safe store of stage timings and counters."""
+
+    def __init__(
+        self,
+        clock: Callable[[], float] = time.perf_counter,
+        record_spans: bool = False,
+        max_spans: int = DEFAULT_MAX_SPANS,
+        wall_clock: Callable[[], float] = time.time,
+    ) -> None:
+        self.clock = clock
+        self.started = clock()
+        self.stopped: Optional[float] = None  # Set by `disable()`
+        self.wall_started = wall_clock()
+        self.record_spans = record_spans
+        self.max_spans = max_spans
+        self.stages: dict[str, StageStats] = {}
+        self.counters: dict[str, int] = {}
+        self.intervals: list[StageInterval] = []
+        self._span_ids = itertools.count(1)
+        self._lock = threading.Lock()
+        self._local = threading.local()
+
+    def _stack(self) -> list[list[Any]]:
+        """Per-thread [nested time, span id] of each open stage."""
+        stack = getattr(self._local, "stack", None)
+        if stack is None:
+            stack = self._local.stack = []
+        return stack
+
+    def _finish(self, name: str, start: float, elapsed: float, self_time: float) -> None:
+        with self._lock:
+            stats = self.stages.get(name)
+            if stats is None:
+                stats = self.stages[name] = StageStats(name)
+            stats.calls += 1
+            stats.total_s += elapsed
+            stats.self_s += self_time
+            stats.max_s = max(stats.max_s, elapsed)
+
+    def _record_interval(self, interval: StageInterval) -> None:
+        with self._lock:
+            if len(self.intervals) < self.max_spans:
+                self.intervals.append(interval)
+            else:
+                self.counters["perf.spans_dropped"] = self.counters.get("perf.spans_dropped", 0) + 1
+
+    def stage(self, name: str) -> ContextManager[None]:
+        return _StageTimer(self, name)
+
+    def count(self, name: str, n: int = 1) -> None:
+        with self._lock:
+            self.counters[name] = self.counters.get(name, 0) + n
+
+    def to_dict(self) -> dict[str, Any]:
+        with self._lock:
+            stages = sorted(self.stages.values(), key=lambda s: s.total_s, reverse=True)
+            return {
+                "wall_ms": round((self._end() - self.started) * 1000, 3),
+                "stages": [s.to_dict() for s in stages],
+                "counters": dict(sorted(self.counters.items())),
+            }
+
+    def _end(self) -> float:
+        return self.stopped if self.stopped is not None else self.clock()
+
+    def _timestamp(self, at: float) -> str:
+        wall = self.wall_started + (at - self.started)
+        return datetime.fromtimestamp(wall, timezone.utc).isoformat()
+
+    def to_spans(self, command: str = "itk") -> list["Span"]:
+        """Convert recorded intervals to Spans under one `itk:cli` root span.
+
+        A stage `parse.cloudwatch` becomes component `itk:parse`, operation
+        `cloudwatch`. Nesting follows the stages' nesting per thread; the
+        root span's response carries the counters.
+        """
+        from itk.trace.span_model import Span
+
+        with self._lock:
+            intervals = list(self.intervals)
+            counters = dict(sorted(self.counters.items()))
+        root = Span(
+            span_id="itk-0",
+            parent_span_id=None,
+            component="itk:cli",
+            operation=command,
+            ts_start=self._timestamp(self.started),
+            ts_end=self._timestamp(self._end()),
+            response={"counters": counters} if counters else None,
+        )
+        spans = [root]
+        for interval in sorted(intervals, key=lambda i: (i.start_s, i.span_id)):
+            step, _, operation = interval.name.partition(".")
+            spans.append(
+                Span(
+                    span_id=f"itk-{interval.span_id}",
+                    parent_span_id=f"itk-{interval.parent_id}" if interval.parent_id else root.span_id,
+                    component=f"itk:{step}",
+                    operation=operation or step,
+                    ts_start=self._timestamp(interval.start_s),
+                    ts_end=self._timestamp(interval.start_s + interval.duration_s),
+                    request={"thread": interval.thread} if interval.thread != "MainThread" else None,
+                )
+            )
+        return spans
+
+
+_active: Optional[PerfRecorder] = None
+
+
+def enable(recorder: Optional[PerfRecorder] = None) -> PerfRecorder:
+    """Start recording into `recorder` (or a new one) and return it."""
+    global _active
+    _active = recorder or PerfRecorder()
+    return _active
+
+
+def disable() -> Optional[PerfRecorder]:
+    """Stop recording and return the recorder that was active."""
+    global _active
+    recorder, _active = _active, None
+    if recorder is not None:
+        recorder.stopped = recorder.clock()
+    return recorder
+
+
+def active() -> Optional[PerfRecorder]:
+    return _active
+
+
+def stage(name: str) -> ContextManager[None]:
+    """Time a block as `name` (a no-op unless recording)."""
+    recorder = _active
+    return _NOOP if recorder is None else recorder.stage(name)
+
+
+def count(name: str, n: int = 1) -> None:
+    """Add `n` to counter `name` (a no-op unless recording)."""
+    recorder = _active
+    if recorder is not None:
+        recorder.count(name, n)
+
+
+def timed(name: str) -> Callable[[F], F]:
+    """Decorator timing every call of a function as stage `name`."""
+
+    def decorate(fn: F) -> F:
+        @functools.wraps(fn)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            recorder = _active
+            if recorder is None:
+                return fn(*args, **kwargs)
+            with recorder.stage(name):
+                return fn(*args, **kwargs)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorate
+
+
+def _frame_label(frame: Any) -> str:
+    code = frame.f_code
+    module = frame.f_globals.get("__name__", "?")
+    return f"{module}:{getattr(code, 'co_qualname', code.co_name)}"
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval.
+
+    The result is in the collapsed format (`outer;...;inner count` per
+    line) read by flamegraph.pl, speedscope and inferno.
+    """
+
+    def __init__(self, interval_s: float = DEFAULT_SAMPLE_INTERVAL_S, thread_id: Optional[int] = None) -> None:
+        self.interval_s = interval_s
+        self.thread_id = thread_id if thread_id is not None else threading.get_ident()
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval_s):
+            frame = sys._current_frames().get(self.thread_id)
+            if frame is None:
+                continue
+            labels = []
+            while frame is not None:
+                labels.append(_frame_label(frame))
+                frame = frame.f_back
+            self.stacks[";".join(reversed(labels))] += 1
+
+    def start(self) -> None:
+        self._thread = threading.Thread(target=self._run, name="itk-perf-sampler", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        return "".join(f"{stack} {n}\n" for stack, n in sorted(self.stacks.items()))
+
+
+class ProfileSession:
+    """Recording for one CLI command: stage timers, plus CPU profiles if asked.
+
+    Usage:
+        with ProfileSession(cpu=True) as session:
+            run_command()
+        session.write(out_dir)
+    """
+
+    def __init__(
+        self,
+        cpu: bool = False,
+        record_spans: bool = False,
+        sample_interval_s: float = DEFAULT_SAMPLE_INTERVAL_S,
+    ) -> None:
+        self.cpu = cpu
+        self.record_spans = record_spans
+        self.sample_interval_s = sample_interval_s
+        self.recorder: Optional[PerfRecorder] = None
+        self._profiler: Any = None
+        self._sampler: Optional[StackSampler] = None
+
+    def __enter__(self) -> "ProfileSession":
+        self.recorder = enable(PerfRecorder(record_spans=self.record_spans))
+        if self.cpu:
+            import cProfile
+
+            self._sampler = StackSampler(self.sample_interval_s)
+            self._sampler.start()
+            self._profiler = cProfile.Profile()
+            self._profiler.enable()
+        return self
+
+    def __exit__(self, *exc: Any) -> None:
+        if self._profiler is not None:
+            self._profiler.disable()
+        if self._sampler is not None:
+            self._sampler.stop()
+        disable()
+
+    def write(self, out_dir: Path, command: Optional[str] = None) -> list[Path]:
+        """Write perf.json (and profile.pstats/profile.collapsed) to out_dir.
+
+        Returns:
+            Paths written
+        """
+        from itk.utils.write_pipeline import atomic_write_text
+
+        out_dir.mkdir(parents=True, exist_ok=True)
+        data = {"command": command, **(self.recorder.to_dict() if self.recorder else {})}
+        written = [out_dir / PERF_FILENAME]
+        atomic_write_text(written[0], json.dumps(data, indent=2) + "\n")
+        if self._profiler is not None:
+            self._profiler.dump_stats(str(out_dir / PSTATS_FILENAME))
+            written.append(out_dir / PSTATS_FILENAME)
+        if self._sampler is not None:
+            atomic_write_text(out_dir / COLLAPSED_FILENAME, self._sampler.collapsed())
+            written.append(out_dir / COLLAPSED_FILENAME)
+        return written
+
+    def write_self_timeline(self, out_dir: Path, command: str = "itk") -> Path:
+        """Render the recorded stages with the timeline viewer.
+
+        Returns:
+            Path of the written self-timeline.html
+        """
+        from itk.diagrams.timeline_view import render_timeline_viewer
+        from itk.trace.build_trace import build_trace_from_spans
+        from itk.utils.write_pipeline import atomic_write_text
+
+        spans = self.recorder.to_spans(command) if self.recorder else []
+        path = out_dir / SELF_TIMELINE_FILENAME
+        html = render_timeline_viewer(build_trace_from_spans(spans), title=f"ITK self-timeline — itk {command}")
+        atomic_write_text(path, html)
+        return path
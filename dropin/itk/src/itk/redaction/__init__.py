@@ -6,6 +6,7 @@ from itk.redaction.redactor import (
     redact_value,
     redact_dict,
 )
+from itk.redaction.stream import redact_json_stream
 
 __all__ = [
     "RedactionConfig",
@@ -13,4 +14,5 @@ __all__ = [
     "default_redactor",
     "redact_value",
     "redact_dict",
+    "redact_json_stream",
 ]
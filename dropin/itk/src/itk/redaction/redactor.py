@@ -12,19 +12,80 @@ By default, redacts:
 """
 from __future__ import annotations
 
+import itertools
 import re
 from dataclasses import dataclass, field
 from typing import Any, Callable, Optional, Pattern, Union
 
+# Changes whenever any redaction config, pattern or key set is modified, so
+# redactors notice edits to the config they were compiled from (see
+# `Redactor._sync`). Compared with != only, so racing bumps are harmless.
+_generations = itertools.count(1)
+_config_generation = 0
+
+
+def _bump_generation() -> None:
+    global _config_generation
+    _config_generation = next(_generations)
+
+
+class _WatchedSet(set):
+    """A set that bumps the config generation when changed in place."""
+
+
+class _WatchedList(list):
+    """A list that bumps the config generation when changed in place."""
+
+
+def _bumping(method: Callable[..., Any]) -> Callable[..., Any]:
+    def wrapper(self: Any, *args: Any) -> Any:
+        result = method(self, *args)
+        _bump_generation()
+        return result
+
+    wrapper.__name__ = method.__name__
+    return wrapper
+
+
+for _name in (
+    "add", "discard", "remove", "pop", "clear", "update", "difference_update",
+    "intersection_update", "symmetric_difference_update",
+    "__ior__", "__iand__", "__isub__", "__ixor__",
+):
+    setattr(_WatchedSet, _name, _bumping(getattr(set, _name)))
+for _name in (
+    "append", "extend", "insert", "remove", "pop", "clear", "sort", "reverse",
+    "__setitem__", "__delitem__", "__iadd__", "__imul__",
+):
+    setattr(_WatchedList, _name, _bumping(getattr(list, _name)))
+
 
 @dataclass
 class RedactionPattern:
-    """A pattern to match and redact."""
+    """A pattern to match and redact.
+
+    The remaining fields are optional hints for the compiled matcher: a
+    string shorter than `min_length`, or containing none of `trigger_chars`,
+    cannot match and is skipped without running the regex; and a match can
+    only begin with one of `start_chars`. Empty means "any".
+    """
 
     name: str
     pattern: Pattern[str]
     replacement: str = "[REDACTED]"
     enabled: bool = True
+    trigger_chars: str = ""
+    start_chars: str = ""
+    min_length: int = 0
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        changed = name in self.__dict__
+        super().__setattr__(name, value)
+        if changed:
+            _bump_generation()
+
+
+_DIGITS = "0123456789"
 
 
 # Default patterns for common PII
@@ -33,26 +94,40 @@ DEFAULT_PATTERNS: list[RedactionPattern] = [
         name="email",
         pattern=re.compile(r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b"),
         replacement="[EMAIL_REDACTED]",
+        trigger_chars="@",
+        min_length=6,
     ),
     RedactionPattern(
         name="phone_us",
         pattern=re.compile(r"\b(?:\+1[-.\s]?)?\(?[0-9]{3}\)?[-.\s]?[0-9]{3}[-.\s]?[0-9]{4}\b"),
         replacement="[PHONE_REDACTED]",
+        trigger_chars=_DIGITS,
+        start_chars=_DIGITS + "+(",
+        min_length=10,
     ),
     RedactionPattern(
         name="ssn",
         pattern=re.compile(r"\b[0-9]{3}[-.\s]?[0-9]{2}[-.\s]?[0-9]{4}\b"),
         replacement="[SSN_REDACTED]",
+        trigger_chars=_DIGITS,
+        start_chars=_DIGITS,
+        min_length=9,
     ),
     RedactionPattern(
         name="credit_card",
         pattern=re.compile(r"\b(?:[0-9]{4}[-.\s]?){3}[0-9]{4}\b"),
         replacement="[CC_REDACTED]",
+        trigger_chars=_DIGITS,
+        start_chars=_DIGITS,
+        min_length=16,
     ),
     RedactionPattern(
         name="aws_account_id",
         pattern=re.compile(r"\b[0-9]{12}\b"),
         replacement="[AWS_ACCOUNT_REDACTED]",
+        trigger_chars=_DIGITS,
+        start_chars=_DIGITS,
+        min_length=12,
     ),
     RedactionPattern(
         name="api_key",
@@ -62,22 +137,31 @@ DEFAULT_PATTERNS: list[RedactionPattern] = [
             re.IGNORECASE,
         ),
         replacement="[API_KEY_REDACTED]",
+        start_chars="ABKPSTabkpst",
+        min_length=18,
     ),
     RedactionPattern(
         name="aws_access_key",
         pattern=re.compile(r"\bAKIA[0-9A-Z]{16}\b"),
         replacement="[AWS_KEY_REDACTED]",
+        trigger_chars="A",
+        start_chars="A",
+        min_length=20,
     ),
     RedactionPattern(
         name="aws_secret_key",
         pattern=re.compile(r"\b[A-Za-z0-9/+=]{40}\b"),
         replacement="[AWS_SECRET_REDACTED]",
+        min_length=40,
         enabled=False,  # Disabled by default - too many false positives
     ),
     RedactionPattern(
         name="ipv4",
         pattern=re.compile(r"\b(?:[0-9]{1,3}\.){3}[0-9]{1,3}\b"),
         replacement="[IP_REDACTED]",
+        trigger_chars=_DIGITS,
+        start_chars=_DIGITS,
+        min_length=7,
         enabled=False,  # Disabled by default - often not PII
     ),
 ]
@@ -91,6 +175,9 @@ def _copy_default_patterns() -> list[RedactionPattern]:
             pattern=p.pattern,
             replacement=p.replacement,
             enabled=p.enabled,
+            trigger_chars=p.trigger_chars,
+            start_chars=p.start_chars,
+            min_length=p.min_length,
         )
         for p in DEFAULT_PATTERNS
     ]
@@ -150,6 +237,17 @@ class RedactionConfig:
         }
     )
 
+    def __setattr__(self, name: str, value: Any) -> None:
+        # Wrap collections so in-place edits are noticed too
+        if name == "patterns" and not isinstance(value, _WatchedList):
+            value = _WatchedList(value)
+        elif name in ("sensitive_keys", "allowed_keys") and not isinstance(value, _WatchedSet):
+            value = _WatchedSet(value)
+        changed = name in self.__dict__
+        super().__setattr__(name, value)
+        if changed:
+            _bump_generation()
+
     def enable_pattern(self, name: str) -> None:
         """Enable a pattern by name."""
         for p in self.patterns:
@@ -165,45 +263,182 @@ class RedactionConfig:
                 return
 
 
+# Regex flags that can be expressed as scoped inline flags in a combined pattern
+_SCOPED_FLAGS = ((re.IGNORECASE, "i"), (re.MULTILINE, "m"), (re.DOTALL, "s"), (re.VERBOSE, "x"))
+_COMBINABLE_FLAGS = re.UNICODE | re.IGNORECASE | re.MULTILINE | re.DOTALL | re.VERBOSE
+_BACKREFERENCE = re.compile(r"\\[1-9]|\(\?P=")
+
+
+def _scoped_source(pattern: Pattern[str]) -> str:
+    """Return a pattern's source wrapped so its flags survive combination."""
+    flags = "".join(c for flag, c in _SCOPED_FLAGS if pattern.flags & flag)
+    if not flags:
+        return pattern.pattern
+    # Newline so a trailing verbose-mode comment cannot swallow the ")"
+    return f"(?{flags}:{pattern.pattern}\n)" if "x" in flags else f"(?{flags}:{pattern.pattern})"
+
+
+class CompiledPatterns:
+    """Enabled redaction patterns compiled into a single-pass matcher.
+
+    All enabled patterns are joined into one alternation, so a clean string
+    (the vast majority of payload values) is scanned once instead of once per
+    pattern. Runs of patterns with `start_chars` hints are grouped behind a
+    one-character lookahead so most positions are rejected without trying
+    each pattern.
+
+    A string the alternation matches is redacted by applying each pattern in
+    turn. Matches of different patterns can overlap (an API key running into
+    a card number), and a leftmost-wins alternation would leave the rest of
+    the overlapped match unredacted; per-pattern substitution redacts both.
+
+    Patterns that cannot be combined safely (backreferences, template
+    replacements, unsupported flags) are always applied in turn.
+    """
+
+    def __init__(self, patterns: list[RedactionPattern]) -> None:
+        self._enabled = [p for p in patterns if p.enabled]
+
+        # Prefilter: strings shorter than every pattern's minimum are skipped;
+        # otherwise a string must be long enough for an untriggered pattern or
+        # contain one of the trigger characters
+        self._min_length = min((p.min_length for p in self._enabled), default=0)
+        self._scan_from = min(
+            (p.min_length for p in self._enabled if not p.trigger_chars), default=None
+        )
+        triggers = "".join(sorted({c for p in self._enabled for c in p.trigger_chars}))
+        self._trigger = re.compile(f"[{re.escape(triggers)}]") if triggers else None
+
+        self._combined: Optional[Pattern[str]] = None
+        if self._enabled and all(self._combinable(p) for p in self._enabled):
+            try:
+                self._combined = re.compile(self._combined_source(self._enabled))
+            except re.error:
+                self._combined = None
+
+    @staticmethod
+    def _combinable(pattern: RedactionPattern) -> bool:
+        return (
+            pattern.pattern.flags & ~_COMBINABLE_FLAGS == 0
+            and not _BACKREFERENCE.search(pattern.pattern.pattern)
+            and "\\" not in pattern.replacement
+        )
+
+    @staticmethod
+    def _combined_source(patterns: list[RedactionPattern]) -> str:
+        # Group consecutive hinted patterns (order decides overlapping matches)
+        branches: list[str] = []
+        gated: list[RedactionPattern] = []
+
+        def close_group() -> None:
+            if gated:
+                starts = "".join(sorted({c for p in gated for c in p.start_chars}))
+                alternatives = "|".join(f"(?:{_scoped_source(p.pattern)})" for p in gated)
+                branches.append(f"(?=[{re.escape(starts)}])(?:{alternatives})")
+                gated.clear()
+
+        for pattern in patterns:
+            if pattern.start_chars:
+                gated.append(pattern)
+            else:
+                close_group()
+                branches.append(f"(?:{_scoped_source(pattern.pattern)})")
+        close_group()
+        return "|".join(branches)
+
+    @property
+    def single_pass(self) -> bool:
+        """Whether strings are scanned with one combined regex first."""
+        return self._combined is not None
+
+    def might_match(self, value: str) -> bool:
+        """Cheap check: False means no pattern can match `value`."""
+        if not self._enabled or len(value) < self._min_length:
+            return False
+        if self._scan_from is not None and len(value) >= self._scan_from:
+            return True
+        return self._trigger is not None and self._trigger.search(value) is not None
+
+    def sub(self, value: str) -> str:
+        """Apply every pattern to `value`."""
+        if not self.might_match(value):
+            return value
+        if self._combined is not None and self._combined.search(value) is None:
+            return value
+        for pattern in self._enabled:
+            value = pattern.pattern.sub(pattern.replacement, value)
+        return value
+
+
 class Redactor:
-    """Redactor instance with configuration."""
+    """Redactor instance with configuration.
+
+    Patterns and key sets are compiled from the config. Any later change to
+    the config (patterns enabled or added, keys added, the config replaced)
+    is picked up on the next call, so a stale compile never lets a value
+    through unredacted.
+    """
 
     def __init__(self, config: Optional[RedactionConfig] = None) -> None:
         self.config = config or RedactionConfig()
+        self.refresh()
+
+    def refresh(self) -> None:
+        """Recompile patterns and key sets from the current config."""
+        generation = _config_generation  # Read first: edits made while compiling recompile again
+        config = self.config
+        self._patterns = CompiledPatterns(config.patterns)
+        self._allowed_keys = frozenset(k.lower() for k in config.allowed_keys)
+        self._sensitive_keys = frozenset(k.lower() for k in config.sensitive_keys)
+        self._compiled_from = (config, generation)
+
+    def _sync(self) -> None:
+        """Recompile if the config changed since the last compile."""
+        config, generation = self._compiled_from
+        if generation != _config_generation or config is not self.config:
+            self.refresh()
 
     def redact_string(self, value: str) -> str:
         """Apply pattern-based redaction to a string."""
         if not self.config.enabled:
             return value
-
-        result = value
-        for pattern in self.config.patterns:
-            if pattern.enabled:
-                result = pattern.pattern.sub(pattern.replacement, result)
-        return result
+        self._sync()
+        return self._patterns.sub(value)
 
     def should_redact_key(self, key: str) -> bool:
         """Check if a key should be fully redacted."""
         if not self.config.enabled:
             return False
+        self._sync()
 
         key_lower = key.lower()
 
         # Allowed keys are never redacted
-        if key_lower in {k.lower() for k in self.config.allowed_keys}:
+        if key_lower in self._allowed_keys:
             return False
 
         # Sensitive keys are always redacted
-        if key_lower in {k.lower() for k in self.config.sensitive_keys}:
-            return True
-
-        return False
-
-    def redact_value(self, value: Any, key: Optional[str] = None) -> Any:
-        """Redact a single value, optionally considering its key."""
+        return key_lower in self._sensitive_keys
+
+    def redact_value(
+        self, value: Any, key: Optional[str] = None, *, copy_on_write: bool = False
+    ) -> Any:
+        """Redact a single value, optionally considering its key.
+
+        Args:
+            value: Value to redact.
+            key: Key the value is stored under, if any.
+            copy_on_write: Return the original object (not a copy) wherever
+                nothing beneath it changes. The result may then share
+                structure with `value`, so it must be treated as read-only.
+        """
         if not self.config.enabled:
             return value
 
+        if copy_on_write:
+            self._sync()
+            return self._redact_shared(value, key)
+
         # If key indicates sensitive data, redact entirely
         if key and self.should_redact_key(key):
             return "[REDACTED]"
@@ -222,16 +457,55 @@ class Redactor:
         # Leave other types unchanged
         return value
 
-    def redact_dict(self, data: dict[str, Any]) -> dict[str, Any]:
-        """Recursively redact a dictionary."""
+    def redact_dict(self, data: dict[str, Any], *, copy_on_write: bool = False) -> dict[str, Any]:
+        """Recursively redact a dictionary.
+
+        Args:
+            data: Dictionary to redact.
+            copy_on_write: See `redact_value`.
+        """
         if not self.config.enabled:
             return data
 
+        if copy_on_write:
+            self._sync()
+            return self._redact_shared(data, None)
+
         result: dict[str, Any] = {}
         for k, v in data.items():
             result[k] = self.redact_value(v, key=k)
         return result
 
+    def _redact_shared(self, value: Any, key: Optional[str]) -> Any:
+        """Copy-on-write redaction: containers are copied only when a child changes."""
+        if key and self.should_redact_key(key):
+            return "[REDACTED]"
+
+        if isinstance(value, str):
+            return self._patterns.sub(value)
+
+        if isinstance(value, dict):
+            result: Optional[dict[str, Any]] = None
+            for k, v in value.items():
+                new = self._redact_shared(v, k)
+                if new is not v:
+                    if result is None:
+                        result = dict(value)
+                    result[k] = new
+            return value if result is None else result
+
+        if isinstance(value, list):
+            items: Optional[list[Any]] = None
+            for i, item in enumerate(value):
+                new = self._redact_shared(item, None)
+                if new is not item:
+                    if items is None:
+                        items = list(value)
+                    items[i] = new
+            return value if items is None else items
+
+        return value
+
 
 # Default redactor instance
 _default_redactor: Optional[Redactor] = None
@@ -0,0 +1,225 @@
+"""Streaming JSON-to-JSON redaction.
+
+`Redactor.redact_dict` needs the whole document as Python objects. Bedrock
+`orchestrationTrace` payloads carrying full prompts can be tens of MB per
+span, so for files on disk (`spans.jsonl`, `payloads/*.json`) this module
+redacts token by token instead: the input is read in chunks, only one string
+token is ever decoded at a time, and everything that is not redacted —
+including whitespace and escapes — is copied through unchanged.
+
+The rules match `Redactor.redact_value`: a value stored under a sensitive
+key is replaced by "[REDACTED]" whatever its type, and string values are
+pattern-redacted. Object keys are never altered.
+
+Input may hold several top-level values (JSON Lines). Pair the output handle
+with `itk.utils.write_pipeline.atomic_open` to redact a file in place.
+
+Example:
+    with open("spans.jsonl", encoding="utf-8") as src, atomic_open(dst_path) as dst:
+        redact_json_stream(src, dst)
+"""
+from __future__ import annotations
+
+import json
+from json.decoder import scanstring
+from typing import Optional, TextIO
+
+from itk.redaction.redactor import Redactor, default_redactor
+
+# Characters read per chunk (grows geometrically for very long tokens)
+DEFAULT_CHUNK_CHARS = 64 * 1024
+
+_WHITESPACE = " \t\n\r"
+_SCALAR_END = frozenset(_WHITESPACE + ",]}:")
+_REDACTED = '"[REDACTED]"'
+
+
+class _Frame:
+    """An open object or array."""
+
+    __slots__ = ("is_object", "expect_key", "key")
+
+    def __init__(self, is_object: bool) -> None:
+        self.is_object = is_object
+        self.expect_key = is_object
+        self.key: Optional[str] = None
+
+
+class _JsonRedactor:
+    """Single-use tokenizer that copies JSON from src to dst, redacting values."""
+
+    def __init__(self, src: TextIO, dst: TextIO, redactor: Redactor, chunk_chars: int) -> None:
+        self.src = src
+        self.dst = dst
+        self.redactor = redactor
+        self.chunk_chars = chunk_chars
+        self.buf = ""
+        self.pos = 0
+        self.offset = 0  # characters consumed before buf[0], for error positions
+        self.eof = False
+        self.stack: list[_Frame] = []
+        # Depth of a sensitive container being skipped (0 when not skipping)
+        self.skip_depth = 0
+
+    # -- buffering ---------------------------------------------------------
+
+    def _fill(self) -> bool:
+        """Read more input; returns False at end of input."""
+        if self.eof:
+            return False
+        # Grow reads with the pending token so rescans stay linear overall
+        chunk = self.src.read(max(self.chunk_chars, len(self.buf) - self.pos))
+        if not chunk:
+            self.eof = True
+            return False
+        self.offset += self.pos
+        self.buf = self.buf[self.pos:] + chunk
+        self.pos = 0
+        return True
+
+    def _error(self, msg: str) -> json.JSONDecodeError:
+        return json.JSONDecodeError(msg, self.buf, self.pos)
+
+    # -- tokens ------------------------------------------------------------
+
+    def _read_string(self) -> tuple[str, str]:
+        """Read a string token at pos; returns (decoded, raw)."""
+        while True:
+            try:
+                decoded, end = scanstring(self.buf, self.pos + 1)
+            except json.JSONDecodeError:
+                if self._fill():
+                    continue
+                raise
+            raw = self.buf[self.pos:end]
+            self.pos = end
+            return decoded, raw
+
+    def _read_scalar(self) -> str:
+        """Read a number/true/false/null token at pos."""
+        end = self.pos
+        while True:
+            while end < len(self.buf) and self.buf[end] not in _SCALAR_END:
+                end += 1
+            if end < len(self.buf):
+                break
+            start = self.pos
+            if not self._fill():
+                break
+            end -= start  # buffer was rebased
+        raw = self.buf[self.pos:end]
+        self.pos = end
+        if not raw:
+            raise self._error(f"Unexpected character {self.buf[self.pos]!r}")
+        return raw
+
+    # -- main loop ---------------------------------------------------------
+
+    def _value_key(self) -> Optional[str]:
+        """Key the next value is stored under (None in arrays/top level)."""
+        if self.stack and self.stack[-1].is_object:
+            return self.stack[-1].key
+        return None
+
+    def _sensitive(self) -> bool:
+        key = self._value_key()
+        return bool(key) and self.redactor.should_redact_key(key)  # type: ignore[arg-type]
+
+    def run(self) -> None:
+        write = self.dst.write
+        while True:
+            if self.pos >= len(self.buf) and not self._fill():
+                break
+            ch = self.buf[self.pos]
+
+            if ch in _WHITESPACE:
+                end = self.pos
+                while end < len(self.buf) and self.buf[end] in _WHITESPACE:
+                    end += 1
+                if not self.skip_depth:
+                    write(self.buf[self.pos:end])
+                self.pos = end
+                continue
+
+            if self.skip_depth:
+                # Inside a sensitive container: consume tokens, emit nothing
+                if ch == '"':
+                    self._read_string()
+                    continue
+                if ch in "{[":
+                    self.skip_depth += 1
+                elif ch in "}]":
+                    self.skip_depth -= 1
+                self.pos += 1
+                continue
+
+            frame = self.stack[-1] if self.stack else None
+
+            if ch in "{[":
+                if self._sensitive():
+                    write(_REDACTED)
+                    self.skip_depth = 1
+                else:
+                    write(ch)
+                    self.stack.append(_Frame(ch == "{"))
+                self.pos += 1
+            elif ch in "}]":
+                if not self.stack:
+                    raise self._error(f"Unexpected {ch!r}")
+                self.stack.pop()
+                write(ch)
+                self.pos += 1
+            elif ch == ",":
+                if frame is not None and frame.is_object:
+                    frame.expect_key = True
+                write(ch)
+                self.pos += 1
+            elif ch == ":":
+                write(ch)
+                self.pos += 1
+            elif ch == '"':
+                decoded, raw = self._read_string()
+                if frame is not None and frame.expect_key:
+                    frame.key = decoded
+                    frame.expect_key = False
+                    write(raw)
+                elif self._sensitive():
+                    write(_REDACTED)
+                else:
+                    redacted = self.redactor.redact_string(decoded)
+                    if redacted is decoded or redacted == decoded:
+                        write(raw)
+                    else:
+                        write(json.dumps(redacted, ensure_ascii=False))
+            else:
+                raw = self._read_scalar()
+                write(_REDACTED if self._sensitive() else raw)
+
+        if self.stack or self.skip_depth:
+            raise json.JSONDecodeError("Unexpected end of input", self.buf, self.pos)
+
+
+def redact_json_stream(
+    src: TextIO,
+    dst: TextIO,
+    redactor: Optional[Redactor] = None,
+    chunk_chars: int = DEFAULT_CHUNK_CHARS,
+) -> None:
+    """Copy JSON (or JSON Lines) from src to dst with redaction applied.
+
+    Args:
+        src: Readable text handle.
+        dst: Writable text handle.
+        redactor: Redactor to apply (default: `default_redactor()`).
+        chunk_chars: Characters to read at a time.
+
+    Raises:
+        json.JSONDecodeError: If the input is not well-formed JSON.
+    """
+    redactor = redactor or default_redactor()
+    if not redactor.config.enabled:
+        while chunk := src.read(chunk_chars):
+            dst.write(chunk)
+        return
+    _JsonRedactor(src, dst, redactor, chunk_chars).run()
+
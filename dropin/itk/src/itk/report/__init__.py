@@ -43,6 +43,7 @@ class CaseResult:
         thumbnail_svg: Inline SVG for mini diagram.
         timeline_svg: Inline SVG for mini timeline.
         spans: List of Span objects (for soak testing / iteration analysis).
+        render_cached: True if artifacts were served from the render cache.
     """
 
     case_id: str
@@ -62,6 +63,7 @@ class CaseResult:
     thumbnail_svg: Optional[str] = None
     timeline_svg: Optional[str] = None
     spans: list = field(default_factory=list)
+    render_cached: bool = False
 
     @property
     def passed(self) -> bool:
@@ -85,6 +87,7 @@ class CaseResult:
             "artifacts_dir": self.artifacts_dir,
             "trace_viewer_path": self.trace_viewer_path,
             "timeline_path": self.timeline_path,
+            "render_cached": self.render_cached,
         }
 
 
@@ -159,6 +162,23 @@ class SuiteResult:
         """Total error spans across all cases."""
         return sum(c.error_count for c in self.cases)
 
+    @property
+    def rendered_count(self) -> int:
+        """Number of cases that produced artifacts."""
+        return sum(1 for c in self.cases if c.artifacts_dir)
+
+    @property
+    def render_cache_hits(self) -> int:
+        """Number of cases whose artifacts came from the render cache."""
+        return sum(1 for c in self.cases if c.artifacts_dir and c.render_cached)
+
+    @property
+    def render_cache_hit_rate(self) -> float:
+        """Render cache hit rate as percentage of cases with artifacts."""
+        if not self.rendered_count:
+            return 0.0
+        return (self.render_cache_hits / self.rendered_count) * 100
+
     def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
         return {
@@ -178,6 +198,8 @@ class SuiteResult:
                 "pass_rate": self.pass_rate,
                 "total_spans": self.total_spans,
                 "total_errors": self.total_errors,
+                "render_cache_hits": self.render_cache_hits,
+                "render_cache_hit_rate": self.render_cache_hit_rate,
             },
             "cases": [c.to_dict() for c in self.cases],
         }
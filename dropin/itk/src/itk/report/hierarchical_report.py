@@ -38,6 +38,7 @@ from pathlib import Path
 from typing import Optional
 
 from itk.report import CaseResult, CaseStatus, SuiteResult
+from itk.utils.html_stream import HtmlStream, render_to_string, stream_to_file
 
 
 # Status configuration
@@ -306,18 +307,15 @@ def _render_test_row(case: CaseResult, index: int) -> str:
     </div>'''
 
 
-def _render_test_group(group: TestGroup, group_index: int) -> str:
-    """Render a collapsible test group (suite)."""
+def _stream_test_group(out: HtmlStream, group: TestGroup, group_index: int) -> None:
+    """Stream a collapsible test group (suite)."""
     status_class = "passed" if group.all_passed else "failed" if group.has_failures else "mixed"
 
-    # Render all test rows in this group
-    test_rows = "\n".join(_render_test_row(c, i) for i, c in enumerate(group.cases))
-
     # Group status summary
     status_text = f"{group.passed_count}/{group.total_count} passed"
     status_color = "#10b981" if group.all_passed else "#ef4444" if group.has_failures else "#f59e0b"
 
-    return f'''
+    out.write(f'''
     <div class="test-group {status_class}" data-group="{group_index}">
         <div class="group-header" onclick="toggleGroup(this)" role="button" tabindex="0">
             <span class="group-expand">▼</span>
@@ -326,44 +324,48 @@ def _render_test_group(group: TestGroup, group_index: int) -> str:
             <span class="group-duration">{_format_duration(group.duration_ms)}</span>
         </div>
         <div class="group-tests">
-            {test_rows}
+            ''')
+    # Test rows in this group
+    out.join("\n", (_render_test_row(c, i) for i, c in enumerate(group.cases)))
+    out.write('''
         </div>
-    </div>'''
+    </div>''')
 
 
-def render_hierarchical_report(
+def stream_hierarchical_report(
+    out: HtmlStream,
     suite: SuiteResult,
     title: Optional[str] = None,
     embed_trace_viewer: bool = True,
-) -> str:
-    """Render hierarchical HTML test report.
+) -> None:
+    """Stream hierarchical HTML test report.
 
     Args:
+        out: Stream to write the document to.
         suite: Suite execution results.
         title: Optional page title.
         embed_trace_viewer: If True, embed trace viewer JS/CSS for modal.
-
-    Returns:
-        Complete HTML document as string.
     """
     title = title or f"Test Report — {suite.suite_name}"
 
     # Group cases into test suites
     groups = _group_cases(suite.cases)
 
-    # Render groups
-    groups_html = "\n".join(_render_test_group(g, i) for i, g in enumerate(groups))
-
     # Pass rate color
     pass_rate = suite.pass_rate
     pass_rate_color = "#10b981" if pass_rate >= 80 else "#f59e0b" if pass_rate >= 50 else "#ef4444"
+    render_cache_info = ""
+    if suite.render_cache_hits:
+        render_cache_info = (
+            f" · Render cache: <strong>{suite.render_cache_hits}/{suite.rendered_count}</strong>"
+        )
 
     # Load trace viewer assets for modal
     modal_assets = ""
     if embed_trace_viewer:
         modal_assets = _get_modal_assets()
 
-    return f'''<!DOCTYPE html>
+    out.write(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -382,7 +384,7 @@ def render_hierarchical_report(
                 <div class="subtitle">
                     Suite ID: <code>{html.escape(suite.suite_id)}</code> · 
                     Mode: <code>{html.escape(suite.mode)}</code> · 
-                    Duration: <strong>{_format_duration(suite.duration_ms)}</strong>
+                    Duration: <strong>{_format_duration(suite.duration_ms)}</strong>{render_cache_info}
                 </div>
             </div>
             <div class="header-right">
@@ -437,7 +439,13 @@ def render_hierarchical_report(
 
         <!-- Test Groups -->
         <main class="test-groups">
-            {groups_html}
+            ''')
+    # Render groups
+    for i, group in enumerate(groups):
+        if i:
+            out.write("\n")
+        _stream_test_group(out, group, i)
+    out.write(f'''
         </main>
 
         <!-- Footer -->
@@ -465,7 +473,25 @@ def render_hierarchical_report(
     </script>
     {modal_assets}
 </body>
-</html>'''
+</html>''')
+
+
+def render_hierarchical_report(
+    suite: SuiteResult,
+    title: Optional[str] = None,
+    embed_trace_viewer: bool = True,
+) -> str:
+    """Render hierarchical HTML test report.
+
+    Args:
+        suite: Suite execution results.
+        title: Optional page title.
+        embed_trace_viewer: If True, embed trace viewer JS/CSS for modal.
+
+    Returns:
+        Complete HTML document as string.
+    """
+    return render_to_string(stream_hierarchical_report, suite, title, embed_trace_viewer)
 
 
 def _get_css() -> str:
@@ -1276,8 +1302,7 @@ def write_hierarchical_report(suite: SuiteResult, out_dir: Path) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Write HTML report
-    html_content = render_hierarchical_report(suite)
-    (out_dir / "index.html").write_text(html_content, encoding="utf-8")
+    stream_to_file(out_dir / "index.html", stream_hierarchical_report, suite)
 
     # Write JSON summary
     json_content = json.dumps(suite.to_dict(), indent=2, ensure_ascii=False)
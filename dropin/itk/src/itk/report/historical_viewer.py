@@ -18,6 +18,8 @@ from itk.trace.span_model import Span
 from itk.trace.trace_model import Trace
 from itk.trace.build_trace import build_trace_from_spans
 from itk.logs.parse import parse_cloudwatch_logs
+from itk.utils.html_stream import HtmlStream, render_to_string
+from itk.utils.write_pipeline import atomic_write_text
 
 
 @dataclass
@@ -44,6 +46,47 @@ class ExecutionSummary:
             "unknown": "❓",
         }
         return icons.get(self.status, "❓")
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        known_ts = self.timestamp != datetime.min.replace(tzinfo=timezone.utc)
+        return {
+            "execution_id": self.execution_id,
+            "timestamp": self.timestamp.isoformat() if known_ts else None,
+            "span_count": self.span_count,
+            "duration_ms": round(self.duration_ms, 3),
+            "status": self.status,
+            "error_count": self.error_count,
+            "retry_count": self.retry_count,
+            "components": self.components,
+            "artifact_dir": self.artifact_dir,
+        }
+
+
+# Default number of executions per gallery index page
+DEFAULT_GALLERY_PAGE_SIZE = 500
+
+# Directory (relative to the view output) holding gallery index pages
+GALLERY_INDEX_DIR = "gallery"
+
+
+@dataclass
+class GalleryIndex:
+    """Manifest of a sharded gallery index."""
+    
+    page_size: int
+    total: int
+    rendered_count: int
+    pages: list[str] = field(default_factory=list)  # relative paths
+    
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "page_size": self.page_size,
+            "total": self.total,
+            "rendered_count": self.rendered_count,
+            "pages": self.pages,
+        }
 
 
 @dataclass
@@ -226,6 +269,24 @@ def build_execution_summary(
     )
 
 
+def select_executions_to_render(
+    executions: list[ExecutionSummary],
+    top: Optional[int] = None,
+) -> list[ExecutionSummary]:
+    """Pick the executions that get detail pages in lazy render mode.
+    
+    Args:
+        executions: Filtered execution summaries, newest first.
+        top: Render only the first N executions (None for all).
+        
+    Returns:
+        Executions to render.
+    """
+    if top is None:
+        return list(executions)
+    return list(executions[:max(top, 0)])
+
+
 def filter_executions(
     executions: list[ExecutionSummary],
     filter_type: str,
@@ -251,55 +312,35 @@ def filter_executions(
         return executions
 
 
-def render_gallery_html(result: ViewResult, title: str = "Historical Executions") -> str:
-    """Render the gallery HTML page.
+def _render_execution_row(i: int, exec_summary: ExecutionSummary) -> str:
+    """Render a single gallery table row."""
+    row_class = "even" if i % 2 == 0 else "odd"
+    status_class = f"status-{exec_summary.status}"
     
-    Args:
-        result: ViewResult with all execution summaries.
-        title: Page title.
-        
-    Returns:
-        Complete HTML document as string.
-    """
-    # Summary stats
-    total = result.execution_count
-    passed = result.passed_count
-    errors = result.error_count
-    warnings = result.warning_count
+    # Format timestamp
+    ts_str = exec_summary.timestamp.strftime("%Y-%m-%d %H:%M:%S") if exec_summary.timestamp != datetime.min.replace(tzinfo=timezone.utc) else "Unknown"
     
-    pass_rate = (passed / total * 100) if total > 0 else 0
-    pass_rate_color = "#10b981" if pass_rate >= 80 else "#f59e0b" if pass_rate >= 50 else "#ef4444"
-    
-    # Build execution rows
-    execution_rows = []
-    for i, exec_summary in enumerate(result.executions):
-        row_class = "even" if i % 2 == 0 else "odd"
-        status_class = f"status-{exec_summary.status}"
-        
-        # Format timestamp
-        ts_str = exec_summary.timestamp.strftime("%Y-%m-%d %H:%M:%S") if exec_summary.timestamp != datetime.min.replace(tzinfo=timezone.utc) else "Unknown"
-        
-        # Format duration
-        if exec_summary.duration_ms > 0:
-            if exec_summary.duration_ms >= 1000:
-                duration_str = f"{exec_summary.duration_ms / 1000:.2f}s"
-            else:
-                duration_str = f"{exec_summary.duration_ms:.0f}ms"
+    # Format duration
+    if exec_summary.duration_ms > 0:
+        if exec_summary.duration_ms >= 1000:
+            duration_str = f"{exec_summary.duration_ms / 1000:.2f}s"
         else:
-            duration_str = "-"
-        
-        # Components badges
-        component_badges = " ".join(
-            f'<span class="badge">{html.escape(c)}</span>'
-            for c in exec_summary.components[:3]  # Limit to first 3
-        )
-        if len(exec_summary.components) > 3:
-            component_badges += f' <span class="badge-more">+{len(exec_summary.components) - 3}</span>'
-        
-        # Short ID for display
-        short_id = exec_summary.execution_id[:12] if len(exec_summary.execution_id) > 12 else exec_summary.execution_id
-        
-        row = f'''
+            duration_str = f"{exec_summary.duration_ms:.0f}ms"
+    else:
+        duration_str = "-"
+    
+    # Components badges
+    component_badges = " ".join(
+        f'<span class="badge">{html.escape(c)}</span>'
+        for c in exec_summary.components[:3]  # Limit to first 3
+    )
+    if len(exec_summary.components) > 3:
+        component_badges += f' <span class="badge-more">+{len(exec_summary.components) - 3}</span>'
+    
+    # Short ID for display
+    short_id = exec_summary.execution_id[:12] if len(exec_summary.execution_id) > 12 else exec_summary.execution_id
+    
+    return f'''
         <tr class="{row_class} {status_class}" data-status="{exec_summary.status}">
             <td class="col-status">{exec_summary.status_icon}</td>
             <td class="col-id" title="{html.escape(exec_summary.execution_id)}">{html.escape(short_id)}</td>
@@ -314,15 +355,26 @@ def render_gallery_html(result: ViewResult, title: str = "Historical Executions"
                 <a href="{exec_summary.artifact_dir}/timeline.html" class="btn btn-secondary">📊 Timeline</a>
             </td>
         </tr>'''
-        execution_rows.append(row)
+
+
+def _stream_gallery_header(
+    out: HtmlStream, result: ViewResult, title: str, extra_css: str = ""
+) -> None:
+    """Stream the gallery document head, summary cards and status filters."""
+    # Summary stats
+    total = result.execution_count
+    passed = result.passed_count
+    errors = result.error_count
+    warnings = result.warning_count
     
-    rows_html = "\n".join(execution_rows)
+    pass_rate = (passed / total * 100) if total > 0 else 0
+    pass_rate_color = "#10b981" if pass_rate >= 80 else "#f59e0b" if pass_rate >= 50 else "#ef4444"
     
     # Time window formatting
     time_start = result.start_time.strftime("%Y-%m-%d %H:%M:%S")
     time_end = result.end_time.strftime("%Y-%m-%d %H:%M:%S")
     
-    return f'''<!DOCTYPE html>
+    out.write(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -572,7 +624,7 @@ def render_gallery_html(result: ViewResult, title: str = "Historical Executions"
         tr.hidden {{
             display: none;
         }}
-    </style>
+{extra_css}    </style>
 </head>
 <body>
     <div class="container">
@@ -618,7 +670,11 @@ def render_gallery_html(result: ViewResult, title: str = "Historical Executions"
             <button class="filter-btn" data-filter="warning" onclick="filterTable('warning')">⚠️ Warnings ({warnings})</button>
             <button class="filter-btn" data-filter="error" onclick="filterTable('error')">❌ Errors ({errors})</button>
         </div>
+''')
+
 
+# Table container and header row shared by both gallery layouts
+_GALLERY_TABLE_HEAD = '''
         <div class="table-container">
             <table>
                 <thead>
@@ -635,29 +691,52 @@ def render_gallery_html(result: ViewResult, title: str = "Historical Executions"
                     </tr>
                 </thead>
                 <tbody>
-                    {rows_html if execution_rows else '<tr><td colspan="9" class="empty-state"><div class="icon">📭</div><div>No executions found in this time window</div></td></tr>'}
-                </tbody>
-            </table>
-        </div>
-    </div>
+                    '''
 
-    <script>
-        // Theme toggle
-        function toggleTheme() {{
+# Theme toggle script shared by both gallery layouts
+_GALLERY_THEME_JS = '''        // Theme toggle
+        function toggleTheme() {
             const html = document.documentElement;
             const current = html.getAttribute('data-theme');
             html.setAttribute('data-theme', current === 'dark' ? 'light' : 'dark');
             localStorage.setItem('theme', html.getAttribute('data-theme'));
-        }}
+        }
 
         // Load saved theme
         const savedTheme = localStorage.getItem('theme');
-        if (savedTheme) {{
+        if (savedTheme) {
             document.documentElement.setAttribute('data-theme', savedTheme);
-        }} else if (window.matchMedia('(prefers-color-scheme: dark)').matches) {{
+        } else if (window.matchMedia('(prefers-color-scheme: dark)').matches) {
             document.documentElement.setAttribute('data-theme', 'dark');
-        }}
+        }
+'''
+
+
+def stream_gallery_html(
+    out: HtmlStream, result: ViewResult, title: str = "Historical Executions"
+) -> None:
+    """Stream the gallery HTML page.
+    
+    Args:
+        out: Stream to write the document to.
+        result: ViewResult with all execution summaries.
+        title: Page title.
+    """
+    _stream_gallery_header(out, result, title)
+    out.write(_GALLERY_TABLE_HEAD)
+    # Execution rows
+    if not out.join("\n", (_render_execution_row(i, e) for i, e in enumerate(result.executions))):
+        out.write('<tr><td colspan="9" class="empty-state"><div class="icon">📭</div><div>No executions found in this time window</div></td></tr>')
+    out.write(f'''
+                </tbody>
+            </table>
+        </div>
+    </div>
 
+    <script>
+''')
+    out.write(_GALLERY_THEME_JS)
+    out.write(f'''
         // Filter table
         function filterTable(status) {{
             // Update active button
@@ -677,7 +756,323 @@ def render_gallery_html(result: ViewResult, title: str = "Historical Executions"
         }}
     </script>
 </body>
-</html>'''
+</html>''')
+
+
+def render_gallery_html(result: ViewResult, title: str = "Historical Executions") -> str:
+    """Render the gallery HTML page.
+    
+    Args:
+        result: ViewResult with all execution summaries.
+        title: Page title.
+        
+    Returns:
+        Complete HTML document as string.
+    """
+    return render_to_string(stream_gallery_html, result, title)
+
+
+def write_gallery_index(
+    executions: Sequence[ExecutionSummary],
+    out_dir: Path,
+    page_size: int = DEFAULT_GALLERY_PAGE_SIZE,
+    rendered_ids: Optional[set[str]] = None,
+) -> GalleryIndex:
+    """Write the execution index for a sharded gallery.
+    
+    Executions are split into `gallery/page-NNNN.js` files of `page_size`
+    compact JSON records each. Pages are wrapped in an `itkGalleryPage(n, [...])`
+    call so the gallery can load them with script tags, which (unlike
+    `fetch`) also works when the gallery is opened from the local filesystem.
+    A plain `gallery/index.json` manifest lists the pages for other tools.
+    
+    Args:
+        executions: Execution summaries in display order.
+        out_dir: View output directory.
+        page_size: Executions per page file.
+        rendered_ids: Execution IDs that have detail pages (None if all do).
+        
+    Returns:
+        GalleryIndex manifest.
+    """
+    page_size = max(page_size, 1)
+    index_dir = out_dir / GALLERY_INDEX_DIR
+    index_dir.mkdir(parents=True, exist_ok=True)
+    
+    pages: list[str] = []
+    rendered_count = 0
+    for page_num, start in enumerate(range(0, len(executions), page_size)):
+        records = []
+        for summary in executions[start:start + page_size]:
+            record = summary.to_dict()
+            record["rendered"] = rendered_ids is None or summary.execution_id in rendered_ids
+            rendered_count += record["rendered"]
+            records.append(record)
+        name = f"page-{page_num + 1:04d}.js"
+        payload = json.dumps(records, separators=(",", ":"), ensure_ascii=False)
+        atomic_write_text(index_dir / name, f"itkGalleryPage({page_num}, {payload});\n")
+        pages.append(f"{GALLERY_INDEX_DIR}/{name}")
+    
+    # Drop pages left over from a previous, larger view
+    current = {Path(p).name for p in pages}
+    for stale in index_dir.glob("page-*.js"):
+        if stale.name not in current:
+            stale.unlink()
+    
+    index = GalleryIndex(
+        page_size=page_size,
+        total=len(executions),
+        rendered_count=rendered_count,
+        pages=pages,
+    )
+    atomic_write_text(index_dir / "index.json", json.dumps(index.to_dict(), indent=2))
+    return index
+
+
+_SHARDED_GALLERY_CSS = """
+        /* Sharded gallery toolbar */
+        .toolbar {
+            display: flex;
+            gap: 0.5rem;
+            align-items: center;
+            margin-bottom: 1rem;
+            flex-wrap: wrap;
+        }
+
+        .search-input, .sort-select {
+            padding: 0.5rem 0.75rem;
+            border: 1px solid var(--border-color);
+            border-radius: 0.375rem;
+            background: var(--bg-color);
+            color: var(--text-color);
+            font-size: 0.875rem;
+        }
+
+        .search-input {
+            flex: 1;
+            min-width: 200px;
+        }
+
+        .pager {
+            display: flex;
+            gap: 0.5rem;
+            align-items: center;
+            color: var(--muted-color);
+            font-size: 0.875rem;
+            margin-left: auto;
+        }
+
+        .not-rendered {
+            color: var(--muted-color);
+            font-size: 0.75rem;
+            font-style: italic;
+        }
+"""
+
+
+def stream_sharded_gallery_html(
+    out: HtmlStream,
+    result: ViewResult,
+    index: GalleryIndex,
+    title: str = "Historical Executions",
+    rows_per_view: int = 100,
+) -> None:
+    """Stream a gallery page that loads its rows from a sharded index.
+    
+    The page itself holds no execution rows. It loads the index pages
+    written by `write_gallery_index` and filters, searches, sorts and
+    paginates the records client-side.
+    
+    Args:
+        out: Stream to write the document to.
+        result: ViewResult used for the summary cards.
+        index: Manifest returned by `write_gallery_index`.
+        title: Page title.
+        rows_per_view: Table rows shown per gallery page.
+    """
+    manifest = json.dumps(index.to_dict()).replace("</", "<\\/")
+    
+    _stream_gallery_header(out, result, title, extra_css=_SHARDED_GALLERY_CSS)
+    out.write('''
+        <div class="toolbar">
+            <input type="text" id="search" class="search-input" placeholder="🔍 Search execution ID or component..." oninput="setQuery(this.value)">
+            <select id="sort-key" class="sort-select" onchange="setSort(this.value)">
+                <option value="timestamp">Timestamp</option>
+                <option value="duration_ms">Duration</option>
+                <option value="span_count">Spans</option>
+                <option value="error_count">Errors</option>
+                <option value="retry_count">Retries</option>
+            </select>
+            <button class="filter-btn" id="sort-dir" onclick="toggleSortDir()">↓ Desc</button>
+            <div class="pager">
+                <button class="filter-btn" onclick="changePage(-1)">‹ Prev</button>
+                <span id="pager-info">Loading…</span>
+                <button class="filter-btn" onclick="changePage(1)">Next ›</button>
+            </div>
+        </div>
+''')
+    out.write(_GALLERY_TABLE_HEAD)
+    out.write('''
+                </tbody>
+            </table>
+        </div>
+    </div>
+
+    <script>
+''')
+    out.write(_GALLERY_THEME_JS)
+    out.write(f'''
+        const GALLERY = {manifest};
+        const ROWS_PER_VIEW = {rows_per_view};
+        const STATUS_ICONS = {{passed: '✅', error: '❌', warning: '⚠️'}};
+        const records = [];
+        let pagesLoaded = 0;
+        let statusFilter = 'all';
+        let query = '';
+        let sortKey = 'timestamp';
+        let sortDesc = true;
+        let viewPage = 0;
+        let renderPending = false;
+
+        function esc(value) {{
+            return String(value).replace(/[&<>"']/g, c => ({{
+                '&': '&amp;', '<': '&lt;', '>': '&gt;', '"': '&quot;', "'": '&#x27;'
+            }})[c]);
+        }}
+
+        // Index pages call this as they load
+        function itkGalleryPage(n, rows) {{
+            for (const r of rows) records.push(r);
+            pagesLoaded++;
+            loadNextPage();
+            scheduleRender();
+        }}
+
+        function loadNextPage() {{
+            if (pagesLoaded >= GALLERY.pages.length) return;
+            const script = document.createElement('script');
+            script.src = GALLERY.pages[pagesLoaded];
+            script.onerror = () => {{
+                document.getElementById('pager-info').textContent = 'Failed to load ' + script.src;
+            }};
+            document.body.appendChild(script);
+        }}
+
+        function scheduleRender() {{
+            if (renderPending) return;
+            renderPending = true;
+            requestAnimationFrame(() => {{ renderPending = false; renderTable(); }});
+        }}
+
+        function filterTable(status) {{
+            statusFilter = status;
+            document.querySelectorAll('.filter-btn[data-filter]').forEach(btn => {{
+                btn.classList.toggle('active', btn.dataset.filter === status);
+            }});
+            viewPage = 0;
+            scheduleRender();
+        }}
+
+        function setQuery(value) {{
+            query = value.trim().toLowerCase();
+            viewPage = 0;
+            scheduleRender();
+        }}
+
+        function setSort(key) {{
+            sortKey = key;
+            viewPage = 0;
+            scheduleRender();
+        }}
+
+        function toggleSortDir() {{
+            sortDesc = !sortDesc;
+            document.getElementById('sort-dir').textContent = sortDesc ? '↓ Desc' : '↑ Asc';
+            scheduleRender();
+        }}
+
+        function changePage(delta) {{
+            viewPage = Math.max(0, viewPage + delta);
+            scheduleRender();
+        }}
+
+        function matches(r) {{
+            if (statusFilter !== 'all' && r.status !== statusFilter) return false;
+            if (!query) return true;
+            if (r.execution_id.toLowerCase().includes(query)) return true;
+            return r.components.some(c => c.toLowerCase().includes(query));
+        }}
+
+        function compare(a, b) {{
+            const x = a[sortKey], y = b[sortKey];
+            if (x === y) return 0;
+            if (x === null) return 1;
+            if (y === null) return -1;
+            return (x < y ? -1 : 1) * (sortDesc ? -1 : 1);
+        }}
+
+        function formatDuration(ms) {{
+            if (ms <= 0) return '-';
+            return ms >= 1000 ? (ms / 1000).toFixed(2) + 's' : Math.round(ms) + 'ms';
+        }}
+
+        function renderRow(r, i) {{
+            const shortId = r.execution_id.slice(0, 12);
+            const ts = r.timestamp ? r.timestamp.replace('T', ' ').slice(0, 19) : 'Unknown';
+            let badges = r.components.slice(0, 3).map(c => `<span class="badge">${{esc(c)}}</span>`).join(' ');
+            if (r.components.length > 3) badges += ` <span class="badge-more">+${{r.components.length - 3}}</span>`;
+            const actions = r.rendered
+                ? `<a href="${{esc(r.artifact_dir)}}/trace-viewer.html" class="btn btn-primary">🔍 View</a>
+                   <a href="${{esc(r.artifact_dir)}}/timeline.html" class="btn btn-secondary">📊 Timeline</a>`
+                : '<span class="not-rendered" title="Re-run itk view with --render all, or include it with --top/--filter">not rendered</span>';
+            return `<tr class="${{i % 2 === 0 ? 'even' : 'odd'}} status-${{esc(r.status)}}" data-status="${{esc(r.status)}}">
+                <td class="col-status">${{STATUS_ICONS[r.status] || '❓'}}</td>
+                <td class="col-id" title="${{esc(r.execution_id)}}">${{esc(shortId)}}</td>
+                <td class="col-timestamp">${{ts}}</td>
+                <td class="col-duration">${{formatDuration(r.duration_ms)}}</td>
+                <td class="col-spans">${{r.span_count}}</td>
+                <td class="col-errors">${{r.error_count > 0 ? r.error_count : '-'}}</td>
+                <td class="col-retries">${{r.retry_count > 0 ? r.retry_count : '-'}}</td>
+                <td class="col-components">${{badges}}</td>
+                <td class="col-actions">${{actions}}</td>
+            </tr>`;
+        }}
+
+        function renderTable() {{
+            const selected = records.filter(matches).sort(compare);
+            const pageCount = Math.max(1, Math.ceil(selected.length / ROWS_PER_VIEW));
+            viewPage = Math.min(viewPage, pageCount - 1);
+            const start = viewPage * ROWS_PER_VIEW;
+            const rows = selected.slice(start, start + ROWS_PER_VIEW);
+            const tbody = document.querySelector('tbody');
+            tbody.innerHTML = rows.length
+                ? rows.map((r, i) => renderRow(r, start + i)).join('\\n')
+                : '<tr><td colspan="9" class="empty-state"><div class="icon">📭</div><div>No executions found in this time window</div></td></tr>';
+            const loading = pagesLoaded < GALLERY.pages.length
+                ? ` · loading ${{pagesLoaded}}/${{GALLERY.pages.length}}`
+                : '';
+            const end = Math.min(start + ROWS_PER_VIEW, selected.length);
+            document.getElementById('pager-info').textContent =
+                `${{selected.length ? start + 1 : 0}}–${{end}} of ${{selected.length}}${{loading}}`;
+        }}
+
+        if (GALLERY.pages.length) {{
+            loadNextPage();
+        }} else {{
+            renderTable();
+        }}
+    </script>
+</body>
+</html>''')
+
+
+def render_sharded_gallery_html(
+    result: ViewResult,
+    index: GalleryIndex,
+    title: str = "Historical Executions",
+) -> str:
+    """Render the sharded gallery page as a string (see `stream_sharded_gallery_html`)."""
+    return render_to_string(stream_sharded_gallery_html, result, index, title)
 
 
 def load_logs_from_file(logs_file: Path) -> list[dict[str, Any]]:
@@ -769,9 +1164,9 @@ def _fetch_logs_with_filter(
     This is slower than Logs Insights but works immediately on new log groups
     without waiting for indexing.
     """
-    import boto3
-    
-    client = boto3.client("logs", region_name=region)
+    from itk.aws import get_client
+
+    client = get_client("logs", region)
     events: list[dict[str, Any]] = []
     
     start_ms = int(start_time.timestamp() * 1000)
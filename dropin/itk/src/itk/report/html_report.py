@@ -15,6 +15,7 @@ from pathlib import Path
 from typing import Optional
 
 from itk.report import CaseResult, CaseStatus, SuiteResult
+from itk.utils.html_stream import HtmlStream, render_to_string, stream_to_file
 
 
 # Status colors and icons
@@ -101,15 +102,18 @@ def _render_case_row(case: CaseResult, index: int) -> str:
     </tr>'''
 
 
-def render_suite_report(suite: SuiteResult, title: Optional[str] = None) -> str:
-    """Render HTML report for suite results.
+def stream_suite_report(
+    out: HtmlStream, suite: SuiteResult, title: Optional[str] = None
+) -> None:
+    """Stream the HTML report for suite results.
+
+    Case rows are written one at a time rather than joined into a single
+    string, so memory does not grow with the number of cases.
 
     Args:
+        out: Stream to write the document to.
         suite: Suite execution results.
         title: Optional page title.
-
-    Returns:
-        Complete HTML document as string.
     """
     title = title or f"Suite Report — {suite.suite_name}"
 
@@ -117,10 +121,7 @@ def render_suite_report(suite: SuiteResult, title: Optional[str] = None) -> str:
     pass_rate = suite.pass_rate
     pass_rate_color = "#10b981" if pass_rate >= 80 else "#f59e0b" if pass_rate >= 50 else "#ef4444"
 
-    # Case rows
-    case_rows = "\n".join(_render_case_row(c, i) for i, c in enumerate(suite.cases))
-
-    return f'''<!DOCTYPE html>
+    out.write(f'''<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -453,7 +454,10 @@ def render_suite_report(suite: SuiteResult, title: Optional[str] = None) -> str:
                 </tr>
             </thead>
             <tbody>
-                {case_rows}
+                ''')
+    # Case rows
+    out.join("\n", (_render_case_row(c, i) for i, c in enumerate(suite.cases)))
+    out.write(f'''
             </tbody>
         </table>
 
@@ -498,7 +502,20 @@ def render_suite_report(suite: SuiteResult, title: Optional[str] = None) -> str:
     }});
     </script>
 </body>
-</html>'''
+</html>''')
+
+
+def render_suite_report(suite: SuiteResult, title: Optional[str] = None) -> str:
+    """Render HTML report for suite results.
+
+    Args:
+        suite: Suite execution results.
+        title: Optional page title.
+
+    Returns:
+        Complete HTML document as string.
+    """
+    return render_to_string(stream_suite_report, suite, title)
 
 
 def write_suite_report(suite: SuiteResult, out_dir: Path) -> None:
@@ -515,8 +532,7 @@ def write_suite_report(suite: SuiteResult, out_dir: Path) -> None:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Write HTML report
-    html_content = render_suite_report(suite)
-    (out_dir / "index.html").write_text(html_content, encoding="utf-8")
+    stream_to_file(out_dir / "index.html", stream_suite_report, suite)
 
     # Write JSON summary
     json_content = json.dumps(suite.to_dict(), indent=2, ensure_ascii=False)
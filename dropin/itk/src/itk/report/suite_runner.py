@@ -10,6 +10,7 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Optional, Sequence
 
+from itk import perf
 from itk.assertions.invariants import run_all_invariants
 from itk.cases.loader import load_case, CaseConfig
 from itk.config import Config, get_config
@@ -19,7 +20,8 @@ from itk.logs.parse import load_fixture_jsonl_as_spans
 from itk.report import CaseResult, CaseStatus, SuiteResult, generate_suite_id
 from itk.trace.build_trace import build_trace_from_spans
 from itk.trace.trace_model import Trace
-from itk.utils.artifacts import write_run_artifacts
+from itk.utils.artifacts import get_redactor, write_run_artifacts
+from itk.utils.render_cache import RenderCache, trace_fingerprint
 
 
 def discover_cases(cases_dir: Path, pattern: str = "*.yaml") -> list[Path]:
@@ -88,9 +90,11 @@ def resolve_fixture_for_case(case_path: Path) -> Optional[Path]:
     return None
 
 
+@perf.timed("suite.case")
 def run_case_dev_fixtures(
     case_path: Path,
     out_dir: Optional[Path] = None,
+    render_cache: Optional[RenderCache] = None,
 ) -> CaseResult:
     """Run a single case in dev-fixtures mode.
 
@@ -98,6 +102,8 @@ def run_case_dev_fixtures(
         case_path: Path to case YAML file.
         out_dir: Output directory for artifacts. If None, skip artifact writing.
             Used for soak testing where we don't want artifacts per iteration.
+        render_cache: Optional render cache; artifacts are not regenerated
+            when the trace fingerprint matches a previous render.
 
     Returns:
         CaseResult with execution details.
@@ -137,22 +143,38 @@ def run_case_dev_fixtures(
         trace = build_trace_from_spans(spans)
 
         # Run invariants
-        invariant_results = run_all_invariants(trace)
+        invariant_results = run_all_invariants(trace, case.invariants)
 
         # Render artifacts and write if out_dir provided
         mermaid = render_mermaid_sequence(trace)
         case_out_dir: Optional[Path] = None
+        render_cached = False
 
         if out_dir is not None:
             # Create case-specific output dir
             case_out_dir = out_dir / case.id
-            write_run_artifacts(
-                out_dir=case_out_dir,
-                trace=trace,
-                mermaid=mermaid,
-                case=case,
-                invariant_results=invariant_results,
-            )
+
+            def _write_artifacts() -> None:
+                write_run_artifacts(
+                    out_dir=case_out_dir,
+                    trace=trace,
+                    mermaid=mermaid,
+                    case=case,
+                    invariant_results=invariant_results,
+                )
+
+            if render_cache is None:
+                _write_artifacts()
+            else:
+                fingerprint = trace_fingerprint(
+                    trace.spans,
+                    redaction=get_redactor().config,
+                    extra={
+                        "case": [case.id, case.name, case.entrypoint.type],
+                        "invariants": [[r.name, r.passed, r.details] for r in invariant_results],
+                    },
+                )
+                render_cached = render_cache.render(case_out_dir, fingerprint, _write_artifacts)
 
         # Generate mini SVG for report thumbnail
         mini_svg = render_mini_svg(trace)
@@ -192,6 +214,7 @@ def run_case_dev_fixtures(
             thumbnail_svg=mini_svg,
             timeline_svg=mini_timeline,
             spans=trace.spans,  # Include spans for soak testing
+            render_cached=render_cached,
         )
 
     except Exception as e:
@@ -207,12 +230,14 @@ def run_case_dev_fixtures(
         )
 
 
+@perf.timed("suite.run")
 def run_suite(
     cases_dir: Path,
     out_dir: Path,
     suite_name: Optional[str] = None,
     case_filter: Optional[Callable[[Path], bool]] = None,
     on_case_complete: Optional[Callable[[CaseResult], None]] = None,
+    render_cache: Optional[RenderCache] = None,
 ) -> SuiteResult:
     """Run a test suite.
 
@@ -222,6 +247,7 @@ def run_suite(
         suite_name: Optional suite name (defaults to directory name).
         case_filter: Optional function to filter which cases to run.
         on_case_complete: Optional callback after each case completes.
+        render_cache: Optional render cache shared across cases.
 
     Returns:
         SuiteResult with all case results.
@@ -250,7 +276,7 @@ def run_suite(
     # Run each case
     for case_path in case_paths:
         if config and config.is_dev_fixtures():
-            result = run_case_dev_fixtures(case_path, out_dir)
+            result = run_case_dev_fixtures(case_path, out_dir, render_cache=render_cache)
         else:
             # Live mode placeholder
             result = CaseResult(
@@ -262,6 +288,7 @@ def run_suite(
             )
 
         suite.cases.append(result)
+        perf.count("suite.cases")
 
         if on_case_complete:
             on_case_complete(result)
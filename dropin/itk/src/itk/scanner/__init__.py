@@ -11,6 +11,9 @@ Performs static analysis on Python/CDK codebases to identify:
 from __future__ import annotations
 
 import ast
+import fnmatch
+import hashlib
+import os
 import re
 from dataclasses import dataclass, field
 from pathlib import Path
@@ -65,6 +68,7 @@ class ScanResult:
     branches: list[DetectedBranch] = field(default_factory=list)
     logging_gaps: list[LoggingGap] = field(default_factory=list)
     scanned_files: int = 0
+    cached_files: int = 0  # Files whose results came from the scan cache
     errors: list[str] = field(default_factory=list)
 
 
@@ -121,10 +125,13 @@ class PythonFileScanner(ast.NodeVisitor):
         self.current_function: str | None = None
         self.current_class: str | None = None
         self._source_lines: list[str] = []
+        self._segment_lines: list[str] = []
     
     def scan(self, source: str) -> None:
         """Parse and scan the source code."""
         self._source_lines = source.splitlines()
+        # Split once; ast.get_source_segment would re-split the source per node
+        self._segment_lines = "\n".join(self._source_lines).splitlines(keepends=True)
         try:
             tree = ast.parse(source)
             self.visit(tree)
@@ -300,9 +307,7 @@ class PythonFileScanner(ast.NodeVisitor):
     
     def _check_handler_logging(self, node: ast.FunctionDef) -> None:
         """Check if a handler has proper logging."""
-        source = ast.get_source_segment(
-            "\n".join(self._source_lines), node
-        ) or ""
+        source = self._get_source_segment(node)
         
         has_entry_log = bool(re.search(r'(log|print).*("|\').*start|entry|received', source, re.I))
         has_exit_log = bool(re.search(r'(log|print).*("|\').*end|exit|complete|return', source, re.I))
@@ -342,9 +347,22 @@ class PythonFileScanner(ast.NodeVisitor):
         pass  # Could add file-level checks here
     
     def _get_source_segment(self, node: ast.AST) -> str:
-        """Get source code for an AST node."""
+        """Get source code for an AST node (same result as ast.get_source_segment)."""
         try:
-            return ast.get_source_segment("\n".join(self._source_lines), node) or ""
+            end_lineno = node.end_lineno  # type: ignore[attr-defined]
+            end_col_offset = node.end_col_offset  # type: ignore[attr-defined]
+            if end_lineno is None or end_col_offset is None:
+                return ""
+            lineno = node.lineno - 1  # type: ignore[attr-defined]
+            end_lineno -= 1
+            col_offset = node.col_offset  # type: ignore[attr-defined]
+            lines = self._segment_lines
+            # Column offsets are in UTF-8 bytes
+            if end_lineno == lineno:
+                return lines[lineno].encode()[col_offset:end_col_offset].decode()
+            first = lines[lineno].encode()[col_offset:].decode()
+            last = lines[end_lineno].encode()[:end_col_offset].decode()
+            return "".join([first, *lines[lineno + 1:end_lineno], last])
         except Exception:
             return ""
     
@@ -390,30 +408,77 @@ class PythonFileScanner(ast.NodeVisitor):
         return name.replace("_", "-").lower()
 
 
+# Default exclusions, matched against each path component (fnmatch-style)
+DEFAULT_EXCLUDE_PATTERNS = [
+    "__pycache__",
+    ".venv",
+    "venv",
+    "node_modules",
+    ".git",
+    "cdk.out",
+    ".pytest_cache",
+    "dist",
+    "build",
+    "*.egg-info",
+]
+
+
+def _is_excluded(name: str, rel_path: str, exclude_patterns: list[str]) -> bool:
+    """Check a directory entry against exclusion patterns.
+
+    Patterns without a slash match the entry name; patterns with a slash
+    match the path relative to the scan root (POSIX separators).
+    """
+    for pattern in exclude_patterns:
+        if "/" in pattern:
+            if fnmatch.fnmatch(rel_path, pattern):
+                return True
+        elif fnmatch.fnmatch(name, pattern):
+            return True
+    return False
+
+
+def iter_python_files(
+    root: Path,
+    exclude_patterns: list[str] | None = None,
+) -> Iterator[tuple[Path, os.stat_result]]:
+    """Yield (path, stat) for Python files under root, in sorted order.
+
+    Excluded directories are pruned during traversal, so trees like
+    `node_modules` are never entered. Symlinked directories are not followed.
+    """
+    exclude_patterns = exclude_patterns or DEFAULT_EXCLUDE_PATTERNS
+    stack: list[tuple[str, str]] = [(str(root), "")]
+    while stack:
+        directory, rel_dir = stack.pop()
+        try:
+            with os.scandir(directory) as it:
+                entries = sorted(it, key=lambda e: e.name)
+        except OSError:
+            continue
+
+        subdirs: list[tuple[str, str]] = []
+        for entry in entries:
+            rel_path = f"{rel_dir}{entry.name}"
+            if _is_excluded(entry.name, rel_path, exclude_patterns):
+                continue
+            try:
+                if entry.is_dir(follow_symlinks=False):
+                    subdirs.append((entry.path, rel_path + "/"))
+                elif entry.name.endswith(".py") and entry.is_file():
+                    yield Path(entry.path), entry.stat()
+            except OSError:
+                continue
+        # Depth-first, files of a directory before its subdirectories
+        stack.extend(reversed(subdirs))
+
+
 def scan_directory(
     root: Path,
     exclude_patterns: list[str] | None = None,
 ) -> Iterator[tuple[Path, str]]:
     """Yield Python files from directory, excluding patterns."""
-    exclude_patterns = exclude_patterns or [
-        "__pycache__",
-        ".venv",
-        "venv",
-        "node_modules",
-        ".git",
-        "cdk.out",
-        ".pytest_cache",
-        "dist",
-        "build",
-        "*.egg-info",
-    ]
-    
-    for py_file in root.rglob("*.py"):
-        # Check exclusions
-        path_str = str(py_file)
-        if any(excl in path_str for excl in exclude_patterns):
-            continue
-        
+    for py_file, _ in iter_python_files(root, exclude_patterns):
         try:
             content = py_file.read_text(encoding="utf-8")
             yield py_file, content
@@ -421,15 +486,89 @@ def scan_directory(
             continue
 
 
+@dataclass
+class FileScan:
+    """Scan results for a single file."""
+
+    file_path: str  # Relative to the repo root
+    size: int
+    mtime_ns: int
+    sha256: str
+    components: list[DetectedComponent] = field(default_factory=list)
+    branches: list[DetectedBranch] = field(default_factory=list)
+    logging_gaps: list[LoggingGap] = field(default_factory=list)
+    error: str | None = None
+    unchanged: bool = False  # Content hash matched the cached entry; not re-parsed
+
+
+def scan_file(
+    repo_path: str,
+    rel_path: str,
+    known_sha256: str | None = None,
+) -> FileScan | None:
+    """Read, hash and scan one file.
+
+    Args:
+        repo_path: Repository root.
+        rel_path: File path relative to the root.
+        known_sha256: Hash of a cached scan; if the content still matches,
+            parsing is skipped and the result is marked `unchanged`.
+
+    Returns:
+        The scan, or None if the file cannot be read as UTF-8.
+    """
+    full_path = os.path.join(repo_path, rel_path)
+    try:
+        with open(full_path, "rb") as f:
+            st = os.fstat(f.fileno())
+            data = f.read()
+        content = data.decode("utf-8")
+    except (OSError, UnicodeDecodeError):
+        return None
+
+    scan = FileScan(
+        file_path=rel_path,
+        size=st.st_size,
+        mtime_ns=st.st_mtime_ns,
+        sha256=hashlib.sha256(data).hexdigest(),
+    )
+    if scan.sha256 == known_sha256:
+        scan.unchanged = True
+        return scan
+
+    # Same newline handling as Path.read_text
+    content = content.replace("\r\n", "\n").replace("\r", "\n")
+    scanner = PythonFileScanner(rel_path)
+    try:
+        scanner.scan(content)
+    except Exception as e:
+        scan.error = f"Error scanning {full_path}: {e}"
+        return scan
+    scan.components = scanner.components
+    scan.branches = scanner.branches
+    scan.logging_gaps = scanner.logging_gaps
+    return scan
+
+
+def _scan_file_args(args: tuple[str, str, str | None]) -> FileScan | None:
+    return scan_file(*args)
+
+
 def scan_codebase(
     repo_path: str | Path,
     exclude_patterns: list[str] | None = None,
+    *,
+    workers: int = 1,
+    cache_dir: str | Path | None = None,
 ) -> ScanResult:
     """Scan a codebase for components and coverage gaps.
     
     Args:
         repo_path: Path to the repository root.
-        exclude_patterns: Glob patterns to exclude.
+        exclude_patterns: Glob patterns to exclude (matched per path component).
+        workers: Processes used to parse files (1 = in-process).
+        cache_dir: Directory of the incremental scan cache (see
+            `itk.scanner.cache`). Unchanged files are not re-parsed.
         
     Returns:
         ScanResult with detected components, branches, and gaps.
@@ -440,18 +579,61 @@ def scan_codebase(
     if not repo_path.exists():
         result.errors.append(f"Repository path does not exist: {repo_path}")
         return result
-    
-    for file_path, content in scan_directory(repo_path, exclude_patterns):
+
+    cache = None
+    if cache_dir is not None:
+        from itk.scanner.cache import ScanCache
+
+        cache = ScanCache.load(Path(cache_dir), repo_path)
+
+    # Walk first, so cached files never need to be opened
+    order: list[str] = []
+    scans: dict[str, FileScan] = {}
+    todo: list[tuple[str, str, str | None]] = []
+    for file_path, st in iter_python_files(repo_path, exclude_patterns):
+        rel_path = str(file_path.relative_to(repo_path))
+        order.append(rel_path)
+        cached = cache.get(rel_path, st) if cache is not None else None
+        if cached is not None:
+            scans[rel_path] = cached
+            result.cached_files += 1
+        else:
+            known = cache.known_hash(rel_path) if cache is not None else None
+            todo.append((str(repo_path), rel_path, known))
+
+    if workers > 1 and len(todo) > 1:
+        from concurrent.futures import ProcessPoolExecutor
+
+        chunksize = max(1, len(todo) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as pool:
+            fresh = list(pool.map(_scan_file_args, todo, chunksize=chunksize))
+    else:
+        fresh = [scan_file(*args) for args in todo]
+
+    for scan in fresh:
+        if scan is None:
+            continue
+        if scan.unchanged and cache is not None:
+            scan = cache.refresh(scan)
+            result.cached_files += 1
+        scans[scan.file_path] = scan
+        if cache is not None and scan.error is None:
+            cache.put(scan)
+
+    for rel_path in order:
+        scan = scans.get(rel_path)
+        if scan is None:
+            continue  # Unreadable
         result.scanned_files += 1
-        
-        scanner = PythonFileScanner(str(file_path.relative_to(repo_path)))
-        try:
-            scanner.scan(content)
-            result.components.extend(scanner.components)
-            result.branches.extend(scanner.branches)
-            result.logging_gaps.extend(scanner.logging_gaps)
-        except Exception as e:
-            result.errors.append(f"Error scanning {file_path}: {e}")
+        if scan.error is not None:
+            result.errors.append(scan.error)
+            continue
+        result.components.extend(scan.components)
+        result.branches.extend(scan.branches)
+        result.logging_gaps.extend(scan.logging_gaps)
+
+    if cache is not None:
+        cache.save(keep=order)
     
     return result
 
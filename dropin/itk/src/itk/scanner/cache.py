@@ -0,0 +1,149 @@
+"""Incremental cache for `itk scan`.
+
+Scanning a large repository parses every Python file with `ast`, although
+between two scans almost nothing changes. The scan cache stores each file's
+`DetectedComponent`, `DetectedBranch` and `LoggingGap` results keyed by its
+repo-relative path, size, mtime and content hash:
+
+- same size and mtime: cached results are used without opening the file
+- stat changed but content hash unchanged: results are reused, stat updated
+- otherwise: the file is parsed again
+
+The cache also records a hash of the scanner source, so editing the
+detection rules invalidates every entry. There is one JSON file per
+repository under `.itk/scan-cache/`.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from dataclasses import asdict, replace
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional
+
+from itk.scanner import DetectedBranch, DetectedComponent, FileScan, LoggingGap
+from itk.utils.write_pipeline import atomic_write_text
+
+# Default directory holding one cache file per scanned repository
+DEFAULT_SCAN_CACHE_DIR = Path(".itk") / "scan-cache"
+
+# Bump when the cache file layout changes
+SCAN_CACHE_VERSION = 1
+
+
+@lru_cache(maxsize=1)
+def scanner_version() -> str:
+    """Return a short hash of the scanner source.
+
+    Any change to the detection rules invalidates cached results.
+    """
+    source = (Path(__file__).parent / "__init__.py").read_bytes()
+    return hashlib.sha256(source).hexdigest()[:16]
+
+
+def _cache_path(cache_dir: Path, repo_path: Path) -> Path:
+    key = hashlib.sha256(os.path.abspath(repo_path).encode("utf-8")).hexdigest()[:16]
+    return cache_dir / f"{key}.json"
+
+
+def _entry_to_dict(scan: FileScan) -> dict[str, Any]:
+    return {
+        "size": scan.size,
+        "mtime_ns": scan.mtime_ns,
+        "sha256": scan.sha256,
+        "components": [asdict(c) for c in scan.components],
+        "branches": [asdict(b) for b in scan.branches],
+        "logging_gaps": [asdict(g) for g in scan.logging_gaps],
+    }
+
+
+def _entry_from_dict(rel_path: str, data: dict[str, Any]) -> FileScan:
+    return FileScan(
+        file_path=rel_path,
+        size=data["size"],
+        mtime_ns=data["mtime_ns"],
+        sha256=data["sha256"],
+        components=[DetectedComponent(**c) for c in data["components"]],
+        branches=[DetectedBranch(**b) for b in data["branches"]],
+        logging_gaps=[LoggingGap(**g) for g in data["logging_gaps"]],
+    )
+
+
+class ScanCache:
+    """Per-file scan results for one repository."""
+
+    def __init__(self, path: Path, entries: Optional[dict[str, dict[str, Any]]] = None) -> None:
+        self.path = path
+        self._entries: dict[str, dict[str, Any]] = entries or {}
+        self._dirty = False
+
+    @classmethod
+    def load(cls, cache_dir: Path, repo_path: Path) -> "ScanCache":
+        """Load the cache for a repository (empty if missing, stale or corrupt)."""
+        path = _cache_path(cache_dir, repo_path)
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return cls(path)
+        if (
+            not isinstance(data, dict)
+            or data.get("version") != SCAN_CACHE_VERSION
+            or data.get("scanner") != scanner_version()
+        ):
+            return cls(path)
+        return cls(path, data.get("files") or {})
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, rel_path: str, st: os.stat_result) -> Optional[FileScan]:
+        """Return cached results if the file's size and mtime are unchanged."""
+        data = self._entries.get(rel_path)
+        if data is None or data["size"] != st.st_size or data["mtime_ns"] != st.st_mtime_ns:
+            return None
+        return _entry_from_dict(rel_path, data)
+
+    def known_hash(self, rel_path: str) -> Optional[str]:
+        """Content hash of the cached entry, if any."""
+        data = self._entries.get(rel_path)
+        return data["sha256"] if data is not None else None
+
+    def refresh(self, scan: FileScan) -> FileScan:
+        """Combine an `unchanged` scan's new stat with the cached results."""
+        cached = _entry_from_dict(scan.file_path, self._entries[scan.file_path])
+        return replace(cached, size=scan.size, mtime_ns=scan.mtime_ns)
+
+    def put(self, scan: FileScan) -> None:
+        """Store a file's results."""
+        self._entries[scan.file_path] = _entry_to_dict(scan)
+        self._dirty = True
+
+    def save(self, keep: Optional[Iterable[str]] = None) -> None:
+        """Write the cache if it changed.
+
+        Args:
+            keep: If given, drop entries for all other paths (deleted or
+                newly excluded files).
+        """
+        if keep is not None:
+            keep_set = set(keep)
+            stale = [p for p in self._entries if p not in keep_set]
+            for rel_path in stale:
+                del self._entries[rel_path]
+            self._dirty = self._dirty or bool(stale)
+        if not self._dirty:
+            return
+        atomic_write_text(
+            self.path,
+            json.dumps(
+                {
+                    "version": SCAN_CACHE_VERSION,
+                    "scanner": scanner_version(),
+                    "files": self._entries,
+                },
+                separators=(",", ":"),
+            ),
+        )
+        self._dirty = False
@@ -30,6 +30,16 @@ class ThrottleType(Enum):
     RATE_LIMIT = "rate_limit"
 
 
+# Lowercased error-message fragments that indicate throttling
+THROTTLE_MESSAGE_PATTERNS: tuple[tuple[str, ThrottleType], ...] = (
+    ("throttlingexception", ThrottleType.AWS_THROTTLE),
+    ("provisionedthroughputexceeded", ThrottleType.AWS_THROTTLE),
+    ("rate exceeded", ThrottleType.RATE_LIMIT),
+    ("too many requests", ThrottleType.RATE_LIMIT),
+    ("request limit exceeded", ThrottleType.RATE_LIMIT),
+)
+
+
 @dataclass
 class SoakConfig:
     """Configuration for a soak test run.
@@ -100,7 +110,8 @@ class SoakIteration:
         span_count: Number of spans in the trace.
         error_count: Number of error spans.
         throttle_events: List of throttle events in this iteration.
-        retry_count: Number of retry attempts in this iteration.
+        retry_count: Server-side retries in this iteration (from span attempts).
+        client_retry_count: Retries made by ITK's own adapters (see itk.aws.retry).
         status: Status string ('passed', 'warning', 'failed', 'error').
         artifacts_dir: Path to iteration artifacts (if detailed mode).
     """
@@ -115,6 +126,7 @@ class SoakIteration:
     retry_count: int = 0
     status: str = "passed"  # passed, warning, failed, error
     artifacts_dir: Optional[str] = None
+    client_retry_count: int = 0
 
     @property
     def is_clean_pass(self) -> bool:
@@ -142,6 +154,7 @@ class SoakIteration:
             "span_count": self.span_count,
             "error_count": self.error_count,
             "retry_count": self.retry_count,
+            "client_retry_count": self.client_retry_count,
             "is_clean_pass": self.is_clean_pass,
             "throttle_detected": self.throttle_detected,
             "throttle_events": [e.to_dict() for e in self.throttle_events],
@@ -223,6 +236,11 @@ class SoakResult:
         """Total retry count across all iterations."""
         return sum(i.retry_count for i in self.iterations)
 
+    @property
+    def total_client_retries(self) -> int:
+        """Total client-side (adapter) retries across all iterations."""
+        return sum(i.client_retry_count for i in self.iterations)
+
     @property
     def avg_retries_per_iteration(self) -> float:
         """Average retries per iteration."""
@@ -289,6 +307,7 @@ class SoakResult:
                 "total_retries": self.total_retries,
                 "avg_retries_per_iteration": self.avg_retries_per_iteration,
                 "max_retries": self.max_retries,
+                "total_client_retries": self.total_client_retries,
                 "total_throttle_events": len(self.all_throttle_events),
                 "throttle_rate": self.throttle_rate,
                 "final_rate": self.final_rate,
@@ -0,0 +1,384 @@
+"""Streaming aggregates for soak reports.
+
+A multi-hour soak produces tens of thousands of iterations. Rendering every
+iteration into the report (and re-downloading it on every refresh) does not
+scale, so the soak report is built from fixed-size aggregates instead:
+
+- `LatencyHistogram` (`itk.utils.histogram`): HDR-style log-linear histogram
+  of iteration durations (bounded number of buckets, ~1% relative error on
+  percentiles)
+- per-time-window clean/warning/failure/throttle counts; windows are merged
+  pairwise when there are too many, so the count stays bounded
+- throttle counts by `ThrottleType`
+- LTTB-downsampled latency and rate series for charts
+- rings of the most recent iterations, throttle events and rate changes
+
+`SoakAggregates.to_dict()` is the payload of `progress.json`, which the live
+report polls instead of reloading the whole page.
+"""
+from __future__ import annotations
+
+from collections import deque
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Optional, Sequence
+
+from itk.utils.histogram import LatencyHistogram
+
+from . import SoakIteration, SoakResult, ThrottleEvent, ThrottleType
+
+# Defaults for bounded report state
+DEFAULT_MAX_POINTS = 300  # chart points per series
+DEFAULT_WINDOW_SECONDS = 60.0  # initial width of a count window
+DEFAULT_MAX_WINDOWS = 120  # windows before merging pairs
+DEFAULT_RECENT_ITERATIONS = 500  # iterations shown in grid/table
+DEFAULT_RECENT_EVENTS = 50  # throttle events / rate changes shown
+
+Point = tuple[float, float]
+
+
+def lttb(points: Sequence[Point], threshold: int) -> list[Point]:
+    """Downsample a series with Largest-Triangle-Three-Buckets.
+
+    Keeps the first and last points and, from each bucket in between, the
+    point forming the largest triangle with its neighbours, which preserves
+    the visual shape (spikes, steps) far better than striding.
+
+    Args:
+        points: (x, y) points sorted by x.
+        threshold: Maximum number of points to return.
+
+    Returns:
+        Downsampled points (the input itself if already small enough).
+    """
+    n = len(points)
+    if threshold >= n or threshold < 3:
+        return list(points)
+
+    sampled = [points[0]]
+    every = (n - 2) / (threshold - 2)
+    a = 0
+    for i in range(threshold - 2):
+        # Average of the next bucket is the third triangle vertex
+        avg_start = int((i + 1) * every) + 1
+        avg_end = min(int((i + 2) * every) + 1, n)
+        span = avg_end - avg_start
+        avg_x = sum(p[0] for p in points[avg_start:avg_end]) / span
+        avg_y = sum(p[1] for p in points[avg_start:avg_end]) / span
+
+        ax, ay = points[a]
+        best_area = -1.0
+        best = int(i * every) + 1
+        for j in range(int(i * every) + 1, int((i + 1) * every) + 1):
+            px, py = points[j]
+            area = abs((ax - avg_x) * (py - ay) - (ax - px) * (avg_y - ay))
+            if area > best_area:
+                best_area = area
+                best = j
+        sampled.append(points[best])
+        a = best
+    sampled.append(points[-1])
+    return sampled
+
+
+class SeriesDownsampler:
+    """Bounded streaming series for charts.
+
+    Points are buffered until the buffer holds twice `max_points`, then
+    compacted with LTTB, so memory stays O(max_points) however long the run.
+    """
+
+    def __init__(self, max_points: int = DEFAULT_MAX_POINTS) -> None:
+        self.max_points = max_points
+        self._points: list[Point] = []
+
+    def add(self, x: float, y: float) -> None:
+        """Append a point (x must be non-decreasing)."""
+        self._points.append((x, y))
+        if len(self._points) > 2 * self.max_points:
+            self._points = lttb(self._points, self.max_points)
+
+    def points(self) -> list[Point]:
+        """Return at most `max_points` points."""
+        return lttb(self._points, self.max_points)
+
+
+@dataclass
+class WindowCounts:
+    """Iteration outcomes within one time window."""
+
+    start_seconds: float
+    clean: int = 0
+    warnings: int = 0
+    failures: int = 0
+    throttles: int = 0
+
+    def merge(self, other: "WindowCounts") -> None:
+        """Add another window's counts into this one."""
+        self.clean += other.clean
+        self.warnings += other.warnings
+        self.failures += other.failures
+        self.throttles += other.throttles
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "start_seconds": self.start_seconds,
+            "clean": self.clean,
+            "warnings": self.warnings,
+            "failures": self.failures,
+            "throttles": self.throttles,
+        }
+
+
+def _parse_ts(value: Optional[str]) -> Optional[datetime]:
+    if not value:
+        return None
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except ValueError:
+        return None
+
+
+class SoakAggregates:
+    """Fixed-size running summary of a soak run."""
+
+    def __init__(
+        self,
+        *,
+        soak_id: str = "",
+        case_name: str = "",
+        mode: str = "",
+        start_time: Optional[str] = None,
+        window_seconds: float = DEFAULT_WINDOW_SECONDS,
+        max_windows: int = DEFAULT_MAX_WINDOWS,
+        max_points: int = DEFAULT_MAX_POINTS,
+        recent_iterations: int = DEFAULT_RECENT_ITERATIONS,
+        recent_events: int = DEFAULT_RECENT_EVENTS,
+    ) -> None:
+        self.soak_id = soak_id
+        self.case_name = case_name
+        self.mode = mode
+        self.start_time = start_time
+        self.duration_seconds = 0.0
+        self.complete = False
+        self.final_rate: Optional[float] = None
+
+        # Counters
+        self.total = 0
+        self.passed = 0
+        self.clean = 0
+        self.warnings = 0
+        self.failures = 0
+        self.total_retries = 0
+        self.max_retries = 0
+        self.total_client_retries = 0
+        self.throttled_iterations = 0
+        self.throttle_count = 0
+        self.throttle_by_type: dict[str, int] = {t.value: 0 for t in ThrottleType}
+        self.rate_change_count = 0
+        self.has_artifacts = False
+
+        self.latency = LatencyHistogram()
+        self.latency_series = SeriesDownsampler(max_points)
+        self.rate_series = SeriesDownsampler(max_points)
+
+        self.window_seconds = window_seconds
+        self.max_windows = max_windows
+        self._windows: dict[int, WindowCounts] = {}
+
+        self.recent_iterations: deque[SoakIteration] = deque(maxlen=recent_iterations)
+        self.recent_throttles: deque[ThrottleEvent] = deque(maxlen=recent_events)
+        self.recent_rate_changes: deque[Any] = deque(maxlen=recent_events)
+
+        self._start_dt = _parse_ts(start_time)
+        self._last_elapsed = 0.0
+
+    # -- updates -----------------------------------------------------------
+
+    def _elapsed(self, iteration: SoakIteration) -> float:
+        ts = _parse_ts(iteration.timestamp)
+        if ts is not None:
+            if self._start_dt is None:
+                self._start_dt = ts
+            try:
+                self._last_elapsed = max((ts - self._start_dt).total_seconds(), 0.0)
+            except TypeError:  # naive vs aware timestamps
+                pass
+        return self._last_elapsed
+
+    def _window(self, elapsed: float) -> WindowCounts:
+        index = int(elapsed // self.window_seconds)
+        window = self._windows.get(index)
+        if window is None:
+            window = WindowCounts(start_seconds=index * self.window_seconds)
+            self._windows[index] = window
+            if len(self._windows) > self.max_windows:
+                self._merge_windows()
+                return self._window(elapsed)
+        return window
+
+    def _merge_windows(self) -> None:
+        """Double the window width, merging adjacent windows."""
+        self.window_seconds *= 2
+        merged: dict[int, WindowCounts] = {}
+        for index in sorted(self._windows):
+            new_index = index // 2
+            target = merged.get(new_index)
+            if target is None:
+                target = WindowCounts(start_seconds=new_index * self.window_seconds)
+                merged[new_index] = target
+            target.merge(self._windows[index])
+        self._windows = merged
+
+    def add_iteration(self, iteration: SoakIteration) -> None:
+        """Fold one iteration into the aggregates."""
+        self.total += 1
+        if iteration.passed:
+            self.passed += 1
+        else:
+            self.failures += 1
+        if iteration.is_clean_pass:
+            self.clean += 1
+        if iteration.is_warning:
+            self.warnings += 1
+        self.total_retries += iteration.retry_count
+        self.max_retries = max(self.max_retries, iteration.retry_count)
+        self.total_client_retries += iteration.client_retry_count
+        if iteration.artifacts_dir:
+            self.has_artifacts = True
+
+        self.latency.record(iteration.duration_ms)
+        self.latency_series.add(iteration.iteration, iteration.duration_ms)
+
+        window = self._window(self._elapsed(iteration))
+        if iteration.is_clean_pass:
+            window.clean += 1
+        elif not iteration.passed:
+            window.failures += 1
+        else:
+            window.warnings += 1
+
+        if iteration.throttle_events:
+            self.throttled_iterations += 1
+            window.throttles += len(iteration.throttle_events)
+        for event in iteration.throttle_events:
+            self.throttle_count += 1
+            key = event.throttle_type.value
+            self.throttle_by_type[key] = self.throttle_by_type.get(key, 0) + 1
+            self.recent_throttles.append(event)
+
+        self.recent_iterations.append(iteration)
+
+    def add_rate_change(self, change: Any) -> None:
+        """Record a rate controller change (a `RateChange`)."""
+        if self.rate_change_count == 0:
+            self.rate_series.add(0, change.old_rate)
+        self.rate_change_count += 1
+        self.rate_series.add(self.rate_change_count, change.new_rate)
+        self.recent_rate_changes.append(change)
+
+    @classmethod
+    def from_result(cls, result: SoakResult, **kwargs: Any) -> "SoakAggregates":
+        """Build aggregates from a finished soak result."""
+        agg = cls(
+            soak_id=result.soak_id,
+            case_name=result.case_name,
+            mode=result.mode.value,
+            start_time=result.start_time,
+            **kwargs,
+        )
+        for iteration in result.iterations:
+            agg.add_iteration(iteration)
+        for change in result.rate_history:
+            agg.add_rate_change(change)
+        agg.duration_seconds = result.duration_seconds
+        agg.complete = result.duration_seconds > 0
+        agg.final_rate = result.final_rate
+        return agg
+
+    # -- derived metrics ---------------------------------------------------
+
+    @property
+    def pass_rate(self) -> float:
+        """Pass rate as fraction (0.0 to 1.0)."""
+        return self.passed / self.total if self.total else 0.0
+
+    @property
+    def consistency_score(self) -> float:
+        """Clean passes divided by total passes (0.0 to 1.0)."""
+        return self.clean / self.passed if self.passed else 0.0
+
+    @property
+    def warning_rate(self) -> float:
+        """Fraction of passing iterations that had warnings."""
+        return self.warnings / self.passed if self.passed else 0.0
+
+    @property
+    def avg_retries_per_iteration(self) -> float:
+        """Average retries per iteration."""
+        return self.total_retries / self.total if self.total else 0.0
+
+    @property
+    def windows(self) -> list[WindowCounts]:
+        """Count windows in time order."""
+        return [self._windows[i] for i in sorted(self._windows)]
+
+    def to_dict(self, recent: Optional[int] = None) -> dict[str, Any]:
+        """Convert to dictionary (the `progress.json` payload).
+
+        Args:
+            recent: Limit the number of recent iterations included (None for
+                the whole ring).
+        """
+        iterations = list(self.recent_iterations)
+        if recent is not None:
+            iterations = iterations[-recent:] if recent > 0 else []
+        return {
+            "soak_id": self.soak_id,
+            "case_name": self.case_name,
+            "mode": self.mode,
+            "start_time": self.start_time,
+            "duration_seconds": self.duration_seconds,
+            "complete": self.complete,
+            "summary": {
+                "total_iterations": self.total,
+                "total_passed": self.passed,
+                "total_clean_passes": self.clean,
+                "total_warnings": self.warnings,
+                "total_failures": self.failures,
+                "pass_rate": self.pass_rate,
+                "consistency_score": self.consistency_score,
+                "warning_rate": self.warning_rate,
+                "avg_iteration_ms": self.latency.mean_ms,
+                "total_retries": self.total_retries,
+                "avg_retries_per_iteration": self.avg_retries_per_iteration,
+                "max_retries": self.max_retries,
+                "total_client_retries": self.total_client_retries,
+                "total_throttle_events": self.throttle_count,
+                "throttled_iterations": self.throttled_iterations,
+                "rate_changes": self.rate_change_count,
+                "final_rate": self.final_rate,
+            },
+            "latency": self.latency.to_dict(),
+            "throttle_by_type": dict(self.throttle_by_type),
+            "window_seconds": self.window_seconds,
+            "windows": [w.to_dict() for w in self.windows],
+            "latency_series": self.latency_series.points(),
+            "rate_series": self.rate_series.points(),
+            "recent_iterations": [
+                {
+                    "iteration": it.iteration,
+                    "status": it.status,
+                    "passed": it.passed,
+                    "duration_ms": it.duration_ms,
+                    "retry_count": it.retry_count,
+                    "client_retry_count": it.client_retry_count,
+                    "error_count": it.error_count,
+                    "throttles": len(it.throttle_events),
+                    "artifacts_dir": it.artifacts_dir,
+                }
+                for it in iterations
+            ],
+            "recent_throttles": [e.to_dict() for e in self.recent_throttles],
+        }
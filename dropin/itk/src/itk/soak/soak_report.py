@@ -1,85 +1,101 @@
 """Live soak test HTML report that updates during execution.
 
-Generates an HTML report that can be refreshed to show:
+Generates an HTML report showing:
 - Current iteration progress
 - Consistency metrics (clean pass % vs warning pass %)
 - Retry distribution
-- Pass/fail rate over time
+- Latency percentiles and downsampled latency chart
+- Pass/fail rate over time (per time window)
 - Throttle events timeline
 - Rate adjustments chart
-- Per-iteration drill-down (detailed mode)
+- Per-iteration drill-down for recent iterations (detailed mode)
+
+The report is rendered from `SoakAggregates`, so its size does not grow with
+run length. During a run, `LiveSoakReport` writes the page once and then only
+rewrites a small progress snapshot, which the page polls and applies in
+place. The snapshot is written twice: `progress.json` for tools, and
+`progress.js` (a JSONP-style `itkSoakProgress({...})` call) for the page, which
+re-injects it as a script tag so polling also works for reports opened from
+disk (file://), where fetch() is blocked.
 """
 from __future__ import annotations
 
 import json
+import time
 from datetime import datetime, timezone
 from pathlib import Path
-from typing import Optional
+from typing import Any, Optional
 
-from . import SoakIteration, SoakResult, ThrottleType
+from itk.utils.html_stream import HtmlStream, render_to_string, stream_to_file
+from itk.utils.write_pipeline import atomic_write_text
 
+from . import SoakIteration, SoakResult, ThrottleEvent
+from .aggregates import SoakAggregates
+from .rate_controller import RateChange
+
+
+# Seconds between progress polls in the live report
+POLL_SECONDS = 5
+
+# Recent iterations included in each progress update
+PROGRESS_RECENT_ITERATIONS = 50
+
+# Global function progress.js calls with the snapshot
+PROGRESS_CALLBACK = "itkSoakProgress"
 
-def render_soak_report(result: SoakResult) -> str:
-    """Render a soak test result as HTML.
+
+def _json_for_script(data: Any) -> str:
+    """Serialize data for embedding inside a <script> element."""
+    return json.dumps(data).replace("</", "<\\/")
+
+
+def stream_soak_report(out: HtmlStream, result: SoakResult) -> None:
+    """Stream a soak test result as HTML.
 
     Args:
+        out: Stream to write the document to.
         result: SoakResult to render.
+    """
+    stream_soak_report_from_aggregates(out, SoakAggregates.from_result(result))
 
-    Returns:
-        HTML string.
+
+def stream_soak_report_from_aggregates(out: HtmlStream, agg: SoakAggregates) -> None:
+    """Stream a soak report from running aggregates.
+
+    The document size is bounded regardless of run length: only the most
+    recent iterations and events are listed, and charts use downsampled
+    series. While the run is in progress the page polls `progress.js`
+    and updates itself in place.
+
+    Args:
+        out: Stream to write the document to.
+        agg: Aggregates to render.
     """
     # Calculate stats
-    total = len(result.iterations)
-    passed = result.total_passed
-    clean = result.total_clean_passes
-    warnings = result.total_warnings
-    failed = result.total_failures
-    pass_rate = result.pass_rate * 100 if total > 0 else 0
-    consistency = result.consistency_score * 100 if result.total_passed > 0 else 0
-    warning_rate = result.warning_rate * 100 if result.total_passed > 0 else 0
+    total = agg.total
+    clean = agg.clean
+    warnings = agg.warnings
+    failed = agg.failures
+    pass_rate = agg.pass_rate * 100
+    consistency = agg.consistency_score * 100
 
     # Retry stats
-    total_retries = result.total_retries
-    avg_retries = result.avg_retries_per_iteration
-    max_retries = result.max_retries
-
-    # Throttle stats
-    all_throttles = result.all_throttle_events
-    throttle_by_type: dict[str, int] = {}
-    for t in all_throttles:
-        key = t.throttle_type.value
-        throttle_by_type[key] = throttle_by_type.get(key, 0) + 1
-
-    # Rate history for chart
-    rate_data = [{"x": 0, "y": result.rate_history[0].old_rate}] if result.rate_history else []
-    for i, change in enumerate(result.rate_history):
-        rate_data.append({"x": i + 1, "y": change.new_rate})
-
-    # Iteration data for charts and table
-    iteration_data = []
-    for it in result.iterations:
-        iteration_data.append({
-            "iteration": it.iteration,
-            "passed": it.passed,
-            "status": it.status,
-            "duration_ms": it.duration_ms,
-            "retry_count": it.retry_count,
-            "error_count": it.error_count,
-            "throttles": len(it.throttle_events),
-            "is_clean_pass": it.is_clean_pass,
-            "artifacts_dir": it.artifacts_dir,
-        })
-
-    # Determine if detailed mode (per-iteration artifacts)
-    has_artifacts = any(it.artifacts_dir for it in result.iterations)
-
-    return f"""<!DOCTYPE html>
+    total_retries = agg.total_retries
+    avg_retries = agg.avg_retries_per_iteration
+    max_retries = agg.max_retries
+    client_retries = agg.total_client_retries
+
+    latency = agg.latency.to_dict()
+    recent = list(agg.recent_iterations)
+    has_artifacts = agg.has_artifacts
+    shown_note = f"last {len(recent)} of {total}" if len(recent) < total else f"{total}"
+
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <meta http-equiv="refresh" content="5">
-    <title>Soak Test: {result.case_name}</title>
+    <title>Soak Test: {agg.case_name}</title>
     <style>
         :root {{
             --bg-primary: #1a1a2e;
@@ -386,50 +402,87 @@ def render_soak_report(result: SoakResult) -> str:
             background: var(--bg-primary);
             text-decoration: none;
         }}
+        
+        /* Charts */
+        .chart {{
+            width: 100%;
+            height: 160px;
+            background: var(--bg-card);
+            border-radius: 4px;
+            margin-top: 10px;
+        }}
+        .chart.small {{ height: 100px; margin-bottom: 10px; }}
+        .chart-empty {{ fill: var(--text-secondary); font-size: 14px; }}
+        .percentiles {{
+            display: flex;
+            gap: 20px;
+            flex-wrap: wrap;
+            font-size: 0.9rem;
+            color: var(--text-secondary);
+        }}
+        .percentiles strong {{ color: var(--text-primary); }}
+        .muted {{ color: var(--text-secondary); font-weight: normal; font-size: 0.85rem; }}
+        .throttle-types {{
+            display: flex;
+            gap: 8px;
+            flex-wrap: wrap;
+            margin-top: 10px;
+            font-size: 0.8rem;
+        }}
+        .throttle-types .type {{
+            padding: 2px 8px;
+            border-radius: 4px;
+            background: var(--bg-card);
+        }}
+        .throttle-types .type.http-429 {{ background: var(--accent-red); color: #000; }}
+        .throttle-types .type.aws-throttle {{ background: var(--accent-yellow); color: #000; }}
+        .throttle-types .type.retry-storm {{ background: #f472b6; color: #000; }}
+        .throttle-types .type.timeout {{ background: #a78bfa; color: #000; }}
+        .throttle-types .type.rate-limit {{ background: #fb923c; color: #000; }}
     </style>
 </head>
 <body>
     <button class="theme-toggle" onclick="document.body.classList.toggle('light-mode'); this.textContent = document.body.classList.contains('light-mode') ? '🌙' : '☀️'" title="Toggle light/dark mode">☀️</button>
     
     <h1>
-        🔄 Soak Test: {result.case_name}
-        <span class="status {'complete' if result.duration_seconds > 0 else 'running'}">
-            {result.mode.value}
+        🔄 Soak Test: {agg.case_name}
+        <span class="status {'complete' if agg.complete else 'running'}" id="soak-status">
+            {agg.mode}
         </span>
     </h1>
     
     <!-- Key Metrics Grid -->
     <div class="stats-grid">
         <div class="stat-card">
-            <div class="value">{total}</div>
+            <div class="value" id="stat-total">{total}</div>
             <div class="label">Iterations</div>
         </div>
         <div class="stat-card pass">
-            <div class="value">{pass_rate:.1f}%</div>
+            <div class="value" id="stat-pass-rate">{pass_rate:.1f}%</div>
             <div class="label">Pass Rate</div>
         </div>
         <div class="stat-card consistency">
-            <div class="value">{consistency:.0f}%</div>
+            <div class="value" id="stat-consistency">{consistency:.0f}%</div>
             <div class="label">Consistency</div>
         </div>
         <div class="stat-card warning">
-            <div class="value">{warnings}</div>
+            <div class="value" id="stat-warnings">{warnings}</div>
             <div class="label">⚠️ Warnings</div>
         </div>
         <div class="stat-card fail">
-            <div class="value">{failed}</div>
+            <div class="value" id="stat-failures">{failed}</div>
             <div class="label">❌ Failures</div>
         </div>
         <div class="stat-card">
-            <div class="value">{total_retries}</div>
+            <div class="value" id="stat-retries">{total_retries}</div>
             <div class="label">Total Retries</div>
         </div>
         <div class="stat-card throttle">
-            <div class="value">{len(all_throttles)}</div>
+            <div class="value" id="stat-throttles">{agg.throttle_count}</div>
             <div class="label">🚦 Throttles</div>
         </div>
         <div class="stat-card">
-            <div class="value">{result.avg_iteration_ms:.0f}ms</div>
+            <div class="value" id="stat-avg">{latency['mean_ms']:.0f}ms</div>
             <div class="label">Avg Duration</div>
         </div>
     </div>
@@ -441,26 +494,50 @@ def render_soak_report(result: SoakResult) -> str:
             Consistency = Clean Passes ÷ Total Passes • Reveals LLM non-determinism masked by retries
         </p>
         <div class="consistency-bar">
-            <div class="clean" style="width: {(clean/total*100) if total else 0}%"></div>
-            <div class="warning" style="width: {(warnings/total*100) if total else 0}%"></div>
-            <div class="fail" style="width: {(failed/total*100) if total else 0}%"></div>
+            <div class="clean" id="bar-clean" style="width: {(clean/total*100) if total else 0}%"></div>
+            <div class="warning" id="bar-warning" style="width: {(warnings/total*100) if total else 0}%"></div>
+            <div class="fail" id="bar-fail" style="width: {(failed/total*100) if total else 0}%"></div>
         </div>
-        <div class="consistency-legend">
+        <div class="consistency-legend" id="consistency-legend">
             {'<span><span class="dot clean"></span>✅ Clean: ' + str(clean) + '</span>' if clean > 0 else ''}
             {'<span><span class="dot warning"></span>⚠️ Warnings: ' + str(warnings) + '</span>' if warnings > 0 else ''}
             {'<span><span class="dot fail"></span>❌ Failed: ' + str(failed) + '</span>' if failed > 0 else ''}
             {'' if (clean + warnings + failed) > 0 else '<span style="color: var(--text-secondary)">No iterations yet</span>'}
         </div>
-        <p style="color: var(--text-secondary); font-size: 0.85rem; margin-top: 12px;">
-            Retries: {total_retries} total • Avg: {avg_retries:.1f}/iter • Max: {max_retries}
+        <p style="color: var(--text-secondary); font-size: 0.85rem; margin-top: 12px;" id="retry-summary">
+            Retries: {total_retries} total • Avg: {avg_retries:.1f}/iter • Max: {max_retries} • Client: {client_retries}
         </p>
     </div>
     
+    <!-- Latency (histogram percentiles + downsampled series) -->
+    <div class="section">
+        <h2>Latency</h2>
+        <div class="percentiles">
+            <span>p50 <strong id="lat-p50">{latency['p50_ms']:.0f}ms</strong></span>
+            <span>p90 <strong id="lat-p90">{latency['p90_ms']:.0f}ms</strong></span>
+            <span>p95 <strong id="lat-p95">{latency['p95_ms']:.0f}ms</strong></span>
+            <span>p99 <strong id="lat-p99">{latency['p99_ms']:.0f}ms</strong></span>
+            <span>max <strong id="lat-max">{latency['max_ms']:.0f}ms</strong></span>
+        </div>
+        <svg class="chart" id="latency-chart" viewBox="0 0 1000 160" preserveAspectRatio="none"></svg>
+    </div>
+    
+    <!-- Outcomes per time window -->
+    <div class="section">
+        <h2>Outcomes Over Time <span class="muted" id="window-size">({agg.window_seconds:.0f}s windows)</span></h2>
+        <svg class="chart" id="window-chart" viewBox="0 0 1000 160" preserveAspectRatio="none"></svg>
+        <div class="throttle-types" id="throttle-types">""")
+    out.join("", (_render_throttle_type(k, v) for k, v in agg.throttle_by_type.items() if v))
+    out.write(f"""</div>
+    </div>
+    
     <!-- Iteration Grid (Visual Overview) -->
     <div class="section">
-        <h2>Iteration Grid</h2>
-        <div class="iteration-grid">
-            {"".join(_render_iteration_cell(it) for it in result.iterations)}
+        <h2>Iteration Grid <span class="muted" id="grid-note">({shown_note})</span></h2>
+        <div class="iteration-grid" id="iteration-grid">
+            """)
+    out.join("", (_render_iteration_cell(it) for it in recent))
+    out.write(f"""
         </div>
     </div>
     
@@ -472,7 +549,7 @@ def render_soak_report(result: SoakResult) -> str:
             <button class="filter-btn" data-filter="warning">⚠️ Warnings Only</button>
             <button class="filter-btn" data-filter="failed">❌ Failed Only</button>
             <button class="filter-btn" data-filter="retries">🔄 Has Retries</button>
-            <span class="filter-count" id="filter-count">Showing {total} of {total}</span>
+            <span class="filter-count" id="filter-count">Showing {len(recent)} of {len(recent)}</span>
         </div>
         <div class="scroll-container">
             <table class="iteration-table">
@@ -488,7 +565,9 @@ def render_soak_report(result: SoakResult) -> str:
                     </tr>
                 </thead>
                 <tbody id="iteration-body">
-                    {"".join(_render_iteration_row(it, has_artifacts) for it in result.iterations)}
+                    """)
+    out.join("", (_render_iteration_row(it, has_artifacts) for it in recent))
+    out.write(f"""
                 </tbody>
             </table>
         </div>
@@ -496,55 +575,65 @@ def render_soak_report(result: SoakResult) -> str:
     
     <!-- Rate Adjustments -->
     <div class="section">
-        <h2>Rate Adjustments ({len(result.rate_history)})</h2>
+        <h2>Rate Adjustments (<span id="rate-count">{agg.rate_change_count}</span>)</h2>
+        <svg class="chart small" id="rate-chart" viewBox="0 0 1000 100" preserveAspectRatio="none"></svg>
         <div class="rate-history">
-            {"".join(_render_rate_change(r) for r in result.rate_history) or '<span style="color: var(--text-secondary)">No rate changes</span>'}
+            """)
+    if not out.join("", (_render_rate_change(r) for r in agg.recent_rate_changes)):
+        out.write('<span style="color: var(--text-secondary)">No rate changes</span>')
+    out.write(f"""
         </div>
     </div>
     
     <!-- Throttle Events -->
     <div class="section">
-        <h2>Throttle Events ({len(all_throttles)})</h2>
+        <h2>Throttle Events ({agg.throttle_count})</h2>
         <div class="timeline">
-            {"".join(_render_throttle_event(t) for t in all_throttles[-50:]) or '<span style="color: var(--text-secondary)">No throttle events</span>'}
+            """)
+    if not out.join("", (_render_throttle_event(t) for t in agg.recent_throttles)):
+        out.write('<span style="color: var(--text-secondary)">No throttle events</span>')
+    out.write(f"""
         </div>
     </div>
     
     <footer>
-        <p>Soak ID: {result.soak_id}</p>
-        <p>Started: {result.start_time} | Duration: {result.duration_seconds:.1f}s</p>
-        <p>Generated by ITK • Auto-refreshes every 5s</p>
+        <p>Soak ID: {agg.soak_id}</p>
+        <p>Started: {agg.start_time} | Duration: <span id="soak-duration">{agg.duration_seconds:.1f}</span>s</p>
+        <p id="live-note">Generated by ITK{'' if agg.complete else f' • Live: polls progress.js every {POLL_SECONDS}s'}</p>
     </footer>
     
     <script>
-        // Data for potential charting
-        const iterationData = {json.dumps(iteration_data)};
-        const rateData = {json.dumps(rate_data)};
-        const totalIterations = {total};
+        // Aggregates snapshot (constant size); live runs refresh it from progress.js
+        let progress = {_json_for_script(agg.to_dict(recent=0))};
+        const hasArtifacts = {'true' if has_artifacts else 'false'};
+        const maxRecent = {agg.recent_iterations.maxlen};
+        let lastIteration = {recent[-1].iteration if recent else -1};
         
         // Update filter count
         function updateFilterCount() {{
+            const rows = document.querySelectorAll('#iteration-body tr');
             const visible = document.querySelectorAll('#iteration-body tr:not([style*="display: none"])').length;
-            document.getElementById('filter-count').textContent = `Showing ${{visible}} of ${{totalIterations}}`;
+            document.getElementById('filter-count').textContent = `Showing ${{visible}} of ${{rows.length}}`;
         }}
         
         // Filter functionality
+        let activeFilter = 'all';
+        function rowVisible(row) {{
+            const status = row.dataset.status;
+            const retries = parseInt(row.dataset.retries || '0');
+            if (activeFilter === 'warning') return status === 'warning';
+            if (activeFilter === 'failed') return status === 'failed' || status === 'error';
+            if (activeFilter === 'retries') return retries > 0;
+            return true;
+        }}
         document.querySelectorAll('.filter-btn').forEach(btn => {{
             btn.addEventListener('click', () => {{
                 document.querySelectorAll('.filter-btn').forEach(b => b.classList.remove('active'));
                 btn.classList.add('active');
-                const filter = btn.dataset.filter;
+                activeFilter = btn.dataset.filter;
                 
                 document.querySelectorAll('#iteration-body tr').forEach(row => {{
-                    const status = row.dataset.status;
-                    const retries = parseInt(row.dataset.retries || '0');
-                    
-                    let show = true;
-                    if (filter === 'warning') show = status === 'warning';
-                    else if (filter === 'failed') show = status === 'failed' || status === 'error';
-                    else if (filter === 'retries') show = retries > 0;
-                    
-                    row.style.display = show ? '' : 'none';
+                    row.style.display = rowVisible(row) ? '' : 'none';
                 }});
                 
                 updateFilterCount();
@@ -584,9 +673,177 @@ def render_soak_report(result: SoakResult) -> str:
             const cols = ['iteration', 'status', 'duration_ms', 'retry_count', 'error_count', 'throttles'];
             return cols.indexOf(col);
         }}
+        
+        // Charts (SVG, drawn from downsampled series)
+        function linePath(points, width, height) {{
+            if (!points.length) return '';
+            const xs = points.map(p => p[0]), ys = points.map(p => p[1]);
+            const x0 = Math.min(...xs), x1 = Math.max(...xs), y1 = Math.max(...ys, 1e-9);
+            return points.map(([x, y]) => {{
+                const px = x1 > x0 ? (x - x0) / (x1 - x0) * width : width / 2;
+                const py = height - (y / y1) * (height - 4) - 2;
+                return px.toFixed(1) + ',' + py.toFixed(1);
+            }}).join(' ');
+        }}
+        
+        function drawLine(id, points, height, color) {{
+            const svg = document.getElementById(id);
+            if (!points.length) {{
+                svg.innerHTML = '<text x="10" y="20" class="chart-empty">No data yet</text>';
+                return;
+            }}
+            svg.innerHTML = `<polyline fill="none" stroke="${{color}}" stroke-width="2" vector-effect="non-scaling-stroke" points="${{linePath(points, 1000, height)}}"/>`;
+        }}
+        
+        function drawWindows(windows) {{
+            const svg = document.getElementById('window-chart');
+            if (!windows.length) {{
+                svg.innerHTML = '<text x="10" y="20" class="chart-empty">No data yet</text>';
+                return;
+            }}
+            const maxTotal = Math.max(...windows.map(w => w.clean + w.warnings + w.failures), 1);
+            const barWidth = 1000 / windows.length;
+            let bars = '';
+            windows.forEach((w, i) => {{
+                let y = 160;
+                for (const [key, color] of [['clean', 'var(--accent-green)'], ['warnings', 'var(--accent-yellow)'], ['failures', 'var(--accent-red)']]) {{
+                    const h = w[key] / maxTotal * 156;
+                    if (h > 0) {{
+                        y -= h;
+                        bars += `<rect x="${{(i * barWidth).toFixed(1)}}" y="${{y.toFixed(1)}}" width="${{Math.max(barWidth - 1, 1).toFixed(1)}}" height="${{h.toFixed(1)}}" fill="${{color}}"><title>+${{w.start_seconds}}s: ${{w.clean}} clean, ${{w.warnings}} warn, ${{w.failures}} fail, ${{w.throttles}} throttles</title></rect>`;
+                    }}
+                }}
+            }});
+            svg.innerHTML = bars;
+        }}
+        
+        function drawCharts() {{
+            drawLine('latency-chart', progress.latency_series, 160, 'var(--accent-blue)');
+            drawLine('rate-chart', progress.rate_series, 100, 'var(--accent-purple)');
+            drawWindows(progress.windows);
+        }}
+        
+        // Live updates
+        function setText(id, text) {{
+            document.getElementById(id).textContent = text;
+        }}
+        
+        function artifactPath(it) {{
+            const parts = it.artifacts_dir.split(/[\\\\/]/);
+            return `iterations/${{String(it.iteration).padStart(4, '0')}}/${{parts[parts.length - 1]}}`;
+        }}
+        
+        function appendIteration(it) {{
+            const cls = it.throttles ? 'throttle' : it.status === 'warning' ? 'warning' : it.passed ? 'pass' : 'fail';
+            const cell = document.createElement('div');
+            cell.className = 'iteration-cell ' + cls;
+            cell.title = `Iteration ${{it.iteration}}: ${{it.status}} (${{Math.round(it.duration_ms)}}ms)`;
+            if (it.artifacts_dir) {{
+                cell.onclick = () => {{ window.location.href = artifactPath(it) + '/trace-viewer.html'; }};
+            }}
+            const grid = document.getElementById('iteration-grid');
+            grid.appendChild(cell);
+            
+            const icons = {{passed: '✅', warning: '⚠️', failed: '❌', error: '💥', skipped: '⏭️'}};
+            const row = document.createElement('tr');
+            Object.assign(row.dataset, {{
+                status: it.status, retries: it.retry_count, iteration: it.iteration,
+                duration_ms: Math.round(it.duration_ms), retry_count: it.retry_count,
+                error_count: it.error_count, throttles: it.throttles,
+            }});
+            let actions = '';
+            if (hasArtifacts) {{
+                actions = it.artifacts_dir
+                    ? `<td><a href="${{artifactPath(it)}}/trace-viewer.html" class="action-btn" title="View trace">🔍 Trace</a> <a href="${{artifactPath(it)}}/timeline.html" class="action-btn" title="View timeline">📊 Timeline</a></td>`
+                    : '<td>—</td>';
+            }}
+            row.innerHTML = `<td>${{it.iteration}}</td>
+                <td><span class="status-cell">${{icons[it.status] || '❓'}} ${{it.status}}</span></td>
+                <td>${{it.duration_ms < 1 ? '<1ms' : Math.round(it.duration_ms) + 'ms'}}</td>
+                <td>${{it.retry_count}}</td><td>${{it.error_count}}</td><td>${{it.throttles}}</td>${{actions}}`;
+            row.style.display = rowVisible(row) ? '' : 'none';
+            const tbody = document.getElementById('iteration-body');
+            tbody.appendChild(row);
+            
+            // Keep the DOM bounded like the report itself
+            while (grid.children.length > maxRecent) grid.removeChild(grid.firstElementChild);
+            while (tbody.children.length > maxRecent) tbody.removeChild(tbody.firstElementChild);
+        }}
+        
+        function applyProgress(p) {{
+            if (p.complete) {{
+                // Final report is written alongside; load it once
+                window.location.reload();
+                return;
+            }}
+            progress = p;
+            const s = p.summary, lat = p.latency, total = s.total_iterations;
+            setText('stat-total', total);
+            setText('stat-pass-rate', (s.pass_rate * 100).toFixed(1) + '%');
+            setText('stat-consistency', Math.round(s.consistency_score * 100) + '%');
+            setText('stat-warnings', s.total_warnings);
+            setText('stat-failures', s.total_failures);
+            setText('stat-retries', s.total_retries);
+            setText('stat-throttles', s.total_throttle_events);
+            setText('stat-avg', Math.round(s.avg_iteration_ms) + 'ms');
+            for (const [id, key] of [['bar-clean', 'total_clean_passes'], ['bar-warning', 'total_warnings'], ['bar-fail', 'total_failures']]) {{
+                document.getElementById(id).style.width = (total ? s[key] / total * 100 : 0) + '%';
+            }}
+            setText('retry-summary', `Retries: ${{s.total_retries}} total • Avg: ${{s.avg_retries_per_iteration.toFixed(1)}}/iter • Max: ${{s.max_retries}} • Client: ${{s.total_client_retries || 0}}`);
+            for (const key of ['p50', 'p90', 'p95', 'p99']) setText('lat-' + key, Math.round(lat[key + '_ms']) + 'ms');
+            setText('lat-max', Math.round(lat.max_ms) + 'ms');
+            setText('window-size', `(${{Math.round(p.window_seconds)}}s windows)`);
+            setText('rate-count', s.rate_changes);
+            setText('soak-duration', p.duration_seconds.toFixed(1));
+            for (const it of p.recent_iterations) {{
+                if (it.iteration > lastIteration) {{
+                    appendIteration(it);
+                    lastIteration = it.iteration;
+                }}
+            }}
+            const shown = document.getElementById('iteration-body').children.length;
+            setText('grid-note', shown < total ? `(last ${{shown}} of ${{total}})` : `(${{total}})`);
+            updateFilterCount();
+            drawCharts();
+        }}
+        
+        // progress.js calls this; a script tag loads from file:// where fetch() cannot
+        window.{PROGRESS_CALLBACK} = applyProgress;
+        let pollScript = null;
+
+        function poll() {{
+            if (pollScript) pollScript.remove();
+            pollScript = document.createElement('script');
+            pollScript.src = 'progress.js?t=' + Date.now();
+            pollScript.onerror = () => setText('live-note', 'Waiting for progress.js; showing last written snapshot');
+            document.body.appendChild(pollScript);
+        }}
+        
+        drawCharts();
+        if (!progress.complete) {{
+            setInterval(poll, {POLL_SECONDS * 1000});
+        }}
     </script>
 </body>
-</html>"""
+</html>""")
+
+
+def render_soak_report(result: SoakResult) -> str:
+    """Render a soak test result as HTML.
+
+    Args:
+        result: SoakResult to render.
+
+    Returns:
+        HTML string.
+    """
+    return render_to_string(stream_soak_report, result)
+
+
+def _render_throttle_type(throttle_type: str, count: int) -> str:
+    """Render a throttle count chip."""
+    type_class = throttle_type.lower().replace("_", "-")
+    return f'<span class="type {type_class}">{throttle_type}: {count}</span>'
 
 
 def _render_iteration_cell(iteration: SoakIteration) -> str:
@@ -683,6 +940,100 @@ def _render_throttle_event(event: ThrottleEvent) -> str:
     </div>'''
 
 
+def _write_progress_files(out_dir: Path, agg: SoakAggregates) -> None:
+    """Write the progress snapshot as progress.json and progress.js."""
+    payload = json.dumps(agg.to_dict(recent=PROGRESS_RECENT_ITERATIONS))
+    atomic_write_text(out_dir / "progress.json", payload)
+    atomic_write_text(out_dir / "progress.js", f"{PROGRESS_CALLBACK}({payload});\n")
+
+
+class LiveSoakReport:
+    """Soak report that is kept up to date while a run is in progress.
+
+    Example:
+        live = LiveSoakReport(out_dir, case_name="demo", mode="fixed")
+        live.start()
+        result = run_soak_with_case(..., on_iteration=live.add_iteration,
+                                    on_rate_change=live.add_rate_change)
+        live.finish(result)
+    """
+
+    def __init__(
+        self,
+        out_dir: Path,
+        case_name: str,
+        mode: str,
+        *,
+        soak_id: str = "",
+        min_interval_seconds: float = 1.0,
+    ) -> None:
+        self.out_dir = out_dir
+        self.min_interval_seconds = min_interval_seconds
+        self.aggregates = SoakAggregates(
+            soak_id=soak_id,
+            case_name=case_name,
+            mode=mode,
+            start_time=datetime.now(timezone.utc).isoformat(),
+        )
+        self._last_write = 0.0
+
+    @property
+    def html_path(self) -> Path:
+        """Path to the HTML report."""
+        return self.out_dir / "soak-report.html"
+
+    @property
+    def progress_path(self) -> Path:
+        """Path to the polled progress file."""
+        return self.out_dir / "progress.json"
+
+    def start(self) -> Path:
+        """Write the initial page and progress file.
+
+        Returns:
+            Path to the HTML report.
+        """
+        self.out_dir.mkdir(parents=True, exist_ok=True)
+        stream_to_file(self.html_path, stream_soak_report_from_aggregates, self.aggregates)
+        self._write_progress(force=True)
+        return self.html_path
+
+    def add_iteration(self, iteration: SoakIteration) -> None:
+        """Record a completed iteration and refresh the progress files."""
+        self.aggregates.add_iteration(iteration)
+        self._write_progress()
+
+    def add_rate_change(self, old_rate: float, new_rate: float, reason: str) -> None:
+        """Record a rate adjustment (matches the `on_rate_change` callback)."""
+        self.aggregates.add_rate_change(
+            RateChange(
+                timestamp=datetime.now(timezone.utc).isoformat(),
+                old_rate=old_rate,
+                new_rate=new_rate,
+                reason=reason,
+                iteration=self.aggregates.total,
+            )
+        )
+
+    def finish(self, result: SoakResult) -> Path:
+        """Write the final report from the complete result.
+
+        Returns:
+            Path to the HTML report.
+        """
+        return write_soak_report(result, self.out_dir)
+
+    def _write_progress(self, force: bool = False) -> None:
+        now = time.monotonic()
+        if not force and now - self._last_write < self.min_interval_seconds:
+            return
+        self._last_write = now
+        self.aggregates.duration_seconds = (
+            datetime.now(timezone.utc) - datetime.fromisoformat(self.aggregates.start_time)
+        ).total_seconds()
+        _write_progress_files(self.out_dir, self.aggregates)
+
+
 def write_soak_report(result: SoakResult, out_dir: Path) -> Path:
     """Write soak report to disk.
 
@@ -696,8 +1047,12 @@ def write_soak_report(result: SoakResult, out_dir: Path) -> Path:
     out_dir.mkdir(parents=True, exist_ok=True)
 
     # Write HTML
+    agg = SoakAggregates.from_result(result)
     html_path = out_dir / "soak-report.html"
-    html_path.write_text(render_soak_report(result), encoding="utf-8")
+    stream_to_file(html_path, stream_soak_report_from_aggregates, agg)
+
+    # Final progress snapshot; a live page polling it reloads once it sees complete
+    _write_progress_files(out_dir, agg)
 
     # Write JSON for programmatic access
     json_path = out_dir / "soak-result.json"
@@ -9,12 +9,15 @@ Integrates with RateController for adaptive rate limiting.
 from __future__ import annotations
 
 import time
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import datetime, timezone
 from pathlib import Path
 from typing import Callable, Optional
 
+from itk import perf
+
 from . import (
+    THROTTLE_MESSAGE_PATTERNS,
     SoakConfig,
     SoakIteration,
     SoakMode,
@@ -34,10 +37,33 @@ class IterationResult:
     status: str  # 'passed', 'warning', 'failed', 'error'
     spans: list[dict]
     duration_ms: float
-    retry_count: int = 0
+    retry_count: int = 0  # Server-side, from span attempts
     error_count: int = 0
     artifacts_dir: Optional[str] = None
     exception: Optional[str] = None
+    client_retry_count: int = 0  # Made by ITK's adapters
+    client_throttle_events: list[ThrottleEvent] = field(default_factory=list)
+
+
+def client_retry_throttles(retry: Optional[dict]) -> list[ThrottleEvent]:
+    """Turn throttled client-side retries (`RetryTelemetry.to_dict()`) into throttle events.
+
+    Throttles absorbed by adapter retries never reach the spans, but the
+    rate controller should still back off for them.
+    """
+    if not retry:
+        return []
+    now = datetime.now(timezone.utc).isoformat()
+    return [
+        ThrottleEvent(
+            timestamp=now,
+            throttle_type=ThrottleType(r["throttle_type"]),
+            source="client-retry",
+            details=f"{r['code']} on attempt {r['attempt']} (backoff {r['delay_ms']:.0f}ms)",
+        )
+        for r in retry.get("retries", [])
+        if r.get("throttle_type")
+    ]
 
 
 def detect_throttle_in_spans(spans: list[dict]) -> list[ThrottleEvent]:
@@ -80,15 +106,7 @@ def detect_throttle_in_spans(spans: list[dict]) -> list[ThrottleEvent]:
 
         # Check error messages for AWS throttling
         error_lower = error.lower() if error else ""
-        throttle_patterns = [
-            ("throttlingexception", ThrottleType.AWS_THROTTLE),
-            ("provisionedthroughputexceeded", ThrottleType.AWS_THROTTLE),
-            ("rate exceeded", ThrottleType.RATE_LIMIT),
-            ("too many requests", ThrottleType.RATE_LIMIT),
-            ("request limit exceeded", ThrottleType.RATE_LIMIT),
-        ]
-
-        for pattern, throttle_type in throttle_patterns:
+        for pattern, throttle_type in THROTTLE_MESSAGE_PATTERNS:
             if pattern in error_lower:
                 events.append(
                     ThrottleEvent(
@@ -125,6 +143,7 @@ def detect_throttle_in_spans(spans: list[dict]) -> list[ThrottleEvent]:
     return events
 
 
+@perf.timed("soak.run")
 def run_soak(
     config: SoakConfig,
     run_iteration: Callable[[int], IterationResult],
@@ -168,10 +187,13 @@ def run_soak(
         iteration_start = time.monotonic()
 
         # Run the iteration
-        iter_result = run_iteration(iteration_num)
+        with perf.stage("soak.iteration"):
+            iter_result = run_iteration(iteration_num)
+        perf.count("soak.iterations")
 
-        # Detect throttles
+        # Detect throttles (in spans and in the adapters' own retries)
         throttle_events = detect_throttle_in_spans(iter_result.spans)
+        throttle_events.extend(iter_result.client_throttle_events)
 
         # Update rate controller
         old_rate = rate_controller.current_rate
@@ -195,6 +217,7 @@ def run_soak(
             span_count=len(iter_result.spans),
             error_count=iter_result.error_count,
             retry_count=iter_result.retry_count,
+            client_retry_count=iter_result.client_retry_count,
             throttle_events=throttle_events,
             timestamp=datetime.now(timezone.utc).isoformat(),
             artifacts_dir=iter_result.artifacts_dir,
@@ -213,7 +236,8 @@ def run_soak(
         sleep_time = max(0, target_interval - elapsed)
 
         if sleep_time > 0 and should_continue(iteration_num):
-            time.sleep(sleep_time)
+            with perf.stage("soak.pacing"):
+                time.sleep(sleep_time)
 
     # Build result
     end_time_dt = datetime.now(timezone.utc)
@@ -239,6 +263,7 @@ def run_soak_with_case(
     mode: str = "dev-fixtures",
     detailed: bool = True,
     on_iteration: Optional[Callable[[SoakIteration], None]] = None,
+    on_rate_change: Optional[Callable[[float, float, str], None]] = None,
 ) -> SoakResult:
     """Run a soak test using a case file.
 
@@ -249,6 +274,7 @@ def run_soak_with_case(
         mode: Execution mode ("dev-fixtures" or "live").
         detailed: If True, save per-iteration artifacts to iterations/NNN/.
         on_iteration: Optional callback after each iteration.
+        on_rate_change: Optional callback when rate changes (old, new, reason).
 
     Returns:
         SoakResult with all iterations.
@@ -391,6 +417,7 @@ def run_soak_with_case(
                     # Update iter_out_dir to case_out_dir for correct link generation
                     iter_out_dir = case_out_dir
                 
+                client_retry = agent_response.get("retry")
                 return IterationResult(
                     passed=error_count == 0,
                     status=status,
@@ -399,9 +426,13 @@ def run_soak_with_case(
                     retry_count=retry_count,
                     error_count=error_count,
                     artifacts_dir=str(iter_out_dir) if iter_out_dir else None,
+                    client_retry_count=client_retry["client_retries"] if client_retry else 0,
+                    client_throttle_events=client_retry_throttles(client_retry),
                 )
             except Exception as e:
                 elapsed = (time.monotonic() - start) * 1000
+                telemetry = getattr(e, "retry_telemetry", None)
+                client_retry = telemetry.to_dict() if telemetry is not None else None
                 return IterationResult(
                     passed=False,
                     status="error",
@@ -411,10 +442,13 @@ def run_soak_with_case(
                     error_count=1,
                     exception=str(e),
                     artifacts_dir=str(iter_out_dir) if iter_out_dir else None,
+                    client_retry_count=client_retry["client_retries"] if client_retry else 0,
+                    client_throttle_events=client_retry_throttles(client_retry),
                 )
 
     return run_soak(
         config=config_with_name,
         run_iteration=run_iteration,
         on_iteration=on_iteration,
+        on_rate_change=on_rate_change,
     )
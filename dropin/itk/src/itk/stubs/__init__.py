@@ -0,0 +1,15 @@
+"""Local stand-ins for the AWS APIs used by live mode.
+
+`StubServer` emulates the subset of Bedrock Agent Runtime, Lambda, SQS and
+CloudWatch Logs that ITK calls, with configurable latency, throttling and
+log emission, so the live pipeline can run and be benchmarked offline.
+"""
+from itk.stubs.logs import LogStore
+from itk.stubs.server import ServiceBehavior, StubConfig, StubServer
+
+__all__ = [
+    "LogStore",
+    "ServiceBehavior",
+    "StubConfig",
+    "StubServer",
+]
@@ -0,0 +1,67 @@
+"""Encoder for the AWS event-stream wire format.
+
+Streaming APIs such as Bedrock's `InvokeAgent` return a sequence of binary
+frames rather than one JSON body. Each frame is:
+
+    total length (4) | headers length (4) | prelude CRC32 (4)
+    headers | payload | message CRC32 (4)
+
+Headers here are always strings (type 7). botocore's parser checks both
+CRCs, so frames built here decode exactly like AWS responses.
+"""
+from __future__ import annotations
+
+import json
+import struct
+import zlib
+from typing import Any
+
+_STRING_HEADER = 7
+
+
+def _crc32(data: bytes, crc: int = 0) -> int:
+    return zlib.crc32(data, crc) & 0xFFFFFFFF
+
+
+def encode_headers(headers: dict[str, str]) -> bytes:
+    """Encode string-valued event-stream headers."""
+    out = bytearray()
+    for name, value in headers.items():
+        name_bytes = name.encode("utf-8")
+        value_bytes = value.encode("utf-8")
+        out += bytes([len(name_bytes)]) + name_bytes
+        out += bytes([_STRING_HEADER]) + struct.pack(">H", len(value_bytes)) + value_bytes
+    return bytes(out)
+
+
+def encode_message(headers: dict[str, str], payload: bytes) -> bytes:
+    """Encode one event-stream frame."""
+    header_bytes = encode_headers(headers)
+    total = 12 + len(header_bytes) + len(payload) + 4
+    prelude = struct.pack(">II", total, len(header_bytes))
+    message = prelude + struct.pack(">I", _crc32(prelude)) + header_bytes + payload
+    return message + struct.pack(">I", _crc32(message))
+
+
+def encode_event(event_type: str, body: dict[str, Any]) -> bytes:
+    """Encode a JSON event frame (e.g. `chunk` or `trace`)."""
+    return encode_message(
+        {
+            ":event-type": event_type,
+            ":content-type": "application/json",
+            ":message-type": "event",
+        },
+        json.dumps(body).encode("utf-8"),
+    )
+
+
+def encode_exception(exception_type: str, message: str) -> bytes:
+    """Encode a modeled exception frame (e.g. `throttlingException`)."""
+    return encode_message(
+        {
+            ":exception-type": exception_type,
+            ":content-type": "application/json",
+            ":message-type": "exception",
+        },
+        json.dumps({"message": message}).encode("utf-8"),
+    )
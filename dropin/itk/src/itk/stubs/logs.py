@@ -0,0 +1,330 @@
+"""In-memory CloudWatch Logs for the stub server.
+
+Stub services append log lines to a `LogStore`. The store answers the
+Logs APIs ITK calls: FilterLogEvents, DescribeLogGroups and Logs Insights
+(StartQuery/GetQueryResults).
+
+Only the part of the Insights query language that ITK's queries use is
+evaluated:
+
+- `filter @message like /regex/` or `like "text"`
+- `filter <field> in [...]` and `filter <field> = "value"`, where
+  non-@ fields come from the JSON log line; clauses can be joined with
+  `and`/`or`
+- `parse <field> /regex/` with named groups, as `(?<name>...)`
+- `stats count(*)|count(f)|min(f)|max(f) [as alias], ... [by f1, f2]`;
+  `@timestamp` aggregates are epoch milliseconds, as in Insights
+- `sort <field> asc|desc`
+- `limit N`
+
+Other commands (`fields`, `display`, ...) are accepted and ignored. Without
+`stats`, every result row has @timestamp, @message, @logStream and @log
+(plus any parsed fields).
+"""
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+import uuid
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Callable, Optional
+
+# Rows returned by Logs Insights when the query has no `limit`
+DEFAULT_QUERY_LIMIT = 1000
+
+_LIKE = re.compile(r'^(?P<field>[@\w.]+)\s+like\s+(?:/(?P<regex>.*)/|"(?P<text>.*)")$')
+_IN = re.compile(r"^(?P<field>[@\w.]+)\s+in\s+\[(?P<values>.*)\]$")
+_EQ = re.compile(r'^(?P<field>[@\w.]+)\s*==?\s*"(?P<value>.*)"$')
+_PARSE = re.compile(r"^(?P<field>[@\w.]+)\s+/(?P<regex>.*)/$")
+_STAT = re.compile(r"^(?P<fn>count|min|max)\((?P<arg>[^)]*)\)(?:\s+as\s+(?P<alias>\w+))?$", re.IGNORECASE)
+
+
+@dataclass
+class LogEvent:
+    """One stored log line."""
+
+    log_group: str
+    log_stream: str
+    timestamp_ms: int
+    message: str
+    event_id: str
+
+    def insights_fields(self) -> dict[str, str]:
+        """Fields of a plain (non-stats) Logs Insights result row."""
+        ts = datetime.fromtimestamp(self.timestamp_ms / 1000, timezone.utc)
+        return {
+            "@timestamp": ts.strftime("%Y-%m-%d %H:%M:%S.") + f"{ts.microsecond // 1000:03d}",
+            "@message": self.message,
+            "@logStream": self.log_stream,
+            "@log": self.log_group,
+        }
+
+    def field_value(self, name: str) -> Any:
+        if name == "@timestamp":
+            return self.timestamp_ms
+        if name == "@message":
+            return self.message
+        if name == "@logStream":
+            return self.log_stream
+        if name == "@log":
+            return self.log_group
+        try:
+            parsed = json.loads(self.message)
+        except json.JSONDecodeError:
+            return None
+        return parsed.get(name) if isinstance(parsed, dict) else None
+
+
+def _split_pipeline(query: str) -> list[str]:
+    """Split a query on `|` outside regex literals and quotes."""
+    parts, current, in_regex, in_quote = [], [], False, False
+    for i, ch in enumerate(query):
+        if ch == '"' and not in_regex:
+            in_quote = not in_quote
+        elif ch == "/" and not in_quote and (
+            in_regex
+            or query[:i].rstrip().endswith("like")
+            or "".join(current).lstrip().lower().startswith("parse ")
+        ):
+            in_regex = not in_regex
+        if ch == "|" and not in_regex and not in_quote:
+            parts.append("".join(current).strip())
+            current = []
+        else:
+            current.append(ch)
+    parts.append("".join(current).strip())
+    return [p for p in parts if p]
+
+
+def _clause_predicate(clause: str) -> Callable[[LogEvent], bool]:
+    clause = clause.strip().strip("()")
+    match = _LIKE.match(clause)
+    if match:
+        field_name = match["field"]
+        if match["regex"] is not None:
+            pattern = re.compile(match["regex"])
+            return lambda e: bool(pattern.search(str(e.field_value(field_name) or "")))
+        text = match["text"]
+        return lambda e: text in str(e.field_value(field_name) or "")
+    match = _IN.match(clause)
+    if match:
+        field_name = match["field"]
+        values = set(re.findall(r'"([^"]*)"', match["values"]))
+        return lambda e: str(e.field_value(field_name)) in values
+    match = _EQ.match(clause)
+    if match:
+        field_name, value = match["field"], match["value"]
+        return lambda e: str(e.field_value(field_name)) == value
+    return lambda e: True  # Unsupported clause: keep the event
+
+
+def _filter_predicate(expression: str) -> Callable[[LogEvent], bool]:
+    any_of = []
+    for alternative in re.split(r"\s+or\s+", expression):
+        all_of = [_clause_predicate(c) for c in re.split(r"\s+and\s+", alternative)]
+        any_of.append(lambda e, preds=all_of: all(p(e) for p in preds))
+    return lambda e: any(p(e) for p in any_of)
+
+
+@dataclass
+class _Row:
+    """A query row: a log event, or an aggregate once `stats` has run."""
+
+    event: Optional[LogEvent]
+    fields: dict[str, Any]
+
+    def get(self, name: str) -> Any:
+        if name in self.fields:
+            return self.fields[name]
+        return self.event.field_value(name) if self.event is not None else None
+
+    def output(self) -> dict[str, str]:
+        out = self.event.insights_fields() if self.event is not None else {}
+        out.update({k: _format_value(v) for k, v in self.fields.items() if v is not None})
+        return out
+
+
+def _format_value(value: Any) -> str:
+    if isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return str(value)
+
+
+def _as_number(value: Any) -> Optional[float]:
+    try:
+        return float(value)
+    except (TypeError, ValueError):
+        return None
+
+
+def _parse_fields(rows: list[_Row], expression: str) -> None:
+    """Add the named groups of a `parse` regex as row fields."""
+    match = _PARSE.match(expression)
+    if not match:
+        return
+    # Insights writes named groups as (?<name>...); Python wants (?P<name>...)
+    pattern = re.compile(re.sub(r"\(\?<(?=[A-Za-z_])", "(?P<", match["regex"]))
+    for row in rows:
+        found = pattern.search(str(row.get(match["field"]) or ""))
+        for name in pattern.groupindex:
+            row.fields[name] = found[name] if found else None
+
+
+def _stats(rows: list[_Row], expression: str) -> list[_Row]:
+    """Aggregate rows for `stats <fn>(<arg>) [as alias], ... [by f1, f2]`."""
+    parts = re.split(r"\s+by\s+", expression, maxsplit=1)
+    aggregates = parts[0]
+    by_fields = [f.strip() for f in parts[1].split(",")] if len(parts) > 1 else []
+    stats = []
+    for spec in aggregates.split(","):
+        match = _STAT.match(spec.strip())
+        if match:
+            fn, arg = match["fn"].lower(), match["arg"].strip()
+            stats.append((fn, arg, match["alias"] or f"{fn}({arg})"))
+
+    groups: dict[tuple[Any, ...], list[_Row]] = {}
+    for row in rows:
+        key = tuple(row.get(f) for f in by_fields)
+        if any(v is None for v in key):
+            continue
+        groups.setdefault(key, []).append(row)
+
+    out = []
+    for key, members in groups.items():
+        fields: dict[str, Any] = dict(zip(by_fields, key))
+        for fn, arg, alias in stats:
+            if fn == "count":
+                fields[alias] = len(members) if arg == "*" else sum(m.get(arg) is not None for m in members)
+                continue
+            values = [v for v in (_as_number(m.get(arg)) for m in members) if v is not None]
+            fields[alias] = (max if fn == "max" else min)(values) if values else None
+        out.append(_Row(None, fields))
+    return out
+
+
+def _filter_pattern_predicate(pattern: Optional[str]) -> Callable[[LogEvent], bool]:
+    """FilterLogEvents patterns: every term (quoted or bare) must appear."""
+    if not pattern:
+        return lambda e: True
+    terms = [q or b for q, b in re.findall(r'"([^"]*)"|(\S+)', pattern)]
+    return lambda e: all(t in e.message for t in terms)
+
+
+class LogStore:
+    """Thread-safe store of log events keyed by log group."""
+
+    def __init__(self, clock: Callable[[], float] = time.time) -> None:
+        self._clock = clock
+        self._lock = threading.Lock()
+        self._groups: dict[str, list[LogEvent]] = {}
+        self._created: dict[str, int] = {}
+        self._queries: dict[str, list[dict[str, str]]] = {}
+
+    def put(self, log_group: str, message: str, log_stream: str = "stub", timestamp_ms: Optional[int] = None) -> None:
+        """Append one log line."""
+        ts = timestamp_ms if timestamp_ms is not None else int(self._clock() * 1000)
+        event = LogEvent(log_group, log_stream, ts, message, uuid.uuid4().hex)
+        with self._lock:
+            if log_group not in self._groups:
+                self._groups[log_group] = []
+                self._created[log_group] = ts
+            self._groups[log_group].append(event)
+
+    def events(self, log_group: str) -> list[LogEvent]:
+        with self._lock:
+            return list(self._groups.get(log_group, []))
+
+    def log_groups(self, prefix: str = "") -> list[str]:
+        with self._lock:
+            return sorted(g for g in self._groups if g.startswith(prefix))
+
+    def describe_log_groups(self, prefix: str = "") -> list[dict[str, Any]]:
+        """Rows for a DescribeLogGroups response."""
+        with self._lock:
+            return [
+                {
+                    "logGroupName": g,
+                    "arn": f"arn:aws:logs:us-east-1:000000000000:log-group:{g}:*",
+                    "creationTime": self._created[g],
+                    "storedBytes": sum(len(e.message) for e in self._groups[g]),
+                }
+                for g in sorted(self._groups)
+                if g.startswith(prefix)
+            ]
+
+    def filter_events(
+        self,
+        log_group: str,
+        start_ms: Optional[int] = None,
+        end_ms: Optional[int] = None,
+        filter_pattern: Optional[str] = None,
+        log_streams: Optional[list[str]] = None,
+    ) -> list[LogEvent]:
+        """FilterLogEvents semantics, sorted by timestamp."""
+        matches = _filter_pattern_predicate(filter_pattern)
+        return sorted(
+            (
+                e
+                for e in self.events(log_group)
+                if (start_ms is None or e.timestamp_ms >= start_ms)
+                and (end_ms is None or e.timestamp_ms <= end_ms)
+                and (not log_streams or e.log_stream in log_streams)
+                and matches(e)
+            ),
+            key=lambda e: e.timestamp_ms,
+        )
+
+    def run_query(self, log_groups: list[str], start_s: int, end_s: int, query: str) -> list[dict[str, str]]:
+        """Evaluate the supported subset of a Logs Insights query.
+
+        Returns:
+            Result rows as field -> value mappings
+        """
+        rows = [
+            _Row(e, {})
+            for group in log_groups
+            for e in self.events(group)
+            if start_s * 1000 <= e.timestamp_ms <= end_s * 1000 + 999
+        ]
+        rows.sort(key=lambda r: r.event.timestamp_ms)
+        limit = DEFAULT_QUERY_LIMIT
+        for command in _split_pipeline(query):
+            keyword, _, rest = command.partition(" ")
+            keyword = keyword.lower()
+            if keyword == "filter":
+                predicate = _filter_predicate(rest.strip())
+                rows = [r for r in rows if r.event is not None and predicate(r.event)]
+            elif keyword == "parse":
+                _parse_fields(rows, rest.strip())
+            elif keyword == "stats":
+                rows = _stats(rows, rest.strip())
+            elif keyword == "sort":
+                field_name, _, direction = rest.strip().partition(" ")
+                present = [r for r in rows if r.get(field_name) is not None]
+                missing = [r for r in rows if r.get(field_name) is None]
+                present.sort(key=lambda r: r.get(field_name), reverse=direction.strip().lower() == "desc")
+                rows = present + missing
+            elif keyword == "limit":
+                limit = int(rest.strip())
+        return [r.output() for r in rows[:limit]]
+
+    def start_query(self, log_groups: list[str], start_s: int, end_s: int, query: str) -> str:
+        """Run a query and keep its results for `query_results`."""
+        query_id = str(uuid.uuid4())
+        results = self.run_query(log_groups, start_s, end_s, query)
+        with self._lock:
+            self._queries[query_id] = results
+        return query_id
+
+    def query_results(self, query_id: str) -> Optional[list[dict[str, str]]]:
+        with self._lock:
+            return self._queries.get(query_id)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._groups.clear()
+            self._created.clear()
+            self._queries.clear()
@@ -0,0 +1,732 @@
+"""Local HTTP server standing in for the AWS APIs live mode calls.
+
+One endpoint serves every emulated service. Requests are routed the way
+AWS protocols identify them:
+
+- Bedrock Agent Runtime `InvokeAgent`
+  (`POST /agents/{id}/agentAliases/{alias}/sessions/{session}/text`):
+  streams orchestration trace events and completion chunks in the
+  event-stream format
+- Lambda `Invoke` (`POST /2015-03-31/functions/{name}/invocations`):
+  sync (`RequestResponse`, with `LogType=Tail`), async (`Event`, 202 and
+  run later) and `DryRun`
+- SQS `SendMessage`/`SendMessageBatch` (`X-Amz-Target: AmazonSQS.*`):
+  messages to queues listed in `StubConfig.sqs_consumers` are delivered
+  to the consuming function after a delay
+- CloudWatch Logs `StartQuery`/`GetQueryResults`/`StopQuery`/
+  `FilterLogEvents`/`DescribeLogGroups` (`X-Amz-Target: Logs_20140328.*`),
+  answered from the server's `LogStore`
+- STS `GetCallerIdentity` (query protocol `Action=GetCallerIdentity`, XML
+  response) and Bedrock Agent `GetAgent` (`GET /agents/{id}/`, always
+  `PREPARED`), so `itk run --mode live` preflight passes
+
+Every function run, agent invocation and action group call writes ITK span
+log lines (plus Lambda START/END/REPORT lines) to the store. The live
+pipeline's log fetchers and correlation therefore see the same shapes as
+in AWS.
+
+Per-service latency, jitter and throttling come from `StubConfig`.
+Throttled calls get the error AWS would return (429
+`TooManyRequestsException` for Lambda, `ThrottlingException` elsewhere).
+
+Example:
+    with StubServer(StubConfig(default=ServiceBehavior(latency_ms=20))) as stub:
+        with stub.activate():
+            ...  # boto3 clients from itk.aws now talk to the stub
+"""
+from __future__ import annotations
+
+import base64
+import hashlib
+import json
+import os
+import random
+import re
+import threading
+import time
+import uuid
+from collections import Counter
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator, Optional
+from xml.sax.saxutils import escape
+from urllib.parse import parse_qs, unquote, urlparse
+
+from itk.stubs.eventstream import encode_event
+from itk.stubs.logs import LogStore
+
+_AGENT_PATH = re.compile(
+    r"^/agents/(?P<agent>[^/]+)/agentAliases/(?P<alias>[^/]+)/sessions/(?P<session>[^/]+)/text$"
+)
+_LAMBDA_PATH = re.compile(r"^/2015-03-31/functions/(?P<function>[^/]+)/invocations$")
+_GET_AGENT_PATH = re.compile(r"^/agents/(?P<agent>[^/]+)/?$")
+_JSON_TARGETS = {"AmazonSQS": "sqs", "Logs_20140328": "logs"}
+_STS_XMLNS = "https://sts.amazonaws.com/doc/2011-06-15/"
+_STUB_ACCOUNT = "000000000000"
+
+
+@dataclass
+class ServiceBehavior:
+    """Latency and fault injection for one service.
+
+    Attributes:
+        latency_ms: Delay before each response.
+        jitter_ms: Extra uniform random delay, 0 to jitter_ms.
+        throttle_rate: Probability that a call is throttled.
+        throttle_every: Throttle every Nth call (0 = never). This is
+            deterministic, unlike throttle_rate.
+    """
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    throttle_rate: float = 0.0
+    throttle_every: int = 0
+
+
+@dataclass
+class StubConfig:
+    """Behaviour of the stub services.
+
+    Attributes:
+        default: Behaviour for services without an entry in `services`.
+        services: Per-service overrides keyed by boto3 service name.
+        seed: Seed for jitter and throttle sampling.
+        emit_logs: Write span and runtime log lines to the log store.
+        completion_text: Agent answer, streamed in `chunk_count` chunks.
+        chunk_count: Completion chunks per InvokeAgent call.
+        chunk_delay_ms: Delay between streamed events (time to next token).
+        trace_steps: Model call + action group steps traced per invocation.
+        action_group: Action group (and Lambda log group) named in traces.
+        lambda_duration_ms: Simulated function run time.
+        lambda_response: Payload returned by RequestResponse invocations.
+        sqs_consumers: Queue name -> function name fed from that queue.
+        consumer_delay_ms: Time from SendMessage to the consumer running.
+        batch_entry_failure_rate: Probability a SendMessageBatch entry fails
+            with a retryable `InternalError`.
+    """
+
+    default: ServiceBehavior = field(default_factory=ServiceBehavior)
+    services: dict[str, ServiceBehavior] = field(default_factory=dict)
+    seed: Optional[int] = None
+    emit_logs: bool = True
+    completion_text: str = "This is a stub agent response."
+    chunk_count: int = 3
+    chunk_delay_ms: float = 0.0
+    trace_steps: int = 1
+    action_group: str = "stub-action-group"
+    lambda_duration_ms: float = 5.0
+    lambda_response: dict[str, Any] = field(
+        default_factory=lambda: {"statusCode": 200, "body": "stub response"}
+    )
+    sqs_consumers: dict[str, str] = field(default_factory=dict)
+    consumer_delay_ms: float = 20.0
+    batch_entry_failure_rate: float = 0.0
+
+    def behavior(self, service: str) -> ServiceBehavior:
+        return self.services.get(service, self.default)
+
+
+class StubError(Exception):
+    """An AWS-style error response."""
+
+    def __init__(self, code: str, message: str, status: int = 400):
+        super().__init__(message)
+        self.code = code
+        self.status = status
+
+
+def _now_iso() -> str:
+    return datetime.now(timezone.utc).isoformat()
+
+
+def _function_name(path_segment: str) -> str:
+    """Function name from a name, partial ARN or full ARN path segment."""
+    name = unquote(path_segment)
+    if ":function:" in name:
+        name = name.split(":function:", 1)[1]
+    return name.split(":", 1)[0]
+
+
+def _itk_trace_id(event: Any) -> Optional[str]:
+    """ITK trace ID from a direct payload or an SQS-shaped event."""
+    if not isinstance(event, dict):
+        return None
+    if event.get("itk_trace_id"):
+        return str(event["itk_trace_id"])
+    for record in event.get("Records") or []:
+        attribute = (record.get("messageAttributes") or {}).get("itk_trace_id") or {}
+        if attribute.get("stringValue"):
+            return str(attribute["stringValue"])
+    return None
+
+
+class StubServer:
+    """Run the emulated AWS endpoint on a local port."""
+
+    def __init__(self, config: Optional[StubConfig] = None, host: str = "127.0.0.1", port: int = 0):
+        """Bind the server (port 0 picks a free port).
+
+        Args:
+            config: Service behaviour (default: no latency, no faults)
+            host: Interface to bind
+            port: Port to bind
+        """
+        self.config = config or StubConfig()
+        self.logs = LogStore()
+        self.messages: dict[str, list[dict[str, Any]]] = {}
+        self._rng = random.Random(self.config.seed)
+        self._lock = threading.Lock()
+        self._calls: Counter[tuple[str, str]] = Counter()
+        self._throttled: Counter[tuple[str, str]] = Counter()
+        self._service_calls: Counter[str] = Counter()
+        self._timers: list[threading.Timer] = []
+        self._thread: Optional[threading.Thread] = None
+        self._httpd = ThreadingHTTPServer((host, port), _StubHandler)
+        self._httpd.daemon_threads = True
+        self._httpd.stub = self  # type: ignore[attr-defined]
+
+    @property
+    def url(self) -> str:
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "StubServer":
+        """Serve from a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(
+                target=self._httpd.serve_forever, kwargs={"poll_interval": 0.05}, daemon=True
+            )
+            self._thread.start()
+        return self
+
+    def serve_forever(self) -> None:
+        """Serve from the calling thread until interrupted."""
+        self._httpd.serve_forever()
+
+    def stop(self) -> None:
+        """Stop serving and cancel pending async deliveries."""
+        with self._lock:
+            timers, self._timers = self._timers, []
+        for timer in timers:
+            timer.cancel()
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self) -> "StubServer":
+        return self.start()
+
+    def __exit__(self, *exc: Any) -> None:
+        self.stop()
+
+    def environ(self, region: str = "us-east-1") -> dict[str, str]:
+        """Environment variables that point boto3 at this server."""
+        return {
+            "AWS_ENDPOINT_URL": self.url,
+            "AWS_ACCESS_KEY_ID": "stub",
+            "AWS_SECRET_ACCESS_KEY": "stub",
+            "AWS_REGION": region,
+            "AWS_DEFAULT_REGION": region,
+        }
+
+    @contextmanager
+    def activate(self, region: str = "us-east-1") -> Iterator["StubServer"]:
+        """Point this process's AWS clients at the stub, then restore.
+
+        Sets `environ()`, unsets AWS_PROFILE and clears the shared client
+        pool on entry and exit, so no client keeps the other endpoint.
+        """
+        from itk.aws import get_client_pool
+
+        overrides: dict[str, Optional[str]] = {**self.environ(region), "AWS_PROFILE": None}
+        saved = {key: os.environ.get(key) for key in overrides}
+        for key, value in overrides.items():
+            if value is None:
+                os.environ.pop(key, None)
+            else:
+                os.environ[key] = value
+        get_client_pool().clear()
+        try:
+            yield self
+        finally:
+            for key, value in saved.items():
+                if value is None:
+                    os.environ.pop(key, None)
+                else:
+                    os.environ[key] = value
+            get_client_pool().clear()
+
+    def stats(self) -> dict[str, Any]:
+        """Calls and throttles per service operation."""
+        with self._lock:
+            return {
+                "calls": {f"{s}:{op}": n for (s, op), n in sorted(self._calls.items())},
+                "throttled": {f"{s}:{op}": n for (s, op), n in sorted(self._throttled.items())},
+                "messages": {queue: len(msgs) for queue, msgs in self.messages.items()},
+                "log_groups": {g: len(self.logs.events(g)) for g in self.logs.log_groups()},
+            }
+
+    # --- Fault injection -------------------------------------------------
+
+    def _admit(self, service: str, operation: str) -> None:
+        """Apply latency and throttling for one call (raises StubError if throttled)."""
+        behavior = self.config.behavior(service)
+        with self._lock:
+            self._calls[(service, operation)] += 1
+            self._service_calls[service] += 1
+            n = self._service_calls[service]
+            throttle = (behavior.throttle_every > 0 and n % behavior.throttle_every == 0) or (
+                behavior.throttle_rate > 0 and self._rng.random() < behavior.throttle_rate
+            )
+            jitter = self._rng.uniform(0, behavior.jitter_ms) if behavior.jitter_ms else 0.0
+            if throttle:
+                self._throttled[(service, operation)] += 1
+        delay = behavior.latency_ms + jitter
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if throttle:
+            if service == "lambda":
+                raise StubError("TooManyRequestsException", "Rate exceeded", 429)
+            if service == "bedrock-agent-runtime":
+                raise StubError("ThrottlingException", "Rate exceeded", 429)
+            raise StubError("ThrottlingException", "Rate exceeded", 400)
+
+    def _schedule(self, delay_ms: float, fn: Any, *args: Any) -> None:
+        timer = threading.Timer(delay_ms / 1000, fn, args)
+        timer.daemon = True
+        with self._lock:
+            self._timers = [t for t in self._timers if t.is_alive()]
+            self._timers.append(timer)
+        timer.start()
+
+    # --- Log emission ----------------------------------------------------
+
+    def _log_span(self, log_group: str, span: dict[str, Any], log_stream: str = "stub") -> None:
+        if self.config.emit_logs:
+            self.logs.put(log_group, json.dumps({k: v for k, v in span.items() if v is not None}), log_stream)
+
+    def run_function(
+        self, function: str, event: Any, request_id: Optional[str] = None, sqs_message_id: Optional[str] = None
+    ) -> tuple[str, list[str]]:
+        """Execute the stub function body: wait, then log like a Lambda run.
+
+        Returns:
+            Tuple of (request_id, log lines written)
+        """
+        request_id = request_id or str(uuid.uuid4())
+        started = _now_iso()
+        duration_ms = self.config.lambda_duration_ms
+        if duration_ms > 0:
+            time.sleep(duration_ms / 1000)
+        span = {
+            "span_id": f"stub-{request_id[:8]}",
+            "component": f"lambda:{function}",
+            "operation": "Invoke",
+            "ts_start": started,
+            "ts_end": _now_iso(),
+            "lambda_request_id": request_id,
+            "itk_trace_id": _itk_trace_id(event),
+            "sqs_message_id": sqs_message_id,
+        }
+        lines = [
+            f"START RequestId: {request_id} Version: $LATEST",
+            json.dumps({k: v for k, v in span.items() if v is not None}),
+            f"END RequestId: {request_id}",
+            f"REPORT RequestId: {request_id}\tDuration: {duration_ms:.2f} ms\t"
+            f"Billed Duration: {max(1, round(duration_ms))} ms",
+        ]
+        if self.config.emit_logs:
+            stream = f"{datetime.now(timezone.utc):%Y/%m/%d}/[$LATEST]stub"
+            for line in lines:
+                self.logs.put(f"/aws/lambda/{function}", line, stream)
+        return request_id, lines
+
+    # --- Lambda ----------------------------------------------------------
+
+    def lambda_invoke(
+        self, function: str, invocation_type: str, log_type: str, payload: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        """Handle Invoke; returns (status, headers, body)."""
+        self._admit("lambda", "Invoke")
+        event = json.loads(payload) if payload else {}
+        request_id = str(uuid.uuid4())
+        headers = {"x-amzn-RequestId": request_id}
+        if invocation_type == "DryRun":
+            return 204, headers, b""
+        if invocation_type == "Event":
+            self._schedule(0, self.run_function, function, event, request_id)
+            return 202, headers, b""
+
+        _, lines = self.run_function(function, event, request_id)
+        headers["X-Amz-Executed-Version"] = "$LATEST"
+        if log_type == "Tail":
+            tail = "\n".join(lines).encode("utf-8")[-4096:]
+            headers["X-Amz-Log-Result"] = base64.b64encode(tail).decode("ascii")
+        return 200, headers, json.dumps(self.config.lambda_response).encode("utf-8")
+
+    # --- SQS -------------------------------------------------------------
+
+    def _enqueue(self, queue_url: str, body: str, attributes: dict[str, Any]) -> dict[str, str]:
+        queue = queue_url.rstrip("/").rsplit("/", 1)[-1]
+        message_id = str(uuid.uuid4())
+        with self._lock:
+            self.messages.setdefault(queue, []).append(
+                {"MessageId": message_id, "Body": body, "MessageAttributes": attributes}
+            )
+        consumer = self.config.sqs_consumers.get(queue)
+        if consumer:
+            record = {
+                "messageId": message_id,
+                "body": body,
+                "eventSource": "aws:sqs",
+                "eventSourceARN": f"arn:aws:sqs:us-east-1:000000000000:{queue}",
+                "messageAttributes": {
+                    name: {"stringValue": a.get("StringValue"), "dataType": a.get("DataType")}
+                    for name, a in attributes.items()
+                },
+            }
+            self._schedule(
+                self.config.consumer_delay_ms,
+                self.run_function,
+                consumer,
+                {"Records": [record]},
+                None,
+                message_id,
+            )
+        return {"MessageId": message_id, "MD5OfMessageBody": hashlib.md5(body.encode("utf-8")).hexdigest()}
+
+    def sqs(self, operation: str, request: dict[str, Any]) -> dict[str, Any]:
+        self._admit("sqs", operation)
+        queue_url = request.get("QueueUrl", "")
+        if operation == "SendMessage":
+            return self._enqueue(queue_url, request.get("MessageBody", ""), request.get("MessageAttributes") or {})
+        if operation == "SendMessageBatch":
+            successful, failed = [], []
+            for entry in request.get("Entries", []):
+                with self._lock:
+                    fail = self._rng.random() < self.config.batch_entry_failure_rate
+                if fail:
+                    failed.append(
+                        {"Id": entry["Id"], "SenderFault": False, "Code": "InternalError", "Message": "Stub failure"}
+                    )
+                    continue
+                sent = self._enqueue(queue_url, entry.get("MessageBody", ""), entry.get("MessageAttributes") or {})
+                successful.append({"Id": entry["Id"], **sent})
+            return {"Successful": successful, "Failed": failed}
+        if operation == "GetQueueUrl":
+            return {"QueueUrl": f"{self.url}/000000000000/{request.get('QueueName', '')}"}
+        raise StubError("UnsupportedOperation", f"SQS operation not emulated: {operation}")
+
+    # --- CloudWatch Logs -------------------------------------------------
+
+    def logs_api(self, operation: str, request: dict[str, Any]) -> dict[str, Any]:
+        self._admit("logs", operation)
+        if operation == "StartQuery":
+            groups = request.get("logGroupNames") or [request["logGroupName"]]
+            query = request["queryString"]
+            if request.get("limit"):
+                query += f" | limit {request['limit']}"
+            return {"queryId": self.logs.start_query(groups, request["startTime"], request["endTime"], query)}
+        if operation == "GetQueryResults":
+            rows = self.logs.query_results(request["queryId"])
+            if rows is None:
+                raise StubError("ResourceNotFoundException", "Query does not exist")
+            return {
+                "status": "Complete",
+                "results": [[{"field": k, "value": v} for k, v in row.items()] for row in rows],
+                "statistics": {"recordsMatched": float(len(rows)), "recordsScanned": float(len(rows))},
+            }
+        if operation == "StopQuery":
+            return {"success": True}
+        if operation == "FilterLogEvents":
+            group = request["logGroupName"]
+            if group not in self.logs.log_groups():
+                raise StubError("ResourceNotFoundException", "The specified log group does not exist.")
+            events = self.logs.filter_events(
+                group,
+                request.get("startTime"),
+                request.get("endTime"),
+                request.get("filterPattern"),
+                request.get("logStreamNames"),
+            )
+            offset = int(request.get("nextToken") or 0)
+            limit = int(request.get("limit") or 10000)
+            page = events[offset : offset + limit]
+            response: dict[str, Any] = {
+                "events": [
+                    {
+                        "logStreamName": e.log_stream,
+                        "timestamp": e.timestamp_ms,
+                        "message": e.message,
+                        "ingestionTime": e.timestamp_ms,
+                        "eventId": e.event_id,
+                    }
+                    for e in page
+                ]
+            }
+            if offset + limit < len(events):
+                response["nextToken"] = str(offset + limit)
+            return response
+        if operation == "DescribeLogGroups":
+            return {"logGroups": self.logs.describe_log_groups(request.get("logGroupNamePrefix", ""))}
+        raise StubError("UnsupportedOperation", f"Logs operation not emulated: {operation}")
+
+    # --- Preflight (STS, Bedrock Agent) -----------------------------------
+
+    def caller_identity(self) -> dict[str, str]:
+        """GetCallerIdentity result for the stub's fixed account."""
+        self._admit("sts", "GetCallerIdentity")
+        return {
+            "UserId": "AIDASTUBUSER",
+            "Account": _STUB_ACCOUNT,
+            "Arn": f"arn:aws:iam::{_STUB_ACCOUNT}:user/itk-stub",
+        }
+
+    def get_agent(self, agent_id: str) -> dict[str, Any]:
+        """GetAgent response; every agent ID exists and is prepared."""
+        self._admit("bedrock-agent", "GetAgent")
+        now = _now_iso()
+        return {
+            "agent": {
+                "agentId": agent_id,
+                "agentName": f"stub-{agent_id}",
+                "agentArn": f"arn:aws:bedrock:us-east-1:{_STUB_ACCOUNT}:agent/{agent_id}",
+                "agentVersion": "DRAFT",
+                "agentStatus": "PREPARED",
+                "idleSessionTTLInSeconds": 600,
+                "agentResourceRoleArn": f"arn:aws:iam::{_STUB_ACCOUNT}:role/itk-stub-agent",
+                "createdAt": now,
+                "updatedAt": now,
+                "preparedAt": now,
+            }
+        }
+
+    # --- Bedrock Agent Runtime --------------------------------------------
+
+    def agent_events(
+        self, agent_id: str, alias_id: str, session_id: str, request: dict[str, Any]
+    ) -> Iterator[bytes]:
+        """Yield event-stream frames for one InvokeAgent call."""
+        config = self.config
+        started = _now_iso()
+        base = {"agentId": agent_id, "agentAliasId": alias_id, "sessionId": session_id, "agentVersion": "1"}
+
+        def trace(orchestration: dict[str, Any]) -> bytes:
+            return encode_event(
+                "trace", {**base, "eventTime": time.time(), "trace": {"orchestrationTrace": orchestration}}
+            )
+
+        frames_sent = 0
+
+        def pause() -> None:
+            if frames_sent and config.chunk_delay_ms > 0:
+                time.sleep(config.chunk_delay_ms / 1000)
+
+        if request.get("enableTrace"):
+            for step in range(config.trace_steps):
+                trace_id = f"{session_id}-{step}"
+                api_path = f"/stub/step-{step}"
+                ag_started = _now_iso()
+                for orchestration in (
+                    {"modelInvocationInput": {"traceId": trace_id, "type": "ORCHESTRATION",
+                                              "text": request.get("inputText", "")}},
+                    {"modelInvocationOutput": {"traceId": trace_id,
+                                               "metadata": {"usage": {"inputTokens": 100, "outputTokens": 20}}}},
+                    {"rationale": {"traceId": trace_id, "text": f"Calling {config.action_group}"}},
+                    {"invocationInput": {"traceId": trace_id, "invocationType": "ACTION_GROUP",
+                                         "actionGroupInvocationInput": {
+                                             "actionGroupName": config.action_group,
+                                             "apiPath": api_path, "verb": "post"}}},
+                    {"observation": {"traceId": trace_id, "type": "ACTION_GROUP",
+                                     "actionGroupInvocationOutput": {"text": "{\"ok\": true}"}}},
+                ):
+                    pause()
+                    yield trace(orchestration)
+                    frames_sent += 1
+                self._log_span(
+                    f"/aws/lambda/{config.action_group}",
+                    {
+                        "span_id": f"stub-ag-{uuid.uuid4().hex[:8]}",
+                        "component": f"lambda:{config.action_group}",
+                        "operation": api_path,
+                        "ts_start": ag_started,
+                        "ts_end": _now_iso(),
+                        "bedrock_session_id": session_id,
+                        "session_id": session_id,
+                    },
+                )
+
+        text = config.completion_text
+        count = max(1, config.chunk_count)
+        size = -(-len(text) // count) or 1
+        for start in range(0, max(len(text), 1), size):
+            pause()
+            piece = text[start : start + size].encode("utf-8")
+            yield encode_event("chunk", {"bytes": base64.b64encode(piece).decode("ascii")})
+            frames_sent += 1
+
+        self._log_span(
+            f"/aws/bedrock/agents/{agent_id}",
+            {
+                "span_id": f"stub-agent-{uuid.uuid4().hex[:8]}",
+                "component": f"agent:{agent_id}",
+                "operation": "InvokeAgent",
+                "ts_start": started,
+                "ts_end": _now_iso(),
+                "bedrock_session_id": session_id,
+                "session_id": session_id,
+            },
+        )
+
+
+class _StubHandler(BaseHTTPRequestHandler):
+    """Route requests to the StubServer that owns this HTTP server."""
+
+    protocol_version = "HTTP/1.1"  # Keep-alive, like AWS endpoints
+
+    @property
+    def stub(self) -> StubServer:
+        return self.server.stub  # type: ignore[attr-defined]
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def _send(self, status: int, body: bytes, headers: dict[str, str]) -> None:
+        self.send_response(status)
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_error(self, error: StubError, json_protocol: bool, content_type: str) -> None:
+        if json_protocol:
+            body = {"__type": error.code, "message": str(error)}
+            self._send(error.status, json.dumps(body).encode("utf-8"), {"Content-Type": content_type})
+        else:
+            self._send(
+                error.status,
+                json.dumps({"message": str(error)}).encode("utf-8"),
+                {"Content-Type": "application/json", "x-amzn-ErrorType": error.code},
+            )
+
+    def _send_query(self, action: str, result: dict[str, str]) -> None:
+        """Answer an AWS query-protocol (STS) call with its XML envelope."""
+        members = "".join(f"<{k}>{escape(v)}</{k}>" for k, v in result.items())
+        body = (
+            f'<{action}Response xmlns="{_STS_XMLNS}">'
+            f"<{action}Result>{members}</{action}Result>"
+            f"<ResponseMetadata><RequestId>{uuid.uuid4()}</RequestId></ResponseMetadata>"
+            f"</{action}Response>"
+        )
+        self._send(200, body.encode("utf-8"), {"Content-Type": "text/xml"})
+
+    def _send_query_error(self, error: StubError) -> None:
+        body = (
+            f'<ErrorResponse xmlns="{_STS_XMLNS}">'
+            f"<Error><Type>Sender</Type><Code>{escape(error.code)}</Code>"
+            f"<Message>{escape(str(error))}</Message></Error>"
+            f"<RequestId>{uuid.uuid4()}</RequestId></ErrorResponse>"
+        )
+        self._send(error.status, body.encode("utf-8"), {"Content-Type": "text/xml"})
+
+    def do_POST(self) -> None:
+        body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+        target = self.headers.get("X-Amz-Target", "")
+        url = urlparse(self.path)
+
+        if target:
+            prefix, _, operation = target.partition(".")
+            service = _JSON_TARGETS.get(prefix)
+            content_type = self.headers.get("Content-Type", "application/x-amz-json-1.1")
+            try:
+                if service is None:
+                    raise StubError("UnknownOperationException", f"Unknown target: {target}")
+                request = json.loads(body or b"{}")
+                response = self.stub.sqs(operation, request) if service == "sqs" else self.stub.logs_api(
+                    operation, request
+                )
+            except StubError as e:
+                self._send_error(e, True, content_type)
+                return
+            except KeyError as e:
+                self._send_error(StubError("InvalidParameterException", f"Missing {e}"), True, content_type)
+                return
+            self._send(200, json.dumps(response).encode("utf-8"), {"Content-Type": content_type})
+            return
+
+        if self.headers.get("Content-Type", "").startswith("application/x-www-form-urlencoded"):
+            action = parse_qs(body.decode("utf-8")).get("Action", [""])[0]
+            try:
+                if action != "GetCallerIdentity":
+                    raise StubError("InvalidAction", f"STS action not emulated: {action}")
+                self._send_query(action, self.stub.caller_identity())
+            except StubError as e:
+                self._send_query_error(e)
+            return
+
+        match = _LAMBDA_PATH.match(url.path)
+        if match:
+            try:
+                status, headers, payload = self.stub.lambda_invoke(
+                    _function_name(match["function"]),
+                    self.headers.get("X-Amz-Invocation-Type", "RequestResponse"),
+                    self.headers.get("X-Amz-Log-Type", "None"),
+                    body,
+                )
+            except StubError as e:
+                self._send_error(e, False, "application/json")
+                return
+            self._send(status, payload, {"Content-Type": "application/json", **headers})
+            return
+
+        match = _AGENT_PATH.match(url.path)
+        if match:
+            self._invoke_agent(match["agent"], match["alias"], unquote(match["session"]), body)
+            return
+
+        self._send_error(StubError("UnknownOperationException", f"No stub for POST {url.path}", 404), False, "")
+
+    def _invoke_agent(self, agent_id: str, alias_id: str, session_id: str, body: bytes) -> None:
+        try:
+            self.stub._admit("bedrock-agent-runtime", "InvokeAgent")
+        except StubError as e:
+            self._send_error(e, False, "application/json")
+            return
+        request = json.loads(body or b"{}")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/vnd.amazon.eventstream")
+        self.send_header("x-amzn-bedrock-agent-content-type", "application/json")
+        self.send_header("x-amz-bedrock-agent-session-id", session_id)
+        self.send_header("x-amzn-RequestId", str(uuid.uuid4()))
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for frame in self.stub.agent_events(agent_id, alias_id, session_id, request):
+            self.wfile.write(f"{len(frame):x}\r\n".encode("ascii") + frame + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def do_GET(self) -> None:
+        url = urlparse(self.path)
+        if url.path == "/_stub/stats":
+            self._send(200, json.dumps(self.stub.stats()).encode("utf-8"), {"Content-Type": "application/json"})
+            return
+        if url.path == "/_stub/logs":
+            group = parse_qs(url.query).get("group", [""])[0]
+            events = [e.message for e in self.stub.logs.events(group)]
+            self._send(200, json.dumps(events).encode("utf-8"), {"Content-Type": "application/json"})
+            return
+        match = _GET_AGENT_PATH.match(url.path)
+        if match:
+            try:
+                response = self.stub.get_agent(unquote(match["agent"]))
+            except StubError as e:
+                self._send_error(e, False, "application/json")
+                return
+            self._send(200, json.dumps(response).encode("utf-8"), {"Content-Type": "application/json"})
+            return
+        self._send_error(StubError("UnknownOperationException", f"No stub for GET {url.path}", 404), False, "")
@@ -4,10 +4,13 @@ from __future__ import annotations
 import json
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import Any, Optional
+from typing import TYPE_CHECKING, Any, Optional
 
 from itk.trace.span_model import Span
 
+if TYPE_CHECKING:
+    from itk.entrypoints.bedrock_agent import StreamTiming
+
 
 @dataclass(frozen=True)
 class Trace:
@@ -67,9 +70,82 @@ def load_bedrock_trace_jsonl(path: Path) -> list[BedrockTraceEvent]:
     return events
 
 
+# StreamTiming fields copied onto the client stream span
+_CLIENT_STREAM_SUMMARY_KEYS = (
+    "request_ms",
+    "ttft_ms",
+    "total_ms",
+    "chunk_count",
+    "chunk_bytes",
+    "max_chunk_gap_ms",
+)
+
+
+def client_stream_spans(
+    timing: "StreamTiming",
+    session_id: Optional[str] = None,
+    parent_span_id: Optional[str] = None,
+) -> list[Span]:
+    """Convert client-side stream timing into synthetic `client:itk` spans.
+
+    Produces one span for the whole response stream, one for time to first
+    token and one per trace phase, all timed by when the client saw them.
+
+    Args:
+        timing: Stream timing recorded by `BedrockAgentAdapter.invoke`
+        session_id: Bedrock session ID for correlation
+        parent_span_id: Parent for the stream span (e.g. the orchestrator span)
+
+    Returns:
+        List of client-side spans
+    """
+    stream_span_id = "bedrock-client-stream"
+    summary = timing.to_dict()
+    spans = [
+        Span(
+            span_id=stream_span_id,
+            parent_span_id=parent_span_id,
+            component="client:itk",
+            operation="InvokeAgentStream",
+            ts_start=timing.started_at,
+            ts_end=timing.timestamp_at(timing.total_ms),
+            bedrock_session_id=session_id,
+            response={key: summary[key] for key in _CLIENT_STREAM_SUMMARY_KEYS},
+        )
+    ]
+    if timing.ttft_ms is not None:
+        spans.append(
+            Span(
+                span_id="bedrock-client-ttft",
+                parent_span_id=stream_span_id,
+                component="client:itk",
+                operation="TimeToFirstToken",
+                ts_start=timing.started_at,
+                ts_end=timing.timestamp_at(timing.ttft_ms),
+                bedrock_session_id=session_id,
+                response={"ttft_ms": round(timing.ttft_ms, 3)},
+            )
+        )
+    for i, phase in enumerate(timing.phases, start=1):
+        spans.append(
+            Span(
+                span_id=f"bedrock-client-phase-{i:03d}",
+                parent_span_id=stream_span_id,
+                component="client:itk",
+                operation="".join(word.capitalize() for word in phase.name.split("-")),
+                ts_start=timing.timestamp_at(phase.start_ms),
+                ts_end=timing.timestamp_at(phase.end_ms),
+                bedrock_session_id=session_id,
+                response={"event_count": phase.event_count, "duration_ms": round(phase.duration_ms, 3)},
+            )
+        )
+    return spans
+
+
 def bedrock_traces_to_spans(
     events: list[BedrockTraceEvent],
     session_id: Optional[str] = None,
+    client_timing: Optional["StreamTiming"] = None,
 ) -> list[Span]:
     """Convert Bedrock trace events into ITK spans.
 
@@ -85,9 +161,13 @@ def bedrock_traces_to_spans(
     5. Agent calls model again to process result (child of root)
     6. Agent returns response
 
+    With `client_timing`, client-side stream spans (see `client_stream_spans`)
+    are added under the orchestrator span.
+
     Args:
         events: List of Bedrock trace events
         session_id: Optional session ID to filter events
+        client_timing: Optional stream timing recorded by the adapter
 
     Returns:
         List of Spans derived from the trace events
@@ -100,6 +180,8 @@ def bedrock_traces_to_spans(
     events.sort(key=lambda e: e.timestamp)
 
     if not events:
+        if client_timing is not None:
+            return client_stream_spans(client_timing, session_id)
         return []
 
     spans: list[Span] = []
@@ -226,6 +308,9 @@ def bedrock_traces_to_spans(
             )
             prev_span_id = new_span_id
 
+    if client_timing is not None:
+        spans.extend(client_stream_spans(client_timing, first_event.session_id, root_span_id))
+
     return spans
 
 
@@ -7,9 +7,12 @@ from datetime import datetime, timezone
 from pathlib import Path
 from typing import TYPE_CHECKING, Any, Optional, Sequence
 
+from itk import perf
 from itk.trace.span_model import Span
 from itk.trace.trace_model import Trace
 from itk.redaction import Redactor, RedactionConfig
+from itk.utils.html_stream import HtmlStream, render_to_string
+from itk.utils.write_pipeline import DEFAULT_IO_WORKERS, WritePipeline
 
 if TYPE_CHECKING:
     from itk.assertions.invariants import InvariantResult
@@ -47,6 +50,7 @@ def _generate_run_id() -> str:
     return datetime.now(timezone.utc).strftime("%Y%m%d-%H%M%S")
 
 
+@perf.timed("write.artifacts")
 def write_run_artifacts(
     *,
     out_dir: Path,
@@ -56,6 +60,9 @@ def write_run_artifacts(
     invariant_results: Optional[Sequence["InvariantResult"]] = None,
     agent_response: Optional[dict] = None,
     mode: str = "dev-fixtures",
+    io_workers: int = DEFAULT_IO_WORKERS,
+    render_workers: int = 0,
+    pack_payloads: bool = False,
 ) -> None:
     """Write all artifacts for a run.
 
@@ -68,91 +75,90 @@ def write_run_artifacts(
     - report.md: Human-readable report
 
     Redaction is applied to all payload data by default.
+
+    Files are written atomically through a `WritePipeline`: renders and file
+    writes overlap, and an interrupted run never leaves partial HTML.
+
+    Args:
+        io_workers: Threads used for file writes (0 = synchronous).
+        render_workers: Processes used for the trace viewer, timeline and
+            report renders (0 = render in this process).
+        pack_payloads: Write payloads into a single payloads.zip instead of
+            one file per payload under payloads/.
     """
+    from itk.diagrams.html_renderer import render_html_sequence
+    from itk.diagrams.trace_viewer import render_trace_viewer, render_mini_svg
+    from itk.diagrams.timeline_view import render_timeline_viewer, render_mini_timeline
+
     out_dir.mkdir(parents=True, exist_ok=True)
     payload_dir = out_dir / "payloads"
-    payload_dir.mkdir(exist_ok=True)
+    if not pack_payloads:
+        payload_dir.mkdir(exist_ok=True)
 
     redactor = get_redactor()
 
-    # Write spans.jsonl with redaction
-    spans_path = out_dir / "spans.jsonl"
-    with spans_path.open("w", encoding="utf-8") as f:
+    with WritePipeline(io_workers=io_workers, render_workers=render_workers) as pipe:
+        # CPU-heavy renders first so they overlap with payload serialization
+        viewer_title = f"Trace Viewer — {case.id}" if case else "Trace Viewer"
+        pipe.render(out_dir / "trace-viewer.html", render_trace_viewer, trace, title=viewer_title)
+
+        timeline_title = f"Timeline — {case.id}" if case else "Timeline"
+        pipe.render(out_dir / "timeline.html", render_timeline_viewer, trace, title=timeline_title)
+
+        pipe.stream(
+            out_dir / "index.html",
+            stream_run_report_html,
+            trace=trace,
+            case=case,
+            invariant_results=invariant_results,
+            agent_response=agent_response,
+            mode=mode,
+            artifacts_dir=out_dir,
+            payloads_packed=pack_payloads,
+        )
+
+        # Write spans.jsonl and payload files with redaction
+        span_lines: list[str] = []
+        payload_files: dict[str, str] = {}
         for s in trace.spans:
             span_dict = asdict(s)
-            # Redact request/response payloads
-            if span_dict.get("request"):
-                span_dict["request"] = redactor.redact_dict(span_dict["request"])
-            if span_dict.get("response"):
-                span_dict["response"] = redactor.redact_dict(span_dict["response"])
-            if span_dict.get("error"):
-                span_dict["error"] = redactor.redact_dict(span_dict["error"])
-            f.write(json.dumps(span_dict, ensure_ascii=False) + "\n")
-
-    # Write payload files with redaction
-    for s in trace.spans:
-        if s.request is not None:
-            redacted_req = redactor.redact_dict(s.request)
-            (payload_dir / f"{s.span_id}.request.json").write_text(
-                json.dumps(redacted_req, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
-        if s.response is not None:
-            redacted_res = redactor.redact_dict(s.response)
-            (payload_dir / f"{s.span_id}.response.json").write_text(
-                json.dumps(redacted_res, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
-        if s.error is not None:
-            redacted_err = redactor.redact_dict(s.error)
-            (payload_dir / f"{s.span_id}.error.json").write_text(
-                json.dumps(redacted_err, indent=2, ensure_ascii=False), encoding="utf-8"
-            )
-
-    # Write mermaid
-    (out_dir / "sequence.mmd").write_text(mermaid, encoding="utf-8")
-
-    # Write HTML sequence diagram (legacy)
-    from itk.diagrams.html_renderer import render_html_sequence
-    
-    title = f"Sequence Diagram — {case.id}" if case else "Sequence Diagram"
-    html_diagram = render_html_sequence(trace, title=title, include_payloads=True)
-    (out_dir / "sequence.html").write_text(html_diagram, encoding="utf-8")
-
-    # Write enhanced interactive trace viewer
-    from itk.diagrams.trace_viewer import render_trace_viewer, render_mini_svg
-    
-    viewer_title = f"Trace Viewer — {case.id}" if case else "Trace Viewer"
-    trace_viewer_html = render_trace_viewer(trace, title=viewer_title)
-    (out_dir / "trace-viewer.html").write_text(trace_viewer_html, encoding="utf-8")
-
-    # Write mini SVG thumbnail
-    mini_svg = render_mini_svg(trace)
-    (out_dir / "thumbnail.svg").write_text(mini_svg, encoding="utf-8")
+            for kind in ("request", "response", "error"):
+                value = getattr(s, kind)
+                if value is None:
+                    continue
+                # Only serialized below, so unchanged subtrees can be shared
+                redacted = redactor.redact_dict(value, copy_on_write=True)
+                span_dict[kind] = redacted
+                payload_files[f"{s.span_id}.{kind}.json"] = json.dumps(
+                    redacted, indent=2, ensure_ascii=False
+                )
+            span_lines.append(json.dumps(span_dict, ensure_ascii=False) + "\n")
+
+        pipe.write_text(out_dir / "spans.jsonl", "".join(span_lines))
+
+        if pack_payloads:
+            pipe.write_archive(out_dir / "payloads.zip", payload_files)
+        else:
+            for name, content in payload_files.items():
+                pipe.write_text(payload_dir / name, content)
+
+        # Write mermaid
+        pipe.write_text(out_dir / "sequence.mmd", mermaid)
+
+        # Write HTML sequence diagram (legacy)
+        title = f"Sequence Diagram — {case.id}" if case else "Sequence Diagram"
+        pipe.write_text(
+            out_dir / "sequence.html",
+            render_html_sequence(trace, title=title, include_payloads=True),
+        )
 
-    # Write timeline view
-    from itk.diagrams.timeline_view import render_timeline_viewer, render_mini_timeline
-    
-    timeline_title = f"Timeline — {case.id}" if case else "Timeline"
-    timeline_html = render_timeline_viewer(trace, title=timeline_title)
-    (out_dir / "timeline.html").write_text(timeline_html, encoding="utf-8")
+        # Thumbnails are cheap; render inline
+        pipe.write_text(out_dir / "thumbnail.svg", render_mini_svg(trace))
+        pipe.write_text(out_dir / "timeline-thumbnail.svg", render_mini_timeline(trace))
 
-    # Write mini timeline thumbnail
-    mini_timeline = render_mini_timeline(trace)
-    (out_dir / "timeline-thumbnail.svg").write_text(mini_timeline, encoding="utf-8")
-
-    # Write markdown report
-    report = _build_report(trace=trace, case=case, invariant_results=invariant_results)
-    (out_dir / "report.md").write_text(report, encoding="utf-8")
-
-    # Write top-level HTML report (index.html)
-    html_report = render_run_report_html(
-        trace=trace,
-        case=case,
-        invariant_results=invariant_results,
-        agent_response=agent_response,
-        mode=mode,
-        artifacts_dir=out_dir,
-    )
-    (out_dir / "index.html").write_text(html_report, encoding="utf-8")
+        # Write markdown report
+        report = _build_report(trace=trace, case=case, invariant_results=invariant_results)
+        pipe.write_text(out_dir / "report.md", report)
 
 
 def _build_report(
@@ -385,10 +391,13 @@ def write_compare_artifacts(
         "summary": {
             "new_paths": len(result.new_paths),
             "missing_paths": len(result.missing_paths),
-            "latency_regressions": len(result.significant_latency_changes),
+            "latency_changes": len(result.significant_latency_changes),
+            "latency_regressions": len(result.latency_regressions),
             "error_regressions": len(result.error_regressions),
+            "path_matches": len(result.path_matches),
             "has_regressions": result.has_regressions,
         },
+        "path_matches": [m.to_dict() for m in result.path_matches],
         "deltas": [
             {
                 "signature": d.signature.signature_string,
@@ -400,6 +409,11 @@ def write_compare_artifacts(
                 "baseline_error_count": d.baseline_error_count,
                 "current_error_count": d.current_error_count,
                 "error_rate_delta": d.error_rate_delta,
+                "baseline_latency": d.baseline_latency.to_dict() if d.baseline_latency else None,
+                "current_latency": d.current_latency.to_dict() if d.current_latency else None,
+                "p50_delta_pct": d.p50_delta_pct,
+                "p50_delta_ci_pct": list(d.p50_delta_ci_pct) if d.p50_delta_ci_pct else None,
+                "latency_significant": d.latency_significant,
             }
             for d in result.deltas
         ],
@@ -409,7 +423,9 @@ def write_compare_artifacts(
     )
 
 
-def render_run_report_html(
+@perf.timed("render.report")
+def stream_run_report_html(
+    out: HtmlStream,
     *,
     trace: Trace,
     case: Optional["CaseConfig"] = None,
@@ -417,8 +433,9 @@ def render_run_report_html(
     agent_response: Optional[dict] = None,
     mode: str = "dev-fixtures",
     artifacts_dir: Optional[Path] = None,
-) -> str:
-    """Render a top-level HTML report for a single test run.
+    payloads_packed: bool = False,
+) -> None:
+    """Stream a top-level HTML report for a single test run.
     
     Similar to soak-report.html but for individual test runs.
     Shows summary stats, links to trace viewer and timeline, and span details.
@@ -458,10 +475,11 @@ def render_run_report_html(
     
     # Relative path for artifacts
     artifacts_rel = "."
+    payloads_href = "payloads.zip" if payloads_packed else "payloads/"
     
     timestamp = datetime.now(timezone.utc).strftime("%Y-%m-%d %H:%M:%S UTC")
     
-    return f"""<!DOCTYPE html>
+    out.write(f"""<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
@@ -740,17 +758,18 @@ def render_run_report_html(
     <div class="section">
         <h2>✅ Invariants</h2>
         <div class="invariants-list">
-            {''.join(f'''<div class="invariant {'pass' if r.passed else 'fail'}">
-                <span class="icon">{'✅' if r.passed else '❌'}</span>
-                <span class="name">{r.name}</span>
-            </div>''' for r in (invariant_results or []))}
+            """)
+    out.join("", (_render_invariant_item(r) for r in (invariant_results or [])))
+    out.write("""
         </div>
     </div>
     
     <div class="section">
         <h2>🏷️ Components</h2>
         <div class="tag-list">
-            {''.join(f'<span class="tag">{c}</span>' for c in components)}
+            """)
+    out.join("", (f'<span class="tag">{c}</span>' for c in components))
+    out.write("""
         </div>
     </div>
     
@@ -767,7 +786,9 @@ def render_run_report_html(
                 </tr>
             </thead>
             <tbody>
-                {''.join(_render_span_row(s) for s in trace.spans)}
+                """)
+    out.join("", (_render_span_row(s) for s in trace.spans))
+    out.write(f"""
             </tbody>
         </table>
     </div>
@@ -779,7 +800,7 @@ def render_run_report_html(
                 <tr><td><a href="{artifacts_rel}/spans.jsonl" style="color: var(--accent-blue);">spans.jsonl</a></td><td>Raw span data (JSONL)</td></tr>
                 <tr><td><a href="{artifacts_rel}/sequence.mmd" style="color: var(--accent-blue);">sequence.mmd</a></td><td>Mermaid sequence diagram</td></tr>
                 <tr><td><a href="{artifacts_rel}/report.md" style="color: var(--accent-blue);">report.md</a></td><td>Markdown report</td></tr>
-                <tr><td><a href="{artifacts_rel}/payloads/" style="color: var(--accent-blue);">payloads/</a></td><td>Request/response JSON files</td></tr>
+                <tr><td><a href="{artifacts_rel}/{payloads_href}" style="color: var(--accent-blue);">{payloads_href}</a></td><td>Request/response JSON files</td></tr>
             </tbody>
         </table>
     </div>
@@ -788,7 +809,41 @@ def render_run_report_html(
         Generated by ITK (Integration Test Kit) • <a href="https://github.com/spidey99/support-bot-integration-test-kit" style="color: var(--accent-blue);">GitHub</a>
     </footer>
 </body>
-</html>"""
+</html>""")
+
+
+def render_run_report_html(
+    *,
+    trace: Trace,
+    case: Optional["CaseConfig"] = None,
+    invariant_results: Optional[Sequence["InvariantResult"]] = None,
+    agent_response: Optional[dict] = None,
+    mode: str = "dev-fixtures",
+    artifacts_dir: Optional[Path] = None,
+    payloads_packed: bool = False,
+) -> str:
+    """Render a top-level HTML report for a single test run.
+
+    See `stream_run_report_html`; returns the document as a string.
+    """
+    return render_to_string(
+        stream_run_report_html,
+        trace=trace,
+        case=case,
+        invariant_results=invariant_results,
+        agent_response=agent_response,
+        mode=mode,
+        artifacts_dir=artifacts_dir,
+        payloads_packed=payloads_packed,
+    )
+
+
+def _render_invariant_item(r: "InvariantResult") -> str:
+    """Render a single invariant result badge."""
+    return f'''<div class="invariant {'pass' if r.passed else 'fail'}">
+                <span class="icon">{'✅' if r.passed else '❌'}</span>
+                <span class="name">{r.name}</span>
+            </div>'''
 
 
 def _render_span_row(s: Span) -> str:
@@ -845,6 +900,8 @@ def _build_comparison_markdown(result: "CompareResult") -> str:
             lines.append(f"- **{len(result.missing_paths)}** path(s) missing in current")
         if result.error_regressions:
             lines.append(f"- **{len(result.error_regressions)}** path(s) with increased errors")
+        if result.latency_regressions:
+            lines.append(f"- **{len(result.latency_regressions)}** path(s) significantly slower")
         lines.append("")
     else:
         lines.extend(
@@ -880,24 +937,57 @@ def _build_comparison_markdown(result: "CompareResult") -> str:
             lines.append(f"- `{d.signature.signature_string}` (was: {d.baseline_count})")
         lines.append("")
 
+    # Near matches between new and missing paths
+    if result.path_matches:
+        lines.extend(
+            [
+                "## 🔀 Changed Paths",
+                "New paths that closely match a missing baseline path "
+                f"({len(result.path_matches)}):",
+                "",
+            ]
+        )
+        for m in result.path_matches:
+            lines.append(f"- `{m.baseline.signature.signature_string}`")
+            lines.append(f"  → `{m.current.signature.signature_string}`")
+            for edit in m.edits:
+                lines.append(f"  - `{edit.description}`")
+            if m.error_changed:
+                lines.append(
+                    "  - now errors" if m.current.signature.has_error else "  - no longer errors"
+                )
+        lines.append("")
+
     # Latency changes
     significant = result.significant_latency_changes
     if significant:
         lines.extend(
             [
-                "## ⏱️ Significant Latency Changes (>10%)",
+                "## ⏱️ Significant Latency Changes",
+                "Median (p50) change with bootstrap confidence interval where enough "
+                "samples exist; otherwise mean change above 10%.",
                 "",
-                "| Path | Baseline (ms) | Current (ms) | Delta |",
-                "|------|---------------|--------------|-------|",
+                "| Path | Baseline (ms) | Current (ms) | Delta | CI |",
+                "|------|---------------|--------------|-------|----|",
             ]
         )
         for d in significant:
-            delta_str = f"{d.latency_delta_pct:+.1f}%"
+            if d.p50_delta_ci_pct is not None and d.baseline_latency and d.current_latency:
+                low, high = d.p50_delta_ci_pct
+                baseline_ms = d.baseline_latency.p50_ms
+                current_ms = d.current_latency.p50_ms
+                delta_str = f"{d.p50_delta_pct:+.1f}% (p50)"
+                ci_str = f"[{low:+.1f}%, {high:+.1f}%]"
+            else:
+                baseline_ms = d.baseline_avg_latency_ms
+                current_ms = d.current_avg_latency_ms
+                delta_str = f"{d.latency_delta_pct:+.1f}% (mean)"
+                ci_str = "—"
             lines.append(
                 f"| `{d.signature.signature_string[:40]}...` | "
-                f"{d.baseline_avg_latency_ms:.1f} | "
-                f"{d.current_avg_latency_ms:.1f} | "
-                f"{delta_str} |"
+                f"{baseline_ms:.1f} | "
+                f"{current_ms:.1f} | "
+                f"{delta_str} | {ci_str} |"
             )
         lines.append("")
 
@@ -923,7 +1013,7 @@ def _build_comparison_markdown(result: "CompareResult") -> str:
     # Stable paths
     stable = [
         d for d in result.changed_paths
-        if abs(d.latency_delta_pct) <= 10.0 and d.error_rate_delta <= 0.0
+        if not d.latency_significant and d.error_rate_delta <= 0.0
     ]
     if stable:
         lines.extend(
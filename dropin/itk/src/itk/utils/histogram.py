@@ -0,0 +1,170 @@
+"""Mergeable HDR-style latency histograms.
+
+`LatencyHistogram` keeps a bounded number of log-linear buckets (~1% relative
+error on percentiles) and merges exactly with histograms of the same
+resolution. It backs the soak report aggregates (`itk.soak.aggregates`) and
+the persistent latency sketches in `itk.compare.baseline_store`.
+"""
+from __future__ import annotations
+
+import math
+from bisect import bisect_right
+from typing import Any, Optional, Sequence
+
+# Linear sub-buckets per power of two (2^7 = 128 -> <1% relative error)
+HISTOGRAM_SUB_BUCKET_BITS = 7
+
+
+class LatencyHistogram:
+    """HDR-style log-linear latency histogram.
+
+    Values are recorded in microseconds. Below 2^bits they are counted
+    exactly; above that each power of two is split into 2^(bits-1) linear
+    sub-buckets, so bucket width is always within 2^-(bits-1) of the value.
+
+    Histograms with the same `sub_bucket_bits` merge exactly, which makes
+    them usable as persistent latency sketches.
+    """
+
+    def __init__(self, sub_bucket_bits: int = HISTOGRAM_SUB_BUCKET_BITS) -> None:
+        self._bits = sub_bucket_bits
+        self._counts: dict[int, int] = {}
+        self.count = 0
+        self.total_ms = 0.0
+        self.min_ms: Optional[float] = None
+        self.max_ms: Optional[float] = None
+
+    def _index(self, value_us: int) -> int:
+        if value_us < (1 << self._bits):
+            return value_us
+        shift = value_us.bit_length() - self._bits
+        return (shift << self._bits) + (value_us >> shift)
+
+    def _bounds_us(self, index: int) -> tuple[int, int]:
+        """Return the [low, high) microsecond range of a bucket."""
+        shift = index >> self._bits
+        sub = index & ((1 << self._bits) - 1)
+        if shift == 0:
+            return sub, sub + 1
+        return sub << shift, (sub + 1) << shift
+
+    @property
+    def bucket_count(self) -> int:
+        """Number of non-empty buckets."""
+        return len(self._counts)
+
+    @property
+    def mean_ms(self) -> float:
+        """Mean recorded value in milliseconds."""
+        return self.total_ms / self.count if self.count else 0.0
+
+    def record(self, value_ms: float) -> None:
+        """Record a duration in milliseconds."""
+        value_ms = max(value_ms, 0.0)
+        index = self._index(int(round(value_ms * 1000)))
+        self._counts[index] = self._counts.get(index, 0) + 1
+        self.count += 1
+        self.total_ms += value_ms
+        self.min_ms = value_ms if self.min_ms is None else min(self.min_ms, value_ms)
+        self.max_ms = value_ms if self.max_ms is None else max(self.max_ms, value_ms)
+
+    def merge(self, other: "LatencyHistogram") -> None:
+        """Add another histogram's counts into this one."""
+        if other._bits != self._bits:
+            raise ValueError(
+                f"Cannot merge histograms with {other._bits} and {self._bits} sub-bucket bits"
+            )
+        for index, count in other._counts.items():
+            self._counts[index] = self._counts.get(index, 0) + count
+        self.count += other.count
+        self.total_ms += other.total_ms
+        if other.min_ms is not None:
+            self.min_ms = other.min_ms if self.min_ms is None else min(self.min_ms, other.min_ms)
+        if other.max_ms is not None:
+            self.max_ms = other.max_ms if self.max_ms is None else max(self.max_ms, other.max_ms)
+
+    def to_state(self) -> dict[str, Any]:
+        """Return the full histogram state (buckets included) for storage."""
+        return {
+            "bits": self._bits,
+            "count": self.count,
+            "total_ms": self.total_ms,
+            "min_ms": self.min_ms,
+            "max_ms": self.max_ms,
+            "buckets": sorted(self._counts.items()),
+        }
+
+    @classmethod
+    def from_state(cls, state: dict[str, Any]) -> "LatencyHistogram":
+        """Rebuild a histogram from `to_state()` output."""
+        hist = cls(sub_bucket_bits=state["bits"])
+        hist._counts = {int(index): int(count) for index, count in state["buckets"]}
+        hist.count = state["count"]
+        hist.total_ms = state["total_ms"]
+        hist.min_ms = state["min_ms"]
+        hist.max_ms = state["max_ms"]
+        return hist
+
+    def ranked(self) -> "RankedHistogram":
+        """Return a read-only sorted-sequence view of the recorded values."""
+        return RankedHistogram(self)
+
+    def percentile(self, pct: float) -> float:
+        """Return the value at a percentile (0-100) in milliseconds."""
+        if not self.count:
+            return 0.0
+        target = max(1, math.ceil(pct / 100 * self.count))
+        seen = 0
+        for index in sorted(self._counts):
+            seen += self._counts[index]
+            if seen >= target:
+                low, high = self._bounds_us(index)
+                value = (low + high - 1) / 2 / 1000
+                return min(max(value, self.min_ms or 0.0), self.max_ms or 0.0)
+        return self.max_ms or 0.0
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "count": self.count,
+            "min_ms": self.min_ms or 0.0,
+            "mean_ms": self.mean_ms,
+            "p50_ms": self.percentile(50),
+            "p90_ms": self.percentile(90),
+            "p95_ms": self.percentile(95),
+            "p99_ms": self.percentile(99),
+            "max_ms": self.max_ms or 0.0,
+        }
+
+
+class RankedHistogram(Sequence[float]):
+    """Sorted-sequence view of a `LatencyHistogram`.
+
+    `view[i]` is the (bucket-midpoint) value of the i-th smallest sample, so
+    functions written for sorted sample lists (percentiles, bootstrap) work
+    on a sketch without expanding it. Lookups are O(log buckets).
+    """
+
+    def __init__(self, hist: LatencyHistogram) -> None:
+        self._hist = hist
+        self._indexes = sorted(hist._counts)
+        self._cumulative: list[int] = []
+        seen = 0
+        for index in self._indexes:
+            seen += hist._counts[index]
+            self._cumulative.append(seen)
+
+    def __len__(self) -> int:
+        return self._hist.count
+
+    def __getitem__(self, rank):  # type: ignore[override]
+        if isinstance(rank, slice):
+            return [self[i] for i in range(*rank.indices(len(self)))]
+        if rank < 0:
+            rank += len(self)
+        if not 0 <= rank < len(self):
+            raise IndexError("histogram rank out of range")
+        index = self._indexes[bisect_right(self._cumulative, rank)]
+        low, high = self._hist._bounds_us(index)
+        value = (low + high - 1) / 2 / 1000
+        return min(max(value, self._hist.min_ms or 0.0), self._hist.max_ms or 0.0)
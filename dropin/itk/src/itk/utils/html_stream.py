@@ -0,0 +1,89 @@
+"""Streaming HTML output for large reports.
+
+Report renderers used to build the whole document as a single f-string,
+with every table row materialized in a list and joined. For large soak runs
+or `itk view` galleries that meant hundreds of MB of transient strings.
+
+Renderers now write their fixed template sections and each row as separate
+chunks to an `HtmlStream`. The stream buffers small chunks and hands them to
+the underlying text handle once the buffer fills, so memory stays bounded by
+the largest single row rather than the document size.
+
+Each streaming renderer has the signature `stream_fn(out: HtmlStream, ...)`.
+`render_to_string` and `stream_to_file` adapt it to the two call styles:
+
+    html = render_to_string(stream_suite_report, suite)
+    stream_to_file(out_dir / "index.html", stream_suite_report, suite)
+"""
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+from typing import Any, Callable, Iterable, TextIO
+
+from itk.utils.write_pipeline import atomic_open
+
+# Flush to the underlying handle once this many characters are buffered
+DEFAULT_BUFFER_CHARS = 64 * 1024
+
+
+class HtmlStream:
+    """Buffered chunk writer over a text handle."""
+
+    def __init__(self, out: TextIO, buffer_chars: int = DEFAULT_BUFFER_CHARS) -> None:
+        self._out = out
+        self._buffer: list[str] = []
+        self._buffered = 0
+        self._buffer_chars = buffer_chars
+
+    def write(self, chunk: str) -> None:
+        """Write a chunk of HTML."""
+        self._buffer.append(chunk)
+        self._buffered += len(chunk)
+        if self._buffered >= self._buffer_chars:
+            self.flush()
+
+    def join(self, sep: str, chunks: Iterable[str]) -> int:
+        """Write chunks separated by sep (streaming equivalent of `sep.join`).
+
+        Returns:
+            Number of chunks written.
+        """
+        count = 0
+        for chunk in chunks:
+            if count:
+                self.write(sep)
+            self.write(chunk)
+            count += 1
+        return count
+
+    def json_array(self, items: Iterable[Any]) -> None:
+        """Write items as a JSON array (same output as `json.dumps(list)`)."""
+        self.write("[")
+        self.join(", ", (json.dumps(item) for item in items))
+        self.write("]")
+
+    def flush(self) -> None:
+        """Hand buffered chunks to the underlying handle."""
+        if self._buffer:
+            self._out.write("".join(self._buffer))
+            self._buffer.clear()
+            self._buffered = 0
+
+
+def render_to_string(stream_fn: Callable[..., None], *args: Any, **kwargs: Any) -> str:
+    """Run a streaming renderer and return the document as a string."""
+    buf = io.StringIO()
+    out = HtmlStream(buf)
+    stream_fn(out, *args, **kwargs)
+    out.flush()
+    return buf.getvalue()
+
+
+def stream_to_file(path: Path, stream_fn: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+    """Run a streaming renderer directly into a file (atomically)."""
+    with atomic_open(path) as f:
+        out = HtmlStream(f)
+        stream_fn(out, *args, **kwargs)
+        out.flush()
@@ -0,0 +1,331 @@
+"""Content-hash render cache for trace artifacts.
+
+Rendering HTML viewers is the most expensive part of `itk suite`, `itk view`
+and `itk trace`, yet fixture-driven runs usually produce byte-identical spans
+from one run to the next. The render cache fingerprints everything that
+influences the rendered output:
+
+- the spans themselves
+- the renderer version (a hash of the renderer source files)
+- the redaction configuration
+- any caller-supplied extras (case metadata, titles, mode)
+
+The fingerprint is stored in each output directory as `.itk-render.json`
+together with the list of files that were produced. On the next run:
+
+- same directory, same fingerprint: rendering is skipped entirely
+- new directory, fingerprint seen before elsewhere: files are hard-linked
+  (or copied when linking is not possible) from the earlier directory
+- otherwise: the outputs are rendered and the fingerprint is recorded
+
+Hard links are safe because artifact writers replace files atomically
+(new inode) rather than truncating them in place.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import shutil
+from dataclasses import asdict, dataclass
+from functools import lru_cache
+from pathlib import Path
+from typing import TYPE_CHECKING, Any, Callable, Optional, Sequence
+
+from itk import perf
+from itk.utils.write_pipeline import atomic_write_text
+
+if TYPE_CHECKING:
+    from itk.redaction import RedactionConfig
+    from itk.trace.span_model import Span
+
+
+# Name of the fingerprint stamp written into each output directory
+STAMP_FILENAME = ".itk-render.json"
+
+# Default location of the fingerprint -> directory index
+DEFAULT_INDEX_PATH = Path(".itk") / "cache" / "render-index.json"
+
+# Bump to invalidate all cached renders regardless of source changes
+RENDER_CACHE_VERSION = 1
+
+# Modules whose source contributes to the renderer version
+_RENDERER_PACKAGES = ("diagrams", "report")
+_RENDERER_MODULES = ("utils/artifacts.py",)
+
+
+@lru_cache(maxsize=1)
+def renderer_version() -> str:
+    """Return a short hash of the renderer source files.
+
+    Any edit to a renderer (or its vendored JS) changes the version and
+    therefore invalidates every cached render.
+    """
+    root = Path(__file__).resolve().parent.parent
+    paths: list[Path] = []
+    for pkg in _RENDERER_PACKAGES:
+        paths.extend(p for p in (root / pkg).rglob("*") if p.suffix in (".py", ".js"))
+    paths.extend(root / m for m in _RENDERER_MODULES)
+
+    h = hashlib.sha256(f"v{RENDER_CACHE_VERSION}".encode())
+    for path in sorted(paths):
+        h.update(path.relative_to(root).as_posix().encode())
+        h.update(path.read_bytes())
+    return h.hexdigest()[:16]
+
+
+def _redaction_fingerprint(config: Optional["RedactionConfig"]) -> Any:
+    """Return a JSON-serializable summary of a redaction config."""
+    if config is None:
+        return None
+    return {
+        "enabled": config.enabled,
+        "patterns": [
+            [p.name, p.pattern.pattern, p.pattern.flags, p.replacement]
+            for p in config.patterns
+            if p.enabled
+        ],
+        "sensitive_keys": sorted(k.lower() for k in config.sensitive_keys),
+        "allowed_keys": sorted(k.lower() for k in config.allowed_keys),
+    }
+
+
+def trace_fingerprint(
+    spans: Sequence["Span"],
+    *,
+    redaction: Optional["RedactionConfig"] = None,
+    extra: Optional[dict[str, Any]] = None,
+) -> str:
+    """Compute a content fingerprint for a set of spans and render inputs.
+
+    Args:
+        spans: Spans that will be rendered.
+        redaction: Redaction config applied to payloads (None if unredacted).
+        extra: Additional render inputs (titles, case metadata, options).
+
+    Returns:
+        Hex SHA-256 digest.
+    """
+    h = hashlib.sha256()
+    header = {
+        "renderer": renderer_version(),
+        "redaction": _redaction_fingerprint(redaction),
+        "extra": extra or {},
+    }
+    h.update(json.dumps(header, sort_keys=True, default=str).encode("utf-8"))
+    for span in spans:
+        h.update(b"\n")
+        h.update(json.dumps(asdict(span), sort_keys=True, default=str).encode("utf-8"))
+    return h.hexdigest()
+
+
+def read_stamp(out_dir: Path) -> Optional[dict[str, Any]]:
+    """Read the fingerprint stamp from an output directory, if present."""
+    try:
+        data = json.loads((out_dir / STAMP_FILENAME).read_text(encoding="utf-8"))
+    except (OSError, ValueError):
+        return None
+    return data if isinstance(data, dict) else None
+
+
+def _stamp_matches(out_dir: Path, fingerprint: str) -> bool:
+    """Check the stamp matches and every recorded output still exists."""
+    stamp = read_stamp(out_dir)
+    if not stamp or stamp.get("fingerprint") != fingerprint:
+        return False
+    return all((out_dir / f).is_file() for f in stamp.get("files", []))
+
+
+def _list_outputs(out_dir: Path) -> list[str]:
+    """List files under an output directory (relative, excluding the stamp)."""
+    return sorted(
+        p.relative_to(out_dir).as_posix()
+        for p in out_dir.rglob("*")
+        if p.is_file() and p.name != STAMP_FILENAME
+    )
+
+
+@dataclass
+class RenderCacheStats:
+    """Counters for render cache lookups."""
+
+    hits: int = 0  # Output directory already up to date
+    links: int = 0  # Outputs linked from another directory
+    misses: int = 0  # Outputs had to be rendered
+
+    @property
+    def lookups(self) -> int:
+        """Total number of lookups."""
+        return self.hits + self.links + self.misses
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served without rendering (0.0-1.0)."""
+        if self.lookups == 0:
+            return 0.0
+        return (self.hits + self.links) / self.lookups
+
+    def to_dict(self) -> dict[str, Any]:
+        """Convert to dictionary for JSON serialization."""
+        return {
+            "hits": self.hits,
+            "links": self.links,
+            "misses": self.misses,
+            "hit_rate": self.hit_rate,
+        }
+
+
+class RenderCache:
+    """Fingerprint-based cache that skips or links unchanged renders."""
+
+    def __init__(
+        self,
+        index_path: Optional[Path] = DEFAULT_INDEX_PATH,
+        force: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            index_path: JSON index mapping fingerprints to directories that
+                hold their outputs. None disables cross-directory linking.
+            force: Always render (stamps are still written).
+        """
+        self.index_path = index_path
+        self.force = force
+        self.stats = RenderCacheStats()
+        self._index: Optional[dict[str, str]] = None
+        self._dirty = False
+
+    def _load_index(self) -> dict[str, str]:
+        if self._index is None:
+            self._index = {}
+            if self.index_path is not None:
+                try:
+                    data = json.loads(self.index_path.read_text(encoding="utf-8"))
+                    if isinstance(data, dict):
+                        self._index = {str(k): str(v) for k, v in data.items()}
+                except (OSError, ValueError):
+                    pass
+        return self._index
+
+    def _link_from(self, src_dir: Path, out_dir: Path) -> bool:
+        """Hard-link (or copy) cached outputs from src_dir into out_dir."""
+        stamp = read_stamp(src_dir)
+        if not stamp:
+            return False
+        files = stamp.get("files", [])
+        try:
+            for rel in files:
+                src = src_dir / rel
+                dst = out_dir / rel
+                dst.parent.mkdir(parents=True, exist_ok=True)
+                if dst.exists():
+                    dst.unlink()
+                try:
+                    os.link(src, dst)
+                except OSError:
+                    shutil.copy2(src, dst)
+            atomic_write_text(out_dir / STAMP_FILENAME, json.dumps(stamp, indent=2))
+        except OSError:
+            return False
+        return True
+
+    def lookup(self, out_dir: Path, fingerprint: str) -> bool:
+        """Try to satisfy out_dir from the cache.
+
+        Returns:
+            True if out_dir now holds up-to-date outputs for the fingerprint.
+        """
+        if self.force:
+            return False
+
+        if _stamp_matches(out_dir, fingerprint):
+            self.stats.hits += 1
+            perf.count("render_cache.hits")
+            return True
+
+        if self.index_path is not None:
+            index = self._load_index()
+            cached_dir = index.get(fingerprint)
+            if cached_dir:
+                src_dir = Path(cached_dir)
+                if src_dir.resolve() != out_dir.resolve() and _stamp_matches(src_dir, fingerprint):
+                    if self._link_from(src_dir, out_dir):
+                        self.stats.links += 1
+                        perf.count("render_cache.links")
+                        return True
+                # Stale entry: the directory moved or was re-rendered
+                del index[fingerprint]
+                self._dirty = True
+
+        return False
+
+    def record(
+        self,
+        out_dir: Path,
+        fingerprint: str,
+        files: Optional[Sequence[str]] = None,
+    ) -> None:
+        """Stamp out_dir with the fingerprint after rendering into it.
+
+        Args:
+            out_dir: Directory that was rendered into.
+            fingerprint: Fingerprint of the render inputs.
+            files: Relative paths of the cached outputs (default: every file
+                in out_dir). Missing files are ignored.
+        """
+        if files is None:
+            outputs = _list_outputs(out_dir)
+        else:
+            outputs = [f for f in files if (out_dir / f).is_file()]
+        stamp = {
+            "fingerprint": fingerprint,
+            "renderer": renderer_version(),
+            "files": outputs,
+        }
+        atomic_write_text(out_dir / STAMP_FILENAME, json.dumps(stamp, indent=2))
+        if self.index_path is not None:
+            self._load_index()[fingerprint] = str(out_dir.resolve())
+            self._dirty = True
+
+    def render(
+        self,
+        out_dir: Path,
+        fingerprint: str,
+        render_fn: Callable[[], None],
+        files: Optional[Sequence[str]] = None,
+    ) -> bool:
+        """Run render_fn unless out_dir can be served from the cache.
+
+        Args:
+            out_dir: Directory render_fn writes into.
+            fingerprint: Fingerprint of the render inputs.
+            render_fn: Callable that produces the outputs.
+            files: Relative paths render_fn produces (default: every file in
+                out_dir after rendering). If any of them is missing afterwards
+                the render is treated as failed and not recorded, so the next
+                run renders again.
+
+        Returns:
+            True if rendering was skipped (cache hit or link).
+        """
+        if self.lookup(out_dir, fingerprint):
+            return True
+        self.stats.misses += 1
+        perf.count("render_cache.misses")
+        out_dir.mkdir(parents=True, exist_ok=True)
+        # Drop a stale stamp first so a failed render never looks fresh
+        (out_dir / STAMP_FILENAME).unlink(missing_ok=True)
+        render_fn()
+        if files is not None and not all((out_dir / f).is_file() for f in files):
+            # A renderer failed (and swallowed its error); don't stamp a partial render
+            return False
+        self.record(out_dir, fingerprint, files)
+        return False
+
+    def flush(self) -> None:
+        """Persist the fingerprint index to disk."""
+        if self.index_path is None or not self._dirty or self._index is None:
+            return
+        atomic_write_text(self.index_path, json.dumps(self._index, indent=2, sort_keys=True))
+        self._dirty = False
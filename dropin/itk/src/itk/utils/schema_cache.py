@@ -0,0 +1,102 @@
+"""Process-wide caches for JSON schemas and parsed files.
+
+Loading a case used to locate, read and parse the schema and build a new
+`Draft202012Validator` every time. Soak runs load the same case once per
+iteration, so that work dominated dev-fixture soaks. This module keeps:
+
+- compiled validators, keyed by schema path
+- parsed file contents (see `cached_parse`), keyed by file path
+
+Every entry is stamped with the file's mtime and size and is rebuilt when
+either changes, so edits made during a run are still picked up. Both caches
+are safe to use from several threads.
+"""
+from __future__ import annotations
+
+import json
+import os
+import threading
+from pathlib import Path
+from typing import Any, Callable, Optional, TypeVar
+
+T = TypeVar("T")
+
+# (mtime_ns, size) of a file
+FileStamp = tuple[int, int]
+
+_lock = threading.Lock()
+_validators: dict[Path, tuple[FileStamp, Any]] = {}
+_parsed: dict[tuple[Path, str], tuple[Any, Any]] = {}
+
+
+def file_stamp(path: Path) -> FileStamp:
+    """Return a cheap change stamp for a file.
+
+    Raises:
+        FileNotFoundError: If the file does not exist.
+    """
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def compiled_validator(schema_path: Path) -> Any:
+    """Return a `Draft202012Validator` for a schema file, reusing it while unchanged.
+
+    Raises:
+        FileNotFoundError: If the schema file does not exist.
+        ImportError: If jsonschema is not installed.
+    """
+    from jsonschema import Draft202012Validator
+
+    key = Path(os.path.abspath(schema_path))
+    stamp = file_stamp(key)
+    with _lock:
+        cached = _validators.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    validator = Draft202012Validator(json.loads(key.read_text(encoding="utf-8")))
+    with _lock:
+        _validators[key] = (stamp, validator)
+    return validator
+
+
+def cached_parse(
+    path: Path,
+    parse: Callable[[Path], T],
+    *,
+    kind: str = "",
+    depends_on: Optional[Path] = None,
+) -> T:
+    """Parse a file once and reuse the result while the file is unchanged.
+
+    The result is shared between callers and must be treated as read-only.
+    Exceptions from `parse` are not cached.
+
+    Args:
+        path: File to parse.
+        parse: Function turning the path into a result.
+        kind: Distinguishes different parses of the same file.
+        depends_on: Another file (e.g. a schema) whose changes also
+            invalidate the entry.
+    """
+    key = (Path(os.path.abspath(path)), kind)
+    stamp: tuple[Any, ...] = (file_stamp(key[0]),)
+    if depends_on is not None:
+        stamp += (file_stamp(depends_on),)
+    with _lock:
+        cached = _parsed.get(key)
+    if cached is not None and cached[0] == stamp:
+        return cached[1]
+
+    result = parse(path)
+    with _lock:
+        _parsed[key] = (stamp, result)
+    return result
+
+
+def clear_caches() -> None:
+    """Drop all cached validators and parsed files."""
+    with _lock:
+        _validators.clear()
+        _parsed.clear()
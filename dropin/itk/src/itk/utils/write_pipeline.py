@@ -0,0 +1,250 @@
+"""Concurrent artifact write pipeline.
+
+Artifact generation is dominated by two kinds of work:
+- CPU-bound HTML/SVG rendering (trace viewer, timeline, run report)
+- Many small file writes (spans.jsonl, per-span payload JSON files)
+
+`WritePipeline` overlaps the two. File writes go through a bounded thread
+pool; renders can optionally be farmed out to a process pool. Every file is
+written atomically (temp file in the same directory, then `os.replace`) so an
+interrupted run never leaves a truncated HTML file behind.
+
+Small payload files can optionally be packed into a single zip archive
+instead of one file per payload.
+"""
+from __future__ import annotations
+
+import os
+import tempfile
+import zipfile
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional, TextIO
+
+from itk import perf
+
+# Default number of I/O threads. File writes release the GIL, so a handful
+# of threads is enough to saturate a local disk.
+DEFAULT_IO_WORKERS = 4
+
+
+def _current_umask() -> int:
+    mask = os.umask(0)
+    os.umask(mask)
+    return mask
+
+
+# Mode for written files. mkstemp creates 0600 temp files and os.replace keeps
+# that mode, so temp files are widened to what open() would have produced.
+_FILE_MODE = 0o666 & ~_current_umask()
+
+
+def _mkstemp_for(path: Path) -> tuple[int, str]:
+    """Create the temp file that will replace `path`, with normal file permissions."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(prefix=f".{path.name}.", suffix=".tmp", dir=path.parent)
+    try:
+        if hasattr(os, "fchmod"):
+            os.fchmod(fd, _FILE_MODE)
+        else:
+            os.chmod(tmp_name, _FILE_MODE)
+    except BaseException:
+        os.close(fd)
+        os.unlink(tmp_name)
+        raise
+    return fd, tmp_name
+
+
+def _count_write(path: Path, size: Optional[int] = None) -> None:
+    """Count a completed write; the file is only stat'ed while profiling."""
+    if perf.active() is None:
+        return
+    perf.count("write.files")
+    perf.count("write.bytes", os.path.getsize(path) if size is None else size)
+
+
+def atomic_write_bytes(path: Path, data: bytes) -> None:
+    """Write bytes to a file atomically.
+
+    Data is written to a temp file in the destination directory and then
+    renamed over the target, so readers see either the old file or the
+    complete new one.
+    """
+    fd, tmp_name = _mkstemp_for(path)
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _count_write(path, len(data))
+
+
+def atomic_write_text(path: Path, text: str, encoding: str = "utf-8") -> None:
+    """Write text to a file atomically (see `atomic_write_bytes`)."""
+    atomic_write_bytes(path, text.encode(encoding))
+
+
+@contextmanager
+def atomic_open(path: Path, encoding: str = "utf-8") -> Iterator[TextIO]:
+    """Open a text file for incremental, atomic writing.
+
+    The handle writes to a temp file in the destination directory, which
+    replaces `path` only if the block exits without an exception.
+    """
+    fd, tmp_name = _mkstemp_for(path)
+    try:
+        with os.fdopen(fd, "w", encoding=encoding, newline="") as f:
+            yield f
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _count_write(path)
+
+
+def write_zip_archive(path: Path, members: dict[str, str]) -> None:
+    """Atomically write a zip archive of text members.
+
+    Args:
+        path: Destination archive path.
+        members: Mapping of archive member name to text content.
+    """
+    fd, tmp_name = _mkstemp_for(path)
+    os.close(fd)
+    try:
+        with zipfile.ZipFile(tmp_name, "w", compression=zipfile.ZIP_DEFLATED) as zf:
+            for name, content in members.items():
+                zf.writestr(name, content.encode("utf-8"))
+        os.replace(tmp_name, path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    _count_write(path)
+
+
+def _render_to_file(path: Path, render_fn: Callable[..., str], args: tuple, kwargs: dict) -> None:
+    """Run a render function and atomically write its output (process pool entry point)."""
+    atomic_write_text(path, render_fn(*args, **kwargs))
+
+
+def _stream_to_file(path: Path, stream_fn: Callable[..., None], args: tuple, kwargs: dict) -> None:
+    """Run a streaming renderer straight into `path` (pool entry point)."""
+    from itk.utils.html_stream import stream_to_file
+
+    stream_to_file(path, stream_fn, *args, **kwargs)
+
+
+class WritePipeline:
+    """Bounded pool for rendering and writing artifact files.
+
+    Use as a context manager; leaving the block waits for every pending
+    write and re-raises the first failure.
+
+    Example:
+        with WritePipeline(io_workers=4) as pipe:
+            pipe.write_text(out_dir / "sequence.mmd", mermaid)
+            pipe.render(out_dir / "trace-viewer.html", render_trace_viewer, trace)
+    """
+
+    def __init__(
+        self,
+        io_workers: int = DEFAULT_IO_WORKERS,
+        render_workers: int = 0,
+    ) -> None:
+        """Initialize the pipeline.
+
+        Args:
+            io_workers: Threads used for file writes. 0 writes synchronously.
+            render_workers: Processes used for renders. 0 renders in the
+                calling thread (render functions and their arguments must be
+                picklable when > 0).
+        """
+        self._io_pool: Optional[Executor] = (
+            ThreadPoolExecutor(max_workers=io_workers, thread_name_prefix="itk-write")
+            if io_workers > 0
+            else None
+        )
+        self._render_pool: Optional[Executor] = (
+            ProcessPoolExecutor(max_workers=render_workers) if render_workers > 0 else None
+        )
+        self._futures: list[Future] = []
+
+    def __enter__(self) -> "WritePipeline":
+        return self
+
+    def __exit__(self, exc_type: Any, exc: Any, tb: Any) -> None:
+        self.close(wait=exc_type is None)
+
+    def _submit_io(self, fn: Callable[..., None], *args: Any) -> None:
+        if self._io_pool is None:
+            fn(*args)
+        else:
+            self._futures.append(self._io_pool.submit(fn, *args))
+
+    def write_text(self, path: Path, text: str) -> None:
+        """Queue an atomic text write."""
+        self._submit_io(atomic_write_text, path, text)
+
+    def write_archive(self, path: Path, members: dict[str, str]) -> None:
+        """Queue an atomic zip archive write."""
+        self._submit_io(write_zip_archive, path, members)
+
+    def render(self, path: Path, render_fn: Callable[..., str], *args: Any, **kwargs: Any) -> None:
+        """Render content with `render_fn(*args, **kwargs)` and write it to `path`.
+
+        With a render pool, both rendering and the write happen in a worker
+        process so the large output string never crosses the process boundary.
+        """
+        if self._render_pool is None:
+            self.write_text(path, render_fn(*args, **kwargs))
+            return
+        self._futures.append(
+            self._render_pool.submit(_render_to_file, path, render_fn, args, kwargs)
+        )
+
+    def stream(self, path: Path, stream_fn: Callable[..., None], *args: Any, **kwargs: Any) -> None:
+        """Run a streaming renderer (`stream_fn(out, *args, **kwargs)`) into `path`.
+
+        Unlike `render`, the document is never held in memory as a whole.
+        It is produced in a worker process when a render pool is configured,
+        otherwise on an I/O thread.
+        """
+        pool = self._render_pool or self._io_pool
+        if pool is None:
+            _stream_to_file(path, stream_fn, args, kwargs)
+        else:
+            self._futures.append(pool.submit(_stream_to_file, path, stream_fn, args, kwargs))
+
+    def wait(self) -> None:
+        """Wait for all queued work and raise the first error, if any."""
+        pending, self._futures = self._futures, []
+        first_error: Optional[BaseException] = None
+        for future in pending:
+            error = future.exception()
+            if error is not None and first_error is None:
+                first_error = error
+        if first_error is not None:
+            raise first_error
+
+    def close(self, wait: bool = True) -> None:
+        """Shut down worker pools, optionally waiting for pending work."""
+        try:
+            if wait:
+                self.wait()
+        finally:
+            if self._render_pool is not None:
+                self._render_pool.shutdown(wait=True)
+            if self._io_pool is not None:
+                self._io_pool.shutdown(wait=True)
@@ -1,7 +1,6 @@
 """Schema validation for ITK case files and fixture JSONL."""
 from __future__ import annotations
 
-import json
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -9,6 +8,8 @@ from typing import Any
 import jsonschema
 import yaml
 
+from itk.utils.schema_cache import compiled_validator
+
 
 @dataclass
 class ValidationError:
@@ -26,6 +27,7 @@ class ValidationResult:
     valid: bool
     errors: list[ValidationError] = field(default_factory=list)
     file_path: str = ""
+    truncated: bool = False  # Stopped early after max_errors
     
     def summary(self) -> str:
         """Return a human-readable summary."""
@@ -37,6 +39,8 @@ class ValidationResult:
                 lines.append(f"  Line {err.line_number}: {err.path} - {err.message}")
             else:
                 lines.append(f"  {err.path} - {err.message}")
+        if self.truncated:
+            lines.append(f"  (stopped after {len(self.errors)} errors)")
         return "\n".join(lines)
 
 
@@ -46,12 +50,12 @@ def _get_schema_dir() -> Path:
     return Path(__file__).parent.parent.parent.parent / "schemas"
 
 
-def _load_schema(schema_name: str) -> dict[str, Any]:
-    """Load a JSON schema by name."""
+def _get_validator(schema_name: str) -> jsonschema.Draft202012Validator:
+    """Return the cached compiled validator for a schema by name."""
     schema_path = _get_schema_dir() / schema_name
     if not schema_path.exists():
         raise FileNotFoundError(f"Schema not found: {schema_path}")
-    return json.loads(schema_path.read_text(encoding="utf-8"))
+    return compiled_validator(schema_path)
 
 
 def _format_path(path: list[Any]) -> str:
@@ -102,7 +106,7 @@ def validate_case(case_path: str | Path) -> ValidationResult:
     
     # Load schema
     try:
-        schema = _load_schema("itk.case.schema.json")
+        validator = _get_validator("itk.case.schema.json")
     except FileNotFoundError as e:
         result.valid = False
         result.errors.append(ValidationError(
@@ -112,7 +116,6 @@ def validate_case(case_path: str | Path) -> ValidationResult:
         return result
     
     # Validate against schema
-    validator = jsonschema.Draft202012Validator(schema)
     errors = list(validator.iter_errors(case_data))
     
     if errors:
@@ -126,93 +129,28 @@ def validate_case(case_path: str | Path) -> ValidationResult:
     return result
 
 
-def validate_fixture(fixture_path: str | Path) -> ValidationResult:
+def validate_fixture(
+    fixture_path: str | Path,
+    *,
+    workers: int = 1,
+    max_errors: int | None = None,
+) -> ValidationResult:
     """Validate a fixture JSONL file against itk.span.schema.json.
     
-    Each line is validated as a separate span.
+    Each line is validated as a separate span. The file is streamed in
+    chunks rather than read whole (see `itk.validation.streaming`).
     
     Args:
         fixture_path: Path to the fixture JSONL file.
+        workers: Worker processes for large files (1 = in-process).
+        max_errors: Stop after this many errors (default: report all).
         
     Returns:
         ValidationResult with any errors found.
     """
-    fixture_path = Path(fixture_path)
-    result = ValidationResult(valid=True, file_path=str(fixture_path))
-    
-    # Check file exists
-    if not fixture_path.exists():
-        result.valid = False
-        result.errors.append(ValidationError(
-            path="$",
-            message=f"File not found: {fixture_path}"
-        ))
-        return result
-    
-    # Load schema
-    try:
-        schema = _load_schema("itk.span.schema.json")
-    except FileNotFoundError as e:
-        result.valid = False
-        result.errors.append(ValidationError(
-            path="$",
-            message=str(e)
-        ))
-        return result
-    
-    validator = jsonschema.Draft202012Validator(schema)
-    
-    # Read and validate each line
-    try:
-        content = fixture_path.read_text(encoding="utf-8")
-    except Exception as e:
-        result.valid = False
-        result.errors.append(ValidationError(
-            path="$",
-            message=f"Cannot read file: {e}"
-        ))
-        return result
-    
-    lines = content.strip().split("\n") if content.strip() else []
-    
-    if not lines:
-        result.valid = False
-        result.errors.append(ValidationError(
-            path="$",
-            message="Fixture file is empty",
-            line_number=0
-        ))
-        return result
-    
-    for line_num, line in enumerate(lines, start=1):
-        line = line.strip()
-        if not line:
-            continue
-            
-        # Parse JSON
-        try:
-            span_data = json.loads(line)
-        except json.JSONDecodeError as e:
-            result.valid = False
-            result.errors.append(ValidationError(
-                path="$",
-                message=f"Invalid JSON: {e}",
-                line_number=line_num
-            ))
-            continue
-        
-        # Validate span against schema
-        errors = list(validator.iter_errors(span_data))
-        if errors:
-            result.valid = False
-            for err in errors:
-                result.errors.append(ValidationError(
-                    path=_format_path(list(err.absolute_path)),
-                    message=err.message,
-                    line_number=line_num
-                ))
-    
-    return result
+    from itk.validation.streaming import validate_fixture_stream
+
+    return validate_fixture_stream(fixture_path, workers=workers, max_errors=max_errors)
 
 
 def validate_span_dict(span: dict[str, Any]) -> ValidationResult:
@@ -229,13 +167,12 @@ def validate_span_dict(span: dict[str, Any]) -> ValidationResult:
     result = ValidationResult(valid=True, file_path="<dict>")
     
     try:
-        schema = _load_schema("itk.span.schema.json")
+        validator = _get_validator("itk.span.schema.json")
     except FileNotFoundError as e:
         result.valid = False
         result.errors.append(ValidationError(path="$", message=str(e)))
         return result
     
-    validator = jsonschema.Draft202012Validator(schema)
     errors = list(validator.iter_errors(span))
     
     if errors:
@@ -263,13 +200,12 @@ def validate_case_dict(case: dict[str, Any]) -> ValidationResult:
     result = ValidationResult(valid=True, file_path="<dict>")
     
     try:
-        schema = _load_schema("itk.case.schema.json")
+        validator = _get_validator("itk.case.schema.json")
     except FileNotFoundError as e:
         result.valid = False
         result.errors.append(ValidationError(path="$", message=str(e)))
         return result
     
-    validator = jsonschema.Draft202012Validator(schema)
     errors = list(validator.iter_errors(case))
     
     if errors:
@@ -0,0 +1,334 @@
+"""Streaming, chunk-parallel validation of fixture JSONL.
+
+`validate_fixture` used to read the whole file into memory and run every line
+through jsonschema. Fixture exports can be several GB, so this module:
+
+- splits the file into byte ranges aligned to line boundaries (the main
+  process only seeks, it never reads the whole file)
+- validates each range in a worker process, reading it straight from disk
+- checks each span with a fast path compiled from the span schema (required
+  fields, property types, minimums) and only runs jsonschema for lines that
+  fail it, so error messages are unchanged
+- merges results in file order and can stop early after N errors
+
+Small files are validated in-process without starting a pool.
+"""
+from __future__ import annotations
+
+import json
+import os
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator, Optional
+
+from itk.utils.schema_cache import compiled_validator
+from itk.validation import ValidationError, ValidationResult, _format_path, _get_schema_dir
+
+SPAN_SCHEMA = "itk.span.schema.json"
+
+# Target size of one validation chunk
+DEFAULT_CHUNK_BYTES = 8 * 1024 * 1024
+
+# Keywords the fast path ignores because they never reject an instance
+_ANNOTATIONS = frozenset(
+    {"$schema", "$id", "title", "description", "format", "examples", "default", "$comment"}
+)
+
+# json.loads only produces these exact types, so membership tests are exact.
+# Floats like 1.0 are valid integers in JSON Schema; those fall back to jsonschema.
+_JSON_TYPES: dict[str, tuple[type, ...]] = {
+    "object": (dict,),
+    "array": (list,),
+    "string": (str,),
+    "null": (type(None),),
+    "boolean": (bool,),
+    "integer": (int,),
+    "number": (int, float),
+}
+
+# (local line number, path, message)
+LineError = tuple[int, str, str]
+
+
+class FastCheck:
+    """Conservative compiled form of a simple JSON schema.
+
+    `accepts` returns True only for instances the schema accepts. False means
+    "not sure": the caller must ask jsonschema.
+    """
+
+    __slots__ = ("types", "required", "properties", "minimum")
+
+    def __init__(
+        self,
+        types: Optional[frozenset[type]] = None,
+        required: tuple[str, ...] = (),
+        properties: Optional[dict[str, "FastCheck"]] = None,
+        minimum: Optional[float] = None,
+    ) -> None:
+        self.types = types
+        self.required = required
+        self.properties = properties or {}
+        self.minimum = minimum
+
+    def accepts(self, value: Any) -> bool:
+        """Whether the value certainly satisfies the schema."""
+        kind = type(value)
+        if self.types is not None and kind not in self.types:
+            return False
+        if kind is dict:
+            for key in self.required:
+                if key not in value:
+                    return False
+            properties = self.properties
+            if properties:
+                for key, item in value.items():
+                    sub = properties.get(key)
+                    if sub is not None and not sub.accepts(item):
+                        return False
+        elif self.minimum is not None and (kind is int or kind is float) and value < self.minimum:
+            return False
+        return True
+
+
+def compile_fast_check(schema: dict[str, Any]) -> Optional[FastCheck]:
+    """Compile a schema into a `FastCheck`.
+
+    Only `type`, `required`, `properties`, `minimum` and a permissive
+    `additionalProperties` are supported.
+
+    Returns:
+        The check, or None if the schema uses anything else.
+    """
+    check = FastCheck()
+    for key, value in schema.items():
+        if key in _ANNOTATIONS:
+            continue
+        if key == "type":
+            names = [value] if isinstance(value, str) else list(value)
+            if any(name not in _JSON_TYPES for name in names):
+                return None
+            check.types = frozenset(t for name in names for t in _JSON_TYPES[name])
+        elif key == "required":
+            check.required = tuple(value)
+        elif key == "properties":
+            for name, subschema in value.items():
+                sub = compile_fast_check(subschema)
+                if sub is None:
+                    return None
+                check.properties[name] = sub
+        elif key == "minimum":
+            check.minimum = value
+        elif key == "additionalProperties":
+            if value is not True:
+                return None
+        else:
+            return None
+    return check
+
+
+class SpanLineChecker:
+    """Validate JSONL lines against a schema, fast path first."""
+
+    def __init__(self, schema_path: Path) -> None:
+        self.validator = compiled_validator(schema_path)
+        self.fast_check = compile_fast_check(self.validator.schema)
+
+    def check_line(self, line: bytes) -> list[tuple[str, str]]:
+        """Return (path, message) errors for one non-blank line."""
+        try:
+            span = json.loads(line)
+        except ValueError as e:  # JSONDecodeError or bad UTF-8
+            return [("$", f"Invalid JSON: {e}")]
+        if self.fast_check is not None and self.fast_check.accepts(span):
+            return []
+        return [
+            (_format_path(list(err.absolute_path)), err.message)
+            for err in self.validator.iter_errors(span)
+        ]
+
+    def check_chunk(
+        self, path: Path, start: int, end: int, max_errors: Optional[int] = None
+    ) -> tuple[int, int, list[LineError]]:
+        """Validate the lines in byte range [start, end) of a file.
+
+        Returns:
+            (line count, non-blank line count, errors with 1-based line
+            numbers relative to the chunk).
+        """
+        with open(path, "rb") as f:
+            f.seek(start)
+            data = f.read(end - start)
+        lines = data.split(b"\n")
+        if lines and not lines[-1]:
+            lines.pop()
+
+        errors: list[LineError] = []
+        non_blank = 0
+        for number, line in enumerate(lines, start=1):
+            line = line.strip()
+            if not line:
+                continue
+            non_blank += 1
+            for err_path, message in self.check_line(line):
+                errors.append((number, err_path, message))
+            if max_errors is not None and len(errors) >= max_errors:
+                break
+        return len(lines), non_blank, errors
+
+
+def iter_chunks(path: Path, chunk_bytes: int = DEFAULT_CHUNK_BYTES) -> Iterator[tuple[int, int]]:
+    """Yield (start, end) byte ranges of roughly chunk_bytes ending on line breaks."""
+    size = os.path.getsize(path)
+    with open(path, "rb") as f:
+        start = 0
+        while start < size:
+            end = min(start + max(chunk_bytes, 1), size)
+            if end < size:
+                f.seek(end)
+                f.readline()
+                end = f.tell()
+            yield start, end
+            start = end
+
+
+# Per-process checker for pool workers
+_worker_checker: Optional[SpanLineChecker] = None
+
+
+def _init_worker(schema_path: str) -> None:
+    global _worker_checker
+    _worker_checker = SpanLineChecker(Path(schema_path))
+
+
+def _check_chunk_in_worker(
+    path: str, start: int, end: int, max_errors: Optional[int]
+) -> tuple[int, int, list[LineError]]:
+    assert _worker_checker is not None
+    return _worker_checker.check_chunk(Path(path), start, end, max_errors)
+
+
+def validate_fixture_stream(
+    fixture_path: str | Path,
+    *,
+    workers: Optional[int] = None,
+    max_errors: Optional[int] = None,
+    chunk_bytes: int = DEFAULT_CHUNK_BYTES,
+) -> ValidationResult:
+    """Validate a fixture JSONL file against itk.span.schema.json.
+
+    Args:
+        fixture_path: Path to the fixture JSONL file.
+        workers: Worker processes (default: CPU count). Files that fit in one
+            chunk, or workers <= 1, are validated in-process.
+        max_errors: Stop after this many errors (default: report all).
+        chunk_bytes: Target bytes per chunk handed to a worker.
+
+    Returns:
+        ValidationResult with errors in file order. `truncated` is set when
+        validation stopped early.
+    """
+    fixture_path = Path(fixture_path)
+    result = ValidationResult(valid=True, file_path=str(fixture_path))
+
+    if not fixture_path.exists():
+        result.valid = False
+        result.errors.append(ValidationError(path="$", message=f"File not found: {fixture_path}"))
+        return result
+
+    schema_path = _get_schema_dir() / SPAN_SCHEMA
+    if not schema_path.exists():
+        result.valid = False
+        result.errors.append(ValidationError(path="$", message=f"Schema not found: {schema_path}"))
+        return result
+
+    try:
+        chunks = iter_chunks(fixture_path, chunk_bytes)
+        first = next(chunks, None)
+        second = next(chunks, None)
+    except OSError as e:
+        result.valid = False
+        result.errors.append(ValidationError(path="$", message=f"Cannot read file: {e}"))
+        return result
+
+    if workers is None:
+        workers = os.cpu_count() or 1
+    pending_chunks = [c for c in (first, second) if c is not None]
+    if second is None or workers <= 1:
+        checker = SpanLineChecker(schema_path)
+        outcomes: Iterator[tuple[int, int, list[LineError]]] = (
+            checker.check_chunk(fixture_path, start, end, max_errors)
+            for start, end in _chain(pending_chunks, chunks)
+        )
+        non_blank = _collect(result, outcomes, max_errors)
+    else:
+        with ProcessPoolExecutor(
+            max_workers=workers, initializer=_init_worker, initargs=(str(schema_path),)
+        ) as pool:
+            outcomes = _ordered_results(
+                pool, str(fixture_path), _chain(pending_chunks, chunks), workers * 2, max_errors
+            )
+            non_blank = _collect(result, outcomes, max_errors)
+
+    if non_blank == 0 and not result.errors:
+        result.valid = False
+        result.errors.append(
+            ValidationError(path="$", message="Fixture file is empty", line_number=0)
+        )
+    return result
+
+
+def _chain(head: list[tuple[int, int]], rest: Iterator[tuple[int, int]]) -> Iterator[tuple[int, int]]:
+    yield from head
+    yield from rest
+
+
+def _ordered_results(
+    pool: ProcessPoolExecutor,
+    path: str,
+    chunks: Iterator[tuple[int, int]],
+    max_in_flight: int,
+    max_errors: Optional[int],
+) -> Iterator[tuple[int, int, list[LineError]]]:
+    """Run chunks on the pool, keeping a bounded window, yielding in file order."""
+    window: deque[Future[tuple[int, int, list[LineError]]]] = deque()
+    try:
+        for start, end in chunks:
+            window.append(pool.submit(_check_chunk_in_worker, path, start, end, max_errors))
+            if len(window) >= max_in_flight:
+                yield window.popleft().result()
+        while window:
+            yield window.popleft().result()
+    finally:
+        # Reached when the consumer stops early
+        for future in window:
+            future.cancel()
+
+
+def _collect(
+    result: ValidationResult,
+    outcomes: Iterator[tuple[int, int, list[LineError]]],
+    max_errors: Optional[int],
+) -> int:
+    """Merge chunk outcomes into result; returns the number of non-blank lines."""
+    line_offset = 0
+    non_blank = 0
+    for line_count, chunk_non_blank, errors in outcomes:
+        non_blank += chunk_non_blank
+        for number, err_path, message in errors:
+            if max_errors is not None and len(result.errors) >= max_errors:
+                break
+            result.errors.append(
+                ValidationError(path=err_path, message=message, line_number=line_offset + number)
+            )
+        line_offset += line_count
+        if max_errors is not None and len(result.errors) >= max_errors:
+            result.truncated = True
+            break
+    if result.errors:
+        result.valid = False
+    close = getattr(outcomes, "close", None)
+    if close is not None:
+        close()
+    return non_blank
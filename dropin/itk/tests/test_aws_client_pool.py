@@ -0,0 +1,110 @@
+"""Tests for the shared boto3 client pool.
+
+Clients are real boto3 clients for a fixed region with dummy credentials;
+creating them makes no network calls.
+"""
+from __future__ import annotations
+
+import threading
+
+import pytest
+
+from itk.aws import ClientPool, get_client_pool
+from itk.aws.client_pool import DEFAULT_MAX_POOL_CONNECTIONS
+
+
+@pytest.fixture(autouse=True)
+def dummy_credentials(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Keep client creation independent of the developer's AWS setup."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    monkeypatch.delenv("AWS_PROFILE", raising=False)
+
+
+class TestClientPool:
+    """Tests for ClientPool."""
+
+    def test_same_key_returns_same_client(self) -> None:
+        pool = ClientPool()
+
+        first = pool.client("lambda", "us-east-1")
+        second = pool.client("lambda", "us-east-1")
+
+        assert first is second
+
+    def test_region_and_timeouts_are_part_of_key(self) -> None:
+        pool = ClientPool()
+
+        base = pool.client("logs", "us-east-1")
+
+        assert pool.client("logs", "us-west-2") is not base
+        assert pool.client("logs", "us-east-1", read_timeout=30) is not base
+        assert pool.client("lambda", "us-east-1") is not base
+
+    def test_client_config(self) -> None:
+        pool = ClientPool()
+
+        client = pool.client("bedrock-agent-runtime", "us-east-1", read_timeout=42, max_attempts=2)
+
+        config = client.meta.config
+        assert config.max_pool_connections == DEFAULT_MAX_POOL_CONNECTIONS
+        assert config.tcp_keepalive is True
+        assert config.read_timeout == 42
+        assert config.retries["total_max_attempts"] == 3  # first call + 2 retries
+
+    def test_stats_record_creation_and_reuse(self) -> None:
+        pool = ClientPool()
+
+        for _ in range(3):
+            pool.client("sqs", "us-east-1")
+        pool.client("logs", "us-east-1")
+
+        stats = pool.stats()
+        assert [(s.service, s.requests) for s in stats] == [("sqs", 3), ("logs", 1)]
+        assert stats[0].creation_ms > 0
+        assert stats[0].to_dict()["region"] == "us-east-1"
+
+    def test_concurrent_callers_share_one_client(self) -> None:
+        pool = ClientPool()
+        barrier = threading.Barrier(8)
+        clients: list[object] = []
+
+        def worker() -> None:
+            barrier.wait()
+            clients.append(pool.client("lambda", "us-east-1"))
+
+        threads = [threading.Thread(target=worker) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        assert len({id(c) for c in clients}) == 1
+        assert pool.stats()[0].requests == 8
+
+    def test_clear(self) -> None:
+        pool = ClientPool()
+        first = pool.client("lambda", "us-east-1")
+
+        pool.clear()
+
+        assert pool.stats() == []
+        assert pool.client("lambda", "us-east-1") is not first
+
+
+class TestCallSites:
+    """Adapters obtain clients from the process-wide pool."""
+
+    def test_adapters_share_pooled_lambda_client(self) -> None:
+        from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+        from itk.entrypoints.sqs_event import SqsEventAdapter, SqsEventTarget
+
+        lambda_adapter = LambdaDirectAdapter(
+            LambdaTarget(function_name_or_arn="fn", region="eu-central-1")
+        )
+        sqs_adapter = SqsEventAdapter(
+            SqsEventTarget(mode="invoke_lambda", target_arn_or_url="fn", region="eu-central-1")
+        )
+
+        assert lambda_adapter._get_client() is sqs_adapter._get_lambda_client()
+        assert get_client_pool().client("lambda", "eu-central-1") is lambda_adapter._get_client()
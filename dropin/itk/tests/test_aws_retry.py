@@ -0,0 +1,334 @@
+"""Tests for the backoff-aware retry engine used by live adapters."""
+from __future__ import annotations
+
+import random
+from typing import Any
+from unittest.mock import MagicMock
+
+import pytest
+from botocore.exceptions import ClientError, ReadTimeoutError
+
+from itk.aws.retry import (
+    ErrorClass,
+    RetryBudget,
+    RetryEngine,
+    RetryPolicy,
+    classify_error,
+)
+from itk.soak import ThrottleType
+
+
+def _client_error(code: str, status: int = 400, retry_attempts: int = 0) -> ClientError:
+    return ClientError(
+        {
+            "Error": {"Code": code, "Message": code},
+            "ResponseMetadata": {"HTTPStatusCode": status, "RetryAttempts": retry_attempts},
+        },
+        "Invoke",
+    )
+
+
+class Flaky:
+    """Callable that raises the given errors, then returns a response."""
+
+    def __init__(self, *errors: Exception) -> None:
+        self.errors = list(errors)
+        self.calls = 0
+
+    def __call__(self, **kwargs: Any) -> dict[str, Any]:
+        self.calls += 1
+        if self.errors:
+            raise self.errors.pop(0)
+        return {"ok": True, "ResponseMetadata": {"RetryAttempts": 1}}
+
+
+def _engine(budget: RetryBudget | None = None, **policy: Any) -> tuple[RetryEngine, list[float]]:
+    sleeps: list[float] = []
+    engine = RetryEngine(RetryPolicy(**policy), budget, sleep=sleeps.append, rng=random.Random(7))
+    return engine, sleeps
+
+
+class TestClassifyError:
+    """Tests for classify_error."""
+
+    @pytest.mark.parametrize(
+        ("error", "error_class", "throttle_type"),
+        [
+            (_client_error("ThrottlingException"), ErrorClass.THROTTLE, ThrottleType.AWS_THROTTLE),
+            (_client_error("throttlingException"), ErrorClass.THROTTLE, ThrottleType.AWS_THROTTLE),
+            (_client_error("TooManyRequestsException", 429), ErrorClass.THROTTLE, ThrottleType.RATE_LIMIT),
+            (_client_error("Whatever", 429), ErrorClass.THROTTLE, ThrottleType.HTTP_429),
+            (_client_error("InternalServerException", 500), ErrorClass.TRANSIENT, None),
+            (_client_error("SomethingNew", 503), ErrorClass.TRANSIENT, None),
+            (_client_error("AccessDeniedException", 403), ErrorClass.FATAL, None),
+            (_client_error("ResourceNotFoundException", 404), ErrorClass.FATAL, None),
+            (ReadTimeoutError(endpoint_url="https://x"), ErrorClass.TRANSIENT, ThrottleType.TIMEOUT),
+            (RuntimeError("Rate exceeded"), ErrorClass.THROTTLE, ThrottleType.RATE_LIMIT),
+            (ValueError("bad payload"), ErrorClass.FATAL, None),
+        ],
+    )
+    def test_classification(
+        self, error: Exception, error_class: ErrorClass, throttle_type: ThrottleType | None
+    ) -> None:
+        result = classify_error(error)
+
+        assert result.error_class is error_class
+        assert result.throttle_type is throttle_type
+
+    def test_wrapped_errors_use_cause(self) -> None:
+        from itk.entrypoints.bedrock_agent import AgentCredentialsError, AgentTimeoutError
+
+        try:
+            raise AgentTimeoutError("timed out", 60) from ReadTimeoutError(endpoint_url="x")
+        except AgentTimeoutError as e:
+            timeout = e
+        try:
+            raise AgentCredentialsError("expired", "aws sso login") from _client_error(
+                "ExpiredTokenException"
+            )
+        except AgentCredentialsError as e:
+            expired = e
+
+        assert classify_error(timeout).error_class is ErrorClass.TRANSIENT
+        assert classify_error(expired).error_class is ErrorClass.FATAL
+        assert classify_error(expired).code == "ExpiredTokenException"
+
+
+class TestRetryEngine:
+    """Tests for RetryEngine.call."""
+
+    def test_retries_throttle_then_succeeds(self) -> None:
+        engine, sleeps = _engine()
+        fn = Flaky(_client_error("ThrottlingException", retry_attempts=2))
+
+        result, telemetry = engine.call(fn, FunctionName="f")
+
+        assert result["ok"]
+        assert fn.calls == 2
+        assert telemetry.attempts == 2
+        assert telemetry.client_retries == 1
+        assert telemetry.sdk_retries == 3  # 2 inside the failed call, 1 inside the successful one
+        assert telemetry.retries[0].throttle_type is ThrottleType.AWS_THROTTLE
+        assert telemetry.throttled
+        assert len(sleeps) == 1
+
+    def test_fatal_errors_are_not_retried(self) -> None:
+        engine, sleeps = _engine()
+        fn = Flaky(_client_error("AccessDeniedException", 403))
+
+        with pytest.raises(ClientError) as excinfo:
+            engine.call(fn)
+
+        assert fn.calls == 1
+        assert sleeps == []
+        telemetry = excinfo.value.retry_telemetry
+        assert telemetry.final_error.error_class is ErrorClass.FATAL
+        assert telemetry.to_dict()["final_error"]["code"] == "AccessDeniedException"
+
+    def test_gives_up_after_max_attempts(self) -> None:
+        engine, sleeps = _engine(max_attempts=3)
+        fn = Flaky(*[_client_error("ThrottlingException") for _ in range(5)])
+
+        with pytest.raises(ClientError) as excinfo:
+            engine.call(fn)
+
+        assert fn.calls == 3
+        assert excinfo.value.retry_telemetry.client_retries == 2
+        assert len(sleeps) == 2
+
+    def test_transient_retries_can_be_disabled(self) -> None:
+        engine, _ = _engine(retry_transient=False)
+        fn = Flaky(_client_error("InternalServerException", 500))
+
+        with pytest.raises(ClientError):
+            engine.call(fn)
+
+        assert fn.calls == 1
+
+    def test_decorrelated_jitter_bounds(self) -> None:
+        policy = RetryPolicy(base_delay_seconds=0.1, max_delay_seconds=2.0)
+        rng = random.Random(1)
+        delay = policy.base_delay_seconds
+        for _ in range(50):
+            previous = delay
+            delay = policy.next_delay(previous, rng)
+            assert policy.base_delay_seconds <= delay <= min(2.0, previous * 3)
+
+    def test_budget_is_shared_across_calls(self) -> None:
+        budget = RetryBudget(max_retries=1)
+        engine, _ = _engine(budget)
+        other = engine.with_policy(RetryPolicy(max_attempts=5))
+
+        engine.call(Flaky(_client_error("ThrottlingException")))
+        with pytest.raises(ClientError) as excinfo:
+            other.call(Flaky(_client_error("ThrottlingException")))
+
+        assert budget.spent == 1
+        assert budget.remaining == 0
+        assert excinfo.value.retry_telemetry.budget_exhausted
+
+    def test_budget_refills_on_success(self) -> None:
+        budget = RetryBudget(max_retries=2, refill_per_success=0.5)
+        engine, _ = _engine(budget, max_attempts=5)
+
+        # A throttling burst drains the budget and the call fails
+        with pytest.raises(ClientError):
+            engine.call(Flaky(*[_client_error("ThrottlingException")] * 4))
+        assert budget.remaining == 0
+
+        for _ in range(4):
+            engine.call(Flaky())
+        assert budget.remaining == 2  # Capped at max_retries
+
+        response, telemetry = engine.call(Flaky(_client_error("ThrottlingException")))
+        assert response["ok"] and telemetry.client_retries == 1
+        assert budget.spent == 3
+
+    def test_timeout_retries_can_be_disabled(self) -> None:
+        engine, _ = _engine(retry_timeouts=False)
+        timeout = Flaky(ReadTimeoutError(endpoint_url="https://example"))
+
+        with pytest.raises(ReadTimeoutError):
+            engine.call(timeout)
+        assert timeout.calls == 1
+
+        # Other transient failures are still retried
+        response, _ = engine.call(Flaky(_client_error("InternalServerException", 500)))
+        assert response["ok"]
+
+    def test_marked_errors_are_not_retried(self) -> None:
+        from itk.aws.retry import mark_not_retryable
+
+        engine, _ = _engine()
+        flaky = Flaky(mark_not_retryable(_client_error("ThrottlingException")))
+
+        with pytest.raises(ClientError) as excinfo:
+            engine.call(flaky)
+
+        assert flaky.calls == 1
+        assert excinfo.value.retry_telemetry.final_error.error_class is ErrorClass.THROTTLE
+
+
+class TestAdapterRetries:
+    """Live adapters go through the retry engine."""
+
+    def test_lambda_invoke_retries_throttle(self) -> None:
+        from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+
+        engine, _ = _engine()
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="fn"), retry=engine)
+        client = MagicMock()
+        client.invoke.side_effect = [
+            _client_error("TooManyRequestsException", 429),
+            {"StatusCode": 200, "ResponseMetadata": {"RequestId": "req-1"}},
+        ]
+        adapter._client = client
+
+        response = adapter.invoke(payload={}, log_type="None")
+
+        assert response.request_id == "req-1"
+        assert client.invoke.call_count == 2
+        assert response.retry.client_retries == 1
+
+    def test_lambda_sync_invoke_does_not_resend_after_timeout(self) -> None:
+        from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+
+        engine, _ = _engine()
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="fn"), retry=engine)
+        client = MagicMock()
+        client.invoke.side_effect = ReadTimeoutError(endpoint_url="https://lambda")
+        adapter._client = client
+
+        with pytest.raises(ReadTimeoutError):
+            adapter.invoke(payload={}, log_type="None")
+
+        assert client.invoke.call_count == 1
+
+    def test_lambda_event_invoke_retries_timeout(self) -> None:
+        from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+
+        engine, _ = _engine()
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="fn"), retry=engine)
+        client = MagicMock()
+        client.invoke.side_effect = [
+            ReadTimeoutError(endpoint_url="https://lambda"),
+            {"StatusCode": 202, "ResponseMetadata": {"RequestId": "req-1"}},
+        ]
+        adapter._client = client
+
+        assert adapter.invoke_async(payload={}).status_code == 202
+        assert client.invoke.call_count == 2
+
+    def test_bedrock_invoke_with_retries_reports_attempts(self) -> None:
+        from itk.entrypoints.bedrock_agent import BedrockAgentAdapter, BedrockAgentTarget
+
+        engine, _ = _engine()
+        adapter = BedrockAgentAdapter(
+            BedrockAgentTarget(agent_id="AGENT", agent_alias_id="ALIAS"), retry=engine
+        )
+        client = MagicMock()
+        client.invoke_agent.side_effect = [
+            _client_error("throttlingException", 429),
+            _client_error("throttlingException", 429),
+            {"completion": iter([{"chunk": {"bytes": b"ok"}}])},
+        ]
+        adapter._client = client
+
+        response, attempts = adapter.invoke_with_retries("Hi", max_retries=3)
+
+        assert response.completion == "ok"
+        assert attempts == 3
+        assert engine.budget.spent == 2
+
+    def test_bedrock_invoke_does_not_resend_after_timeout(self) -> None:
+        from itk.entrypoints.bedrock_agent import AgentTimeoutError, BedrockAgentAdapter, BedrockAgentTarget
+
+        engine, _ = _engine()
+        adapter = BedrockAgentAdapter(
+            BedrockAgentTarget(agent_id="AGENT", agent_alias_id="ALIAS"), retry=engine
+        )
+        client = MagicMock()
+        client.invoke_agent.side_effect = ReadTimeoutError(endpoint_url="https://bedrock")
+        adapter._client = client
+
+        with pytest.raises(AgentTimeoutError):
+            adapter.invoke("Hi", session_id="s1")
+
+        assert client.invoke_agent.call_count == 1
+
+    def test_bedrock_timeout_retries_are_opt_in(self) -> None:
+        from itk.entrypoints.bedrock_agent import BedrockAgentAdapter, BedrockAgentTarget
+
+        engine, _ = _engine()
+        adapter = BedrockAgentAdapter(
+            BedrockAgentTarget(agent_id="AGENT", agent_alias_id="ALIAS"), retry=engine, retry_timeouts=True
+        )
+        client = MagicMock()
+        client.invoke_agent.side_effect = [
+            ReadTimeoutError(endpoint_url="https://bedrock"),
+            {"completion": iter([{"chunk": {"bytes": b"ok"}}])},
+        ]
+        adapter._client = client
+
+        assert adapter.invoke("Hi", session_id="s1").completion == "ok"
+        assert client.invoke_agent.call_count == 2
+
+    def test_bedrock_stream_errors_are_not_retried(self) -> None:
+        from itk.entrypoints.bedrock_agent import BedrockAgentAdapter, BedrockAgentTarget
+
+        def stream() -> Any:
+            yield {"trace": {"orchestrationTrace": {}}}
+            raise _client_error("throttlingException", 429)
+
+        engine, _ = _engine()
+        adapter = BedrockAgentAdapter(
+            BedrockAgentTarget(agent_id="AGENT", agent_alias_id="ALIAS"), retry=engine
+        )
+        client = MagicMock()
+        client.invoke_agent.return_value = {"completion": stream()}
+        adapter._client = client
+
+        with pytest.raises(ClientError):
+            adapter.invoke("Hi", session_id="s1")
+
+        assert client.invoke_agent.call_count == 1
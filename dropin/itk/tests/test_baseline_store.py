@@ -0,0 +1,201 @@
+"""Tests for the persistent baseline store."""
+from __future__ import annotations
+
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from itk.compare.baseline_store import BaselineStore, PathAggregator
+from itk.compare.compare import compare_to_baseline, compare_trace_sets
+from itk.trace.span_model import Span
+from itk.trace.trace_model import Trace
+from itk.utils.histogram import LatencyHistogram
+
+
+def _trace(latency_ms: float, component: str = "lambda:foo", error: bool = False) -> Trace:
+    end_s, end_ms = divmod(int(latency_ms), 1000)
+    return Trace(
+        spans=[
+            Span(
+                span_id="s1",
+                parent_span_id=None,
+                component=component,
+                operation="Invoke",
+                ts_start="2026-01-15T12:00:00.000Z",
+                ts_end=f"2026-01-15T12:00:{end_s:02d}.{end_ms:03d}Z",
+                error={"message": "boom"} if error else None,
+            )
+        ]
+    )
+
+
+class TestLatencyHistogramMerge:
+    """Tests for the sketch operations the store relies on."""
+
+    def test_merge_equals_combined(self) -> None:
+        a, b, both = LatencyHistogram(), LatencyHistogram(), LatencyHistogram()
+        for i in range(1000):
+            (a if i % 2 else b).record(i * 1.5)
+            both.record(i * 1.5)
+        a.merge(b)
+        assert a.to_state() == both.to_state()
+
+    def test_state_round_trip(self) -> None:
+        hist = LatencyHistogram()
+        for v in (1.0, 12.5, 480.0, 3000.0):
+            hist.record(v)
+        assert LatencyHistogram.from_state(hist.to_state()).to_dict() == hist.to_dict()
+
+    def test_ranked_view_sorted(self) -> None:
+        hist = LatencyHistogram()
+        values = [random.Random(1).uniform(10, 1000) for _ in range(200)]
+        for v in values:
+            hist.record(v)
+        ranked = hist.ranked()
+        assert len(ranked) == 200
+        assert list(ranked) == sorted(ranked)
+        assert ranked[0] == pytest.approx(min(values), rel=0.01)
+        assert ranked[-1] == pytest.approx(max(values), rel=0.01)
+
+
+class TestBaselineStore:
+    """Tests for BaselineStore."""
+
+    def test_record_and_load(self, tmp_path: Path) -> None:
+        with BaselineStore.open("nightly", root=tmp_path) as store:
+            store.record_run([_trace(100), _trace(200), _trace(50, component="lambda:bar", error=True)])
+            baseline = store.load()
+
+        assert (tmp_path / "nightly.db").exists()
+        by_component = {p.signature.steps[0][0]: p for p in baseline.values()}
+        assert by_component["lambda:foo"].count == 2
+        assert by_component["lambda:foo"].latency.max_ms == pytest.approx(200.0)
+        assert by_component["lambda:bar"].error_count == 1
+        assert by_component["lambda:bar"].signature.has_error
+
+    def test_rolling_window(self, tmp_path: Path) -> None:
+        with BaselineStore.open("rolling", root=tmp_path) as store:
+            for latency in (100, 200, 300):
+                store.record_run([_trace(latency)], label=f"run-{latency}")
+            assert [r.label for r in store.runs()] == ["run-100", "run-200", "run-300"]
+
+            (last_two,) = store.load(last_n=2).values()
+            assert last_two.count == 2
+            assert last_two.latency.min_ms == pytest.approx(200.0)
+            (everything,) = store.load().values()
+            assert everything.count == 3
+
+    def test_keep_runs_prunes(self, tmp_path: Path) -> None:
+        with BaselineStore.open("pruned", root=tmp_path) as store:
+            for latency in (100, 200, 300, 400):
+                store.record_run([_trace(latency)], keep_runs=2)
+            assert len(store.runs()) == 2
+            (path,) = store.load().values()
+            assert path.count == 2
+
+    def test_persists_across_opens(self, tmp_path: Path) -> None:
+        with BaselineStore.open("persist", root=tmp_path) as store:
+            store.record_run([_trace(100)])
+        with BaselineStore.open("persist", root=tmp_path) as store:
+            store.record_run([_trace(120)])
+            assert len(store.runs()) == 2
+            (path,) = store.load().values()
+            assert path.count == 2
+
+    def test_rejects_bad_name(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError):
+            BaselineStore.open("../escape", root=tmp_path)
+
+    def test_incremental_aggregator(self, tmp_path: Path) -> None:
+        aggregate = PathAggregator()
+        for latency in (100, 110, 120):
+            aggregate.add(_trace(latency))
+        aggregate.add(Trace(spans=[]))
+        assert aggregate.trace_count == 3
+        with BaselineStore.open("soak", root=tmp_path) as store:
+            store.record(aggregate, label="soak-1")
+            (path,) = store.load().values()
+        assert path.count == 3
+
+
+class TestCompareToBaseline:
+    """Tests for compare_to_baseline."""
+
+    def test_matches_raw_comparison(self, tmp_path: Path) -> None:
+        rng = random.Random(3)
+        baselines = [_trace(rng.gauss(500, 30)) for _ in range(300)]
+        slower = [_trace(rng.gauss(550, 30)) for _ in range(300)]
+
+        with BaselineStore.open("cmp", root=tmp_path) as store:
+            store.record_run(baselines)
+            stored = compare_to_baseline(store.load(), slower)
+        raw = compare_trace_sets(baselines, slower)
+
+        (stored_delta,) = stored.deltas
+        (raw_delta,) = raw.deltas
+        assert stored_delta.baseline_count == raw_delta.baseline_count
+        assert stored_delta.p50_delta_pct == pytest.approx(raw_delta.p50_delta_pct, abs=1.0)
+        assert stored.latency_regressions == [stored_delta]
+
+    def test_missing_and_new_paths(self, tmp_path: Path) -> None:
+        with BaselineStore.open("paths", root=tmp_path) as store:
+            store.record_run([_trace(100, component="lambda:old")])
+            result = compare_to_baseline(store.load(), [_trace(100, component="lambda:new")])
+        assert len(result.missing_paths) == 1
+        assert len(result.new_paths) == 1
+        assert result.has_regressions
+
+    def test_missing_paths_scoped_to_current_cases(self, tmp_path: Path) -> None:
+        with BaselineStore.open("suite", root=tmp_path) as store:
+            store.record_run(
+                [_trace(100, component="lambda:a"), _trace(100, component="lambda:b")],
+                case_ids=["case_a", "case_b"],
+            )
+            baseline = store.load()
+
+        assert {p.signature.steps[0][0]: p.cases for p in baseline.values()} == {
+            "lambda:a": {"case_a"},
+            "lambda:b": {"case_b"},
+        }
+        only_a = compare_to_baseline(baseline, [_trace(100, component="lambda:a")], current_cases=["case_a"])
+        assert only_a.missing_paths == []
+        assert not only_a.has_regressions
+        # Without case information every baseline path is expected
+        unscoped = compare_to_baseline(baseline, [_trace(100, component="lambda:a")])
+        assert len(unscoped.missing_paths) == 1
+
+
+class TestSuiteBaselineCli:
+    """Tests for `itk suite --record-baseline` followed by `itk compare --baseline`."""
+
+    def _itk(self, *args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "itk", *args],
+            cwd=str(Path(__file__).parent.parent / "src"),
+            capture_output=True,
+            text=True,
+        )
+
+    def test_compare_suite_runs(self, cases_dir: Path, tmp_path: Path) -> None:
+        baselines = tmp_path / "baselines"
+        for run in ("first", "second"):
+            extra = ["--record-baseline", "nightly", "--baseline-dir", str(baselines)] if run == "first" else []
+            self._itk("suite", "--mode", "dev-fixtures", "--cases-dir", str(cases_dir),
+                      "--out", str(tmp_path / run), *extra)
+        assert (baselines / "nightly.db").exists()
+
+        compare = ["compare", "--baseline", "nightly", "--baseline-dir", str(baselines)]
+        result = self._itk(*compare, "--b", str(tmp_path / "second"), "--out", str(tmp_path / "cmp"))
+        assert result.returncode == 0, f"CLI failed: {result.stdout}{result.stderr}"
+        assert "Missing paths: 0" in result.stdout
+        assert "Regressions: NO" in result.stdout
+
+        # One case directory is compared against that case's paths only
+        case_dir = next(p.parent for p in (tmp_path / "second").glob("*/spans.jsonl"))
+        result = self._itk(*compare, "--b", str(case_dir), "--out", str(tmp_path / "cmp-case"))
+        assert result.returncode == 0, f"CLI failed: {result.stdout}{result.stderr}"
+        assert "New paths: 0" in result.stdout
+        assert "Missing paths: 0" in result.stdout
@@ -0,0 +1,155 @@
+"""Tests for the synthetic corpus and `itk bench` runner."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from itk.bench import (
+    BenchmarkResult,
+    BenchReport,
+    check_regressions,
+    generate_log_lines,
+    run_benchmarks,
+    write_corpus,
+)
+
+
+class TestCorpus:
+    """Tests for generate_log_lines."""
+
+    def test_deterministic_exact_size_and_time_ordered(self) -> None:
+        events = list(generate_log_lines(500, seed=7))
+
+        assert len(events) == 500
+        assert events == list(generate_log_lines(500, seed=7))
+        assert events != list(generate_log_lines(500, seed=8))
+        timestamps = [e["timestamp"] for e in events]
+        assert timestamps == sorted(timestamps)
+
+    def test_support_bot_shapes(self) -> None:
+        messages = [e["message"] for e in generate_log_lines(2000)]
+
+        assert any(m.startswith("START RequestId:") for m in messages)
+        assert any(m.startswith("REPORT RequestId:") for m in messages)
+        assert any("Event_body is {'message':" in m for m in messages)
+        assert any('"orchestrationTrace"' in m and '"rationale"' in m for m in messages)
+        assert any("thread_ts" in m for m in messages)
+        assert any("@example." in m for m in messages)
+        # Stringified JSON inside the stringified application line
+        nested = [json.loads(m) for m in messages if '"payload"' in m]
+        assert nested and isinstance(json.loads(nested[0]["payload"]), dict)
+
+    def test_correlates_into_conversations(self) -> None:
+        from itk.correlation.dynamic_discovery import discover_correlations
+        from itk.logs.parse import parse_cloudwatch_logs
+
+        events = list(generate_log_lines(1000))
+
+        assert len(parse_cloudwatch_logs(events)) > 700
+        chains = discover_correlations(events)
+        assert len(chains) > 20
+        assert max(len(c.entries) for c in chains) >= 14
+
+    def test_write_corpus(self, tmp_path: Path) -> None:
+        path = tmp_path / "corpus" / "logs.jsonl"
+
+        written = write_corpus(path, 50, seed=1)
+
+        lines = path.read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 50
+        assert written == path.stat().st_size
+        assert [json.loads(line) for line in lines] == list(generate_log_lines(50, seed=1))
+
+
+class TestRunner:
+    """Tests for run_benchmarks and the regression gate."""
+
+    def test_runs_selected_benchmarks_in_process(self) -> None:
+        seen: list[str] = []
+
+        report = run_benchmarks(
+            600,
+            repeat=2,
+            only=["parse", "stitch", "render", "soak"],
+            window_lines=200,
+            isolate=False,
+            on_result=lambda r: seen.append(r.name),
+        )
+
+        assert seen == ["parse", "stitch", "render", "soak"]
+        parse = report.results[0]
+        assert (parse.unit, parse.items) == ("lines", 600)
+        assert len(parse.run_seconds) == 2
+        assert len(parse.window_ms) == 6
+        for result in report.results:
+            data = result.to_dict()
+            assert data["items"] > 0
+            assert data["throughput"] > 0
+            assert data["p99_ms"] >= data["p50_ms"] > 0
+        assert report.to_dict()["environment"]["python"]
+
+    def test_unknown_benchmark(self) -> None:
+        with pytest.raises(ValueError, match="Unknown benchmark"):
+            run_benchmarks(10, only=["parse", "nope"], isolate=False)
+
+    def _report(self, throughput: float, p99_ms: float, rss: float) -> BenchReport:
+        result = BenchmarkResult(
+            name="parse",
+            unit="lines",
+            items=int(throughput),
+            run_seconds=[1.0],
+            window_ms=[p99_ms],
+            peak_rss_mb=rss,
+        )
+        return BenchReport(lines=1000, seed=42, repeat=1, window_lines=100, results=[result])
+
+    def test_regression_gate(self) -> None:
+        baseline = self._report(1000, 10.0, 100.0).to_dict()
+
+        assert check_regressions(self._report(900, 11.0, 110.0), baseline, tolerance=0.2) == []
+        regressions = check_regressions(self._report(700, 13.0, 130.0), baseline, tolerance=0.2)
+        assert [(r.metric, round(r.change_pct)) for r in regressions] == [
+            ("throughput", -30),
+            ("p99_ms", 30),
+            ("peak_rss_mb", 30),
+        ]
+
+    def test_baseline_from_other_corpus_rejected(self) -> None:
+        baseline = self._report(1000, 10.0, 100.0).to_dict()
+        baseline["lines"] = 5000
+
+        with pytest.raises(ValueError, match="lines=5000"):
+            check_regressions(self._report(1000, 10.0, 100.0), baseline)
+
+
+class TestBenchCli:
+    """Tests for `itk bench`."""
+
+    def _bench(self, *args: str) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "itk", "bench", "--lines", "300", "--window", "100", "--repeat", "1",
+             "--only", "parse", "--no-isolate", *args],
+            cwd=str(Path(__file__).parent.parent / "src"),
+            capture_output=True,
+            text=True,
+        )
+
+    def test_writes_results_and_gates_on_baseline(self, tmp_path: Path) -> None:
+        out = tmp_path / "bench.json"
+
+        result = self._bench("--out", str(out))
+
+        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        baseline = json.loads(out.read_text(encoding="utf-8"))
+        assert [r["name"] for r in baseline["results"]] == ["parse"]
+
+        # An impossible baseline makes the gate fail
+        baseline["results"][0]["throughput"] *= 1000
+        out.write_text(json.dumps(baseline), encoding="utf-8")
+        result = self._bench("--baseline", str(out))
+        assert result.returncode == 1
+        assert "parse throughput" in result.stdout
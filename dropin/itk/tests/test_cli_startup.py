@@ -0,0 +1,108 @@
+"""Startup-cost regression tests for the `itk` CLI.
+
+`itk` runs many times per CI pipeline, so importing `itk.cli` and parsing
+arguments must not pull in jsonschema, yaml, boto3 or the renderers.
+"""
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+from itk import cli
+
+SRC_DIR = Path(__file__).parent.parent / "src"
+
+# Cumulative `python -X importtime` budget for `import itk.cli` with warm
+# bytecode, in milliseconds. The lazy-import CLI takes ~30ms; importing the
+# heavy modules eagerly again costs 200ms+. Raise it on slow runners.
+IMPORT_BUDGET_MS = float(os.environ.get("ITK_IMPORT_BUDGET_MS", "100"))
+
+# Modules that must only be imported by the commands that need them
+HEAVY_MODULES = (
+    "jsonschema",
+    "yaml",
+    "boto3",
+    "itk.cases.loader",
+    "itk.assertions.invariants",
+    "itk.utils.artifacts",
+    "itk.diagrams.mermaid_seq",
+    "itk.logs.parse",
+)
+
+
+def _run_python(*args: str, pycache: Path | None = None) -> subprocess.CompletedProcess[str]:
+    env = {
+        **os.environ,
+        "PYTHONPATH": str(SRC_DIR),
+        "ITK_SUPPRESS_VENV_WARNING": "1",
+        "PYTHONUTF8": "1",
+    }
+    if pycache is not None:
+        # Private, writable bytecode cache so timings never include compiling
+        env.pop("PYTHONDONTWRITEBYTECODE", None)
+        env["PYTHONPYCACHEPREFIX"] = str(pycache)
+    return subprocess.run(
+        [sys.executable, *args], capture_output=True, text=True, env=env, check=True
+    )
+
+
+def _imported_after(argv: list[str]) -> set[str]:
+    """Return the modules loaded after running `itk <argv>` in a fresh interpreter."""
+    script = (
+        "import sys\n"
+        "from itk.cli import main\n"
+        f"sys.argv = ['itk', *{argv!r}]\n"
+        "try:\n"
+        "    main()\n"
+        "except SystemExit:\n"
+        "    pass\n"
+        "print('\\n'.join(sys.modules), file=sys.stderr)\n"
+    )
+    return set(_run_python("-c", script).stderr.split())
+
+
+class TestImportCost:
+    """Tests for `import itk.cli` cost."""
+
+    def test_import_within_budget(self, tmp_path: Path) -> None:
+        _run_python("-c", "import itk.cli", pycache=tmp_path)  # Warm the bytecode cache
+        result = _run_python("-X", "importtime", "-c", "import itk.cli", pycache=tmp_path)
+        cumulative_us = None
+        for line in result.stderr.splitlines():
+            # "import time: self [us] | cumulative | imported package"
+            parts = [p.strip() for p in line.split("|")]
+            if len(parts) == 3 and parts[2] == "itk.cli":
+                cumulative_us = int(parts[1])
+        assert cumulative_us is not None, result.stderr[-2000:]
+        assert cumulative_us / 1000 < IMPORT_BUDGET_MS
+
+    @pytest.mark.parametrize("argv", [["--help"], ["validate", "--help"], ["run", "--help"]])
+    def test_heavy_modules_not_imported(self, argv: list[str]) -> None:
+        loaded = _imported_after(argv)
+        assert "itk.cli" in loaded
+        assert not loaded & set(HEAVY_MODULES)
+
+
+class TestCommandTable:
+    """Tests for lazy subcommand registration."""
+
+    def test_every_command_registers_a_handler(self) -> None:
+        import argparse
+
+        for name, (help_text, add_args) in cli.COMMANDS.items():
+            parser = argparse.ArgumentParser(prog=f"itk {name}")
+            add_args(parser)
+            assert help_text
+            assert callable(parser.get_default("func")), name
+
+    def test_registrars_not_shadowed_by_later_definitions(self) -> None:
+        for name, (_, add_args) in cli.COMMANDS.items():
+            assert getattr(cli, add_args.__name__) is add_args, name
+
+    def test_requested_command(self) -> None:
+        assert cli._requested_command(["-v", "run", "--case", "x"]) == "run"
+        assert cli._requested_command(["--help"]) is None
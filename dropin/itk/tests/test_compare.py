@@ -1,14 +1,28 @@
 """Tests for compare module - path signatures and delta detection."""
 from __future__ import annotations
 
+import json
+import random
+import subprocess
+import sys
+from dataclasses import asdict
+from pathlib import Path
+
 import pytest
 
 from itk.trace.span_model import Span
 from itk.trace.trace_model import Trace
 from itk.compare.path_signature import (
     PathSignature,
+    SignatureInterner,
     extract_path_signature,
     compute_trace_latency_ms,
+    summarize_trace,
+)
+from itk.compare.stats import (
+    LatencyDistribution,
+    bootstrap_median_delta_pct,
+    percentile,
 )
 from itk.compare.compare import (
     PathDelta,
@@ -256,6 +270,105 @@ class TestCompareTraces:
         assert result.has_regressions
 
 
+def _timed_trace(latency_ms: float, component: str = "lambda:foo") -> Trace:
+    """Single-span trace lasting latency_ms."""
+    end_s, end_ms = divmod(int(latency_ms), 1000)
+    return Trace(
+        spans=[
+            Span(
+                span_id="s1",
+                parent_span_id=None,
+                component=component,
+                operation="Invoke",
+                ts_start="2026-01-15T12:00:00.000Z",
+                ts_end=f"2026-01-15T12:00:{end_s:02d}.{end_ms:03d}Z",
+            )
+        ]
+    )
+
+
+class TestSummarizeTrace:
+    """Tests for summarize_trace and SignatureInterner."""
+
+    def test_matches_separate_passes(self) -> None:
+        spans = [
+            Span(
+                span_id="s2",
+                parent_span_id="s1",
+                component="model:claude",
+                operation="InvokeModel",
+                ts_start="2026-01-15T12:00:00.500Z",
+                ts_end="2026-01-15T12:00:02.000Z",
+                attempt=2,
+                error={"message": "throttled"},
+            ),
+            Span(
+                span_id="s1",
+                parent_span_id=None,
+                component="lambda:foo",
+                operation="Invoke",
+                ts_start="2026-01-15T12:00:00.000Z",
+                ts_end="2026-01-15T12:00:01.000Z",
+            ),
+        ]
+        trace = Trace(spans=spans)
+        steps, has_error, retry_count, latency_ms = summarize_trace(trace)
+        sig = extract_path_signature(trace)
+        assert (steps, has_error, retry_count) == (sig.steps, sig.has_error, sig.retry_count)
+        assert latency_ms == compute_trace_latency_ms(trace)
+
+    def test_interner_reuses_ids(self) -> None:
+        interner = SignatureInterner()
+        a = interner.intern((("lambda:foo", "Invoke"),), False, 0)
+        b = interner.intern((("lambda:foo", "Invoke"),), True, 0)
+        assert interner.intern((("lambda:foo", "Invoke"),), False, 0) == a
+        assert a != b
+        assert len(interner) == 2
+        assert interner.signatures[b].has_error
+
+
+class TestLatencyStats:
+    """Tests for percentile helpers and the bootstrap interval."""
+
+    def test_percentile_interpolates(self) -> None:
+        values = [10.0, 20.0, 30.0, 40.0]
+        assert percentile(values, 0) == 10.0
+        assert percentile(values, 50) == 25.0
+        assert percentile(values, 100) == 40.0
+        assert percentile([], 50) == 0.0
+
+    def test_distribution_from_sorted(self) -> None:
+        dist = LatencyDistribution.from_sorted([float(v) for v in range(1, 101)])
+        assert dist.count == 100
+        assert dist.mean_ms == 50.5
+        assert dist.p50_ms == 50.5
+        assert dist.p99_ms == pytest.approx(99.01)
+        assert dist.to_dict()["max_ms"] == 100.0
+
+    def test_bootstrap_detects_shift(self) -> None:
+        rng = random.Random(1)
+        baseline = sorted(rng.lognormvariate(5, 0.3) for _ in range(500))
+        current = sorted(v * 1.1 for v in baseline)
+        low, high = bootstrap_median_delta_pct(baseline, current)
+        assert 0 < low < 10.0 < high
+
+    def test_bootstrap_identical_includes_zero(self) -> None:
+        rng = random.Random(2)
+        baseline = sorted(rng.lognormvariate(5, 0.3) for _ in range(500))
+        current = sorted(rng.lognormvariate(5, 0.3) for _ in range(500))
+        low, high = bootstrap_median_delta_pct(baseline, current)
+        assert low < 0 < high
+
+    def test_bootstrap_deterministic_with_seed(self) -> None:
+        values = sorted(float(v) for v in range(1, 50))
+        first = bootstrap_median_delta_pct(values, values, rng=random.Random(3))
+        second = bootstrap_median_delta_pct(values, values, rng=random.Random(3))
+        assert first == second
+
+    def test_bootstrap_needs_samples(self) -> None:
+        assert bootstrap_median_delta_pct([1.0, 2.0], [1.0, 2.0, 3.0]) is None
+
+
 class TestCompareTraceSets:
     """Tests for compare_trace_sets function."""
 
@@ -300,6 +413,37 @@ class TestCompareTraceSets:
         assert len(result.missing_paths) == 1  # good path missing
         assert len(result.new_paths) == 1  # error path is new
 
+    def test_significant_latency_regression(self) -> None:
+        rng = random.Random(4)
+        baseline_ms = [rng.gauss(500, 30) for _ in range(200)]
+        baselines = [_timed_trace(ms) for ms in baseline_ms]
+        slower = [_timed_trace(ms * 1.05) for ms in baseline_ms]
+        result = compare_trace_sets(baselines, slower)
+        delta = result.deltas[0]
+        assert delta.baseline_latency is not None
+        assert delta.baseline_latency.count == 200
+        assert delta.p50_delta_ci_pct is not None
+        # A 5% shift is below the old 10% rule but is significant here
+        assert delta.latency_significant
+        assert result.latency_regressions == [delta]
+        assert result.has_regressions
+
+    def test_noise_not_significant(self) -> None:
+        rng = random.Random(5)
+        baselines = [_timed_trace(rng.gauss(500, 30)) for _ in range(200)]
+        currents = [_timed_trace(rng.gauss(500, 30)) for _ in range(200)]
+        result = compare_trace_sets(baselines, currents)
+        assert not result.significant_latency_changes
+        assert not result.latency_regressions
+
+    def test_small_samples_use_threshold(self) -> None:
+        baselines = [_timed_trace(100)]
+        currents = [_timed_trace(150)]
+        result = compare_trace_sets(baselines, currents)
+        delta = result.deltas[0]
+        assert delta.p50_delta_ci_pct is None
+        assert delta.latency_significant
+
 
 class TestCompareResult:
     """Tests for CompareResult properties."""
@@ -320,3 +464,46 @@ class TestCompareResult:
             ],
         )
         assert len(result.significant_latency_changes) == 1
+
+
+class TestCompareCli:
+    """Tests for the `itk compare` exit code."""
+
+    def _write_run(self, run_dir: Path, latencies_ms: list[float]) -> None:
+        run_dir.mkdir(parents=True)
+        lines = []
+        for i, ms in enumerate(latencies_ms):
+            (span,) = _timed_trace(ms).spans
+            lines.append(json.dumps({**asdict(span), "span_id": f"s{i}", "itk_trace_id": f"exec-{i}"}))
+        (run_dir / "spans.jsonl").write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+    def _compare(self, tmp_path: Path) -> subprocess.CompletedProcess[str]:
+        return subprocess.run(
+            [sys.executable, "-m", "itk", "compare", "--a", str(tmp_path / "a"), "--b", str(tmp_path / "b"),
+             "--out", str(tmp_path / "cmp")],
+            cwd=str(Path(__file__).parent.parent / "src"),
+            capture_output=True,
+            text=True,
+        )
+
+    def test_significant_slowdown_fails(self, tmp_path: Path) -> None:
+        rng = random.Random(4)
+        baseline_ms = [rng.gauss(500, 30) for _ in range(200)]
+        self._write_run(tmp_path / "a", baseline_ms)
+        self._write_run(tmp_path / "b", [ms * 1.05 for ms in baseline_ms])
+
+        result = self._compare(tmp_path)
+
+        assert result.returncode == 1, result.stderr
+        assert "Latency regressions: 1" in result.stdout
+        assert "Regressions: YES" in result.stdout
+
+    def test_noise_passes(self, tmp_path: Path) -> None:
+        rng = random.Random(5)
+        self._write_run(tmp_path / "a", [rng.gauss(500, 30) for _ in range(200)])
+        self._write_run(tmp_path / "b", [rng.gauss(500, 30) for _ in range(200)])
+
+        result = self._compare(tmp_path)
+
+        assert result.returncode == 0, result.stdout + result.stderr
+        assert "Regressions: NO" in result.stdout
@@ -156,6 +156,121 @@ class TestSqsEventAdapter:
         adapter._validate_target()
 
 
+class FakeSqsBatchClient:
+    """SQS client whose send_message_batch fails the listed entry IDs once."""
+
+    def __init__(self, fail_once: dict[str, dict[str, Any]] | None = None) -> None:
+        self.fail_once = dict(fail_once or {})
+        self.calls: list[list[str]] = []
+
+    def send_message_batch(self, QueueUrl: str, Entries: list[dict[str, Any]]) -> dict[str, Any]:
+        ids = [e["Id"] for e in Entries]
+        self.calls.append(ids)
+        failed = [
+            {"Id": i, **self.fail_once.pop(i)} for i in ids if i in self.fail_once
+        ]
+        failed_ids = {f["Id"] for f in failed}
+        return {
+            "Successful": [{"Id": i, "MessageId": f"msg-{i}"} for i in ids if i not in failed_ids],
+            "Failed": failed,
+        }
+
+
+class TestSqsBatchReplay:
+    """Test SqsEventAdapter.replay_batch."""
+
+    QUEUE_URL = "https://sqs.us-east-1.amazonaws.com/123456789/orders"
+
+    def _adapter(self, client: FakeSqsBatchClient) -> Any:
+        from itk.aws.retry import RetryEngine, RetryPolicy
+        from itk.entrypoints.sqs_event import SqsEventAdapter, SqsEventTarget
+
+        adapter = SqsEventAdapter(
+            SqsEventTarget(mode="publish_sqs", target_arn_or_url=self.QUEUE_URL),
+            retry=RetryEngine(RetryPolicy(max_attempts=2), sleep=lambda _: None),
+        )
+        adapter._sqs_client = client
+        return adapter
+
+    @staticmethod
+    def _event(n: int) -> dict[str, Any]:
+        return {"Records": [{"body": {"order": i}} for i in range(n)]}
+
+    def test_chunks_records_into_batches_of_ten(self) -> None:
+        client = FakeSqsBatchClient()
+
+        result = self._adapter(client).replay_batch(self._event(23), concurrency=4)
+
+        assert sorted(len(c) for c in client.calls) == [3, 10, 10]
+        assert result.batch_count == 3
+        assert result.message_ids == [f"msg-{i}" for i in range(23)]
+        assert result.sent_count == 23
+        assert result.failed == []
+
+    def test_repeat_multiplies_records(self) -> None:
+        client = FakeSqsBatchClient()
+
+        result = self._adapter(client).replay_batch(self._event(4), repeat=5)
+
+        assert len(result.records) == 20
+        assert result.batch_count == 2
+
+    def test_partial_failure_resends_only_failed_entries(self) -> None:
+        client = FakeSqsBatchClient({"3": {"Code": "InternalError", "SenderFault": False}})
+
+        result = self._adapter(client).replay_batch(self._event(5))
+
+        assert client.calls == [["0", "1", "2", "3", "4"], ["3"]]
+        assert result.sent_count == 5
+        assert result.records[3].attempts == 2
+        assert result.records[3].error_code is None
+        assert result.client_retries == 1
+
+    def test_entry_throttles_reported_as_client_retries(self) -> None:
+        client = FakeSqsBatchClient({"1": {"Code": "ThrottlingException", "SenderFault": False}})
+
+        result = self._adapter(client).replay_batch(self._event(12), concurrency=2)
+        retry = result.retry.to_dict()
+
+        assert retry["client_retries"] == 1
+        assert [(r["code"], r["throttle_type"]) for r in retry["retries"]] == [
+            ("ThrottlingException", "aws_throttle")
+        ]
+        assert result.retry.attempts == 3  # Two batches, one resend
+
+    def test_sender_fault_is_not_retried(self) -> None:
+        client = FakeSqsBatchClient(
+            {"1": {"Code": "InvalidMessageContents", "Message": "bad", "SenderFault": True}}
+        )
+
+        result = self._adapter(client).replay_batch(self._event(3))
+
+        assert len(client.calls) == 1
+        assert result.message_ids == ["msg-0", None, "msg-2"]
+        assert result.failed[0].error_code == "InvalidMessageContents"
+        assert result.to_dict()["failed_count"] == 1
+
+    def test_seed_spans_carry_message_ids(self) -> None:
+        client = FakeSqsBatchClient()
+
+        result = self._adapter(client).replay_batch(self._event(2), itk_trace_id="itk-1")
+        spans = result.seed_spans()
+
+        assert [s.sqs_message_id for s in spans] == ["msg-0", "msg-1"]
+        assert {s.component for s in spans} == {"sqs:orders"}
+        assert all(s.itk_trace_id == "itk-1" and s.is_async for s in spans)
+
+    def test_requires_publish_mode(self) -> None:
+        from itk.entrypoints.sqs_event import SqsEventAdapter, SqsEventTarget
+
+        adapter = SqsEventAdapter(
+            SqsEventTarget(mode="invoke_lambda", target_arn_or_url="fn"), offline=True
+        )
+
+        with pytest.raises(ValueError, match="publish_sqs"):
+            adapter.replay_batch(self._event(2))
+
+
 class TestLambdaDirectAdapter:
     """Test the Lambda direct adapter."""
 
@@ -233,3 +348,48 @@ class TestBedrockAgentAdapter:
         assert response.completion  # Has a response
         assert response.session_id  # Has session ID
         assert isinstance(response.traces, list)
+
+    def test_live_invoke_records_stream_timing(self) -> None:
+        """Live invocations record TTFT, chunks and trace phases."""
+        from itk.entrypoints.bedrock_agent import BedrockAgentAdapter, BedrockAgentTarget
+
+        stream = [
+            {"trace": {"trace": {"preProcessingTrace": {}}}},
+            {"trace": {"trace": {"orchestrationTrace": {"modelInvocationInput": {}}}}},
+            {"trace": {"trace": {"orchestrationTrace": {"modelInvocationOutput": {}}}}},
+            {"trace": {"trace": {"orchestrationTrace": {
+                "invocationInput": {"invocationType": "ACTION_GROUP"},
+            }}}},
+            {"chunk": {"bytes": b"Hello, "}},
+            {"chunk": {"bytes": b"world"}},
+        ]
+        adapter = BedrockAgentAdapter(BedrockAgentTarget(agent_id="AGENT", agent_alias_id="ALIAS"))
+        adapter._client = MagicMock()
+        adapter._client.invoke_agent.return_value = {"completion": iter(stream)}
+
+        response = adapter.invoke(input_text="Hi")
+
+        timing = response.timing
+        assert response.completion == "Hello, world"
+        assert timing.chunk_count == 2
+        assert timing.chunk_bytes == 12
+        assert len(timing.trace_offsets_ms) == 4
+        assert timing.ttft_ms is not None and timing.ttft_ms >= timing.trace_offsets_ms[-1]
+        assert timing.total_ms >= timing.chunk_offsets_ms[-1]
+        assert [(p.name, p.event_count) for p in timing.phases] == [
+            ("pre-processing", 1),
+            ("model-invocation", 2),
+            ("action-group", 1),
+        ]
+        assert timing.phases[0].end_ms == timing.phases[1].start_ms
+        assert timing.to_dict()["chunk_count"] == 2
+
+    def test_offline_invoke_has_no_timing(self) -> None:
+        """Offline mock responses carry no client timing."""
+        from itk.entrypoints.bedrock_agent import BedrockAgentAdapter, BedrockAgentTarget
+
+        adapter = BedrockAgentAdapter(
+            BedrockAgentTarget(agent_id="AGENT", agent_alias_id="ALIAS"), offline=True
+        )
+
+        assert adapter.invoke(input_text="Hi").timing is None
@@ -28,6 +28,9 @@ from itk.report.historical_viewer import (
     filter_executions,
     render_gallery_html,
     load_logs_from_file,
+    render_sharded_gallery_html,
+    select_executions_to_render,
+    write_gallery_index,
 )
 from itk.trace.span_model import Span
 
@@ -427,6 +430,106 @@ class TestRenderGalleryHtml(unittest.TestCase):
         self.assertIn("toggleTheme", html)
 
 
+class TestShardedGallery(unittest.TestCase):
+    """Tests for the sharded gallery index and lazy render selection."""
+
+    def make_summaries(self, count: int) -> list[ExecutionSummary]:
+        """Create execution summaries, newest first."""
+        base = datetime(2026, 1, 18, 10, 0, 0, tzinfo=timezone.utc)
+        return [
+            ExecutionSummary(
+                execution_id=f"exec-{i:04d}",
+                timestamp=base - timedelta(minutes=i),
+                span_count=2,
+                duration_ms=100.0,
+                status="error" if i % 2 else "passed",
+                error_count=i % 2,
+                retry_count=0,
+                components=["lambda"],
+                artifact_dir=f"exec-{i:04d}",
+            )
+            for i in range(count)
+        ]
+
+    def read_page(self, path: Path) -> list[dict]:
+        """Parse the JSON payload of an index page."""
+        text = path.read_text(encoding="utf-8")
+        return json.loads(text[text.index("[") : text.rindex("]") + 1])
+
+    def test_to_dict(self) -> None:
+        """Summary serializes timestamps as ISO strings."""
+        record = self.make_summaries(1)[0].to_dict()
+        self.assertEqual(record["execution_id"], "exec-0000")
+        self.assertEqual(record["timestamp"], "2026-01-18T10:00:00+00:00")
+
+    def test_writes_pages(self) -> None:
+        """Index is split into page files with a manifest."""
+        with TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            index = write_gallery_index(self.make_summaries(5), out_dir, page_size=2)
+
+            self.assertEqual(index.total, 5)
+            self.assertEqual(index.pages, [
+                "gallery/page-0001.js",
+                "gallery/page-0002.js",
+                "gallery/page-0003.js",
+            ])
+            records = self.read_page(out_dir / "gallery" / "page-0003.js")
+            self.assertEqual([r["execution_id"] for r in records], ["exec-0004"])
+            manifest = json.loads((out_dir / "gallery" / "index.json").read_text())
+            self.assertEqual(manifest["pages"], index.pages)
+
+    def test_marks_rendered_executions(self) -> None:
+        """Only executions with detail pages are marked rendered."""
+        summaries = self.make_summaries(4)
+        with TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            rendered = {s.execution_id for s in select_executions_to_render(summaries, top=1)}
+            index = write_gallery_index(summaries, out_dir, rendered_ids=rendered)
+
+            records = self.read_page(out_dir / "gallery" / "page-0001.js")
+            self.assertEqual([r["rendered"] for r in records], [True, False, False, False])
+            self.assertEqual(index.rendered_count, 1)
+
+    def test_removes_stale_pages(self) -> None:
+        """A smaller index removes pages from a previous larger one."""
+        with TemporaryDirectory() as tmp:
+            out_dir = Path(tmp)
+            write_gallery_index(self.make_summaries(5), out_dir, page_size=2)
+            write_gallery_index(self.make_summaries(1), out_dir, page_size=2)
+
+            pages = sorted(p.name for p in (out_dir / "gallery").glob("page-*.js"))
+            self.assertEqual(pages, ["page-0001.js"])
+
+    def test_select_top(self) -> None:
+        """Top N keeps the first (newest) executions."""
+        summaries = self.make_summaries(5)
+        self.assertEqual(len(select_executions_to_render(summaries)), 5)
+        self.assertEqual(
+            [s.execution_id for s in select_executions_to_render(summaries, top=2)],
+            ["exec-0000", "exec-0001"],
+        )
+
+    def test_sharded_html_loads_index(self) -> None:
+        """Sharded gallery embeds the manifest instead of rows."""
+        summaries = self.make_summaries(3)
+        result = ViewResult(
+            start_time=datetime.now(timezone.utc) - timedelta(hours=1),
+            end_time=datetime.now(timezone.utc),
+            total_logs=10,
+            executions=summaries,
+        )
+        with TemporaryDirectory() as tmp:
+            index = write_gallery_index(summaries, Path(tmp), page_size=2)
+
+        html = render_sharded_gallery_html(result, index)
+
+        self.assertIn("gallery/page-0002.js", html)
+        self.assertIn("itkGalleryPage", html)
+        self.assertNotIn("exec-0001", html)
+        self.assertIn("filterTable", html)
+
+
 class TestLoadLogsFromFile(unittest.TestCase):
     """Tests for load_logs_from_file."""
 
@@ -0,0 +1,87 @@
+"""Tests for streaming HTML output."""
+from __future__ import annotations
+
+import io
+from pathlib import Path
+
+import pytest
+
+from itk.report import CaseResult, CaseStatus, SuiteResult
+from itk.report.html_report import render_suite_report, write_suite_report
+from itk.utils.html_stream import HtmlStream, render_to_string, stream_to_file
+
+
+def _stream_rows(out: HtmlStream, rows: list[str]) -> None:
+    out.write("<ul>")
+    out.join("\n", (f"<li>{r}</li>" for r in rows))
+    out.write("</ul>")
+
+
+def _stream_then_fail(out: HtmlStream) -> None:
+    out.write("<html>")
+    out.flush()
+    raise RuntimeError("render failed")
+
+
+class TestHtmlStream:
+    """Tests for HtmlStream."""
+
+    def test_join_matches_str_join(self) -> None:
+        buf = io.StringIO()
+        out = HtmlStream(buf)
+        count = out.join(", ", iter(["a", "b", "c"]))
+        out.flush()
+        assert count == 3
+        assert buf.getvalue() == "a, b, c"
+
+    def test_buffer_flushes_when_full(self) -> None:
+        buf = io.StringIO()
+        out = HtmlStream(buf, buffer_chars=4)
+        out.write("ab")
+        assert buf.getvalue() == ""
+        out.write("cd")
+        assert buf.getvalue() == "abcd"
+
+    def test_json_array_matches_json_dumps(self) -> None:
+        import json
+
+        items = [{"a": 1}, [2, 3], "x"]
+        buf = io.StringIO()
+        out = HtmlStream(buf)
+        out.json_array(iter(items))
+        out.flush()
+        assert buf.getvalue() == json.dumps(items)
+
+    def test_render_to_string(self) -> None:
+        assert render_to_string(_stream_rows, ["a", "b"]) == "<ul><li>a</li>\n<li>b</li></ul>"
+
+    def test_stream_to_file_matches_string(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.html"
+        stream_to_file(target, _stream_rows, ["a", "b"])
+        assert target.read_text(encoding="utf-8") == render_to_string(_stream_rows, ["a", "b"])
+
+    def test_failed_stream_keeps_previous_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.html"
+        target.write_text("previous", encoding="utf-8")
+        with pytest.raises(RuntimeError):
+            stream_to_file(target, _stream_then_fail)
+        assert target.read_text(encoding="utf-8") == "previous"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.html"]
+
+
+class TestStreamedReports:
+    """Tests that streamed report files match the string renderers."""
+
+    def test_suite_report_file_matches_render(self, tmp_path: Path) -> None:
+        suite = SuiteResult(
+            suite_id="suite-001",
+            suite_name="Streamed",
+            started_at="2026-01-15T12:00:00+00:00",
+            finished_at="2026-01-15T12:00:01+00:00",
+            cases=[
+                CaseResult(case_id=f"case-{i}", case_name=f"Case {i}", status=CaseStatus.PASSED, duration_ms=10)
+                for i in range(3)
+            ],
+        )
+        write_suite_report(suite, tmp_path)
+        assert (tmp_path / "index.html").read_text(encoding="utf-8") == render_suite_report(suite)
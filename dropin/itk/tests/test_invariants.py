@@ -3,11 +3,17 @@ from __future__ import annotations
 
 import pytest
 
+from itk.assertions import invariants as invariants_module
+from itk.cases.loader import InvariantSpec
 from itk.trace.span_model import Span
 from itk.trace.trace_model import Trace
 from itk.assertions.invariants import (
     InvariantConfig,
     InvariantResult,
+    TraceIndex,
+    evaluate_invariants,
+    register_invariant,
+    registered_invariants,
     run_invariants,
     run_all_invariants,
     _check_has_spans,
@@ -296,3 +302,93 @@ class TestRunAllInvariants:
         results = run_all_invariants(trace)
         names = {r.name for r in results}
         assert "no_error_spans" in names
+
+
+class TestTraceIndex:
+    """Tests for the shared single-pass index."""
+
+    def test_collects_facts(self) -> None:
+        trace = Trace(spans=[
+            make_span(span_id="s1", component="lambda:a"),
+            make_span(span_id="s2", parent_span_id="s1", component="model:b", attempt=3),
+            make_span(span_id="s2", parent_span_id="missing", error={"message": "boom"}),
+        ])
+        index = TraceIndex(trace)
+        assert index.span_count == 3
+        assert index.duplicate_ids == ["s2"]
+        assert index.orphan_ids == ["s2"]
+        assert index.root_count == 1
+        assert index.components == {"lambda:a", "model:b", "lambda:test"}
+        assert len(index.retried_spans) == 1
+        assert len(index.error_spans) == 1
+
+    def test_timestamps_parsed_once(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        calls: list[str] = []
+        real_parse = invariants_module._parse_timestamp
+
+        def counting_parse(ts: str):
+            calls.append(ts)
+            return real_parse(ts)
+
+        monkeypatch.setattr(invariants_module, "_parse_timestamp", counting_parse)
+        trace = Trace(spans=[
+            make_span(ts_start="2026-01-15T12:00:00Z", ts_end="2026-01-15T12:00:01Z"),
+        ])
+        index = TraceIndex(trace)
+        evaluate_invariants(index, [("valid_timestamps", {}), ("valid_timestamps", {})])
+        assert len(calls) == 2  # start and end, once
+
+
+class TestInvariantRegistry:
+    """Tests for registered and case-defined invariants."""
+
+    def test_builtins_registered(self) -> None:
+        names = registered_invariants()
+        for name in ("has_spans", "no_orphan_spans", "max_retry_count", "no_error_spans"):
+            assert name in names
+
+    def test_plugin_shares_pass(self) -> None:
+        @register_invariant("test_max_span_count", replace=True)
+        def _max_span_count(index: TraceIndex, params) -> InvariantResult:
+            limit = params.get("max", 1)
+            return InvariantResult("test_max_span_count", index.span_count <= limit)
+
+        trace = Trace(spans=[make_span(span_id="s1"), make_span(span_id="s2")])
+        results = run_invariants(trace, extra=[InvariantSpec("test_max_span_count", {"max": 1})])
+        assert results[-1].name == "test_max_span_count"
+        assert not results[-1].passed
+
+    def test_duplicate_registration_rejected(self) -> None:
+        with pytest.raises(ValueError):
+            register_invariant("has_spans")(lambda index, params: None)
+
+    def test_case_spec_overrides_default_params(self) -> None:
+        trace = Trace(spans=[make_span(attempt=3)])
+        default = next(r for r in run_invariants(trace) if r.name == "max_retry_count")
+        assert default.passed
+
+        results = run_invariants(trace, extra=[InvariantSpec("max_retry_count", {"max_retries": 1})])
+        overridden = [r for r in results if r.name == "max_retry_count"]
+        assert len(overridden) == 1
+        assert not overridden[0].passed
+
+    def test_case_spec_appended(self) -> None:
+        trace = Trace(spans=[make_span(error={"message": "boom"})])
+        results = run_invariants(trace, extra=[InvariantSpec("no_error_spans", {})])
+        assert results[-1].name == "no_error_spans"
+        assert not results[-1].passed
+        # run_all_invariants already includes it: no duplicate
+        all_results = run_all_invariants(trace, [InvariantSpec("no_error_spans", {})])
+        assert [r.name for r in all_results].count("no_error_spans") == 1
+
+    def test_unknown_and_failing_checks_reported(self) -> None:
+        @register_invariant("test_explodes", replace=True)
+        def _explodes(index: TraceIndex, params) -> InvariantResult:
+            raise RuntimeError("kaboom")
+
+        trace = Trace(spans=[make_span()])
+        unknown, exploded = evaluate_invariants(trace, [("no_such_check", {}), ("test_explodes", {})])
+        assert not unknown.passed
+        assert "Unknown invariant" in unknown.details["error"]
+        assert not exploded.passed
+        assert "kaboom" in exploded.details["error"]
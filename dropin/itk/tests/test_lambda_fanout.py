@@ -0,0 +1,240 @@
+"""Tests for the async Lambda fan-out load generator.
+
+Invocations go through a real boto3 Lambda client pointed at a local stub
+endpoint that speaks the Invoke wire protocol.
+"""
+from __future__ import annotations
+
+import json
+import re
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Iterator
+
+import pytest
+
+from itk.aws.retry import RetryEngine, RetryPolicy
+from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+from itk.entrypoints.lambda_fanout import (
+    FanoutInvocation,
+    FanoutResult,
+    LambdaFanout,
+    match_completions,
+)
+
+INVOKE_PATH = re.compile(r"^/2015-03-31/functions/(?P<name>[^/]+)/invocations")
+
+
+class StubLambda(ThreadingHTTPServer):
+    """Local Lambda Invoke endpoint recording event payloads."""
+
+    def __init__(self, throttle_first: int = 0) -> None:
+        super().__init__(("127.0.0.1", 0), _StubLambdaHandler)
+        self.throttle_remaining = throttle_first
+        self.events: list[dict[str, Any]] = []
+        self.invocation_types: list[str] = []
+        self.lock = threading.Lock()
+
+    @property
+    def url(self) -> str:
+        return f"http://127.0.0.1:{self.server_address[1]}"
+
+
+class _StubLambdaHandler(BaseHTTPRequestHandler):
+    server: StubLambda
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass
+
+    def do_POST(self) -> None:
+        if not INVOKE_PATH.match(self.path):
+            self.send_error(404)
+            return
+        body = self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        with self.server.lock:
+            throttle = self.server.throttle_remaining > 0
+            if throttle:
+                self.server.throttle_remaining -= 1
+            else:
+                self.server.events.append(json.loads(body))
+                self.server.invocation_types.append(self.headers.get("X-Amz-Invocation-Type", ""))
+        if throttle:
+            error = json.dumps({"message": "Rate exceeded"}).encode()
+            self.send_response(429)
+            self.send_header("x-amzn-ErrorType", "TooManyRequestsException")
+            self.send_header("Content-Length", str(len(error)))
+            self.end_headers()
+            self.wfile.write(error)
+            return
+        self.send_response(202)
+        self.send_header("x-amzn-RequestId", f"req-{len(self.server.events)}")
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+
+@pytest.fixture
+def stub_lambda(monkeypatch: pytest.MonkeyPatch) -> Iterator[StubLambda]:
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "testing")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "testing")
+    server = StubLambda()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+def _adapter(server: StubLambda) -> LambdaDirectAdapter:
+    import boto3
+    from botocore.config import Config
+
+    adapter = LambdaDirectAdapter(
+        LambdaTarget(function_name_or_arn="worker", region="us-east-1"),
+        retry=RetryEngine(RetryPolicy(max_attempts=3), sleep=lambda _: None),
+    )
+    adapter._client = boto3.client(
+        "lambda",
+        region_name="us-east-1",
+        endpoint_url=server.url,
+        config=Config(retries={"max_attempts": 0}),
+    )
+    return adapter
+
+
+class TestLambdaFanout:
+    """Tests for LambdaFanout.fire against the stub endpoint."""
+
+    def test_fires_async_invocations_with_correlation_ids(self, stub_lambda: StubLambda) -> None:
+        fanout = LambdaFanout(_adapter(stub_lambda), rate_per_second=1000, concurrency=4)
+
+        result = fanout.fire({"action": "ping"}, count=12, run_id="run1")
+
+        assert len(result.accepted) == 12
+        assert set(stub_lambda.invocation_types) == {"Event"}
+        ids = sorted(e["itk_trace_id"] for e in stub_lambda.events)
+        assert ids == [f"itk-fanout-run1-{i:05d}" for i in range(12)]
+        assert all(e["action"] == "ping" for e in stub_lambda.events)
+        assert result.acceptance_latency().count == 12
+
+    def test_throttled_invocations_are_retried(self, stub_lambda: StubLambda) -> None:
+        stub_lambda.throttle_remaining = 2
+        fanout = LambdaFanout(_adapter(stub_lambda), rate_per_second=1000, concurrency=1)
+
+        result = fanout.fire({}, count=3)
+
+        assert len(result.accepted) == 3
+        assert result.to_dict()["client_retries"] == 2
+
+    def test_rate_schedule_spaces_dispatches(self) -> None:
+        now = [1000.0]
+        sleeps: list[float] = []
+
+        def sleep(seconds: float) -> None:
+            sleeps.append(seconds)
+            now[0] += seconds
+
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="worker"), offline=True)
+        fanout = LambdaFanout(adapter, rate_per_second=4, clock=lambda: now[0], sleep=sleep)
+
+        result = fanout.fire({}, count=5)
+
+        assert [i.scheduled_at - 1000.0 for i in result.invocations] == [0, 0.25, 0.5, 0.75, 1.0]
+        assert sum(sleeps) == pytest.approx(1.0)
+        assert len(result.accepted) == 5
+
+    def test_invalid_rate(self) -> None:
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="worker"), offline=True)
+
+        with pytest.raises(ValueError, match="rate_per_second"):
+            LambdaFanout(adapter, rate_per_second=0)
+
+
+class TestMatchCompletions:
+    """Tests for log-derived end-to-end latency."""
+
+    def test_latest_matching_event_is_completion(self) -> None:
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="worker"), offline=True)
+        result = LambdaFanout(adapter, rate_per_second=1000).fire({}, count=3, run_id="abc")
+        base = result.invocations[0].dispatched_at
+        events = [
+            {"timestamp": int((base + 0.1) * 1000), "message": "start itk-fanout-abc-00000"},
+            {"timestamp": int((base + 0.5) * 1000), "message": '{"itk_trace_id": "itk-fanout-abc-00000"}'},
+            {"timestamp": int((base + 0.3) * 1000), "message": "done itk-fanout-abc-00001"},
+            {"timestamp": int((base + 0.3) * 1000), "message": "other run itk-fanout-xyz-00002"},
+        ]
+
+        completed = match_completions(result, events)
+
+        assert completed == 2
+        first, second, third = result.invocations
+        assert first.log_events == 2
+        assert first.end_to_end_ms == pytest.approx(500 - (first.dispatched_at - base) * 1000, abs=2)
+        assert second.completed_at is not None
+        assert third.completed_at is None
+        assert result.to_dict()["completed"] == 2
+
+    def test_insights_timestamp_strings(self) -> None:
+        invocation = FanoutInvocation(
+            index=0, correlation_id="itk-fanout-r-00000", scheduled_at=0, dispatched_at=1.7e9
+        )
+        result = FanoutResult(run_id="r", function="worker", rate_per_second=1, invocations=[invocation])
+
+        match_completions(result, [{"timestamp": "2023-11-14 22:13:21.000", "message": "itk-fanout-r-00000"}])
+
+        assert invocation.end_to_end_ms == pytest.approx(1000, abs=1)
+
+
+class _FakeLogsClient:
+    """Logs Insights client returning canned rows."""
+
+    def __init__(self, rows: list[dict[str, Any]]) -> None:
+        self.rows = rows
+        self.queries: list[str] = []
+
+    def run_query(self, query: Any) -> Any:
+        from itk.logs.cloudwatch_fetch import CloudWatchQueryResult
+
+        self.queries.append(query.query_string)
+        return CloudWatchQueryResult(query_id="q", status="Complete", results=self.rows, statistics={})
+
+
+class TestCollect:
+    """Tests for LambdaFanout.collect."""
+
+    def _fired(self) -> tuple[LambdaFanout, FanoutResult]:
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="worker"), offline=True)
+        fanout = LambdaFanout(adapter, rate_per_second=1000)
+        return fanout, fanout.fire({}, count=3, run_id="abc")
+
+    def test_aggregates_latest_timestamp_per_invocation(self) -> None:
+        fanout, result = self._fired()
+        base = result.invocations[0].dispatched_at
+        client = _FakeLogsClient([
+            {"cid": "itk-fanout-abc-00000", "completed_at": str(int((base + 2) * 1000)), "events": "40"},
+            {"cid": "itk-fanout-abc-00001", "completed_at": str(int((base + 1) * 1000)), "events": "3"},
+        ])
+
+        completed = fanout.collect(result, ["/aws/lambda/worker"], logs_client=client)
+
+        query = client.queries[0]
+        assert "stats max(@timestamp)" in query and "by cid" in query
+        assert "sort @timestamp asc" not in query
+        assert completed == 2
+        first, second, third = result.invocations
+        assert first.log_events == 40
+        assert first.completed_at == pytest.approx(base + 2, abs=0.001)
+        assert third.completed_at is None
+        assert result.to_dict()["collect_truncated"] is False
+
+    def test_reports_row_limit(self) -> None:
+        fanout, result = self._fired()
+        base = result.invocations[0].dispatched_at
+        client = _FakeLogsClient([
+            {"cid": f"itk-fanout-abc-{i:05d}", "completed_at": str(int((base + 1) * 1000)), "events": "1"}
+            for i in range(2)
+        ])
+
+        fanout.collect(result, ["/aws/lambda/worker"], logs_client=client, limit=2)
+
+        assert result.collect_truncated
+        assert "limit 2" in client.queries[0]
@@ -0,0 +1,129 @@
+"""Tests for near-match search between path signatures."""
+from __future__ import annotations
+
+import random
+
+from itk.compare.compare import PathDelta, compare_trace_sets
+from itk.compare.path_match import (
+    PathIndex,
+    match_near_paths,
+    step_diff,
+    step_edit_distance,
+)
+from itk.compare.path_signature import PathSignature
+from itk.trace.span_model import Span
+from itk.trace.trace_model import Trace
+
+A = ("lambda:entry", "Invoke")
+B = ("agent:supervisor", "InvokeAgent")
+C = ("model:claude", "InvokeModel")
+D = ("lambda:action", "Invoke")
+R = ("model:claude", "Rationale")
+
+
+def _trace(*steps: tuple[str, str]) -> Trace:
+    return Trace(
+        spans=[
+            Span(
+                span_id=f"s{i}",
+                parent_span_id=None,
+                component=comp,
+                operation=op,
+                ts_start=f"2026-01-15T12:00:0{i}.000Z",
+            )
+            for i, (comp, op) in enumerate(steps)
+        ]
+    )
+
+
+class TestEditDistance:
+    """Tests for step_edit_distance and step_diff."""
+
+    def test_distance(self) -> None:
+        assert step_edit_distance((A, B, C), (A, B, C)) == 0
+        assert step_edit_distance((A, B, C), (A, B, R, C)) == 1
+        assert step_edit_distance((A, B, C), (A, D, C)) == 1
+        assert step_edit_distance((), (A, B)) == 2
+
+    def test_limit_matches_exact(self) -> None:
+        rng = random.Random(5)
+        alphabet = [A, B, C, D, R]
+        for _ in range(300):
+            a = tuple(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+            b = tuple(rng.choice(alphabet) for _ in range(rng.randint(0, 9)))
+            exact = step_edit_distance(a, b)
+            for limit in (0, 1, 2, 3):
+                assert step_edit_distance(a, b, limit=limit) == min(exact, limit + 1)
+
+    def test_diff_describes_edits(self) -> None:
+        edits = step_diff((A, B, C, D), (A, R, C))
+        assert [(e.op, e.index) for e in edits] == [("change", 1), ("delete", 3)]
+        assert edits[0].baseline_step == B
+        assert edits[0].current_step == R
+        assert "agent:supervisor:InvokeAgent" in edits[0].description
+
+    def test_diff_insert(self) -> None:
+        (edit,) = step_diff((A, C), (A, R, C))
+        assert edit.op == "insert"
+        assert edit.index == 1
+        assert edit.current_step == R
+
+
+class TestPathIndex:
+    """Tests for PathIndex search."""
+
+    def test_search_matches_brute_force(self) -> None:
+        rng = random.Random(11)
+        alphabet = [A, B, C, D, R]
+        signatures = list(
+            {
+                tuple(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+                for _ in range(500)
+            }
+        )
+        index = PathIndex(PathSignature(steps=s) for s in signatures)
+        assert len(index) == len(signatures)
+
+        for _ in range(20):
+            query = tuple(rng.choice(alphabet) for _ in range(rng.randint(0, 8)))
+            expected = sorted(s for s in signatures if step_edit_distance(query, s) <= 2)
+            found = sorted(sig.steps for _, sig in index.search(query, 2))
+            assert found == expected
+
+
+class TestMatchNearPaths:
+    """Tests for pairing new and missing paths."""
+
+    def test_extra_step_is_matched(self) -> None:
+        result = compare_trace_sets([_trace(A, B, C)], [_trace(A, B, R, C)])
+        assert len(result.new_paths) == 1
+        assert len(result.missing_paths) == 1
+        (match,) = result.path_matches
+        assert match.distance == 1
+        assert match.edits[0].op == "insert"
+        assert match.to_dict()["edits"][0]["current_step"] == list(R)
+
+    def test_unrelated_paths_not_matched(self) -> None:
+        result = compare_trace_sets([_trace(A, B)], [_trace(C, D, R, C)])
+        assert result.path_matches == []
+
+    def test_closest_pair_wins(self) -> None:
+        missing = [
+            PathDelta(signature=PathSignature(steps=(A, B, C, D)), baseline_count=1),
+            PathDelta(signature=PathSignature(steps=(A, B, C)), baseline_count=1),
+        ]
+        new = [PathDelta(signature=PathSignature(steps=(A, B, R, C)), current_count=1)]
+        (match,) = match_near_paths(missing, new)
+        assert match.baseline is missing[1]
+
+    def test_error_variant_matched(self) -> None:
+        missing = [PathDelta(signature=PathSignature(steps=(A, B)), baseline_count=1)]
+        new = [PathDelta(signature=PathSignature(steps=(A, B), has_error=True), current_count=1)]
+        (match,) = match_near_paths(missing, new)
+        assert match.distance == 0
+        assert match.error_changed
+
+    def test_disabled(self) -> None:
+        missing = [PathDelta(signature=PathSignature(steps=(A, B)), baseline_count=1)]
+        new = [PathDelta(signature=PathSignature(steps=(A, R, B)), current_count=1)]
+        assert match_near_paths(missing, new, max_distance=-1) == []
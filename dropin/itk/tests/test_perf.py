@@ -0,0 +1,229 @@
+"""Tests for the itk.perf stage timers, `--profile` and `--self-timeline`."""
+from __future__ import annotations
+
+import json
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+from typing import Iterator
+
+import pytest
+
+from itk import perf
+
+
+class FakeClock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.fixture
+def clock() -> Iterator[FakeClock]:
+    fake = FakeClock()
+    perf.enable(perf.PerfRecorder(clock=fake))
+    yield fake
+    perf.disable()
+
+
+class TestPerfRecorder:
+    """Tests for stages and counters."""
+
+    def test_disabled_by_default_is_noop(self) -> None:
+        assert perf.active() is None
+        with perf.stage("parse.x"):
+            perf.count("parse.lines", 5)
+
+        @perf.timed("render.y")
+        def render() -> str:
+            return "ok"
+
+        assert render() == "ok"
+        assert perf.active() is None
+
+    def test_nested_stages_report_self_time(self, clock: FakeClock) -> None:
+        @perf.timed("render.viewer")
+        def render() -> None:
+            clock.now += 2.0
+
+        with perf.stage("write.artifacts"):
+            clock.now += 1.0
+            render()
+            render()
+        perf.count("write.bytes", 100)
+        perf.count("write.bytes", 50)
+
+        data = perf.disable().to_dict()
+        stages = {s["name"]: s for s in data["stages"]}
+        assert stages["write.artifacts"]["total_ms"] == 5000
+        assert stages["write.artifacts"]["self_ms"] == 1000
+        assert stages["render.viewer"] == {
+            "name": "render.viewer",
+            "calls": 2,
+            "total_ms": 4000,
+            "self_ms": 4000,
+            "mean_ms": 2000,
+            "max_ms": 2000,
+        }
+        assert [s["name"] for s in data["stages"]] == ["write.artifacts", "render.viewer"]
+        assert data["counters"] == {"write.bytes": 150}
+
+    def test_stages_nest_per_thread(self) -> None:
+        recorder = perf.enable()
+        try:
+            def worker() -> None:
+                with perf.stage("render.thread"):
+                    time.sleep(0.01)
+
+            with perf.stage("suite.run"):
+                thread = threading.Thread(target=worker)
+                thread.start()
+                thread.join()
+        finally:
+            perf.disable()
+
+        stages = {s.name: s for s in recorder.stages.values()}
+        # Work in another thread doesn't count as nested time for this thread
+        assert stages["suite.run"].self_s == stages["suite.run"].total_s
+        assert stages["render.thread"].calls == 1
+
+    def test_pipeline_is_instrumented(self, clock: FakeClock) -> None:
+        from itk.correlation.dynamic_discovery import discover_correlations
+        from itk.logs.parse import parse_cloudwatch_logs
+
+        events = [{"timestamp": 1, "message": '{"component": "lambda", "operation": "x", "requestId": "r1"}'}]
+        parse_cloudwatch_logs(events)
+        discover_correlations(events)
+
+        recorder = perf.active()
+        assert {"parse.cloudwatch", "correlate.discover"} <= set(recorder.stages)
+        assert recorder.counters["parse.lines"] == 1
+        assert recorder.counters["parse.spans"] == 1
+        assert recorder.counters["correlate.lines"] == 1
+
+
+class TestSelfTimeline:
+    """Tests for recording stages as ITK's own spans."""
+
+    def test_intervals_become_nested_itk_spans(self) -> None:
+        clock = FakeClock()
+        recorder = perf.enable(perf.PerfRecorder(clock=clock, record_spans=True, wall_clock=lambda: 1_700_000_000.0))
+        try:
+            with perf.stage("write.artifacts"):
+                clock.now += 0.5
+                with perf.stage("render.timeline"):
+                    clock.now += 0.25
+            with perf.stage("load"):
+                clock.now += 0.125
+            perf.count("write.files", 3)
+        finally:
+            perf.disable()
+        clock.now += 10  # Time after recording stopped is not part of the run
+
+        root, write, render, load = recorder.to_spans("run")
+
+        assert (root.component, root.operation, root.parent_span_id) == ("itk:cli", "run", None)
+        assert root.response == {"counters": {"write.files": 3}}
+        assert (root.ts_start, root.ts_end) == ("2023-11-14T22:13:20+00:00", "2023-11-14T22:13:20.875000+00:00")
+        assert (write.component, write.operation, write.parent_span_id) == ("itk:write", "artifacts", root.span_id)
+        assert (render.component, render.operation, render.parent_span_id) == ("itk:render", "timeline", write.span_id)
+        assert (render.ts_start, render.ts_end) == ("2023-11-14T22:13:20.500000+00:00", "2023-11-14T22:13:20.750000+00:00")
+        assert (load.component, load.operation, load.parent_span_id) == ("itk:load", "load", root.span_id)
+
+    def test_span_cap_counts_dropped(self) -> None:
+        recorder = perf.enable(perf.PerfRecorder(record_spans=True, max_spans=2))
+        try:
+            for _ in range(5):
+                with perf.stage("render.x"):
+                    pass
+        finally:
+            perf.disable()
+
+        assert len(recorder.to_spans()) == 3
+        assert recorder.counters["perf.spans_dropped"] == 3
+        assert recorder.stages["render.x"].calls == 5
+
+    def test_intervals_not_kept_by_default(self, clock: FakeClock) -> None:
+        with perf.stage("parse.x"):
+            pass
+
+        assert perf.active().intervals == []
+
+
+class TestProfileSession:
+    """Tests for perf.json and the CPU profile outputs."""
+
+    def test_writes_perf_pstats_and_collapsed_stacks(self, tmp_path: Path) -> None:
+        import pstats
+
+        def busy_loop() -> None:
+            deadline = time.perf_counter() + 0.1
+            while time.perf_counter() < deadline:
+                sum(range(100))
+
+        with perf.ProfileSession(cpu=True, sample_interval_s=0.001) as session:
+            with perf.stage("render.busy"):
+                busy_loop()
+
+        paths = session.write(tmp_path, command="trace")
+
+        assert [p.name for p in paths] == ["perf.json", "profile.pstats", "profile.collapsed"]
+        data = json.loads((tmp_path / "perf.json").read_text(encoding="utf-8"))
+        assert data["command"] == "trace"
+        assert data["stages"][0]["name"] == "render.busy"
+        assert pstats.Stats(str(tmp_path / "profile.pstats")).total_calls > 0
+        collapsed = (tmp_path / "profile.collapsed").read_text(encoding="utf-8").splitlines()
+        assert any("test_perf:TestProfileSession.test_writes_perf_pstats_and_collapsed_stacks.<locals>.busy_loop" in line
+                   for line in collapsed)
+        assert all(line.rsplit(" ", 1)[1].isdigit() for line in collapsed)
+        assert perf.active() is None
+
+
+class TestProfileCli:
+    """Tests for `itk --profile` / `itk <command> --profile`."""
+
+    @pytest.mark.parametrize("before_command", [True, False])
+    def test_trace_writes_perf_json(self, tmp_path: Path, before_command: bool) -> None:
+        logs = Path(__file__).parent.parent / "fixtures" / "logs" / "support_bot_sample.jsonl"
+        out = tmp_path / "out"
+        trace_args = ["trace", "--logs", str(logs), "--out", str(out)]
+        args = ["--profile", *trace_args] if before_command else [*trace_args, "--profile"]
+
+        result = subprocess.run(
+            [sys.executable, "-m", "itk", *args],
+            cwd=str(Path(__file__).parent.parent / "src"),
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        data = json.loads((out / "perf.json").read_text(encoding="utf-8"))
+        assert data["command"] == "trace"
+        names = {s["name"] for s in data["stages"]}
+        assert {"load.logs", "correlate.discover"} <= names
+        assert data["counters"]["load.lines"] > 0
+        assert not (out / "profile.pstats").exists()
+        assert not (out / "self-timeline.html").exists()
+        assert "Profile" in result.stderr
+
+    def test_run_writes_self_timeline(self, tmp_path: Path) -> None:
+        root = Path(__file__).parent.parent
+        out = tmp_path / "run"
+
+        result = subprocess.run(
+            [sys.executable, "-m", "itk", "run", "--mode", "dev-fixtures",
+             "--case", str(root / "cases" / "agent_gatekeeper_basic.yaml"), "--out", str(out), "--self-timeline"],
+            cwd=str(root / "src"),
+            capture_output=True,
+            text=True,
+        )
+
+        assert result.returncode == 0, f"CLI failed: {result.stderr}"
+        html = (out / "self-timeline.html").read_text(encoding="utf-8")
+        for component in ("itk:cli", "itk:load", "itk:parse", "itk:render", "itk:write"):
+            assert component in html
+        assert not (out / "perf.json").exists()
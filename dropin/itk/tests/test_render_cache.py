@@ -0,0 +1,182 @@
+"""Tests for the content-hash render cache."""
+from __future__ import annotations
+
+import json
+import os
+from pathlib import Path
+
+import pytest
+
+import itk.config as config_module
+from itk.config import Config, Mode
+from itk.redaction import RedactionConfig
+from itk.report.suite_runner import run_suite
+from itk.trace.span_model import Span
+from itk.utils.render_cache import (
+    STAMP_FILENAME,
+    RenderCache,
+    read_stamp,
+    trace_fingerprint,
+)
+
+
+def _spans(operation: str = "InvokeLambda") -> list[Span]:
+    return [
+        Span(
+            span_id="span-001",
+            parent_span_id=None,
+            component="lambda:entry",
+            operation=operation,
+            request={"q": "hello"},
+        )
+    ]
+
+
+class _Renderer:
+    """Render function that counts invocations."""
+
+    def __init__(self, out_dir: Path) -> None:
+        self.out_dir = out_dir
+        self.calls = 0
+
+    def __call__(self) -> None:
+        self.calls += 1
+        (self.out_dir / "view.html").write_text(f"render {self.calls}", encoding="utf-8")
+
+
+class TestTraceFingerprint:
+    """Tests for trace_fingerprint."""
+
+    def test_stable_for_identical_spans(self) -> None:
+        assert trace_fingerprint(_spans()) == trace_fingerprint(_spans())
+
+    def test_changes_with_spans(self) -> None:
+        assert trace_fingerprint(_spans()) != trace_fingerprint(_spans("InvokeAgent"))
+
+    def test_changes_with_redaction_config(self) -> None:
+        enabled = trace_fingerprint(_spans(), redaction=RedactionConfig())
+        disabled = trace_fingerprint(_spans(), redaction=RedactionConfig(enabled=False))
+        assert enabled != disabled
+
+    def test_changes_with_extra(self) -> None:
+        assert trace_fingerprint(_spans(), extra={"title": "a"}) != trace_fingerprint(
+            _spans(), extra={"title": "b"}
+        )
+
+
+class TestRenderCache:
+    """Tests for RenderCache."""
+
+    def test_same_directory_hit(self, tmp_path: Path) -> None:
+        out_dir = tmp_path / "out"
+        out_dir.mkdir()
+        renderer = _Renderer(out_dir)
+        fp = trace_fingerprint(_spans())
+
+        cache = RenderCache(index_path=None)
+        assert cache.render(out_dir, fp, renderer) is False
+        assert cache.render(out_dir, fp, renderer) is True
+        assert renderer.calls == 1
+        assert cache.stats.hits == 1
+        assert cache.stats.misses == 1
+        assert cache.stats.hit_rate == 0.5
+        assert read_stamp(out_dir)["files"] == ["view.html"]
+
+    def test_changed_fingerprint_rerenders(self, tmp_path: Path) -> None:
+        renderer = _Renderer(tmp_path)
+        cache = RenderCache(index_path=None)
+        cache.render(tmp_path, trace_fingerprint(_spans()), renderer)
+        cache.render(tmp_path, trace_fingerprint(_spans("InvokeAgent")), renderer)
+        assert renderer.calls == 2
+
+    def test_missing_output_rerenders(self, tmp_path: Path) -> None:
+        renderer = _Renderer(tmp_path)
+        fp = trace_fingerprint(_spans())
+        cache = RenderCache(index_path=None)
+        cache.render(tmp_path, fp, renderer)
+        (tmp_path / "view.html").unlink()
+        cache.render(tmp_path, fp, renderer)
+        assert renderer.calls == 2
+
+    def test_force_always_renders(self, tmp_path: Path) -> None:
+        renderer = _Renderer(tmp_path)
+        fp = trace_fingerprint(_spans())
+        cache = RenderCache(index_path=None, force=True)
+        cache.render(tmp_path, fp, renderer)
+        cache.render(tmp_path, fp, renderer)
+        assert renderer.calls == 2
+        assert (tmp_path / STAMP_FILENAME).exists()
+
+    def test_links_from_other_directory(self, tmp_path: Path) -> None:
+        index_path = tmp_path / "cache" / "index.json"
+        first = tmp_path / "run-1"
+        second = tmp_path / "run-2"
+        fp = trace_fingerprint(_spans())
+
+        cache = RenderCache(index_path=index_path)
+        cache.render(first, fp, _Renderer(first))
+        cache.flush()
+
+        # A fresh cache instance picks up the persisted index
+        renderer = _Renderer(second)
+        cache = RenderCache(index_path=index_path)
+        assert cache.render(second, fp, renderer) is True
+        assert renderer.calls == 0
+        assert cache.stats.links == 1
+        assert (second / "view.html").read_text(encoding="utf-8") == "render 1"
+        if hasattr(os, "link"):
+            assert os.path.samefile(first / "view.html", second / "view.html")
+
+    def test_explicit_file_list(self, tmp_path: Path) -> None:
+        (tmp_path / "unrelated.txt").write_text("x", encoding="utf-8")
+        cache = RenderCache(index_path=None)
+        cache.render(tmp_path, "fp", _Renderer(tmp_path), files=["view.html"])
+        assert read_stamp(tmp_path)["files"] == ["view.html"]
+
+    def test_failed_render_retried_next_run(self, tmp_path: Path) -> None:
+        calls = 0
+
+        def flaky_render() -> None:
+            # Like `itk trace`'s chain renderer: errors are swallowed, the file is just missing
+            nonlocal calls
+            calls += 1
+            try:
+                if calls == 1:
+                    raise RuntimeError("renderer crashed")
+                (tmp_path / "view.html").write_text("ok", encoding="utf-8")
+            except RuntimeError:
+                pass
+
+        cache = RenderCache(index_path=None)
+        assert cache.render(tmp_path, "fp", flaky_render, files=["view.html"]) is False
+        assert read_stamp(tmp_path) is None
+
+        assert cache.render(tmp_path, "fp", flaky_render, files=["view.html"]) is False
+        assert calls == 2
+        assert read_stamp(tmp_path)["files"] == ["view.html"]
+        assert cache.render(tmp_path, "fp", flaky_render, files=["view.html"]) is True
+        assert calls == 2
+
+
+class TestSuiteRenderCache:
+    """Tests for render cache integration with run_suite."""
+
+    @pytest.fixture(autouse=True)
+    def _dev_fixtures_config(self, monkeypatch: pytest.MonkeyPatch) -> None:
+        monkeypatch.setattr(config_module, "_config", Config(mode=Mode.DEV_FIXTURES))
+
+    def test_second_run_hits_cache(self, cases_dir: Path, tmp_path: Path) -> None:
+        out_dir = tmp_path / "suite"
+        index_path = tmp_path / "index.json"
+
+        first = run_suite(cases_dir, out_dir, render_cache=RenderCache(index_path=index_path))
+        assert first.rendered_count > 0
+        assert first.render_cache_hits == 0
+
+        second = run_suite(cases_dir, out_dir, render_cache=RenderCache(index_path=index_path))
+        assert second.render_cache_hits == second.rendered_count
+        assert second.render_cache_hit_rate == 100.0
+        assert second.to_dict()["summary"]["render_cache_hits"] == second.rendered_count
+
+        stamp = json.loads((Path(second.cases[0].artifacts_dir) / STAMP_FILENAME).read_text())
+        assert "trace-viewer.html" in stamp["files"]
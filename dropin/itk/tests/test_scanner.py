@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import os
 import tempfile
 from pathlib import Path
 
 import pytest
 
 from itk.scanner import (
+    DEFAULT_EXCLUDE_PATTERNS,
     DetectedComponent,
     DetectedBranch,
     LoggingGap,
@@ -17,7 +19,9 @@ from itk.scanner import (
     compare_with_cases,
     generate_coverage_report,
     generate_skeleton_cases,
+    iter_python_files,
 )
+from itk.scanner.cache import ScanCache
 
 
 # ============================================================================
@@ -458,6 +462,99 @@ class TestScanCodebase:
         assert result.scanned_files == 1
 
 
+class TestIncrementalScan:
+    """Tests for pruned traversal, the scan cache and parallel scanning."""
+
+    def test_excluded_trees_pruned(self, temp_repo: Path) -> None:
+        (temp_repo / "pkg.egg-info").mkdir()
+        (temp_repo / "pkg.egg-info" / "setup.py").write_text("def handler(event, context): pass")
+        (temp_repo / "src" / "generated").mkdir(parents=True)
+        (temp_repo / "src" / "generated" / "gen.py").write_text("x = 1")
+        (temp_repo / "src" / "app.py").write_text("x = 1")
+        (temp_repo / "distribution.py").write_text("x = 1")
+
+        files = [
+            p.relative_to(temp_repo).as_posix()
+            for p, _ in iter_python_files(temp_repo, [*DEFAULT_EXCLUDE_PATTERNS, "src/generated"])
+        ]
+        assert files == ["distribution.py", "src/app.py"]
+
+    def test_second_scan_uses_cache(
+        self,
+        temp_repo: Path,
+        tmp_path_factory: pytest.TempPathFactory,
+        lambda_handler_file: Path,
+        cdk_infrastructure_file: Path,
+    ) -> None:
+        cache_dir = tmp_path_factory.mktemp("scan-cache")
+        first = scan_codebase(temp_repo, cache_dir=cache_dir)
+        second = scan_codebase(temp_repo, cache_dir=cache_dir)
+
+        assert first.cached_files == 0
+        assert second.cached_files == second.scanned_files == 2
+        assert second.components == first.components
+        assert second.branches == first.branches
+        assert second.logging_gaps == first.logging_gaps
+
+    def test_changed_file_rescanned(
+        self, temp_repo: Path, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        cache_dir = tmp_path_factory.mktemp("scan-cache")
+        handler = temp_repo / "handler.py"
+        handler.write_text("def handler(event, context): pass\n")
+        (temp_repo / "other.py").write_text("x = 1\n")
+        scan_codebase(temp_repo, cache_dir=cache_dir)
+
+        handler.write_text("def lambda_handler(event, context): pass\n")
+        st = handler.stat()
+        os.utime(handler, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        result = scan_codebase(temp_repo, cache_dir=cache_dir)
+
+        assert result.cached_files == 1
+        assert [c.name for c in result.components] == ["lambda-handler"]
+
+    def test_touched_file_reused_by_hash(
+        self, temp_repo: Path, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        cache_dir = tmp_path_factory.mktemp("scan-cache")
+        handler = temp_repo / "handler.py"
+        handler.write_text("def handler(event, context): pass\n")
+        scan_codebase(temp_repo, cache_dir=cache_dir)
+
+        st = handler.stat()
+        os.utime(handler, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        result = scan_codebase(temp_repo, cache_dir=cache_dir)
+        assert result.cached_files == 1
+        assert len(result.components) == 1
+
+    def test_corrupt_cache_ignored(
+        self, temp_repo: Path, tmp_path_factory: pytest.TempPathFactory
+    ) -> None:
+        cache_dir = tmp_path_factory.mktemp("scan-cache")
+        (temp_repo / "handler.py").write_text("def handler(event, context): pass\n")
+        scan_codebase(temp_repo, cache_dir=cache_dir)
+        for cache_file in cache_dir.iterdir():
+            cache_file.write_text("{not json")
+
+        result = scan_codebase(temp_repo, cache_dir=cache_dir)
+        assert result.cached_files == 0
+        assert len(result.components) == 1
+        assert len(ScanCache.load(cache_dir, temp_repo)) == 1
+
+    def test_workers_match_serial(
+        self,
+        temp_repo: Path,
+        lambda_handler_file: Path,
+        cdk_infrastructure_file: Path,
+        bedrock_action_file: Path,
+    ) -> None:
+        serial = scan_codebase(temp_repo)
+        parallel = scan_codebase(temp_repo, workers=2)
+        assert parallel.scanned_files == serial.scanned_files
+        assert parallel.components == serial.components
+        assert parallel.branches == serial.branches
+
+
 # ============================================================================
 # Coverage comparison tests
 # ============================================================================
@@ -429,6 +429,88 @@ def test_run_soak_with_throttle():
     assert result.final_rate < config.initial_rate
 
 
+def test_run_soak_separates_client_retries():
+    """Client-side retries are counted apart from span retries and feed throttle detection."""
+    from itk.soak.soak_runner import client_retry_throttles
+
+    config = SoakConfig(mode=SoakMode.ITERATIONS, iterations=2, initial_rate=10.0)
+    client_retry = {
+        "client_retries": 2,
+        "retries": [
+            {"attempt": 1, "code": "ThrottlingException", "delay_ms": 250.0, "throttle_type": "aws_throttle"},
+            {"attempt": 2, "code": "InternalServerException", "delay_ms": 400.0, "throttle_type": None},
+        ],
+    }
+
+    def run_iteration(i: int) -> IterationResult:
+        return IterationResult(
+            passed=True,
+            status="warning",
+            spans=[],
+            duration_ms=10.0,
+            retry_count=1,
+            client_retry_count=client_retry["client_retries"] if i == 0 else 0,
+            client_throttle_events=client_retry_throttles(client_retry) if i == 0 else [],
+        )
+
+    result = run_soak(config, run_iteration)
+
+    assert result.total_retries == 2
+    assert result.total_client_retries == 2
+    assert result.to_dict()["summary"]["total_client_retries"] == 2
+    assert [e.throttle_type for e in result.all_throttle_events] == [ThrottleType.AWS_THROTTLE]
+    assert result.iterations[0].to_dict()["client_retry_count"] == 2
+
+
+def test_live_sqs_batch_resends_count_as_client_retries(monkeypatch, tmp_path):
+    """Throttled SQS batch entries reach the soak as client retries and throttle events."""
+    from pathlib import Path
+
+    from itk import cli
+    from itk.aws.retry import RetryEngine, RetryPolicy
+    from itk.entrypoints.sqs_event import SqsEventAdapter, SqsEventTarget
+    from itk.soak.soak_runner import run_soak_with_case
+
+    class ThrottleOnceClient:
+        def __init__(self):
+            self.throttled = False
+
+        def send_message_batch(self, QueueUrl, Entries):
+            failed = [] if self.throttled else [
+                {"Id": Entries[0]["Id"], "Code": "ThrottlingException", "SenderFault": False}
+            ]
+            self.throttled = True
+            failed_ids = {f["Id"] for f in failed}
+            return {
+                "Successful": [
+                    {"Id": e["Id"], "MessageId": f"msg-{e['Id']}"} for e in Entries if e["Id"] not in failed_ids
+                ],
+                "Failed": failed,
+            }
+
+    def run_live_mode(case_path, config):
+        adapter = SqsEventAdapter(
+            SqsEventTarget(mode="publish_sqs", target_arn_or_url="https://sqs.us-east-1.amazonaws.com/1/q"),
+            retry=RetryEngine(RetryPolicy(max_attempts=3), sleep=lambda _: None),
+        )
+        adapter._sqs_client = ThrottleOnceClient()
+        payload = {"Records": [{"body": {"order": i}} for i in range(3)]}
+        return cli._run_sqs_batch(
+            adapter, payload, config, "us-east-1", datetime.now(timezone.utc), repeat=1, concurrency=1
+        )
+
+    monkeypatch.setattr(cli, "_run_live_mode", run_live_mode)
+    monkeypatch.setattr(cli, "_fetch_cloudwatch_spans", lambda *args, **kwargs: [])
+    case_path = Path(__file__).parent.parent / "cases" / "sqs_basic_message.yaml"
+    config = SoakConfig(mode=SoakMode.ITERATIONS, iterations=1, initial_rate=10.0)
+
+    result = run_soak_with_case(case_path, config, tmp_path, mode="live", detailed=False)
+
+    assert result.total_client_retries == 1
+    assert [e.throttle_type for e in result.all_throttle_events] == [ThrottleType.AWS_THROTTLE]
+    assert result.iterations[0].to_dict()["client_retry_count"] == 1
+
+
 def test_run_soak_callbacks():
     """Test soak run callbacks."""
     config = SoakConfig(mode=SoakMode.ITERATIONS, iterations=3)
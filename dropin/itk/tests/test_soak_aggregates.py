@@ -0,0 +1,179 @@
+"""Tests for bounded soak aggregates and the live soak report."""
+from __future__ import annotations
+
+import json
+import random
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+from itk.soak import SoakIteration, SoakMode, SoakResult, ThrottleEvent, ThrottleType
+from itk.soak.aggregates import (
+    SeriesDownsampler,
+    SoakAggregates,
+    lttb,
+)
+from itk.soak.soak_report import LiveSoakReport, render_soak_report, write_soak_report
+from itk.utils.histogram import LatencyHistogram
+
+START = datetime(2026, 1, 1, tzinfo=timezone.utc)
+
+
+def _iteration(i: int, *, seconds: float | None = None, **kwargs) -> SoakIteration:
+    ts = START + timedelta(seconds=i if seconds is None else seconds)
+    return SoakIteration(iteration=i, duration_ms=100.0 + i % 50, timestamp=ts.isoformat(), **kwargs)
+
+
+def _result(n: int) -> SoakResult:
+    iterations = []
+    for i in range(n):
+        if i % 10 == 0:
+            iterations.append(_iteration(i, passed=True, retry_count=1, status="warning"))
+        elif i % 17 == 0:
+            iterations.append(_iteration(i, passed=False, status="failed"))
+        else:
+            iterations.append(_iteration(i))
+    return SoakResult(
+        soak_id="soak-test",
+        case_name="demo",
+        mode=SoakMode.ITERATIONS,
+        start_time=START.isoformat(),
+        duration_seconds=float(n),
+        iterations=iterations,
+    )
+
+
+class TestLatencyHistogram:
+    """Tests for LatencyHistogram."""
+
+    def test_percentiles_within_one_percent(self) -> None:
+        rng = random.Random(7)
+        values = [rng.uniform(1, 5000) for _ in range(20000)]
+        hist = LatencyHistogram()
+        for v in values:
+            hist.record(v)
+
+        values.sort()
+        for pct in (50, 90, 99):
+            exact = values[int(len(values) * pct / 100) - 1]
+            assert abs(hist.percentile(pct) - exact) / exact < 0.01
+        assert hist.to_dict()["max_ms"] == max(values)
+
+    def test_bucket_count_independent_of_samples(self) -> None:
+        hist = LatencyHistogram()
+        for i in range(100000):
+            hist.record(100 + i % 200)
+        assert hist.bucket_count < 500
+
+    def test_empty(self) -> None:
+        assert LatencyHistogram().to_dict()["p99_ms"] == 0
+
+
+class TestDownsampling:
+    """Tests for lttb and SeriesDownsampler."""
+
+    def test_lttb_keeps_endpoints(self) -> None:
+        points = [(float(i), float(i % 13)) for i in range(1000)]
+        sampled = lttb(points, 50)
+        assert len(sampled) == 50
+        assert sampled[0] == points[0]
+        assert sampled[-1] == points[-1]
+
+    def test_lttb_short_series_unchanged(self) -> None:
+        points = [(0.0, 1.0), (1.0, 2.0)]
+        assert lttb(points, 10) == points
+
+    def test_downsampler_bounded(self) -> None:
+        series = SeriesDownsampler(max_points=100)
+        for i in range(50000):
+            series.add(i, i % 7)
+            assert len(series._points) <= 200
+        points = series.points()
+        assert len(points) == 100
+        assert points[-1] == (49999, 49999 % 7)
+
+
+class TestSoakAggregates:
+    """Tests for SoakAggregates."""
+
+    def test_counts_match_result(self) -> None:
+        result = _result(200)
+        agg = SoakAggregates.from_result(result)
+        assert agg.total == result.total_iterations
+        assert agg.clean == result.total_clean_passes
+        assert agg.warnings == result.total_warnings
+        assert agg.failures == result.total_failures
+        assert agg.pass_rate == result.pass_rate
+        assert agg.consistency_score == result.consistency_score
+        assert agg.complete
+
+    def test_windows_bounded(self) -> None:
+        agg = SoakAggregates(
+            soak_id="s", case_name="c", mode="duration", start_time=START.isoformat(),
+            window_seconds=1.0, max_windows=10,
+        )
+        for i in range(1000):
+            agg.add_iteration(_iteration(i))
+        windows = agg.windows
+        assert len(windows) <= 10
+        assert sum(w.clean for w in windows) == 1000
+        assert agg.window_seconds > 1.0
+
+    def test_throttles_counted_by_type(self) -> None:
+        agg = SoakAggregates(soak_id="s", case_name="c", mode="iterations", start_time=None)
+        event = ThrottleEvent(
+            timestamp=START.isoformat(), throttle_type=ThrottleType.HTTP_429, source="lambda"
+        )
+        agg.add_iteration(_iteration(0, passed=False, status="failed", throttle_events=[event]))
+        data = agg.to_dict()
+        assert data["throttle_by_type"][ThrottleType.HTTP_429.value] == 1
+        assert data["summary"]["total_throttle_events"] == 1
+        assert data["windows"][0]["throttles"] == 1
+
+
+class TestSoakReport:
+    """Tests for the aggregate-based soak report."""
+
+    def test_report_size_bounded(self) -> None:
+        small = render_soak_report(_result(1000))
+        large = render_soak_report(_result(10000))
+        assert len(large) < len(small) * 1.1
+
+    def test_no_meta_refresh(self) -> None:
+        html = render_soak_report(_result(10))
+        assert 'http-equiv="refresh"' not in html
+        # Polled with a script tag, which also works for file:// pages
+        assert "progress.js" in html
+        assert "fetch('progress" not in html
+
+    def test_write_includes_progress(self, tmp_path: Path) -> None:
+        write_soak_report(_result(20), tmp_path)
+        progress = json.loads((tmp_path / "progress.json").read_text(encoding="utf-8"))
+        assert progress["complete"] is True
+        assert progress["summary"]["total_iterations"] == 20
+        script = (tmp_path / "progress.js").read_text(encoding="utf-8")
+        assert script.startswith("itkSoakProgress(") and script.endswith(");\n")
+        assert json.loads(script[len("itkSoakProgress("):-3]) == progress
+        assert (tmp_path / "soak-result.json").exists()
+
+
+class TestLiveSoakReport:
+    """Tests for LiveSoakReport."""
+
+    def test_progress_updates(self, tmp_path: Path) -> None:
+        live = LiveSoakReport(tmp_path, case_name="demo", mode="iterations", min_interval_seconds=0)
+        html_path = live.start()
+        html = html_path.read_text(encoding="utf-8")
+
+        for i in range(3):
+            live.add_iteration(_iteration(i))
+        live.add_rate_change(1.0, 0.5, "throttle")
+
+        progress = json.loads(live.progress_path.read_text(encoding="utf-8"))
+        assert progress["complete"] is False
+        assert progress["summary"]["total_iterations"] == 3
+        assert [it["iteration"] for it in progress["recent_iterations"]] == [0, 1, 2]
+        # The page itself is not rewritten per iteration
+        assert html_path.read_text(encoding="utf-8") == html
+
+        live.finish(_result(3))
+        assert json.loads(live.progress_path.read_text(encoding="utf-8"))["complete"] is True
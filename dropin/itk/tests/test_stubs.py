@@ -0,0 +1,287 @@
+"""Tests for the local AWS stand-in server.
+
+Live-mode adapters and fetchers run unchanged against the stub; boto3 is
+pointed at it through `StubServer.activate()`.
+"""
+from __future__ import annotations
+
+import time
+from typing import Iterator
+
+import pytest
+
+from itk.aws.retry import RetryEngine, RetryPolicy
+from itk.stubs import LogStore, ServiceBehavior, StubConfig, StubServer
+
+
+@pytest.fixture
+def stub(monkeypatch: pytest.MonkeyPatch) -> Iterator[StubServer]:
+    # Leave retries to ITK's engine so throttles are visible to the tests
+    monkeypatch.setenv("AWS_MAX_ATTEMPTS", "1")
+    server = StubServer(
+        StubConfig(
+            seed=1,
+            lambda_duration_ms=1,
+            consumer_delay_ms=1,
+            trace_steps=2,
+            sqs_consumers={"orders": "order-worker"},
+        )
+    )
+    with server, server.activate():
+        yield server
+
+
+def _engine() -> RetryEngine:
+    return RetryEngine(RetryPolicy(max_attempts=3), sleep=lambda _: None)
+
+
+def _wait_for(predicate, timeout: float = 2.0) -> None:
+    deadline = time.monotonic() + timeout
+    while not predicate() and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+
+class TestBedrockAgentStub:
+    """InvokeAgent streaming through BedrockAgentAdapter."""
+
+    def test_streams_completion_and_traces(self, stub: StubServer) -> None:
+        from itk.entrypoints.bedrock_agent import BedrockAgentAdapter, BedrockAgentTarget
+        from itk.trace.trace_model import bedrock_traces_to_spans, parse_bedrock_trace_event
+
+        adapter = BedrockAgentAdapter(
+            BedrockAgentTarget(agent_id="AGENT1", agent_alias_id="ALIAS1", region="us-east-1"),
+            retry=_engine(),
+        )
+
+        response = adapter.invoke("What's my order status?", session_id="sess-1", enable_trace=True)
+
+        assert response.completion == stub.config.completion_text
+        assert response.timing.chunk_count == stub.config.chunk_count
+        assert len(response.traces) == 10  # 5 orchestration events per step
+        spans = bedrock_traces_to_spans([parse_bedrock_trace_event(t) for t in response.traces], "sess-1")
+        components = [s.component for s in spans]
+        assert components.count("agent:bedrock-model") == 2
+        assert components.count("lambda:stub-action-group") == 2
+        assert len(stub.logs.events("/aws/lambda/stub-action-group")) == 2
+
+
+class TestLambdaStub:
+    """Lambda Invoke through LambdaDirectAdapter."""
+
+    def test_sync_invoke_returns_payload_and_log_tail(self, stub: StubServer) -> None:
+        from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+
+        adapter = LambdaDirectAdapter(
+            LambdaTarget(function_name_or_arn="arn:aws:lambda:us-east-1:1:function:worker:live", region="us-east-1"),
+            retry=_engine(),
+        )
+
+        response = adapter.invoke({"itk_trace_id": "itk-1"})
+
+        assert response.status_code == 200
+        assert response.payload == stub.config.lambda_response
+        assert response.log_result.startswith("START RequestId")
+        assert '"itk_trace_id": "itk-1"' in response.log_result
+        assert len(stub.logs.events("/aws/lambda/worker")) == 4
+
+    def test_throttle_every_nth_call(self, stub: StubServer) -> None:
+        from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+
+        stub.config.services["lambda"] = ServiceBehavior(throttle_every=2)
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="worker", region="us-east-1"), retry=_engine())
+
+        responses = [adapter.invoke_async({}) for _ in range(3)]
+
+        assert [r.status_code for r in responses] == [202, 202, 202]
+        assert sum(r.retry.client_retries for r in responses) == 2
+        assert stub.stats()["calls"]["lambda:Invoke"] == 5
+
+    def test_fanout_end_to_end_latency_from_logs(self, stub: StubServer) -> None:
+        from itk.entrypoints.lambda_direct import LambdaDirectAdapter, LambdaTarget
+        from itk.entrypoints.lambda_fanout import LambdaFanout
+        from itk.logs.cloudwatch_fetch import CloudWatchLogsClient
+
+        adapter = LambdaDirectAdapter(LambdaTarget(function_name_or_arn="worker", region="us-east-1"), retry=_engine())
+        fanout = LambdaFanout(adapter, rate_per_second=500)
+
+        result = fanout.fire({"action": "ping"}, count=20)
+        _wait_for(lambda: len(stub.logs.events("/aws/lambda/worker")) == 80)
+        completed = fanout.collect(result, ["/aws/lambda/worker"], CloudWatchLogsClient(region="us-east-1"))
+
+        assert completed == 20
+        assert {i.log_events for i in result.invocations} == {1}  # One line per run carries the ID
+        assert result.end_to_end_latency().min_ms >= 0
+
+
+class TestSqsStub:
+    """SQS sends and consumer delivery."""
+
+    def test_batch_replay_is_consumed_and_correlated(self, stub: StubServer) -> None:
+        from itk.entrypoints.sqs_event import SqsEventAdapter, SqsEventTarget
+
+        adapter = SqsEventAdapter(
+            SqsEventTarget(mode="publish_sqs", target_arn_or_url=f"{stub.url}/000000000000/orders", region="us-east-1"),
+            retry=_engine(),
+        )
+        event = {"Records": [{"body": {"order": i}} for i in range(25)]}
+
+        result = adapter.replay_batch(event, itk_trace_id="itk-batch")
+        _wait_for(lambda: len(stub.logs.events("/aws/lambda/order-worker")) == 100)
+
+        assert result.sent_count == 25
+        assert len(stub.messages["orders"]) == 25
+        logged = " ".join(e.message for e in stub.logs.events("/aws/lambda/order-worker"))
+        assert all(message_id in logged for message_id in result.message_ids)
+        assert '"itk_trace_id": "itk-batch"' in logged
+
+    def test_batch_entry_failures_are_resent(self, stub: StubServer) -> None:
+        from itk.entrypoints.sqs_event import SqsEventAdapter, SqsEventTarget
+
+        stub.config.batch_entry_failure_rate = 0.3
+        adapter = SqsEventAdapter(
+            SqsEventTarget(mode="publish_sqs", target_arn_or_url=f"{stub.url}/000000000000/other"),
+            retry=RetryEngine(RetryPolicy(max_attempts=10), sleep=lambda _: None),
+        )
+
+        result = adapter.replay_batch({"Records": [{"body": i} for i in range(30)]})
+
+        assert result.sent_count == 30
+        assert result.client_retries > 0
+        assert len(stub.messages["other"]) == 30
+
+
+class TestLogsStub:
+    """CloudWatch Logs APIs answered from the log store."""
+
+    def test_insights_query_through_cloudwatch_client(self, stub: StubServer) -> None:
+        from itk.logs.cloudwatch_fetch import CloudWatchLogsClient, CloudWatchQuery
+
+        now = time.time()
+        stub.logs.put("/aws/lambda/a", '{"itk_trace_id": "t1", "component": "lambda:a"}')
+        stub.logs.put("/aws/lambda/a", '{"itk_trace_id": "t2", "component": "lambda:a"}')
+        stub.logs.put("/aws/lambda/b", "plain text t1")
+
+        result = CloudWatchLogsClient(region="us-east-1").run_query(
+            CloudWatchQuery(
+                log_groups=["/aws/lambda/a", "/aws/lambda/b"],
+                query_string='fields @timestamp, @message | filter itk_trace_id in ["t1"] | limit 10',
+                start_time_ms=int((now - 60) * 1000),
+                end_time_ms=int((now + 60) * 1000),
+            )
+        )
+
+        assert [r["@message"] for r in result.results] == ['{"itk_trace_id": "t1", "component": "lambda:a"}']
+
+    def test_filter_log_events_paginates(self, stub: StubServer) -> None:
+        from itk.aws import get_client
+
+        for i in range(25):
+            stub.logs.put("/aws/lambda/many", f"line {i}")
+
+        pages = get_client("logs", "us-east-1").get_paginator("filter_log_events").paginate(
+            logGroupName="/aws/lambda/many", limit=10
+        )
+        events = [e for page in pages for e in page["events"]]
+
+        assert [e["message"] for e in events] == [f"line {i}" for i in range(25)]
+
+
+class TestLiveRunStub:
+    """`itk run --mode live` pieces against the stub: preflight and invoke."""
+
+    def test_caller_identity_is_xml(self, stub: StubServer) -> None:
+        from itk.aws import get_client
+
+        identity = get_client("sts", "us-east-1").get_caller_identity()
+
+        assert identity["Account"] == "000000000000"
+        assert identity["Arn"].endswith(":user/itk-stub")
+
+    def test_preflight_passes(self, stub: StubServer) -> None:
+        from itk.preflight import run_preflight_checks
+
+        result = run_preflight_checks(region="us-east-1", agent_id="AGENT1")
+
+        assert [c.name for c in result.checks] == ["aws_credentials", "agent_accessible"]
+        assert not result.critical_failed
+        assert stub.stats()["calls"] == {"bedrock-agent:GetAgent": 1, "sts:GetCallerIdentity": 1}
+
+    def test_run_lambda_invoke_end_to_end(self, stub: StubServer, monkeypatch: pytest.MonkeyPatch) -> None:
+        from itk import cli
+        from itk.cases.loader import CaseConfig, EntrypointConfig
+        from itk.config import Config, Targets
+
+        # Skip the CloudWatch propagation wait; the stub's log store is immediate
+        sleep = time.sleep
+        monkeypatch.setattr(time, "sleep", lambda seconds: sleep(min(seconds, 0.01)))
+        case = CaseConfig(
+            id="stub-lambda",
+            name="Lambda through the stub",
+            entrypoint=EntrypointConfig(
+                type="lambda_invoke",
+                target={"function_name_or_arn": "worker", "region": "us-east-1"},
+                payload={"itk_trace_id": "itk-e2e", "action": "process"},
+            ),
+            invariants=[],
+            notes={},
+        )
+        config = Config(targets=Targets(log_groups=["/aws/lambda/worker"]))
+
+        trace, response = cli._run_lambda_invoke(case, config)
+
+        assert response["status_code"] == 200
+        assert response["payload"] == stub.config.lambda_response
+        assert response["function_error"] is None
+        assert [s.component for s in trace.spans] == ["lambda:worker"]
+        assert stub.stats()["calls"] == {"lambda:Invoke": 1, "logs:GetQueryResults": 1, "logs:StartQuery": 1}
+
+
+class TestLogStore:
+    """Tests for the supported Logs Insights subset."""
+
+    @pytest.fixture
+    def store(self) -> LogStore:
+        store = LogStore()
+        for i, message in enumerate(
+            ['{"itk_trace_id": "a"}', "START RequestId: 1", '{"itk_trace_id": "b"}', "ERROR | boom"]
+        ):
+            store.put("g", message, timestamp_ms=1_000_000 + i)
+        return store
+
+    @pytest.mark.parametrize(
+        ("query", "expected"),
+        [
+            ("fields @message | filter @message like /START|ERROR/", ["START RequestId: 1", "ERROR | boom"]),
+            ('filter @message like "boom"', ["ERROR | boom"]),
+            ('filter itk_trace_id = "b"', ['{"itk_trace_id": "b"}']),
+            ('filter itk_trace_id = "a" or @message like /START/', ['{"itk_trace_id": "a"}', "START RequestId: 1"]),
+            ("sort @timestamp desc | limit 1", ["ERROR | boom"]),
+        ],
+    )
+    def test_query(self, store: LogStore, query: str, expected: list[str]) -> None:
+        rows = store.run_query(["g"], 999, 1001, query)
+
+        assert [r["@message"] for r in rows] == expected
+
+    def test_parse_and_stats_by_field(self) -> None:
+        store = LogStore()
+        for ts, message in [(5, "start run-1"), (9, "done run-1"), (7, "done run-2"), (8, "unrelated")]:
+            store.put("g", message, timestamp_ms=1_000_000 + ts)
+
+        rows = store.run_query(
+            ["g"],
+            999,
+            1001,
+            "filter @message like /run-/ | parse @message /(?<cid>run-\\d+)/"
+            " | stats max(@timestamp) as last, count(*) as n by cid | sort last desc",
+        )
+
+        assert rows == [
+            {"cid": "run-1", "last": "1000009", "n": "2"},
+            {"cid": "run-2", "last": "1000007", "n": "1"},
+        ]
+
+    def test_filter_pattern_terms(self, store: LogStore) -> None:
+        events = store.filter_events("g", filter_pattern='"itk_trace_id" b')
+
+        assert [e.message for e in events] == ['{"itk_trace_id": "b"}']
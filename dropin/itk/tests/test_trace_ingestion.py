@@ -125,6 +125,34 @@ class TestBedrockTracesToSpans:
         assert span.request is not None
         assert "reasoning" in span.request
 
+    def test_client_timing_spans(self, fixtures_dir: Path) -> None:
+        """Client-side stream timing becomes spans under the orchestrator."""
+        from itk.entrypoints.bedrock_agent import StreamPhase, StreamTiming
+
+        trace_path = fixtures_dir / "traces" / "bedrock_trace_sample_001.jsonl"
+        events = load_bedrock_trace_jsonl(trace_path)
+        timing = StreamTiming(
+            started_at="2026-01-18T12:00:00+00:00",
+            request_ms=80.0,
+            total_ms=1500.0,
+            chunk_count=2,
+            chunk_bytes=10,
+            chunk_offsets_ms=[1200.0, 1450.0],
+            phases=[StreamPhase("model-invocation", 100.0, 900.0, 2)],
+        )
+
+        spans = bedrock_traces_to_spans(events, client_timing=timing)
+
+        by_id = {s.span_id: s for s in spans}
+        stream = by_id["bedrock-client-stream"]
+        assert stream.parent_span_id == "bedrock-orchestrator-000"
+        assert stream.ts_end == "2026-01-18T12:00:01.500000+00:00"
+        assert stream.response["ttft_ms"] == 1200.0
+        assert by_id["bedrock-client-ttft"].ts_end == "2026-01-18T12:00:01.200000+00:00"
+        phase = by_id["bedrock-client-phase-001"]
+        assert phase.operation == "ModelInvocation"
+        assert phase.ts_start == "2026-01-18T12:00:00.100000+00:00"
+
 
 class TestMergeTraceIntoLogSpans:
     """Tests for merging trace spans with log spans."""
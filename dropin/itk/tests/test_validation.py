@@ -2,9 +2,14 @@
 from __future__ import annotations
 
 import json
+import os
 import pytest
 from pathlib import Path
 
+from itk.cases.loader import load_case
+from itk.utils.schema_cache import clear_caches, compiled_validator
+from itk.validation.streaming import FastCheck, compile_fast_check, validate_fixture_stream
+
 from itk.validation import (
     ValidationResult,
     ValidationError,
@@ -334,3 +339,165 @@ entrypoint:
         )
         result = validate_fixture(fixture_file)
         assert result.valid
+
+
+# ============================================================================
+# Test validator and parsed-case caches
+# ============================================================================
+
+
+CASE_YAML = """
+id: cached-001
+name: {name}
+entrypoint:
+  type: http
+  target:
+    url: https://example.com
+  payload:
+    body: test
+"""
+
+
+def _bump_mtime(path: Path) -> None:
+    """Move a file's mtime forward so the change is visible to the cache."""
+    st = path.stat()
+    os.utime(path, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+
+
+class TestSchemaCache:
+    """Tests for compiled validator and parsed-file caches."""
+
+    def test_validator_reused(self) -> None:
+        schema_path = Path(__file__).parent.parent / "schemas" / "itk.span.schema.json"
+        assert compiled_validator(schema_path) is compiled_validator(schema_path)
+
+    def test_validator_rebuilt_when_schema_changes(self, tmp_path: Path) -> None:
+        schema_path = tmp_path / "schema.json"
+        schema_path.write_text(json.dumps({"type": "object"}), encoding="utf-8")
+        first = compiled_validator(schema_path)
+        assert first.is_valid({})
+
+        schema_path.write_text(json.dumps({"type": "object", "required": ["id"]}), encoding="utf-8")
+        _bump_mtime(schema_path)
+        second = compiled_validator(schema_path)
+        assert second is not first
+        assert not second.is_valid({})
+
+    def test_load_case_cached_until_modified(self, tmp_path: Path) -> None:
+        case_file = tmp_path / "case.yaml"
+        case_file.write_text(CASE_YAML.format(name="First"), encoding="utf-8")
+        first = load_case(case_file)
+        assert load_case(case_file) is first
+
+        case_file.write_text(CASE_YAML.format(name="Second"), encoding="utf-8")
+        _bump_mtime(case_file)
+        assert load_case(case_file).name == "Second"
+
+    def test_invalid_case_not_cached(self, tmp_path: Path) -> None:
+        case_file = tmp_path / "case.yaml"
+        case_file.write_text("id: broken\n", encoding="utf-8")
+        with pytest.raises(ValueError):
+            load_case(case_file)
+
+        case_file.write_text(CASE_YAML.format(name="Fixed"), encoding="utf-8")
+        _bump_mtime(case_file)
+        assert load_case(case_file).name == "Fixed"
+
+    def test_clear_caches(self, tmp_path: Path) -> None:
+        case_file = tmp_path / "case.yaml"
+        case_file.write_text(CASE_YAML.format(name="First"), encoding="utf-8")
+        first = load_case(case_file)
+        clear_caches()
+        assert load_case(case_file) is not first
+
+
+# ============================================================================
+# Test streaming fixture validation
+# ============================================================================
+
+
+def _span_line(i: int, **extra: object) -> str:
+    return json.dumps({"span_id": f"s{i}", "component": "lambda:x", "operation": "Invoke", **extra})
+
+
+class TestFastCheck:
+    """Tests for the compiled span schema fast path."""
+
+    @pytest.fixture
+    def check(self) -> FastCheck:
+        schema = json.loads((Path(__file__).parent.parent / "schemas" / "itk.span.schema.json").read_text())
+        compiled = compile_fast_check(schema)
+        assert compiled is not None
+        return compiled
+
+    def test_accepts_valid_span(self, check: FastCheck) -> None:
+        assert check.accepts(json.loads(_span_line(1, attempt=2, error={"code": "E", "retryable": True})))
+
+    @pytest.mark.parametrize(
+        "span",
+        [
+            {"span_id": "s1", "component": "c"},
+            {"span_id": 1, "component": "c", "operation": "o"},
+            {"span_id": "s1", "component": "c", "operation": "o", "attempt": 0},
+            {"span_id": "s1", "component": "c", "operation": "o", "attempt": True},
+            {"span_id": "s1", "component": "c", "operation": "o", "error": {"retryable": "yes"}},
+            ["not", "an", "object"],
+        ],
+    )
+    def test_rejects_invalid_span(self, check: FastCheck, span: object) -> None:
+        assert not check.accepts(span)
+
+    def test_unsupported_keyword_disables_fast_path(self) -> None:
+        assert compile_fast_check({"type": "string", "pattern": "^a"}) is None
+
+
+class TestValidateFixtureStream:
+    """Tests for chunked fixture validation."""
+
+    def test_line_numbers_across_chunks(self, tmp_path: Path) -> None:
+        fixture_file = tmp_path / "spans.jsonl"
+        lines = [_span_line(i) for i in range(200)]
+        lines[57] = '{"span_id": "bad"}'
+        lines[150] = "not json"
+        fixture_file.write_text("\n".join(lines) + "\n", encoding="utf-8")
+
+        result = validate_fixture_stream(fixture_file, workers=1, chunk_bytes=512)
+        assert not result.valid
+        assert {e.line_number for e in result.errors} == {58, 151}
+        assert any("'component' is a required property" == e.message for e in result.errors)
+
+    def test_worker_pool_matches_in_process(self, tmp_path: Path) -> None:
+        fixture_file = tmp_path / "spans.jsonl"
+        lines = [_span_line(i) for i in range(300)]
+        for i in (3, 120, 299):
+            lines[i] = json.dumps({"span_id": i})
+        fixture_file.write_text("\n".join(lines), encoding="utf-8")
+
+        serial = validate_fixture_stream(fixture_file, workers=1, chunk_bytes=1024)
+        parallel = validate_fixture_stream(fixture_file, workers=2, chunk_bytes=1024)
+        assert parallel.errors == serial.errors
+        assert {e.line_number for e in serial.errors} == {4, 121, 300}
+
+    def test_max_errors_stops_early(self, tmp_path: Path) -> None:
+        fixture_file = tmp_path / "spans.jsonl"
+        fixture_file.write_text("\n".join("{}" for _ in range(100)), encoding="utf-8")
+
+        result = validate_fixture_stream(fixture_file, workers=1, max_errors=5, chunk_bytes=64)
+        assert len(result.errors) == 5
+        assert result.truncated
+        assert "stopped after 5 errors" in result.summary()
+
+    def test_blank_lines_keep_file_line_numbers(self, tmp_path: Path) -> None:
+        fixture_file = tmp_path / "spans.jsonl"
+        fixture_file.write_text("\n\n" + _span_line(1) + "\n\n{}\n", encoding="utf-8")
+
+        result = validate_fixture(fixture_file)
+        assert {e.line_number for e in result.errors} == {5}
+
+    def test_blank_only_fixture_is_empty(self, tmp_path: Path) -> None:
+        fixture_file = tmp_path / "blank.jsonl"
+        fixture_file.write_text("\n  \n", encoding="utf-8")
+
+        result = validate_fixture_stream(fixture_file)
+        assert not result.valid
+        assert result.errors[0].message == "Fixture file is empty"
@@ -1,11 +1,14 @@
 """Tests for Bedrock Agent version resolution."""
-from datetime import datetime
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any
 
 import pytest
 
 from itk.entrypoints.version_resolver import (
     AgentAlias,
     AgentVersion,
+    ResolutionCache,
     ResolvedAgent,
     VersionResolver,
 )
@@ -188,3 +191,133 @@ class TestAgentAlias:
         assert alias.alias_id == "ALIAS123"
         assert alias.alias_name == "production"
         assert alias.agent_version == "5"
+
+
+class FakeBedrockAgent:
+    """Minimal bedrock-agent client returning configurable listings."""
+
+    def __init__(self, versions: list[str], aliases: dict[str, str]) -> None:
+        self.versions = versions  # Oldest first, all PREPARED
+        self.aliases = aliases  # alias ID -> version
+        self.calls: list[str] = []
+
+    def get_paginator(self, operation: str) -> "FakeBedrockAgent":
+        self.calls.append(operation)
+        self._operation = operation
+        return self
+
+    def paginate(self, agentId: str) -> list[dict[str, Any]]:
+        if self._operation == "list_agent_versions":
+            return [{"agentVersionSummaries": [
+                {
+                    "agentVersion": v,
+                    "agentStatus": "PREPARED",
+                    "createdAt": datetime(2026, 1, i + 1, tzinfo=timezone.utc),
+                }
+                for i, v in enumerate(self.versions)
+            ]}]
+        return [{"agentAliasSummaries": [
+            {
+                "agentAliasId": alias_id,
+                "agentAliasName": alias_id.lower(),
+                "agentAliasStatus": "PREPARED",
+                "routingConfiguration": [{"agentVersion": version}],
+            }
+            for alias_id, version in self.aliases.items()
+        ]}]
+
+
+def _resolver(client: FakeBedrockAgent, cache: ResolutionCache) -> VersionResolver:
+    resolver = VersionResolver(region="us-east-1", cache=cache)
+    resolver._client = client
+    return resolver
+
+
+class TestResolutionCache:
+    """Tests for listings shared across resolvers."""
+
+    def test_second_resolver_uses_cached_listings(self) -> None:
+        client = FakeBedrockAgent(["1", "2"], {"LIVE": "2"})
+        cache = ResolutionCache()
+
+        first = _resolver(client, cache).resolve("AGENT", agent_version="latest")
+        second = _resolver(client, cache).resolve("AGENT", agent_version="latest")
+
+        assert first == second
+        assert second.agent_alias_id == "LIVE"
+        # "latest" re-lists versions; the unchanged newest version keeps cached aliases
+        assert client.calls == ["list_agent_versions", "list_agent_aliases", "list_agent_versions"]
+        assert cache.hits == 2
+
+    def test_latest_sees_newly_prepared_version(self) -> None:
+        client = FakeBedrockAgent(["1"], {"LIVE": "1"})
+        cache = ResolutionCache()
+        assert _resolver(client, cache).resolve("AGENT", agent_version="latest").agent_alias_id == "LIVE"
+
+        # Version 2 is prepared and an alias pointed at it while the listings are cached
+        client.versions.append("2")
+        client.aliases["NEW"] = "2"
+        resolved = _resolver(client, cache).resolve("AGENT", agent_version="latest")
+
+        assert (resolved.agent_alias_id, resolved.resolved_version) == ("NEW", "2")
+        assert client.calls[2:] == ["list_agent_versions", "list_agent_aliases"]
+        assert cache.get_versions("us-east-1", "AGENT")[0].version == "2"
+        assert {a.alias_id for a in cache.get_aliases("us-east-1", "AGENT")} == {"LIVE", "NEW"}
+
+    def test_entries_expire_after_ttl(self) -> None:
+        now = [1000.0]
+        client = FakeBedrockAgent(["1"], {"LIVE": "1"})
+        cache = ResolutionCache(ttl_seconds=60, clock=lambda: now[0])
+
+        _resolver(client, cache).resolve("AGENT", agent_version="latest")
+        now[0] += 61
+        _resolver(client, cache).resolve("AGENT", agent_version="latest")
+
+        assert len(client.calls) == 4
+
+    def test_stale_listing_is_refreshed_on_failure(self) -> None:
+        client = FakeBedrockAgent(["1"], {"LIVE": "1"})
+        cache = ResolutionCache()
+        _resolver(client, cache).resolve("AGENT", agent_version="latest")
+
+        # Version 2 is prepared and an alias pointed at it
+        client.versions.append("2")
+        client.aliases["NEW"] = "2"
+        resolved = _resolver(client, cache).resolve("AGENT", agent_version="2")
+
+        assert resolved.agent_alias_id == "NEW"
+        assert {a.alias_id for a in cache.get_aliases("us-east-1", "AGENT")} == {"LIVE", "NEW"}
+
+    def test_invalidate(self) -> None:
+        client = FakeBedrockAgent(["1"], {"LIVE": "1"})
+        cache = ResolutionCache()
+        resolver = _resolver(client, cache)
+        resolver.resolve("AGENT", agent_version="latest")
+
+        resolver.invalidate("AGENT")
+
+        assert cache.get_versions("us-east-1", "AGENT") is None
+        assert cache.get_aliases("us-east-1", "AGENT") is None
+
+    def test_persisted_across_instances(self, tmp_path: Path) -> None:
+        path = tmp_path / "cache" / "agent-resolution.json"
+        client = FakeBedrockAgent(["1", "2"], {"LIVE": "2"})
+        _resolver(client, ResolutionCache(path)).resolve("AGENT", agent_version="latest")
+
+        reloaded = ResolutionCache(path)
+        versions = reloaded.get_versions("us-east-1", "AGENT")
+
+        assert [v.version for v in versions] == ["2", "1"]
+        assert versions[0].created_at.tzinfo is not None
+        assert reloaded.get_aliases("us-east-1", "AGENT")[0].alias_id == "LIVE"
+        assert reloaded.invalidate(region="us-east-1") == 2
+        assert ResolutionCache(path).get_versions("us-east-1", "AGENT") is None
+
+    def test_zero_ttl_disables_cache(self) -> None:
+        client = FakeBedrockAgent(["1"], {"LIVE": "1"})
+        cache = ResolutionCache(ttl_seconds=0)
+
+        _resolver(client, cache).resolve("AGENT", agent_version="latest")
+        _resolver(client, cache).resolve("AGENT", agent_version="latest")
+
+        assert len(client.calls) == 4
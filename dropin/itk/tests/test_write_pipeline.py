@@ -0,0 +1,202 @@
+"""Tests for the concurrent artifact write pipeline."""
+from __future__ import annotations
+
+import json
+import os
+import stat
+import subprocess
+import sys
+import zipfile
+from pathlib import Path
+
+import pytest
+
+from itk import perf
+from itk.trace.span_model import Span
+from itk.trace.trace_model import Trace
+from itk.utils.artifacts import write_run_artifacts
+from itk.utils.write_pipeline import (
+    WritePipeline,
+    atomic_open,
+    atomic_write_text,
+    write_zip_archive,
+)
+
+
+def _upper(text: str) -> str:
+    return text.upper()
+
+
+def _boom(text: str) -> str:
+    raise ValueError("render failed")
+
+
+def _make_trace() -> Trace:
+    return Trace(
+        spans=[
+            Span(
+                span_id="span-001",
+                parent_span_id=None,
+                component="lambda:entry",
+                operation="InvokeLambda",
+                ts_start="2026-01-15T12:00:00.000Z",
+                ts_end="2026-01-15T12:00:00.100Z",
+                request={"email": "user@example.com"},
+                response={"ok": True},
+            ),
+            Span(
+                span_id="span-002",
+                parent_span_id="span-001",
+                component="agent:supervisor",
+                operation="InvokeAgent",
+                ts_start="2026-01-15T12:00:00.010Z",
+                ts_end="2026-01-15T12:00:00.090Z",
+                error={"message": "boom"},
+            ),
+        ]
+    )
+
+
+class TestAtomicWrites:
+    """Tests for atomic write helpers."""
+
+    def test_atomic_write_replaces_file(self, tmp_path: Path) -> None:
+        target = tmp_path / "out.html"
+        target.write_text("old", encoding="utf-8")
+        atomic_write_text(target, "new")
+        assert target.read_text(encoding="utf-8") == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["out.html"]
+
+    def test_zip_archive_members(self, tmp_path: Path) -> None:
+        target = tmp_path / "payloads.zip"
+        write_zip_archive(target, {"a.json": "{}", "b.json": "[]"})
+        with zipfile.ZipFile(target) as zf:
+            assert sorted(zf.namelist()) == ["a.json", "b.json"]
+            assert zf.read("b.json") == b"[]"
+
+
+    def test_write_counters_recorded_while_profiling(self, tmp_path: Path) -> None:
+        recorder = perf.enable()
+        try:
+            atomic_write_text(tmp_path / "a.txt", "abc")
+            with atomic_open(tmp_path / "b.txt") as f:
+                f.write("hello")
+            write_zip_archive(tmp_path / "c.zip", {"x.json": "{}"})
+        finally:
+            perf.disable()
+
+        assert recorder.counters["write.files"] == 3
+        assert recorder.counters["write.bytes"] == 3 + 5 + (tmp_path / "c.zip").stat().st_size
+
+    def test_no_stat_without_profiling(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        def fail(path: str) -> int:
+            raise AssertionError(f"unexpected stat of {path}")
+
+        monkeypatch.setattr("itk.utils.write_pipeline.os.path.getsize", fail)
+        with atomic_open(tmp_path / "b.txt") as f:
+            f.write("hello")
+        write_zip_archive(tmp_path / "c.zip", {"x.json": "{}"})
+
+        assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "hello"
+
+    @pytest.mark.skipif(sys.platform == "win32", reason="POSIX file modes")
+    def test_written_files_get_umask_mode(self, tmp_path: Path) -> None:
+        script = (
+            "import sys\n"
+            "from pathlib import Path\n"
+            "from itk.utils.write_pipeline import atomic_open, atomic_write_text, write_zip_archive\n"
+            "out = Path(sys.argv[1])\n"
+            "atomic_write_text(out / 'index.html', 'x')\n"
+            "with atomic_open(out / 'spans.jsonl') as f:\n"
+            "    f.write('{}')\n"
+            "write_zip_archive(out / 'payloads.zip', {'a.json': '{}'})\n"
+        )
+
+        result = subprocess.run(
+            [sys.executable, "-c", script, str(tmp_path)],
+            cwd=str(Path(__file__).parent.parent / "src"),
+            capture_output=True,
+            text=True,
+            preexec_fn=lambda: os.umask(0o022),
+        )
+
+        assert result.returncode == 0, result.stderr
+        modes = {p.name: stat.S_IMODE(p.stat().st_mode) for p in tmp_path.iterdir()}
+        assert modes == {"index.html": 0o644, "spans.jsonl": 0o644, "payloads.zip": 0o644}
+
+class TestWritePipeline:
+    """Tests for WritePipeline."""
+
+    @pytest.mark.parametrize("io_workers", [0, 2])
+    def test_writes_and_renders(self, tmp_path: Path, io_workers: int) -> None:
+        with WritePipeline(io_workers=io_workers) as pipe:
+            pipe.write_text(tmp_path / "a.txt", "alpha")
+            pipe.render(tmp_path / "b.txt", _upper, "beta")
+        assert (tmp_path / "a.txt").read_text(encoding="utf-8") == "alpha"
+        assert (tmp_path / "b.txt").read_text(encoding="utf-8") == "BETA"
+
+    def test_process_pool_render(self, tmp_path: Path) -> None:
+        with WritePipeline(io_workers=1, render_workers=1) as pipe:
+            pipe.render(tmp_path / "c.txt", _upper, "gamma")
+        assert (tmp_path / "c.txt").read_text(encoding="utf-8") == "GAMMA"
+
+    def test_render_error_propagates_without_partial_file(self, tmp_path: Path) -> None:
+        with pytest.raises(ValueError, match="render failed"):
+            with WritePipeline(io_workers=1, render_workers=1) as pipe:
+                pipe.render(tmp_path / "bad.html", _boom, "x")
+        assert list(tmp_path.iterdir()) == []
+
+
+class TestWriteRunArtifacts:
+    """Tests for write_run_artifacts through the pipeline."""
+
+    def test_writes_expected_files(self, tmp_path: Path) -> None:
+        write_run_artifacts(out_dir=tmp_path, trace=_make_trace(), mermaid="sequenceDiagram")
+
+        for name in (
+            "index.html",
+            "spans.jsonl",
+            "sequence.mmd",
+            "sequence.html",
+            "trace-viewer.html",
+            "timeline.html",
+            "thumbnail.svg",
+            "timeline-thumbnail.svg",
+            "report.md",
+        ):
+            assert (tmp_path / name).exists(), f"{name} missing"
+
+        assert (tmp_path / "payloads" / "span-001.request.json").exists()
+        assert (tmp_path / "payloads" / "span-002.error.json").exists()
+        request = json.loads((tmp_path / "payloads" / "span-001.request.json").read_text())
+        assert request["email"] == "[EMAIL_REDACTED]"
+
+        lines = (tmp_path / "spans.jsonl").read_text(encoding="utf-8").splitlines()
+        assert len(lines) == 2
+        assert json.loads(lines[0])["request"]["email"] == "[EMAIL_REDACTED]"
+
+    def test_pack_payloads(self, tmp_path: Path) -> None:
+        write_run_artifacts(
+            out_dir=tmp_path,
+            trace=_make_trace(),
+            mermaid="sequenceDiagram",
+            pack_payloads=True,
+        )
+        assert not (tmp_path / "payloads").exists()
+        with zipfile.ZipFile(tmp_path / "payloads.zip") as zf:
+            assert sorted(zf.namelist()) == [
+                "span-001.request.json",
+                "span-001.response.json",
+                "span-002.error.json",
+            ]
+        assert "payloads.zip" in (tmp_path / "index.html").read_text(encoding="utf-8")
+
+    def test_render_workers_match_inline_output(self, tmp_path: Path) -> None:
+        inline_dir = tmp_path / "inline"
+        pooled_dir = tmp_path / "pooled"
+        trace = _make_trace()
+        write_run_artifacts(out_dir=inline_dir, trace=trace, mermaid="m", io_workers=0)
+        write_run_artifacts(out_dir=pooled_dir, trace=trace, mermaid="m", render_workers=2)
+
+        for name in ("trace-viewer.html", "timeline.html", "spans.jsonl"):
+            assert (inline_dir / name).read_bytes() == (pooled_dir / name).read_bytes()